@@ -15,6 +15,7 @@ from language_model_gateway.configs.config_reader.github_config_zip_reader impor
 )
 from language_model_gateway.configs.config_reader.s3_config_reader import S3ConfigReader
 from language_model_gateway.configs.config_schema import ChatModelConfig
+from language_model_gateway.gateway.http.http_cache import HttpCache
 from language_model_gateway.gateway.utilities.expiring_cache import ExpiringCache
 from language_model_gateway.gateway.utilities.url_parser import UrlParser
 
@@ -25,16 +26,23 @@ class ConfigReader:
     _identifier: UUID = uuid4()
     _lock: asyncio.Lock = asyncio.Lock()
 
-    def __init__(self, *, cache: ExpiringCache[List[ChatModelConfig]]) -> None:
+    def __init__(
+        self,
+        *,
+        cache: ExpiringCache[List[ChatModelConfig]],
+        http_cache: Optional[HttpCache] = None,
+    ) -> None:
         """
         Initialize the async config reader
 
         Args:
             cache: Expiring cache for model configurations
+            http_cache: conditional request cache for reading configurations from GitHub
         """
         assert cache is not None
         self._cache: ExpiringCache[List[ChatModelConfig]] = cache
         assert self._cache is not None
+        self._http_cache: Optional[HttpCache] = http_cache
 
     # noinspection PyMethodMayBeStatic
     async def read_model_configs_async(self) -> List[ChatModelConfig]:
@@ -127,9 +135,9 @@ class ConfigReader:
                 f"ConfigReader with id:  {self._identifier} loaded {len(models)} model configurations from S3"
             )
         elif UrlParser.is_github_url(config_path):
-            models = await GitHubConfigReader().read_model_configs(
-                github_url=config_path
-            )
+            models = await GitHubConfigReader(
+                http_cache=self._http_cache
+            ).read_model_configs(github_url=config_path)
             logger.info(
                 f"ConfigReader with id:  {self._identifier} loaded {len(models)} model configurations from GitHub"
             )
@@ -9,16 +9,23 @@ from typing import List, Tuple, Optional, Any, Dict
 from urllib.parse import urlparse, unquote
 
 from language_model_gateway.configs.config_schema import ChatModelConfig
+from language_model_gateway.gateway.http.http_cache import HttpCache
+from language_model_gateway.gateway.http.http_cache_transport import (
+    HttpCacheTransport,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class GitHubConfigReader:
-    def __init__(self) -> None:
+    def __init__(self, *, http_cache: Optional[HttpCache] = None) -> None:
         """
         Initialize the async GitHub config reader
 
+        Args:
+            http_cache: if set, unchanged files are served from the cache with conditional requests
         """
+        self.http_cache: Optional[HttpCache] = http_cache
         self.github_token: Optional[str] = os.environ.get("GITHUB_TOKEN")
         self.max_retries: int = 5
         self.base_delay: int = 1  # Base delay in seconds
@@ -161,7 +168,13 @@ class GitHubConfigReader:
         logger.info(f"Reading model configurations from GitHub: {repo_url}/{path}")
         configs: List[ChatModelConfig] = []
 
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(
+            transport=(
+                HttpCacheTransport(http_cache=self.http_cache)
+                if self.http_cache is not None
+                else None
+            )
+        ) as client:
             try:
                 # Construct the GitHub API URL to list contents
                 api_url = f"https://api.github.com/repos/{repo_url}/contents/{path}?ref={branch}"
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Literal
 
 from pydantic import BaseModel
 
@@ -78,6 +78,70 @@ class ModelConfig(BaseModel):
     model: str
     """The model to use"""
 
+    regions: List[str] | None = None
+    """AWS regions to send bedrock requests to.  Requests go to the fastest region that is not throttling and fail over to the next one.  Defaults to AWS_REGION"""
+
+
+class ContextBudgetConfig(BaseModel):
+    """Context budget configuration"""
+
+    max_input_tokens: int
+    """The maximum number of tokens to send to the model for messages and tool definitions"""
+
+    keep_last_turns: int = 4
+    """The number of most recent conversation turns that are always kept"""
+
+    strategy: Literal["drop", "summarize"] = "drop"
+    """What to do with older turns that do not fit: drop them or replace them with a short summary"""
+
+    summary_max_tokens: int = 500
+    """The maximum number of tokens in the summary when strategy is summarize"""
+
+
+class ModelRoutingConfig(BaseModel):
+    """Routes each request to the fast model in model or to strong_model"""
+
+    strong_model: ModelConfig
+    """The stronger model used for requests that need it"""
+
+    max_fast_prompt_tokens: int = 4000
+    """Requests with more prompt tokens (messages and tool definitions) go to the strong model"""
+
+    max_fast_tool_score: float | None = 2.0
+    """Requests where the best matching tool scores higher than this against the latest user message are likely to need tools and go to the strong model.  None ignores tools"""
+
+    strong_for_json_schema: bool = True
+    """Requests with a json_schema response format go to the strong model"""
+
+    escalate_on_invalid_response: bool = False
+    """Retry non-streaming json_schema requests on the strong model when the fast model's response does not match the schema"""
+
+
+class ToolSelectionConfig(BaseModel):
+    """Tool selection configuration"""
+
+    max_tools: int
+    """The maximum number of tools bound to the model for a request"""
+
+    always_include: List[str] | None = None
+    """Names of tools that are always bound to the model.  These count towards max_tools"""
+
+
+class HedgingConfig(BaseModel):
+    """Sends a duplicate request when the first response is slow and uses whichever responds first"""
+
+    percentile: float = 95
+    """A duplicate request is sent when the first byte has not arrived within this percentile of the recent times to first byte"""
+
+    max_extra_load_percent: float = 5
+    """The maximum percent of requests that are duplicated"""
+
+    initial_delay_seconds: float = 2.0
+    """The delay before sending a duplicate request until enough times to first byte have been seen"""
+
+    min_delay_seconds: float = 0.1
+    """The minimum delay before sending a duplicate request"""
+
 
 class ChatModelConfig(BaseModel):
     """Model configuration for chat models"""
@@ -100,6 +164,9 @@ class ChatModelConfig(BaseModel):
     url: str | None = None
     """The URL to access the model"""
 
+    urls: List[str] | None = None
+    """URLs of replicas of an openai agent.  Requests are balanced across them and fail over to the next one.  Used instead of url."""
+
     disabled: bool | None = None
 
     model: ModelConfig | None = None
@@ -123,6 +190,30 @@ class ChatModelConfig(BaseModel):
     example_prompts: List[PromptConfig] | None = None
     """Example prompts for the model"""
 
+    context_budget: ContextBudgetConfig | None = None
+    """The context budget for the messages sent to the model"""
+
+    routing: ModelRoutingConfig | None = None
+    """Routes each request to model or a stronger model based on the request"""
+
+    tool_selection: ToolSelectionConfig | None = None
+    """Binds only the tools most relevant to the latest user message to the model"""
+
+    hedging: HedgingConfig | None = None
+    """Sends a duplicate request to another upstream when the first byte is slow.  Langchain models only hedge streaming requests without tools."""
+
+    max_output_tokens: int | None = None
+    """The maximum number of tokens a request can generate.  Also used when the request does not set max_tokens"""
+
+    request_timeout_seconds: float | None = None
+    """The maximum wall clock time for a request.  The agent is stopped and the output so far is returned"""
+
+    structured_output_mode: Literal["native", "prompt"] = "prompt"
+    """How json_schema response formats are handled.  native uses the tool calling support of the model so it returns JSON that matches the schema.  prompt asks for JSON in <json> tags and extracts it from the response.  Defaults to prompt since not every model supports tool calling"""
+
+    status_messages_in_history: Literal["keep", "collapse", "strip"] = "collapse"
+    """What to do with the status messages the gateway added to assistant messages when they are sent back as history"""
+
     def get_agents(self) -> List[AgentConfig]:
         """Get the agents for the model"""
         return self.agents or self.tools or []
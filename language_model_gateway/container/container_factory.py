@@ -1,16 +1,37 @@
 import logging
 import os
+import tempfile
+from typing import List, Optional
+
+from botocore.config import Config
 
 from language_model_gateway.configs.config_reader.config_reader import ConfigReader
 from language_model_gateway.container.simple_container import SimpleContainer
 from language_model_gateway.gateway.aws.aws_client_factory import AwsClientFactory
+from language_model_gateway.gateway.aws.bedrock_rate_limiter import (
+    BedrockRateLimiter,
+)
+from language_model_gateway.gateway.aws.bedrock_region_router import (
+    BedrockRegionRouter,
+)
 from language_model_gateway.gateway.converters.langgraph_to_openai_converter import (
     LangGraphToOpenAIConverter,
 )
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
 from language_model_gateway.gateway.file_managers.file_manager_factory import (
     FileManagerFactory,
 )
+from language_model_gateway.gateway.http.http_cache import HttpCache
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
+from language_model_gateway.gateway.http.upstream_pool import UpstreamPool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
 from language_model_gateway.gateway.image_generation.image_generator_factory import (
     ImageGeneratorFactory,
 )
@@ -37,19 +58,68 @@ from language_model_gateway.gateway.tools.tool_provider import ToolProvider
 from language_model_gateway.gateway.utilities.confluence.confluence_helper import (
     ConfluenceHelper,
 )
+from language_model_gateway.gateway.utilities.confluence.confluence_page_cache import (
+    ConfluencePageCache,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_search_index import (
+    ConfluenceSearchIndex,
+)
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
 from language_model_gateway.gateway.utilities.environment_variables import (
     EnvironmentVariables,
 )
 from language_model_gateway.gateway.utilities.expiring_cache import ExpiringCache
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff_cache import (
+    GithubPullRequestDiffCache,
+)
 from language_model_gateway.gateway.utilities.github.github_pull_request_helper import (
     GithubPullRequestHelper,
 )
+from language_model_gateway.gateway.utilities.jira.jira_issue_index import (
+    JiraIssueIndex,
+)
 from language_model_gateway.gateway.utilities.jira.jira_issues_helper import (
     JiraIssueHelper,
 )
 from language_model_gateway.gateway.utilities.databricks.databricks_helper import (
     DatabricksHelper,
 )
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_store import (
+    PassageStore,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_router import (
+    ModelRouter,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+from language_model_gateway.gateway.utilities.tool_selection.tool_selector import (
+    ToolSelector,
+)
+from language_model_gateway.gateway.utilities.web_search.arxiv_web_search_engine import (
+    ArxivWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.duckduckgo_web_search_engine import (
+    DuckDuckGoWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.google_web_search_engine import (
+    GoogleWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.pubmed_web_search_engine import (
+    PubmedWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_cache import (
+    WebSearchCache,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_engine import (
+    WebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_searcher import (
+    WebSearcher,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,21 +132,79 @@ class ContainerFactory:
         container = SimpleContainer()
 
         # register services here
-        container.register(HttpClientFactory, lambda c: HttpClientFactory())
+        # circuit breaker state is shared by all requests so we use singleton
+        container.singleton(CircuitBreakerRegistry, CircuitBreakerRegistry())
+
+        container.register(
+            HttpClientFactory,
+            lambda c: HttpClientFactory(
+                circuit_breaker_registry=c.resolve(CircuitBreakerRegistry)
+            ),
+        )
+
+        # the cache is kept in a file so it survives restarts and all the workers on the host share it
+        container.singleton(
+            HttpCache,
+            HttpCache(
+                database_path=os.environ.get("HTTP_CACHE_DATABASE_PATH")
+                or os.path.join(
+                    tempfile.gettempdir(), "language_model_gateway_http_cache.db"
+                ),
+                max_size_bytes=(
+                    int(os.environ["HTTP_CACHE_MAX_SIZE_BYTES"])
+                    if os.environ.get("HTTP_CACHE_MAX_SIZE_BYTES")
+                    else 100 * 1024 * 1024
+                ),
+            ),
+        )
+
+        # upstream latency and health are shared by all requests so we use singleton
+        container.singleton(UpstreamPool, UpstreamPool())
+        # times to first byte and the hedge budget are shared by all requests so we use singleton
+        container.singleton(RequestHedger, RequestHedger())
 
         container.register(
             OpenAiChatCompletionsProvider,
             lambda c: OpenAiChatCompletionsProvider(
-                http_client_factory=c.resolve(HttpClientFactory)
+                http_client_factory=c.resolve(HttpClientFactory),
+                upstream_pool=c.resolve(UpstreamPool),
+                request_hedger=c.resolve(RequestHedger),
+            ),
+        )
+        container.register(
+            ModelFactory,
+            lambda c: ModelFactory(
+                circuit_breaker_registry=c.resolve(CircuitBreakerRegistry),
+                bedrock_region_router=c.resolve(BedrockRegionRouter),
+                bedrock_rate_limiter=c.resolve(BedrockRateLimiter),
             ),
         )
-        container.register(ModelFactory, lambda c: ModelFactory())
 
         container.register(
             AwsClientFactory,
             lambda c: AwsClientFactory(),
         )
 
+        # region latency and throttling are shared by all requests so we use singleton
+        container.singleton(
+            BedrockRegionRouter,
+            BedrockRegionRouter(
+                aws_client_factory=AwsClientFactory(),
+                # throttled calls are retried by RegionRoutingBedrockClient at the learned rate
+                client_config=Config(retries={"mode": "standard", "max_attempts": 1}),
+            ),
+        )
+        # the rate limits are kept in a file so all the workers on the host share them
+        container.singleton(
+            BedrockRateLimiter,
+            BedrockRateLimiter(
+                database_path=os.environ.get("BEDROCK_RATE_LIMITER_DATABASE_PATH")
+                or os.path.join(
+                    tempfile.gettempdir(), "language_model_gateway_bedrock_rates.db"
+                )
+            ),
+        )
+
         container.register(
             ImageGeneratorFactory,
             lambda c: ImageGeneratorFactory(
@@ -90,8 +218,41 @@ class ContainerFactory:
             ),
         )
 
+        container.register(TokenCounter, lambda c: TokenCounter())
+
+        # we want only one instance of the cache so we use singleton
+        container.singleton(
+            MessageConversionCache,
+            MessageConversionCache(
+                max_entries=(
+                    int(os.environ["MESSAGE_CONVERSION_CACHE_MAX_ENTRIES"])
+                    if os.environ.get("MESSAGE_CONVERSION_CACHE_MAX_ENTRIES")
+                    else 10_000
+                )
+            ),
+        )
+
+        container.register(
+            ContextBudgetManager,
+            lambda c: ContextBudgetManager(token_counter=c.resolve(TokenCounter)),
+        )
+
+        container.register(
+            ToolSelector,
+            lambda c: ToolSelector(token_counter=c.resolve(TokenCounter)),
+        )
+
         container.register(
-            LangGraphToOpenAIConverter, lambda c: LangGraphToOpenAIConverter()
+            ModelRouter,
+            lambda c: ModelRouter(token_counter=c.resolve(TokenCounter)),
+        )
+
+        container.register(
+            LangGraphToOpenAIConverter,
+            lambda c: LangGraphToOpenAIConverter(
+                context_budget_manager=c.resolve(ContextBudgetManager),
+                message_conversion_cache=c.resolve(MessageConversionCache),
+            ),
         )
 
         container.register(
@@ -107,15 +268,31 @@ class ContainerFactory:
             lambda c: EnvironmentVariables(),
         )
 
+        # diffs are cached by head SHA and shared by all requests so we use singleton
+        container.singleton(GithubPullRequestDiffCache, GithubPullRequestDiffCache())
+
         container.register(
             GithubPullRequestHelper,
             lambda c: GithubPullRequestHelper(
                 org_name=c.resolve(EnvironmentVariables).github_org,
                 access_token=c.resolve(EnvironmentVariables).github_token,
                 http_client_factory=c.resolve(HttpClientFactory),
+                http_cache=c.resolve(HttpCache),
+                use_graphql=os.environ.get("GITHUB_USE_GRAPHQL", "1") == "1",
+                github_pull_request_diff_cache=c.resolve(GithubPullRequestDiffCache),
             ),
         )
 
+        # the issue index is optional and kept in a file so all the workers on the host share it
+        jira_issue_index_database_path: Optional[str] = os.environ.get(
+            "JIRA_ISSUE_INDEX_DATABASE_PATH"
+        )
+        if jira_issue_index_database_path:
+            container.singleton(
+                JiraIssueIndex,
+                JiraIssueIndex(database_path=jira_issue_index_database_path),
+            )
+
         container.register(
             JiraIssueHelper,
             lambda c: JiraIssueHelper(
@@ -123,9 +300,46 @@ class ContainerFactory:
                 jira_base_url=c.resolve(EnvironmentVariables).jira_base_url,
                 access_token=c.resolve(EnvironmentVariables).jira_token,
                 username=c.resolve(EnvironmentVariables).jira_username,
+                jira_issue_index=(
+                    c.resolve(JiraIssueIndex)
+                    if jira_issue_index_database_path
+                    else None
+                ),
+                index_project_keys=[
+                    project_key.strip()
+                    for project_key in os.environ.get(
+                        "JIRA_ISSUE_INDEX_PROJECTS", ""
+                    ).split(",")
+                    if project_key.strip()
+                ],
             ),
         )
 
+        # pages are cached by version and shared by all requests so we use singleton
+        container.singleton(ConfluencePageCache, ConfluencePageCache())
+
+        # the search index is optional and kept in a file so all the workers on the host share it
+        confluence_index_database_path: Optional[str] = os.environ.get(
+            "CONFLUENCE_INDEX_DATABASE_PATH"
+        )
+        confluence_index_spaces: List[str] = [
+            space_key.strip()
+            for space_key in os.environ.get("CONFLUENCE_INDEX_SPACES", "").split(",")
+            if space_key.strip()
+        ]
+        use_confluence_search_index: bool = bool(
+            confluence_index_database_path and confluence_index_spaces
+        )
+        if use_confluence_search_index:
+            assert confluence_index_database_path
+            container.singleton(
+                ConfluenceSearchIndex,
+                ConfluenceSearchIndex(
+                    database_path=confluence_index_database_path,
+                    space_keys=confluence_index_spaces,
+                ),
+            )
+
         container.register(
             ConfluenceHelper,
             lambda c: ConfluenceHelper(
@@ -133,6 +347,15 @@ class ContainerFactory:
                 confluence_base_url=c.resolve(EnvironmentVariables).jira_base_url,
                 access_token=c.resolve(EnvironmentVariables).jira_token,
                 username=c.resolve(EnvironmentVariables).jira_username,
+                confluence_page_cache=c.resolve(ConfluencePageCache),
+                confluence_search_index=(
+                    c.resolve(ConfluenceSearchIndex)
+                    if use_confluence_search_index
+                    else None
+                ),
+                passage_extractor=(
+                    c.resolve(PassageExtractor) if use_confluence_search_index else None
+                ),
             ),
         )
 
@@ -141,6 +364,58 @@ class ContainerFactory:
             lambda c: DatabricksHelper(),
         )
 
+        # documents are kept for fetching more passages in later tool calls so we use singleton
+        container.singleton(PassageStore, PassageStore())
+        container.register(
+            PassageExtractor,
+            lambda c: PassageExtractor(
+                token_counter=c.resolve(TokenCounter),
+                passage_store=c.resolve(PassageStore),
+            ),
+        )
+
+        # engines searched by the multi engine web search tool.  Google needs an API key.
+        web_search_engines: List[WebSearchEngine] = []
+        for engine_name in os.environ.get(
+            "WEB_SEARCH_ENGINES", "google,duckduckgo,pubmed,arxiv"
+        ).split(","):
+            match engine_name.strip():
+                case "google":
+                    google_api_key: Optional[str] = os.environ.get("GOOGLE_API_KEY")
+                    google_cse_id: Optional[str] = os.environ.get("GOOGLE_CSE_ID")
+                    if google_api_key and google_cse_id:
+                        web_search_engines.append(
+                            GoogleWebSearchEngine(
+                                api_key=google_api_key, cse_id=google_cse_id
+                            )
+                        )
+                case "duckduckgo":
+                    web_search_engines.append(DuckDuckGoWebSearchEngine())
+                case "pubmed":
+                    web_search_engines.append(PubmedWebSearchEngine())
+                case "arxiv":
+                    web_search_engines.append(ArxivWebSearchEngine())
+                case "":
+                    pass
+                case _:
+                    raise ValueError(f"Unknown web search engine: {engine_name}")
+
+        # search results are shared by all requests so we use singleton
+        container.singleton(WebSearchCache, WebSearchCache())
+        # the searcher keeps the http client open across requests so we use singleton
+        if web_search_engines:
+            container.singleton(
+                WebSearcher,
+                WebSearcher(
+                    http_client_factory=container.resolve(HttpClientFactory),
+                    web_search_cache=container.resolve(WebSearchCache),
+                    engines=web_search_engines,
+                    timeout_seconds=float(
+                        os.environ.get("WEB_SEARCH_TIMEOUT_SECONDS", "10")
+                    ),
+                ),
+            )
+
         container.register(
             ToolProvider,
             lambda c: ToolProvider(
@@ -152,6 +427,9 @@ class ContainerFactory:
                 jira_issues_helper=c.resolve(JiraIssueHelper),
                 confluence_helper=c.resolve(ConfluenceHelper),
                 databricks_helper=c.resolve(DatabricksHelper),
+                circuit_breaker_registry=c.resolve(CircuitBreakerRegistry),
+                passage_extractor=c.resolve(PassageExtractor),
+                web_searcher=(c.resolve(WebSearcher) if web_search_engines else None),
             ),
         )
         container.register(
@@ -160,6 +438,9 @@ class ContainerFactory:
                 model_factory=c.resolve(ModelFactory),
                 lang_graph_to_open_ai_converter=c.resolve(LangGraphToOpenAIConverter),
                 tool_provider=c.resolve(ToolProvider),
+                tool_selector=c.resolve(ToolSelector),
+                model_router=c.resolve(ModelRouter),
+                request_hedger=c.resolve(RequestHedger),
             ),
         )
         # we want only one instance of the cache so we use singleton
@@ -175,7 +456,10 @@ class ContainerFactory:
         )
 
         container.register(
-            ConfigReader, lambda c: ConfigReader(cache=c.resolve(ExpiringCache))
+            ConfigReader,
+            lambda c: ConfigReader(
+                cache=c.resolve(ExpiringCache), http_cache=c.resolve(HttpCache)
+            ),
         )
         container.register(
             ChatCompletionManager,
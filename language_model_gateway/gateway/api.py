@@ -7,6 +7,7 @@ from typing import AsyncGenerator, Annotated, List
 
 from fastapi import FastAPI, HTTPException
 from fastapi.params import Depends
+from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.requests import Request
 from starlette.responses import FileResponse, JSONResponse
 from starlette.staticfiles import StaticFiles
@@ -94,6 +95,8 @@ def create_app() -> FastAPI:
     app1.include_router(
         ImagesRouter(image_generation_path=image_generation_path).get_router()
     )
+    # expose prometheus metrics (http metrics and the gateway metrics) on /metrics
+    Instrumentator().instrument(app1).expose(app1, include_in_schema=False)
     return app1
 
 
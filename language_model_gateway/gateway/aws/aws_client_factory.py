@@ -1,15 +1,31 @@
 import os
+from typing import Optional
 
 import boto3
+from botocore.config import Config
 
 
 class AwsClientFactory:
     # noinspection PyMethodMayBeStatic
-    def create_client(self, *, service_name: str) -> boto3.client:
-        """Create and return a Bedrock client"""
+    def create_client(
+        self,
+        *,
+        service_name: str,
+        region_name: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> boto3.client:
+        """
+        Create and return an AWS client
+
+        Args:
+            service_name: AWS service
+            region_name: AWS region.  Defaults to AWS_REGION or us-east-1.
+            config: botocore client configuration e.g. retries
+        """
         session = boto3.Session(profile_name=os.environ.get("AWS_CREDENTIALS_PROFILE"))
         bedrock_client = session.client(
             service_name=service_name,
-            region_name="us-east-1",
+            region_name=region_name or os.environ.get("AWS_REGION", "us-east-1"),
+            config=config,
         )
         return bedrock_client
@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    BEDROCK_RATE_LIMIT,
+    BEDROCK_RATE_LIMITER_WAIT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BedrockRateLimiter:
+    """
+    Adaptive token bucket per (model, region) for bedrock calls.
+
+    The rate is learned AIMD style: each successful call adds additive_increase requests per
+    second and a throttled call halves the rate (at most once per decrease_interval_seconds so
+    one burst of throttles counts once).  Calls take a token before they are sent and wait for
+    one when the bucket is empty, up to max_wait_seconds, after which they are sent anyway.  The
+    debt of queued callers is capped at max_wait_seconds of requests so callers that gave up
+    waiting do not make every later caller wait longer.
+
+    Async callers wait with acquire_async() so the wait does not hold a thread of the executor
+    that runs the blocking bedrock calls.
+
+    The buckets are kept in a SQLite database so every worker process on the host shares them
+    and the fleet converges on one rate instead of each worker probing on its own.
+    """
+
+    def __init__(
+        self,
+        *,
+        database_path: str,
+        initial_rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 1000.0,
+        additive_increase: float = 0.1,
+        multiplicative_decrease: float = 0.5,
+        decrease_interval_seconds: float = 1.0,
+        max_wait_seconds: float = 10.0,
+    ) -> None:
+        self.database_path: str = database_path
+        self.initial_rate: float = initial_rate
+        self.min_rate: float = min_rate
+        self.max_rate: float = max_rate
+        self.additive_increase: float = additive_increase
+        self.multiplicative_decrease: float = multiplicative_decrease
+        self.decrease_interval_seconds: float = decrease_interval_seconds
+        self.max_wait_seconds: float = max_wait_seconds
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # connections cannot be shared with forked worker processes
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection: sqlite3.Connection = sqlite3.connect(
+                self.database_path,
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                " model TEXT NOT NULL,"
+                " region TEXT NOT NULL,"
+                " rate REAL NOT NULL,"
+                " tokens REAL NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " decreased_at REAL NOT NULL,"
+                " PRIMARY KEY (model, region))"
+            )
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def _update(
+        self, *, model: str, region: str, tokens_needed: float, event: Optional[str]
+    ) -> Tuple[float, float]:
+        """
+        Refill the bucket, apply a success or throttle and take tokens in one transaction
+
+        Returns:
+            the rate and the tokens left.  Tokens are negative when callers are queued.
+        """
+        now: float = time.time()
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row: Optional[Tuple[float, float, float, float]] = connection.execute(
+                    "SELECT rate, tokens, updated_at, decreased_at FROM rate_limits"
+                    " WHERE model = ? AND region = ?",
+                    (model, region),
+                ).fetchone()
+                rate: float
+                tokens: float
+                updated_at: float
+                decreased_at: float
+                rate, tokens, updated_at, decreased_at = row or (
+                    self.initial_rate,
+                    self.initial_rate,
+                    now,
+                    0.0,
+                )
+                # the bucket holds at most one second of requests
+                tokens = min(tokens + rate * max(now - updated_at, 0), max(rate, 1))
+                if event == "success":
+                    rate = min(rate + self.additive_increase, self.max_rate)
+                elif (
+                    event == "throttle"
+                    and now - decreased_at >= self.decrease_interval_seconds
+                ):
+                    rate = max(rate * self.multiplicative_decrease, self.min_rate)
+                    tokens = min(tokens, 0)
+                    decreased_at = now
+                # callers that wait longer than max_wait_seconds are sent anyway so their
+                # tokens are not owed
+                tokens = max(tokens - tokens_needed, -rate * self.max_wait_seconds)
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits"
+                    " (model, region, rate, tokens, updated_at, decreased_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (model, region, rate, tokens, now, decreased_at),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        BEDROCK_RATE_LIMIT.labels(model=model, region=region).set(rate)
+        return rate, tokens
+
+    def get_rate(self, *, model: str, region: str) -> float:
+        """
+        Get the current rate
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+
+        Returns:
+            requests per second
+        """
+        rate, _ = self._update(model=model, region=region, tokens_needed=0, event=None)
+        return rate
+
+    def _reserve(self, *, model: str, region: str) -> float:
+        """
+        Take a token for a call
+
+        Returns:
+            seconds to wait before sending the call
+        """
+        rate: float
+        tokens: float
+        rate, tokens = self._update(
+            model=model, region=region, tokens_needed=1, event=None
+        )
+        # the token is reserved so queued callers are served in order
+        wait_seconds: float = min(max(-tokens / rate, 0), self.max_wait_seconds)
+        if wait_seconds > 0:
+            logger.info(
+                f"Waiting {wait_seconds:.2f}s for the bedrock rate limit of {model} in {region} ({rate:.1f}/s)"
+            )
+        BEDROCK_RATE_LIMITER_WAIT_SECONDS.labels(model=model, region=region).observe(
+            wait_seconds
+        )
+        return wait_seconds
+
+    def acquire(self, *, model: str, region: str) -> float:
+        """
+        Take a token for a call, waiting for one if the bucket is empty.  This blocks so call it
+        from the thread making the bedrock call.
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+
+        Returns:
+            seconds waited
+        """
+        wait_seconds: float = self._reserve(model=model, region=region)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    async def acquire_async(self, *, model: str, region: str) -> float:
+        """
+        Take a token for a call, waiting for one on the event loop if the bucket is empty
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+
+        Returns:
+            seconds waited
+        """
+        wait_seconds: float = await asyncio.to_thread(
+            self._reserve, model=model, region=region
+        )
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        return wait_seconds
+
+    def record_success(self, *, model: str, region: str) -> None:
+        """
+        Increase the rate after a successful call
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+        """
+        self._update(model=model, region=region, tokens_needed=0, event="success")
+
+    def record_throttle(self, *, model: str, region: str) -> None:
+        """
+        Decrease the rate after a throttled call
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+        """
+        rate, _ = self._update(
+            model=model, region=region, tokens_needed=0, event="throttle"
+        )
+        logger.warning(
+            f"Bedrock throttled {model} in {region} so the rate limit is now {rate:.1f}/s"
+        )
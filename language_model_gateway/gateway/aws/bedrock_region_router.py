@@ -0,0 +1,207 @@
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import boto3
+from botocore.config import Config
+
+from language_model_gateway.gateway.aws.aws_client_factory import AwsClientFactory
+from language_model_gateway.gateway.aws.bedrock_region_state import (
+    BedrockRegionState,
+)
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    BEDROCK_REGION_LATENCY_SECONDS,
+    BEDROCK_REGION_REQUESTS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BedrockRegionRouter:
+    """
+    Orders the AWS regions of a bedrock model for each request and keeps one bedrock-runtime
+    client per region.
+
+    Regions are ordered by their EWMA latency divided by the share of requests that are not
+    throttled and by the share that did not fail, so a region that throttles half the requests
+    looks twice as slow.  A region that throttles or fails is tried last for a cool down that
+    doubles with each consecutive throttle or failure.  The
+    state is kept per model and region and shared by all requests so this is registered as a
+    singleton.
+    """
+
+    def __init__(
+        self,
+        *,
+        aws_client_factory: AwsClientFactory,
+        ewma_alpha: float = 0.3,
+        throttle_cool_down_seconds: float = 1.0,
+        max_throttle_cool_down_seconds: float = 60.0,
+        client_config: Optional[Config] = None,
+    ) -> None:
+        self.aws_client_factory: AwsClientFactory = aws_client_factory
+        assert self.aws_client_factory is not None
+        assert isinstance(self.aws_client_factory, AwsClientFactory)
+        self.ewma_alpha: float = ewma_alpha
+        self.throttle_cool_down_seconds: float = throttle_cool_down_seconds
+        self.max_throttle_cool_down_seconds: float = max_throttle_cool_down_seconds
+        # e.g. to turn off the botocore retries when BedrockRateLimiter paces the retries
+        self.client_config: Optional[Config] = client_config
+        self._states: Dict[Tuple[str, str], BedrockRegionState] = {}
+        self._clients: Dict[str, Any] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_state(self, model: str, region: str) -> BedrockRegionState:
+        state: Optional[BedrockRegionState] = self._states.get((model, region))
+        if state is None:
+            state = BedrockRegionState(region=region)
+            self._states[(model, region)] = state
+        return state
+
+    def get_state(self, *, model: str, region: str) -> BedrockRegionState:
+        """
+        Get the current state of a region for a model
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+
+        Returns:
+            copy of the state
+        """
+        with self._lock:
+            return BedrockRegionState(**self._get_state(model, region).__dict__)
+
+    def get_client(self, *, region: str) -> boto3.client:
+        """
+        Get the bedrock-runtime client for a region.  Clients are created once and reused.
+
+        Args:
+            region: AWS region
+
+        Returns:
+            bedrock-runtime client
+        """
+        with self._lock:
+            client: Any = self._clients.get(region)
+            if client is None:
+                client = self.aws_client_factory.create_client(
+                    service_name="bedrock-runtime",
+                    region_name=region,
+                    config=self.client_config,
+                )
+                self._clients[region] = client
+            return client
+
+    def order_regions(self, *, model: str, regions: Sequence[str]) -> List[str]:
+        """
+        Order the regions to try for a request
+
+        Args:
+            model: bedrock model id
+            regions: configured regions
+
+        Returns:
+            regions in the order to try them
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            states: List[BedrockRegionState] = [
+                self._get_state(model, region) for region in regions
+            ]
+
+            def sort_key(state: BedrockRegionState) -> Tuple[bool, float]:
+                return (
+                    state.throttled_until > now or state.failed_until > now,
+                    (state.ewma_latency_seconds or 0.0)
+                    / max(1 - state.throttle_rate, 0.05)
+                    / max(1 - state.failure_rate, 0.05),
+                )
+
+            # sorted() is stable so ties keep the configured order
+            return [s.region for s in sorted(states, key=sort_key)]
+
+    def record_success(
+        self, *, model: str, region: str, latency_seconds: float
+    ) -> None:
+        """
+        Record a successful request
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+            latency_seconds: time to the response (to the first event for streaming requests)
+        """
+        with self._lock:
+            state: BedrockRegionState = self._get_state(model, region)
+            state.ewma_latency_seconds = (
+                latency_seconds
+                if state.ewma_latency_seconds is None
+                else self.ewma_alpha * latency_seconds
+                + (1 - self.ewma_alpha) * state.ewma_latency_seconds
+            )
+            state.throttle_rate *= 1 - self.ewma_alpha
+            state.consecutive_throttles = 0
+            state.throttled_until = 0.0
+            state.failure_rate *= 1 - self.ewma_alpha
+            state.consecutive_failures = 0
+            state.failed_until = 0.0
+        BEDROCK_REGION_REQUESTS.labels(
+            model=model, region=region, result="success"
+        ).inc()
+        BEDROCK_REGION_LATENCY_SECONDS.labels(model=model, region=region).observe(
+            latency_seconds
+        )
+
+    def record_throttle(self, *, model: str, region: str) -> None:
+        """
+        Record a throttled request
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+        """
+        with self._lock:
+            state: BedrockRegionState = self._get_state(model, region)
+            state.throttle_rate = (
+                self.ewma_alpha + (1 - self.ewma_alpha) * state.throttle_rate
+            )
+            cool_down_seconds: float = min(
+                self.throttle_cool_down_seconds * 2**state.consecutive_throttles,
+                self.max_throttle_cool_down_seconds,
+            )
+            state.consecutive_throttles += 1
+            state.throttled_until = time.monotonic() + cool_down_seconds
+        logger.warning(
+            f"Bedrock region {region} throttled {model} so trying it last for {cool_down_seconds}s"
+        )
+        BEDROCK_REGION_REQUESTS.labels(
+            model=model, region=region, result="throttled"
+        ).inc()
+
+    def record_failure(self, *, model: str, region: str) -> None:
+        """
+        Record a request that failed with a service or connection error
+
+        Args:
+            model: bedrock model id
+            region: AWS region
+        """
+        with self._lock:
+            state: BedrockRegionState = self._get_state(model, region)
+            state.failure_rate = (
+                self.ewma_alpha + (1 - self.ewma_alpha) * state.failure_rate
+            )
+            cool_down_seconds: float = min(
+                self.throttle_cool_down_seconds * 2**state.consecutive_failures,
+                self.max_throttle_cool_down_seconds,
+            )
+            state.consecutive_failures += 1
+            state.failed_until = time.monotonic() + cool_down_seconds
+        logger.warning(
+            f"Bedrock region {region} failed for {model} so trying it last for {cool_down_seconds}s"
+        )
+        BEDROCK_REGION_REQUESTS.labels(
+            model=model, region=region, result="failure"
+        ).inc()
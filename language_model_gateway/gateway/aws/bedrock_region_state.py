@@ -0,0 +1,20 @@
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass
+class BedrockRegionState:
+    region: str
+    # exponentially weighted moving average of the latency.  None until the first success.
+    ewma_latency_seconds: Optional[float] = None
+    # exponentially weighted moving average of the share of requests that were throttled
+    throttle_rate: float = 0.0
+    consecutive_throttles: int = 0
+    # time.monotonic() until which the region is tried last
+    throttled_until: float = 0.0
+    # exponentially weighted moving average of the share of requests that failed with a service
+    # or connection error
+    failure_rate: float = 0.0
+    consecutive_failures: int = 0
+    # time.monotonic() until which the region is tried last after a failure
+    failed_until: float = 0.0
@@ -0,0 +1,209 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from botocore.exceptions import (
+    BotoCoreError,
+    ClientError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+)
+
+from language_model_gateway.gateway.aws.bedrock_rate_limiter import (
+    BedrockRateLimiter,
+)
+from language_model_gateway.gateway.aws.bedrock_region_router import (
+    BedrockRegionRouter,
+)
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    BEDROCK_REGION_FAILOVERS,
+)
+
+logger = logging.getLogger(__name__)
+
+# token taken by pace_async() for the next call in this context as [model, region].  The entry
+# is cleared when the call uses the token.
+_paced_call: ContextVar[Optional[List[str]]] = ContextVar(
+    "bedrock_paced_call", default=None
+)
+
+
+class RegionRoutingBedrockClient:
+    """
+    Stands in for the bedrock-runtime client of ChatBedrockConverse and sends each call to the
+    regions of the model in the order given by BedrockRegionRouter.
+
+    Throttling, service errors and connection errors fail over to the next region.  For streaming
+    calls this is only done until the first event is received: after that output may have been
+    sent to the client so the error is raised.
+
+    With a BedrockRateLimiter each call first waits for the rate limit of its region and when
+    every region failed the regions are tried again, up to max_rounds times, so a throttled
+    request is queued at the learned rate instead of failing.  The calls are blocking and run on
+    the default executor, so async callers wait for the rate limit of the first region with
+    pace_async() before the call instead of sleeping on an executor thread.
+    """
+
+    # error codes of ClientError and of errors in the event stream (lower cased)
+    throttling_error_codes = {
+        "throttlingexception",
+        "toomanyrequestsexception",
+        "servicequotaexceededexception",
+    }
+    service_error_codes = {
+        "serviceunavailableexception",
+        "internalserverexception",
+        "modelnotreadyexception",
+        "modeltimeoutexception",
+    }
+
+    def __init__(
+        self,
+        *,
+        bedrock_region_router: BedrockRegionRouter,
+        model: str,
+        regions: List[str],
+        bedrock_rate_limiter: Optional[BedrockRateLimiter] = None,
+        max_rounds: int = 3,
+    ) -> None:
+        self.bedrock_region_router: BedrockRegionRouter = bedrock_region_router
+        assert self.bedrock_region_router is not None
+        assert isinstance(self.bedrock_region_router, BedrockRegionRouter)
+        self.model: str = model
+        self.regions: List[str] = regions
+        assert self.regions, "At least one region is required"
+        self.bedrock_rate_limiter: Optional[BedrockRateLimiter] = bedrock_rate_limiter
+        # without the rate limiter retries would not be paced
+        self.max_rounds: int = max_rounds if bedrock_rate_limiter is not None else 1
+
+    def should_fail_over(self, *, error: Exception, region: str) -> bool:
+        """
+        Record the error for the region and decide whether to try the next region
+
+        Args:
+            error: error from the region
+            region: AWS region
+
+        Returns:
+            True if the error is a throttling, service or connection error
+        """
+        if isinstance(error, ClientError):
+            code: str = str(error.response.get("Error", {}).get("Code", "")).lower()
+            if code in self.throttling_error_codes:
+                self.bedrock_region_router.record_throttle(
+                    model=self.model, region=region
+                )
+                if self.bedrock_rate_limiter is not None:
+                    self.bedrock_rate_limiter.record_throttle(
+                        model=self.model, region=region
+                    )
+                return True
+            if code in self.service_error_codes:
+                self.bedrock_region_router.record_failure(
+                    model=self.model, region=region
+                )
+                return True
+            return False
+        if isinstance(error, (EndpointConnectionError, ConnectTimeoutError)):
+            self.bedrock_region_router.record_failure(model=self.model, region=region)
+            return True
+        return False
+
+    def _fail_over(self, *, error: Exception, region: str, is_last: bool) -> None:
+        if is_last or not self.should_fail_over(error=error, region=region):
+            raise error
+        logger.warning(f"Failing over {self.model} from {region}: {error}")
+        BEDROCK_REGION_FAILOVERS.labels(model=self.model, region=region).inc()
+
+    def _get_attempt_regions(self) -> List[str]:
+        regions: List[str] = self.bedrock_region_router.order_regions(
+            model=self.model, regions=self.regions
+        )
+        return regions * self.max_rounds
+
+    async def pace_async(self) -> None:
+        """
+        Wait on the event loop for the rate limit of the region the next call in this context
+        will go to first
+        """
+        if self.bedrock_rate_limiter is None:
+            return
+        region: str = self.bedrock_region_router.order_regions(
+            model=self.model, regions=self.regions
+        )[0]
+        await self.bedrock_rate_limiter.acquire_async(model=self.model, region=region)
+        _paced_call.set([self.model, region])
+
+    def _acquire(self, *, region: str) -> None:
+        if self.bedrock_rate_limiter is None:
+            return
+        if _paced_call.get() == [self.model, region]:
+            # the token was taken by pace_async()
+            _paced_call.set(None)
+            return
+        self.bedrock_rate_limiter.acquire(model=self.model, region=region)
+
+    def _record_success(self, *, region: str, latency_seconds: float) -> None:
+        self.bedrock_region_router.record_success(
+            model=self.model, region=region, latency_seconds=latency_seconds
+        )
+        if self.bedrock_rate_limiter is not None:
+            self.bedrock_rate_limiter.record_success(model=self.model, region=region)
+
+    def converse(self, **kwargs: Any) -> Dict[str, Any]:
+        regions: List[str] = self._get_attempt_regions()
+        for index, region in enumerate(regions):
+            self._acquire(region=region)
+            start_time: float = time.monotonic()
+            try:
+                response: Dict[str, Any] = self.bedrock_region_router.get_client(
+                    region=region
+                ).converse(**kwargs)
+            except (ClientError, BotoCoreError) as e:
+                self._fail_over(
+                    error=e, region=region, is_last=index == len(regions) - 1
+                )
+                continue
+            self._record_success(
+                region=region, latency_seconds=time.monotonic() - start_time
+            )
+            return response
+        raise AssertionError("unreachable")
+
+    def converse_stream(self, **kwargs: Any) -> Dict[str, Any]:
+        regions: List[str] = self._get_attempt_regions()
+        for index, region in enumerate(regions):
+            self._acquire(region=region)
+            start_time: float = time.monotonic()
+            try:
+                response: Dict[str, Any] = self.bedrock_region_router.get_client(
+                    region=region
+                ).converse_stream(**kwargs)
+                events: Iterator[Dict[str, Any]] = iter(response["stream"])
+                # throttling in the stream is reported as the first event
+                first_event: Optional[Dict[str, Any]] = next(events, None)
+            except (ClientError, BotoCoreError) as e:
+                self._fail_over(
+                    error=e, region=region, is_last=index == len(regions) - 1
+                )
+                continue
+            self._record_success(
+                region=region, latency_seconds=time.monotonic() - start_time
+            )
+            return {**response, "stream": self._prepend(first_event, events)}
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _prepend(
+        first_event: Optional[Dict[str, Any]], events: Iterator[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        if first_event is not None:
+            yield first_event
+        yield from events
+
+    def __getattr__(self, name: str) -> Any:
+        # other operations go to the first configured region
+        return getattr(
+            self.bedrock_region_router.get_client(region=self.regions[0]), name
+        )
@@ -0,0 +1,17 @@
+import dataclasses
+from typing import List, Optional
+
+from langchain_core.messages import BaseMessage
+
+
+@dataclasses.dataclass
+class ConvertedMessages:
+    messages: List[BaseMessage]
+    prefix_keys: List[str]
+    """rolling hash of the message history up to and including each message"""
+    cached_message_count: int
+    """number of messages that were found in the cache"""
+    token_counts: Optional[List[int]] = None
+    """token count of each message, only set when tokens were counted"""
+    cumulative_token_counts: Optional[List[int]] = None
+    """token count of the message history up to and including each message"""
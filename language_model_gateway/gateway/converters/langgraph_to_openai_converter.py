@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import os
@@ -31,11 +32,13 @@ from langchain_core.messages import AIMessageChunk
 from langchain_core.messages.ai import UsageMetadata
 from langchain_core.runnables.schema import CustomStreamEvent, StandardStreamEvent
 from langchain_core.tools import BaseTool
+from langchain_core.utils.json_schema import dereference_refs
 from langgraph.graph.graph import CompiledGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import ToolNode, create_react_agent
 from openai import NotGiven, NOT_GIVEN
 from openai.types import CompletionUsage
+from openai.types.completion_usage import PromptTokensDetails
 from openai.types.chat import (
     ChatCompletionChunk,
     ChatCompletion,
@@ -48,9 +51,27 @@ from openai.types.chat.chat_completion_chunk import ChoiceDelta, Choice as Chunk
 from openai.types.chat.completion_create_params import ResponseFormat
 from openai.types.shared_params import ResponseFormatJSONSchema
 from openai.types.shared_params.response_format_json_schema import JSONSchema
+from pydantic import BaseModel
 from starlette.responses import StreamingResponse, JSONResponse
 
-from language_model_gateway.gateway.converters.my_messages_state import MyMessagesState
+from language_model_gateway.configs.config_schema import ChatModelConfig
+from language_model_gateway.gateway.converters.converted_messages import (
+    ConvertedMessages,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+from language_model_gateway.gateway.converters.my_messages_state import (
+    MyMessagesState,
+    MyMessagesStateWithStructuredResponse,
+)
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    STATUS_MESSAGE_TOKENS_REMOVED,
+)
+from language_model_gateway.gateway.models.model_factory import ModelFactory
+from language_model_gateway.gateway.models.prompt_caching_chat_bedrock_converse import (
+    PromptCachingChatBedrockConverse,
+)
 from language_model_gateway.gateway.converters.streaming_tool_node import (
     StreamingToolNode,
 )
@@ -59,16 +80,49 @@ from language_model_gateway.gateway.schema.openai.completions import (
     ROLE_TYPES,
     INCOMING_MESSAGE_TYPES,
 )
+from language_model_gateway.gateway.utilities.async_deadline import (
+    iterate_until_deadline,
+)
+from language_model_gateway.gateway.utilities.deadline_exceeded_error import (
+    DeadlineExceededError,
+)
 from language_model_gateway.gateway.utilities.chat_message_helpers import (
     langchain_to_chat_message,
     convert_message_content_to_string,
 )
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
 from language_model_gateway.gateway.utilities.json_extractor import JsonExtractor
+from language_model_gateway.gateway.utilities.status_message_marker import (
+    StatusMessageMarker,
+    STATUS_MESSAGE_MODES,
+)
+from language_model_gateway.gateway.utilities.streaming_json_extractor import (
+    StreamingJsonExtractor,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
 
 logger = logging.getLogger(__file__)
 
 
 class LangGraphToOpenAIConverter:
+    # name of the AI message that holds the structured response from the graph
+    structured_response_message_name: str = "structured_response"
+
+    def __init__(
+        self,
+        *,
+        context_budget_manager: ContextBudgetManager,
+        message_conversion_cache: MessageConversionCache,
+    ) -> None:
+        self.context_budget_manager: ContextBudgetManager = context_budget_manager
+        assert self.context_budget_manager is not None
+        assert isinstance(self.context_budget_manager, ContextBudgetManager)
+        self.message_conversion_cache: MessageConversionCache = message_conversion_cache
+        assert self.message_conversion_cache is not None
+        assert isinstance(self.message_conversion_cache, MessageConversionCache)
+
     async def _stream_resp_async_generator(
         self,
         *,
@@ -77,6 +131,9 @@ class LangGraphToOpenAIConverter:
         headers: Dict[str, str],
         compiled_state_graph: CompiledStateGraph,
         messages: List[ChatCompletionMessageParam],
+        model_config: ChatModelConfig,
+        tools: Sequence[BaseTool],
+        json_output_requested: bool = False,
     ) -> AsyncGenerator[str, None]:
         """
         Asynchronously generate streaming responses from the agent.
@@ -87,18 +144,30 @@ class LangGraphToOpenAIConverter:
             headers: The request headers.
             compiled_state_graph: The compiled state graph.
             messages: The list of chat completion message parameters.
+            model_config: The model configuration.
+            tools: The tools bound to the model.
+            json_output_requested: only stream the JSON payload from the response and
+                validate it at the end
 
         Yields:
             The streaming response as a string.
         """
+        json_extractor: Optional[StreamingJsonExtractor] = (
+            StreamingJsonExtractor() if json_output_requested else None
+        )
         try:
             # Process streamed events from the graph and yield messages over the SSE stream.
             event: StandardStreamEvent | CustomStreamEvent
-            async for event in self.astream_events(
-                request=request,
-                headers=headers,
-                compiled_state_graph=compiled_state_graph,
-                messages=messages,
+            async for event in iterate_until_deadline(
+                items=self.astream_events(
+                    request=request,
+                    headers=headers,
+                    compiled_state_graph=compiled_state_graph,
+                    messages=messages,
+                    model_config=model_config,
+                    tools=tools,
+                ),
+                timeout_seconds=model_config.request_timeout_seconds,
             ):
                 if not event:
                     continue
@@ -141,6 +210,10 @@ class LangGraphToOpenAIConverter:
                                 f"content_text: {content_text} (type: {type(content_text)})"
                             )
 
+                            if json_extractor is not None:
+                                # only send the JSON payload and drop the tags and any prose around it
+                                content_text = json_extractor.add(content_text)
+
                             if (
                                 os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1"
                                 and content_text
@@ -210,10 +283,15 @@ class LangGraphToOpenAIConverter:
                         if tool_input_display and "auth_token" in tool_input_display:
                             tool_input_display["auth_token"] = "***"
 
-                        if tool_name:
+                        # status messages would break the JSON so are not sent
+                        if tool_name and json_extractor is None:
                             logger.debug(
                                 f"on_tool_start: {tool_name} {tool_input_display}"
                             )
+                            # mark the status text so it can be removed when sent back as history
+                            tool_start_status: str = StatusMessageMarker.mark(
+                                f"Running Agent {tool_name}: {tool_input_display}"
+                            )
                             chat_stream_response = ChatCompletionChunk(
                                 id=request_id,
                                 created=int(time.time()),
@@ -223,7 +301,7 @@ class LangGraphToOpenAIConverter:
                                         index=0,
                                         delta=ChoiceDelta(
                                             role="assistant",
-                                            content=f"\n\n> Running Agent {tool_name}: {tool_input_display}\n",
+                                            content=f"\n\n> {tool_start_status}\n",
                                         ),
                                     )
                                 ],
@@ -246,7 +324,7 @@ class LangGraphToOpenAIConverter:
 
                             # print(f"on_tool_end: {tool_message}")
 
-                            if artifact:
+                            if artifact and json_extractor is None:
                                 if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
                                     logger.info(f"Returning artifact: {artifact}")
 
@@ -259,7 +337,7 @@ class LangGraphToOpenAIConverter:
                                             index=0,
                                             delta=ChoiceDelta(
                                                 role="assistant",
-                                                content=f"\n> {artifact}\n",
+                                                content=f"\n> {StatusMessageMarker.mark(str(artifact))}\n",
                                             ),
                                         )
                                     ],
@@ -274,7 +352,46 @@ class LangGraphToOpenAIConverter:
                     case _:
                         # Handle other event types
                         pass
+        except DeadlineExceededError as e:
+            # stop the agent and end the response cleanly with the output so far
+            logger.warning(
+                f"Request {request_id} for {model_config.name} stopped after"
+                f" {e.timeout_seconds} seconds"
+            )
+            chat_stream_response = ChatCompletionChunk(
+                id=request_id,
+                created=int(time.time()),
+                model=request["model"],
+                choices=[
+                    ChunkChoice(
+                        index=0,
+                        delta=ChoiceDelta(
+                            role="assistant",
+                            # keep the content JSON only when JSON was requested
+                            content=self.get_timeout_message(
+                                timeout_seconds=e.timeout_seconds
+                            )
+                            if json_extractor is None
+                            else None,
+                        ),
+                        finish_reason="length",
+                    )
+                ],
+                usage=CompletionUsage(
+                    prompt_tokens=0, completion_tokens=0, total_tokens=0
+                ),
+                object="chat.completion.chunk",
+            )
+            yield f"data: {json.dumps(chat_stream_response.model_dump())}\n\n"
         except Exception as e:
+            if json_extractor is not None:
+                logger.exception(
+                    f"Streaming request {request_id} for {model_config.name} failed"
+                )
+                yield self.get_streaming_error_event(message=str(e))
+                # the stream stopped part way so there is no complete JSON to flush or validate
+                yield "data: [DONE]\n\n"
+                return
             chat_stream_response = ChatCompletionChunk(
                 id=request_id,
                 created=int(time.time()),
@@ -295,6 +412,39 @@ class LangGraphToOpenAIConverter:
             )
             yield f"data: {json.dumps(chat_stream_response.model_dump())}\n\n"
 
+        if json_extractor is not None:
+            json_remaining: str = json_extractor.finish()
+            if json_remaining:
+                chat_stream_response = ChatCompletionChunk(
+                    id=request_id,
+                    created=int(time.time()),
+                    model=request["model"],
+                    choices=[
+                        ChunkChoice(
+                            index=0,
+                            delta=ChoiceDelta(role="assistant", content=json_remaining),
+                        )
+                    ],
+                    usage=CompletionUsage(
+                        prompt_tokens=0, completion_tokens=0, total_tokens=0
+                    ),
+                    object="chat.completion.chunk",
+                )
+                yield f"data: {json.dumps(chat_stream_response.model_dump())}\n\n"
+
+            json_schema: Optional[JSONSchema] = self.get_json_schema_from_request(
+                chat_request=request
+            )
+            json_errors: List[str] = json_extractor.validate(
+                schema=json_schema["schema"] if json_schema else None
+            )
+            if json_errors:
+                logger.warning(
+                    f"Streamed JSON for request {request_id} is not valid: {json_errors}"
+                )
+                # report the errors outside the content so it stays parseable JSON
+                yield self.get_streaming_error_event(message="\n".join(json_errors))
+
         yield "data: [DONE]\n\n"
 
     async def call_agent_with_input(
@@ -305,6 +455,8 @@ class LangGraphToOpenAIConverter:
         request_id: str,
         compiled_state_graph: CompiledStateGraph,
         system_messages: List[ChatCompletionSystemMessageParam],
+        model_config: ChatModelConfig,
+        tools: Sequence[BaseTool],
     ) -> StreamingResponse | JSONResponse:
         """
         Call the agent with the provided input and return the response.
@@ -315,6 +467,8 @@ class LangGraphToOpenAIConverter:
             request_id: The unique request identifier.
             compiled_state_graph: The compiled state graph.
             system_messages: The list of chat completion message parameters.
+            model_config: The model configuration.
+            tools: The tools bound to the model.
 
         Returns:
             The response as a StreamingResponse or JSONResponse.
@@ -323,6 +477,10 @@ class LangGraphToOpenAIConverter:
         assert isinstance(chat_request, dict)
 
         if chat_request.get("stream"):
+            json_output_streaming_requested: bool
+            chat_request, json_output_streaming_requested = (
+                self.add_system_messages_for_json(chat_request=chat_request)
+            )
             return StreamingResponse(
                 await self.get_streaming_response_async(
                     headers=headers,
@@ -330,21 +488,35 @@ class LangGraphToOpenAIConverter:
                     request_id=request_id,
                     compiled_state_graph=compiled_state_graph,
                     system_messages=system_messages,
+                    model_config=model_config,
+                    tools=tools,
+                    json_output_requested=json_output_streaming_requested,
                 ),
                 media_type="text/event-stream",
             )
         else:
             try:
                 json_output_requested: bool
-                chat_request, json_output_requested = self.add_system_messages_for_json(
-                    chat_request=chat_request
-                )
+                if (
+                    self.get_native_response_format(
+                        chat_request=chat_request, model_config=model_config
+                    )
+                    is not None
+                ):
+                    # the graph returns the structured response so no prompt is needed
+                    json_output_requested = True
+                else:
+                    chat_request, json_output_requested = (
+                        self.add_system_messages_for_json(chat_request=chat_request)
+                    )
 
                 responses: List[AnyMessage] = await self.ainvoke(
                     compiled_state_graph=compiled_state_graph,
                     headers=headers,
                     request=chat_request,
                     system_messages=system_messages,
+                    model_config=model_config,
+                    tools=tools,
                 )
                 # add usage metadata from each message into a total usage metadata
                 total_usage_metadata: CompletionUsage = (
@@ -357,10 +529,17 @@ class LangGraphToOpenAIConverter:
                     )
                 )
 
+                structured_responses: List[AIMessage] = [
+                    m
+                    for m in responses
+                    if isinstance(m, AIMessage)
+                    and m.name == self.structured_response_message_name
+                ]
                 output_messages_raw: List[ChatCompletionMessage | None] = [
                     langchain_to_chat_message(m)
                     for m in responses
-                    if isinstance(m, AIMessage) or isinstance(m, ToolMessage)
+                    if (isinstance(m, AIMessage) or isinstance(m, ToolMessage))
+                    and m not in structured_responses
                 ]
                 output_messages: List[ChatCompletionMessage] = [
                     m for m in output_messages_raw if m is not None
@@ -374,13 +553,22 @@ class LangGraphToOpenAIConverter:
                 choices_text = "\n".join([f"{c.message.content}" for c in choices])
 
                 if json_output_requested:
-                    # extract the json content from response and just return that
-                    json_content_raw: Dict[str, Any] | List[Dict[str, Any]] | str = (
-                        (JsonExtractor.extract_structured_output(text=choices_text))
-                        if choices_text
-                        else choices_text
-                    )
-                    json_content: str = json.dumps(json_content_raw)
+                    json_content: str
+                    if structured_responses:
+                        # the model returned JSON that matches the schema
+                        json_content = convert_message_content_to_string(
+                            structured_responses[-1].content
+                        )
+                    else:
+                        # extract the json content from response and just return that
+                        json_content_raw: (
+                            Dict[str, Any] | List[Dict[str, Any]] | str
+                        ) = (
+                            (JsonExtractor.extract_structured_output(text=choices_text))
+                            if choices_text
+                            else choices_text
+                        )
+                        json_content = json.dumps(json_content_raw)
                     choices = [
                         Choice(
                             index=i,
@@ -408,6 +596,71 @@ class LangGraphToOpenAIConverter:
                 logger.exception(e, stack_info=True)
                 raise HTTPException(status_code=500, detail=f"Unexpected error: {e}")
 
+    @staticmethod
+    def get_native_response_format(
+        *, chat_request: ChatRequest, model_config: ChatModelConfig
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the JSON schema to pass to the structured output support of the model when the
+        request asks for a json_schema response and the model uses the native structured output mode.
+        Otherwise, returns None and add_system_messages_for_json() is used.
+
+        Args:
+            chat_request: The chat request.
+            model_config: The model configuration.
+
+        Returns:
+            JSON schema with the title and description used as the name and description of the tool
+        """
+        if model_config.structured_output_mode != "native" or chat_request.get(
+            "stream"
+        ):
+            return None
+        json_schema: JSONSchema | None = (
+            LangGraphToOpenAIConverter.get_json_schema_from_request(
+                chat_request=chat_request
+            )
+        )
+        if json_schema is None:
+            return None
+        return {
+            **json_schema["schema"],
+            "title": json_schema["name"],
+            "description": json_schema.get("description")
+            or f"Respond with the {json_schema['name']}",
+        }
+
+    @staticmethod
+    def get_json_schema_from_request(
+        *, chat_request: ChatRequest
+    ) -> Optional[JSONSchema]:
+        """
+        Returns the JSON schema from a json_schema response format with the references inlined
+
+        Args:
+            chat_request: The chat request.
+
+        Returns:
+            JSON schema or None if the request does not have a json_schema response format
+        """
+        response_format: ResponseFormat | NotGiven = chat_request.get(
+            "response_format", NOT_GIVEN
+        )
+        if (
+            isinstance(response_format, NotGiven)
+            or response_format.get("type") != "json_schema"
+        ):
+            return None
+        json_schema: JSONSchema | None = cast(
+            ResponseFormatJSONSchema, response_format
+        ).get("json_schema")
+        if json_schema is None or not json_schema.get("schema"):
+            return None
+        # inline the definitions since not every provider supports $ref in tool schemas
+        schema: Dict[str, Any] = dereference_refs(dict(json_schema["schema"]))
+        schema.pop("$defs", None)
+        return {**json_schema, "schema": schema}
+
     @staticmethod
     def add_system_messages_for_json(
         *, chat_request: ChatRequest
@@ -487,11 +740,20 @@ class LangGraphToOpenAIConverter:
         total_usage_metadata: CompletionUsage = CompletionUsage(
             prompt_tokens=0, completion_tokens=0, total_tokens=0
         )
+        cached_tokens: int = 0
         usage_metadata: UsageMetadata
         for usage_metadata in usages:
             total_usage_metadata.prompt_tokens += usage_metadata["input_tokens"]
             total_usage_metadata.completion_tokens += usage_metadata["output_tokens"]
             total_usage_metadata.total_tokens += usage_metadata["total_tokens"]
+            # tokens read from the prompt cache (e.g. Bedrock cache points)
+            cached_tokens += (usage_metadata.get("input_token_details") or {}).get(
+                "cache_read"
+            ) or 0
+        if cached_tokens:
+            total_usage_metadata.prompt_tokens_details = PromptTokensDetails(
+                cached_tokens=cached_tokens
+            )
         return total_usage_metadata
 
     async def get_streaming_response_async(
@@ -502,6 +764,9 @@ class LangGraphToOpenAIConverter:
         request_id: str,
         compiled_state_graph: CompiledStateGraph,
         system_messages: List[ChatCompletionSystemMessageParam],
+        model_config: ChatModelConfig,
+        tools: Sequence[BaseTool],
+        json_output_requested: bool = False,
     ) -> AsyncGenerator[str, None]:
         """
         Get the streaming response asynchronously.
@@ -512,6 +777,9 @@ class LangGraphToOpenAIConverter:
             request_id: The unique request identifier.
             compiled_state_graph: The compiled state graph.
             system_messages: The list of chat completion message parameters.
+            model_config: The model configuration.
+            tools: The tools bound to the model.
+            json_output_requested: only stream the JSON payload from the response
 
         Returns:
             The streaming response as an async generator.
@@ -531,6 +799,9 @@ class LangGraphToOpenAIConverter:
             headers=headers,
             compiled_state_graph=compiled_state_graph,
             messages=messages,
+            model_config=model_config,
+            tools=tools,
+            json_output_requested=json_output_requested,
         )
         return generator
 
@@ -542,6 +813,7 @@ class LangGraphToOpenAIConverter:
         headers: Dict[str, str],
         messages: List[BaseMessage],
         compiled_state_graph: CompiledStateGraph,
+        timeout_seconds: Optional[float] = None,
     ) -> List[AnyMessage]:
         """
         Run the graph with the provided messages asynchronously.
@@ -549,19 +821,110 @@ class LangGraphToOpenAIConverter:
         Args:
             messages: The list of role and incoming message type tuples.
             compiled_state_graph: The compiled state graph.
+            timeout_seconds: wall clock limit for the run.  When it is reached the agent is
+                stopped and the messages so far are returned followed by a note.
 
         Returns:
             The list of any messages.
         """
 
-        output: Dict[str, Any] = await compiled_state_graph.ainvoke(
-            input=self.create_state(
-                chat_request=chat_request, headers=headers, messages=messages
+        if timeout_seconds is None:
+            output: Dict[str, Any] = await compiled_state_graph.ainvoke(
+                input=self.create_state(
+                    chat_request=chat_request, headers=headers, messages=messages
+                )
+            )
+            return self.get_messages_from_state(state=output)
+
+        # stream the state after each step so the output so far is available if the deadline is reached
+        state: Optional[Dict[str, Any]] = None
+        try:
+            async for state in iterate_until_deadline(
+                items=compiled_state_graph.astream(
+                    input=self.create_state(
+                        chat_request=chat_request, headers=headers, messages=messages
+                    ),
+                    stream_mode="values",
+                ),
+                timeout_seconds=timeout_seconds,
+            ):
+                pass
+        except DeadlineExceededError:
+            logger.warning(f"Agent stopped after {timeout_seconds} seconds")
+            partial_messages: List[AnyMessage] = (
+                self.get_messages_from_state(state=state)
+                if state
+                else cast(List[AnyMessage], list(messages))
             )
+            return partial_messages + [
+                AIMessage(
+                    content=self.get_timeout_message(timeout_seconds=timeout_seconds)
+                )
+            ]
+        assert state is not None
+        return self.get_messages_from_state(state=state)
+
+    def get_messages_from_state(self, *, state: Dict[str, Any]) -> List[AnyMessage]:
+        """
+        Get the output messages from the state of the graph.  A structured response is added as
+        an AI message with the JSON as content and the name structured_response_message_name.
+
+        Args:
+            state: state of the graph
+
+        Returns:
+            The list of any messages.
+        """
+        out_messages: List[AnyMessage] = list(state["messages"])
+        structured_response: Dict[str, Any] | BaseModel | None = state.get(
+            "structured_response"
         )
-        out_messages: List[AnyMessage] = output["messages"]
+        if structured_response is not None:
+            out_messages.append(
+                AIMessage(
+                    content=(
+                        structured_response.model_dump_json()
+                        if isinstance(structured_response, BaseModel)
+                        else json.dumps(structured_response)
+                    ),
+                    name=self.structured_response_message_name,
+                )
+            )
         return out_messages
 
+    @staticmethod
+    def get_streaming_error_event(*, message: str) -> str:
+        """
+        Returns a server-sent event reporting an error in the same shape as the OpenAI API.
+
+        This is sent before the final [DONE] so that errors do not have to be appended to the
+        streamed content.
+
+        Args:
+            message: The error message.
+
+        Returns:
+            The server-sent event.
+        """
+        return f"data: {json.dumps({'error': {'message': message, 'type': 'server_error'}})}\n\n"
+
+    @staticmethod
+    def get_timeout_message(*, timeout_seconds: float) -> str:
+        """
+        Text added to the response when the agent is stopped at the request deadline
+
+        Args:
+            timeout_seconds: the wall clock limit that was reached
+
+        Returns:
+            status text
+        """
+        # marked so it is removed when the response is sent back as history
+        timeout_status: str = StatusMessageMarker.mark(
+            f"Stopped: the request took longer than {timeout_seconds} seconds"
+        )
+        return f"\n\n> {timeout_status}\n"
+
     # noinspection PyMethodMayBeStatic
     async def _stream_graph_with_messages_async(
         self,
@@ -601,6 +964,8 @@ class LangGraphToOpenAIConverter:
         headers: Dict[str, str],
         compiled_state_graph: CompiledStateGraph,
         system_messages: Iterable[ChatCompletionSystemMessageParam],
+        model_config: ChatModelConfig,
+        tools: Sequence[BaseTool],
     ) -> List[AnyMessage]:
         """
         Run the agent asynchronously.
@@ -610,6 +975,8 @@ class LangGraphToOpenAIConverter:
             headers: The request headers.
             compiled_state_graph: The compiled state graph.
             system_messages: The iterable of chat completion message parameters.
+            model_config: The model configuration.
+            tools: The tools bound to the model.
 
         Returns:
             The list of any messages.
@@ -628,7 +995,13 @@ class LangGraphToOpenAIConverter:
             chat_request=request,
             headers=headers,
             compiled_state_graph=compiled_state_graph,
-            messages=self.create_messages_for_graph(messages=messages),
+            timeout_seconds=model_config.request_timeout_seconds,
+            messages=self.create_messages_for_graph_within_budget(
+                request=request,
+                messages=messages,
+                model_config=model_config,
+                tools=tools,
+            ),
         )
 
     async def astream_events(
@@ -638,6 +1011,8 @@ class LangGraphToOpenAIConverter:
         headers: Dict[str, str],
         compiled_state_graph: CompiledStateGraph,
         messages: Iterable[ChatCompletionMessageParam],
+        model_config: ChatModelConfig,
+        tools: Sequence[BaseTool],
     ) -> AsyncGenerator[StandardStreamEvent | CustomStreamEvent, None]:
         """
         Stream events asynchronously.
@@ -647,6 +1022,8 @@ class LangGraphToOpenAIConverter:
             headers: The request headers.
             compiled_state_graph: The compiled state graph.
             messages: The iterable of chat completion message parameters.
+            model_config: The model configuration.
+            tools: The tools bound to the model.
 
         Yields:
             The standard or custom stream event.
@@ -656,11 +1033,68 @@ class LangGraphToOpenAIConverter:
             request=request,
             headers=headers,
             compiled_state_graph=compiled_state_graph,
-            messages=self.create_messages_for_graph(messages=messages),
+            messages=self.create_messages_for_graph_within_budget(
+                request=request,
+                messages=messages,
+                model_config=model_config,
+                tools=tools,
+            ),
         ):
             yield event
 
-    # noinspection PyMethodMayBeStatic
+    def create_messages_for_graph_within_budget(
+        self,
+        *,
+        request: ChatRequest,
+        messages: Iterable[ChatCompletionMessageParam],
+        model_config: ChatModelConfig,
+        tools: Sequence[BaseTool],
+    ) -> List[BaseMessage]:
+        """
+        Create messages for the graph, trim them to the context budget of the model and
+        add the prompt cache point if the model uses prompt caching.
+
+        Args:
+            request: The chat request.
+            messages: The iterable of chat completion message parameters.
+            model_config: The model configuration.
+            tools: The tools bound to the model.
+
+        Returns:
+            The list of messages to send to the graph.
+        """
+        converted_messages: ConvertedMessages = self.convert_messages_for_graph(
+            messages=messages,
+            model_name=request["model"],
+            status_messages_in_history=model_config.status_messages_in_history,
+        )
+        if model_config.context_budget is not None:
+            token_counter: TokenCounter = self.context_budget_manager.token_counter
+            converted_messages = self.message_conversion_cache.count_tokens(
+                converted_messages=converted_messages,
+                count=lambda m: token_counter.count_message(message=m),
+            )
+        messages_for_graph: List[BaseMessage] = (
+            self.context_budget_manager.apply_budget(
+                model_name=request["model"],
+                messages=converted_messages.messages,
+                tools=tools,
+                context_budget=model_config.context_budget,
+                message_token_counts=converted_messages.token_counts,
+            ).messages
+        )
+        if PromptCachingChatBedrockConverse.is_prompt_caching_enabled(
+            model_config=ModelFactory.get_model_config(chat_model_config=model_config),
+            system_prompts=model_config.system_prompts,
+        ):
+            messages_for_graph = (
+                PromptCachingChatBedrockConverse.add_system_prompt_cache_point(
+                    messages=messages_for_graph,
+                    system_prompts=model_config.system_prompts or [],
+                )
+            )
+        return messages_for_graph
+
     def create_messages_for_graph(
         self, *, messages: Iterable[ChatCompletionMessageParam]
     ) -> List[BaseMessage]:
@@ -671,56 +1105,103 @@ class LangGraphToOpenAIConverter:
             messages: The iterable of chat completion message parameters.
 
         Returns:
-            The list of role and incoming message type tuples.
+            The list of messages for the graph.
         """
-        chat_messages: List[tuple[ROLE_TYPES, INCOMING_MESSAGE_TYPES]] = cast(
-            List[tuple[ROLE_TYPES, INCOMING_MESSAGE_TYPES]],
-            [(m["role"], m["content"]) for m in messages],
+        return self.convert_messages_for_graph(
+            messages=messages, model_name="", status_messages_in_history="keep"
+        ).messages
+
+    def convert_messages_for_graph(
+        self,
+        *,
+        messages: Iterable[ChatCompletionMessageParam],
+        model_name: str,
+        status_messages_in_history: STATUS_MESSAGE_MODES,
+    ) -> ConvertedMessages:
+        """
+        Convert the messages for the graph.  Messages from a conversation prefix seen before are
+        taken from the message conversion cache.
+
+        Args:
+            messages: The iterable of chat completion message parameters.
+            model_name: The name of the model (used for metrics).
+            status_messages_in_history: What to do with status messages in assistant messages.
+
+        Returns:
+            The converted messages.
+        """
+        return self.message_conversion_cache.convert_messages(
+            messages=list(messages),
+            convert=functools.partial(
+                self.convert_message_for_graph,
+                model_name=model_name,
+                status_messages_in_history=status_messages_in_history,
+            ),
+            namespace=f"status_messages_in_history={status_messages_in_history}",
         )
 
-        messages_: List[BaseMessage] = []
-        for role, content in chat_messages:
-            match role:
-                case "system":
-                    messages_.append(
-                        SystemMessage(
-                            content=self.convert_incoming_message_content_to_string(
-                                content
-                            ),
-                            role="system",
-                        )
-                    )
-                case "user":
-                    messages_.append(
-                        HumanMessage(
-                            content=self.convert_incoming_message_content_to_string(
-                                content
-                            ),
-                            role="user",
-                        )
-                    )
-                case "assistant":
-                    messages_.append(
-                        AIMessage(
-                            content=self.convert_incoming_message_content_to_string(
-                                content
-                            ),
-                            role="assistant",
-                        )
+    def convert_message_for_graph(
+        self,
+        message: ChatCompletionMessageParam,
+        *,
+        model_name: str,
+        status_messages_in_history: STATUS_MESSAGE_MODES,
+    ) -> BaseMessage:
+        """
+        Convert an incoming message to a langchain message.
+
+        Args:
+            message: The chat completion message parameter.
+            model_name: The name of the model (used for metrics).
+            status_messages_in_history: What to do with status messages in assistant messages.
+
+        Returns:
+            The langchain message.
+        """
+        role: ROLE_TYPES = cast(ROLE_TYPES, message["role"])
+        content: INCOMING_MESSAGE_TYPES = cast(
+            INCOMING_MESSAGE_TYPES, message.get("content")
+        )
+        match role:
+            case "system":
+                return SystemMessage(
+                    content=self.convert_incoming_message_content_to_string(content),
+                    role="system",
+                )
+            case "user":
+                return HumanMessage(
+                    content=self.convert_incoming_message_content_to_string(content),
+                    role="user",
+                )
+            case "assistant":
+                text: str = self.convert_incoming_message_content_to_string(content)
+                new_text, status_messages = StatusMessageMarker.remove(
+                    text=text, mode=status_messages_in_history
+                )
+                if status_messages:
+                    token_counter: TokenCounter = (
+                        self.context_budget_manager.token_counter
                     )
-                case "tool":
-                    messages_.append(
-                        ToolMessage(
-                            content=self.convert_incoming_message_content_to_string(
-                                content
-                            ),
-                            role="tool",
+                    STATUS_MESSAGE_TOKENS_REMOVED.labels(
+                        model=model_name, mode=status_messages_in_history
+                    ).inc(
+                        max(
+                            token_counter.count_text(text=text)
+                            - token_counter.count_text(text=new_text),
+                            0,
                         )
                     )
-                case _:
-                    raise ValueError(f"Unexpected role: {role}")
-
-        return messages_
+                return AIMessage(
+                    content=new_text,
+                    role="assistant",
+                )
+            case "tool":
+                return ToolMessage(
+                    content=self.convert_incoming_message_content_to_string(content),
+                    role="tool",
+                )
+            case _:
+                raise ValueError(f"Unexpected role: {role}")
 
     async def run_graph_async(
         self,
@@ -754,7 +1235,11 @@ class LangGraphToOpenAIConverter:
 
     # noinspection PyMethodMayBeStatic
     async def create_graph_for_llm_async(
-        self, *, llm: BaseChatModel, tools: Sequence[BaseTool]
+        self,
+        *,
+        llm: BaseChatModel,
+        tools: Sequence[BaseTool],
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> CompiledStateGraph:
         """
         Create a graph for the language model asynchronously.
@@ -762,15 +1247,22 @@ class LangGraphToOpenAIConverter:
         Args:
             llm: The base chat model.
             tools: The sequence of tools.
+            response_format: JSON schema for a structured response from get_native_response_format()
 
         Returns:
             The compiled state graph.
         """
-        return await self._create_graph_for_llm_with_tools_async(llm=llm, tools=tools)
+        return await self._create_graph_for_llm_with_tools_async(
+            llm=llm, tools=tools, response_format=response_format
+        )
 
     # noinspection PyMethodMayBeStatic
     async def _create_graph_for_llm_with_tools_async(
-        self, *, llm: BaseChatModel, tools: Sequence[BaseTool]
+        self,
+        *,
+        llm: BaseChatModel,
+        tools: Sequence[BaseTool],
+        response_format: Optional[Dict[str, Any]] = None,
     ) -> CompiledStateGraph:
         """
         Create a graph for the language model asynchronously.
@@ -778,6 +1270,8 @@ class LangGraphToOpenAIConverter:
 
         :param llm: base chat model
         :param tools: list of tools
+        :param response_format: JSON schema for a structured response.  When set, the graph
+            asks the model for a response matching the schema after the agent is done.
         :return: compiled state graph
         """
         tool_node: ToolNode | None = None
@@ -787,7 +1281,12 @@ class LangGraphToOpenAIConverter:
         compiled_state_graph: CompiledGraph = create_react_agent(
             model=llm,
             tools=tool_node if tool_node is not None else [],
-            state_schema=MyMessagesState,
+            state_schema=(
+                MyMessagesStateWithStructuredResponse
+                if response_format is not None
+                else MyMessagesState
+            ),
+            response_format=response_format,
         )
         return cast(CompiledStateGraph, compiled_state_graph)
 
@@ -805,10 +1304,20 @@ class LangGraphToOpenAIConverter:
         Returns:
             The completion usage metadata.
         """
+        cached_tokens: int = sum(
+            (u.prompt_tokens_details.cached_tokens or 0)
+            for u in (original, new_one)
+            if u.prompt_tokens_details is not None
+        )
         return CompletionUsage(
             prompt_tokens=original.prompt_tokens + new_one.prompt_tokens,
             completion_tokens=original.completion_tokens + new_one.completion_tokens,
             total_tokens=original.total_tokens + new_one.total_tokens,
+            prompt_tokens_details=(
+                PromptTokensDetails(cached_tokens=cached_tokens)
+                if cached_tokens
+                else None
+            ),
         )
 
     @staticmethod
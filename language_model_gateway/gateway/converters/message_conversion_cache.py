@@ -0,0 +1,184 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage
+from openai.types.chat import ChatCompletionMessageParam
+
+from language_model_gateway.gateway.converters.converted_messages import (
+    ConvertedMessages,
+)
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    MESSAGE_CONVERSION_CACHE_LOOKUPS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class _MessageConversionCacheEntry:
+    message: BaseMessage
+    token_count: Optional[int] = None
+    cumulative_token_count: Optional[int] = None
+
+
+class MessageConversionCache:
+    """
+    LRU cache of converted messages keyed on a rolling hash of the conversation prefix.
+
+    Chat clients resend the whole conversation on every turn so the same prefix is converted
+    (and tokenized when a context budget is set) over and over.  Each entry is keyed on the hash
+    of all the messages up to and including it, so a message is only reused when everything
+    before it is identical too, and each turn only converts the newly appended messages.
+
+    This is shared across requests so register it as a singleton.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        """
+        Args:
+            max_entries: maximum number of messages to keep.  Least recently used messages are evicted first.
+        """
+        assert max_entries > 0
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, _MessageConversionCacheEntry] = OrderedDict()
+        # requests run on one event loop but tools can run in threads so guard the OrderedDict
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_prefix_keys(
+        *, messages: Sequence[ChatCompletionMessageParam], namespace: str = ""
+    ) -> List[str]:
+        """
+        Compute the rolling hash of the conversation up to and including each message
+
+        Args:
+            messages: incoming messages
+            namespace: included in the hash so conversions with different options do not share entries
+
+        Returns:
+            list of keys, one per message
+        """
+        keys: List[str] = []
+        previous_key: str = namespace
+        for message in messages:
+            message_hash = hashlib.sha256(previous_key.encode("utf-8"))
+            message_hash.update(
+                json.dumps(
+                    [message["role"], message.get("content")],
+                    sort_keys=True,
+                    default=str,
+                ).encode("utf-8")
+            )
+            previous_key = message_hash.hexdigest()
+            keys.append(previous_key)
+        return keys
+
+    def convert_messages(
+        self,
+        *,
+        messages: Sequence[ChatCompletionMessageParam],
+        convert: Callable[[ChatCompletionMessageParam], BaseMessage],
+        namespace: str = "",
+    ) -> ConvertedMessages:
+        """
+        Convert the messages, reusing the conversions of the longest cached prefix
+
+        Args:
+            messages: incoming messages
+            convert: function to convert a message that is not in the cache
+            namespace: included in the cache key so conversions with different options do not share entries
+
+        Returns:
+            converted messages
+        """
+        prefix_keys: List[str] = self.get_prefix_keys(
+            messages=messages, namespace=namespace
+        )
+        converted: List[BaseMessage] = []
+        cached_message_count: int = 0
+        for message, key in zip(messages, prefix_keys):
+            entry: Optional[_MessageConversionCacheEntry] = self._get(key)
+            if entry is None:
+                entry = _MessageConversionCacheEntry(message=convert(message))
+                self._set(key, entry)
+            else:
+                cached_message_count += 1
+            # copy since langgraph sets the id on the messages it receives
+            converted.append(entry.message.model_copy())
+
+        MESSAGE_CONVERSION_CACHE_LOOKUPS.labels(result="hit").inc(cached_message_count)
+        MESSAGE_CONVERSION_CACHE_LOOKUPS.labels(result="miss").inc(
+            len(messages) - cached_message_count
+        )
+        logger.debug(
+            f"Converted {len(messages)} messages, {cached_message_count} from cache"
+        )
+        return ConvertedMessages(
+            messages=converted,
+            prefix_keys=prefix_keys,
+            cached_message_count=cached_message_count,
+        )
+
+    def count_tokens(
+        self,
+        *,
+        converted_messages: ConvertedMessages,
+        count: Callable[[BaseMessage], int],
+    ) -> ConvertedMessages:
+        """
+        Set the token counts on the converted messages, counting only messages whose count is not cached
+
+        Args:
+            converted_messages: result of convert_messages
+            count: function to count the tokens of a message
+
+        Returns:
+            the converted messages with token_counts and cumulative_token_counts set
+        """
+        token_counts: List[int] = []
+        cumulative_token_counts: List[int] = []
+        cumulative_token_count: int = 0
+        for message, key in zip(
+            converted_messages.messages, converted_messages.prefix_keys
+        ):
+            entry: Optional[_MessageConversionCacheEntry] = self._get(key)
+            if entry is None:
+                # evicted since convert_messages was called
+                entry = _MessageConversionCacheEntry(message=message)
+                self._set(key, entry)
+            if entry.token_count is None:
+                entry.token_count = count(message)
+            cumulative_token_count += entry.token_count
+            entry.cumulative_token_count = cumulative_token_count
+            token_counts.append(entry.token_count)
+            cumulative_token_counts.append(cumulative_token_count)
+
+        converted_messages.token_counts = token_counts
+        converted_messages.cumulative_token_counts = cumulative_token_counts
+        return converted_messages
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str) -> Optional[_MessageConversionCacheEntry]:
+        with self._lock:
+            entry: Optional[_MessageConversionCacheEntry] = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: _MessageConversionCacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
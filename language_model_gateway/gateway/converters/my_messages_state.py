@@ -1,9 +1,13 @@
 from typing import Optional
 
 from langchain_core.messages.ai import UsageMetadata
-from langgraph.prebuilt.chat_agent_executor import AgentState
+from langgraph.prebuilt.chat_agent_executor import AgentState, StructuredResponse
 
 
 class MyMessagesState(AgentState):
     usage_metadata: Optional[UsageMetadata]
     auth_token: Optional[str]
+
+
+class MyMessagesStateWithStructuredResponse(MyMessagesState):
+    structured_response: StructuredResponse
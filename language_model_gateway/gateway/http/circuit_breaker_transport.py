@@ -0,0 +1,72 @@
+import asyncio
+import time
+from typing import Optional
+
+import httpx
+
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker import (
+    CircuitBreaker,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
+
+
+class CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that passes requests through the circuit breaker of their host.
+
+    Connection errors, timeouts and 5xx responses count as failures and the time to the response
+    headers is the latency.  Set count_slow_calls to False for upstreams like LLM agents where
+    the time to the headers of a non-streaming response is the whole generation.  When the breaker is open the request fails immediately with a
+    ConnectError instead of waiting out the timeout, so existing error handling and upstream
+    failover treat it like an unreachable host.
+    """
+
+    def __init__(
+        self,
+        *,
+        circuit_breaker_registry: CircuitBreakerRegistry,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        count_slow_calls: bool = True,
+    ) -> None:
+        self.circuit_breaker_registry: CircuitBreakerRegistry = circuit_breaker_registry
+        assert self.circuit_breaker_registry is not None
+        assert isinstance(self.circuit_breaker_registry, CircuitBreakerRegistry)
+        self.transport: httpx.AsyncBaseTransport = (
+            transport or httpx.AsyncHTTPTransport()
+        )
+        self.count_slow_calls: bool = count_slow_calls
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        circuit_breaker: CircuitBreaker = self.circuit_breaker_registry.get(
+            name=self.circuit_breaker_registry.get_name_for_url(str(request.url))
+        )
+        if not circuit_breaker.allow_request():
+            raise httpx.ConnectError(
+                f"{circuit_breaker.name} is temporarily unavailable (circuit breaker is open)",
+                request=request,
+            )
+        start_time: float = time.monotonic()
+        try:
+            response: httpx.Response = await self.transport.handle_async_request(
+                request
+            )
+        except asyncio.CancelledError:
+            circuit_breaker.release()
+            raise
+        except Exception:
+            circuit_breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success(
+                latency_seconds=time.monotonic() - start_time
+                if self.count_slow_calls
+                else None
+            )
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from language_model_gateway.gateway.http.http_cache_entry import HttpCacheEntry
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    HTTP_CACHE_EVICTIONS,
+    HTTP_CACHE_SIZE_BYTES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpCache:
+    """
+    Persistent store of responses with an ETag or Last-Modified header for conditional requests.
+
+    Entries are kept in a SQLite database so they survive restarts and are shared by the workers
+    on the host.  When the bodies add up to more than max_size_bytes the least recently used
+    entries are evicted.  Bodies larger than max_entry_bytes are not stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        database_path: str,
+        max_size_bytes: int = 100 * 1024 * 1024,
+        max_entry_bytes: int = 5 * 1024 * 1024,
+    ) -> None:
+        self.database_path: str = database_path
+        self.max_size_bytes: int = max_size_bytes
+        self.max_entry_bytes: int = max_entry_bytes
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # connections cannot be shared with forked worker processes
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection: sqlite3.Connection = sqlite3.connect(
+                self.database_path,
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS http_cache ("
+                " key TEXT PRIMARY KEY,"
+                " url TEXT NOT NULL,"
+                " status_code INTEGER NOT NULL,"
+                " headers TEXT NOT NULL,"
+                " content BLOB NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " size INTEGER NOT NULL,"
+                " last_used_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS http_cache_last_used_at"
+                " ON http_cache (last_used_at)"
+            )
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def get_key(
+        *, url: str, accept: Optional[str], authorization: Optional[str]
+    ) -> str:
+        """
+        Get the cache key of a request.  GitHub varies responses by Accept and Authorization so
+        both are part of the key.  The authorization is hashed so tokens are not stored.
+
+        Args:
+            url: request url
+            accept: Accept header
+            authorization: Authorization header
+
+        Returns:
+            cache key
+        """
+        return hashlib.sha256(
+            json.dumps([url, accept, authorization]).encode()
+        ).hexdigest()
+
+    def get(self, *, key: str) -> Optional[HttpCacheEntry]:
+        """
+        Get an entry and mark it as recently used
+
+        Args:
+            key: cache key
+
+        Returns:
+            the entry or None
+        """
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            row: Optional[Tuple[int, str, bytes, Optional[str], Optional[str]]] = (
+                connection.execute(
+                    "SELECT status_code, headers, content, etag, last_modified"
+                    " FROM http_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            )
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE http_cache SET last_used_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return HttpCacheEntry(
+            status_code=row[0],
+            headers=[(name, value) for name, value in json.loads(row[1])],
+            content=row[2],
+            etag=row[3],
+            last_modified=row[4],
+        )
+
+    def set(self, *, key: str, url: str, entry: HttpCacheEntry) -> bool:
+        """
+        Store an entry and evict the least recently used entries if the cache is full
+
+        Args:
+            key: cache key
+            url: request url (for troubleshooting)
+            entry: entry to store
+
+        Returns:
+            False if the body is too large to store
+        """
+        size: int = len(entry.content)
+        if size > self.max_entry_bytes:
+            return False
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO http_cache"
+                    " (key, url, status_code, headers, content, etag, last_modified, size, last_used_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        url,
+                        entry.status_code,
+                        json.dumps(entry.headers),
+                        entry.content,
+                        entry.etag,
+                        entry.last_modified,
+                        size,
+                        time.time(),
+                    ),
+                )
+                total_size: int = connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM http_cache"
+                ).fetchone()[0]
+                evicted: int = 0
+                while total_size > self.max_size_bytes:
+                    oldest: Optional[Tuple[str, int]] = connection.execute(
+                        "SELECT key, size FROM http_cache ORDER BY last_used_at LIMIT 1"
+                    ).fetchone()
+                    if oldest is None:
+                        break
+                    connection.execute(
+                        "DELETE FROM http_cache WHERE key = ?", (oldest[0],)
+                    )
+                    total_size -= oldest[1]
+                    evicted += 1
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        if evicted:
+            HTTP_CACHE_EVICTIONS.inc(evicted)
+        HTTP_CACHE_SIZE_BYTES.set(total_size)
+        return True
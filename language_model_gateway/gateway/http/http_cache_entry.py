@@ -0,0 +1,12 @@
+import dataclasses
+from typing import List, Optional, Tuple
+
+
+@dataclasses.dataclass
+class HttpCacheEntry:
+    status_code: int
+    headers: List[Tuple[str, str]]
+    # decoded body
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
@@ -0,0 +1,115 @@
+import asyncio
+from typing import List, Optional, Tuple
+
+import httpx
+
+from language_model_gateway.gateway.http.http_cache import HttpCache
+from language_model_gateway.gateway.http.http_cache_entry import HttpCacheEntry
+from language_model_gateway.gateway.metrics.gateway_metrics import HTTP_CACHE_REQUESTS
+
+
+class HttpCacheTransport(httpx.AsyncBaseTransport):
+    """
+    httpx transport that turns GET requests into conditional requests.
+
+    Responses with an ETag or Last-Modified header are stored in the HttpCache.  The next request
+    for the same url sends If-None-Match / If-Modified-Since and a 304 response is answered with
+    the stored body, so callers always see a normal 200 response.  GitHub does not count 304
+    responses against the rate limit.  The headers of the 304 response (e.g. the rate limit
+    headers) replace the stored ones.
+    """
+
+    # headers that describe the encoded body on the wire and not the stored decoded body
+    body_headers = {"content-encoding", "content-length", "transfer-encoding"}
+
+    def __init__(
+        self,
+        *,
+        http_cache: HttpCache,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self.http_cache: HttpCache = http_cache
+        assert self.http_cache is not None
+        assert isinstance(self.http_cache, HttpCache)
+        self.transport: httpx.AsyncBaseTransport = (
+            transport or httpx.AsyncHTTPTransport()
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # leave requests that are already conditional to the caller
+        if (
+            request.method != "GET"
+            or "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+        ):
+            return await self.transport.handle_async_request(request)
+
+        host: str = request.url.host
+        key: str = HttpCache.get_key(
+            url=str(request.url),
+            accept=request.headers.get("Accept"),
+            authorization=request.headers.get("Authorization"),
+        )
+        entry: Optional[HttpCacheEntry] = await asyncio.to_thread(
+            self.http_cache.get, key=key
+        )
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+
+        response: httpx.Response = await self.transport.handle_async_request(request)
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            HTTP_CACHE_REQUESTS.labels(host=host, result="not_modified").inc()
+            headers: httpx.Headers = httpx.Headers(entry.headers)
+            for name, value in response.headers.items():
+                if name.lower() not in self.body_headers:
+                    headers[name] = value
+            return httpx.Response(
+                status_code=entry.status_code,
+                headers=headers,
+                content=entry.content,
+                request=request,
+                extensions=response.extensions,
+            )
+
+        etag: Optional[str] = response.headers.get("ETag")
+        last_modified: Optional[str] = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            HTTP_CACHE_REQUESTS.labels(host=host, result="uncacheable").inc()
+            return response
+
+        content: bytes = await response.aread()
+        stored_headers: List[Tuple[str, str]] = [
+            (name, value)
+            for name, value in response.headers.multi_items()
+            if name.lower() not in self.body_headers
+        ]
+        stored: bool = await asyncio.to_thread(
+            self.http_cache.set,
+            key=key,
+            url=str(request.url),
+            entry=HttpCacheEntry(
+                status_code=response.status_code,
+                headers=stored_headers,
+                content=content,
+                etag=etag,
+                last_modified=last_modified,
+            ),
+        )
+        HTTP_CACHE_REQUESTS.labels(
+            host=host, result="miss" if stored else "too_large"
+        ).inc()
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=stored_headers,
+            content=content,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
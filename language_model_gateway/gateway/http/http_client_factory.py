@@ -3,8 +3,30 @@ from typing import AsyncGenerator, Dict, Optional
 
 import httpx
 
+from language_model_gateway.gateway.http.circuit_breaker_transport import (
+    CircuitBreakerTransport,
+)
+from language_model_gateway.gateway.http.http_cache import HttpCache
+from language_model_gateway.gateway.http.http_cache_transport import (
+    HttpCacheTransport,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
+
 
 class HttpClientFactory:
+    def __init__(
+        self, *, circuit_breaker_registry: Optional[CircuitBreakerRegistry] = None
+    ) -> None:
+        """
+        Args:
+            circuit_breaker_registry: if set, requests go through the circuit breaker of their host
+        """
+        self.circuit_breaker_registry: Optional[CircuitBreakerRegistry] = (
+            circuit_breaker_registry
+        )
+
     @asynccontextmanager
     async def create_http_client(
         self,
@@ -12,8 +34,33 @@ class HttpClientFactory:
         base_url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = 5.0,
+        http_cache: Optional[HttpCache] = None,
+        count_slow_calls: bool = True,
     ) -> AsyncGenerator[httpx.AsyncClient, None]:
+        """
+        Args:
+            base_url: base url of the requests
+            headers: headers sent with every request
+            timeout: timeout in seconds
+            http_cache: if set, GET requests are sent as conditional requests and 304 responses are
+                served from the cache
+            count_slow_calls: whether slow responses count against the circuit breaker of the host.
+                Turn this off for upstreams whose response time depends on the work requested.
+        """
+        transport: Optional[httpx.AsyncBaseTransport] = (
+            CircuitBreakerTransport(
+                circuit_breaker_registry=self.circuit_breaker_registry,
+                count_slow_calls=count_slow_calls,
+            )
+            if self.circuit_breaker_registry is not None
+            else None
+        )
+        if http_cache is not None:
+            transport = HttpCacheTransport(http_cache=http_cache, transport=transport)
         async with httpx.AsyncClient(
-            base_url=base_url, headers=headers, timeout=timeout
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            transport=transport,
         ) as client:
             yield client
@@ -0,0 +1,199 @@
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from language_model_gateway.gateway.http.upstream_state import UpstreamState
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    UPSTREAM_HEALTHY,
+    UPSTREAM_LATENCY_SECONDS,
+    UPSTREAM_OUTSTANDING_REQUESTS,
+    UPSTREAM_REQUESTS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamPool:
+    """
+    Tracks the upstream URLs of OpenAI-type agents and picks the one to send each request to.
+
+    Upstreams are scored by their EWMA latency times (outstanding requests + 1) and the lowest
+    score wins, so a slow upstream or one with a queue gets fewer requests.  Upstreams that have
+    not been used yet are scored with the average latency of the others and win ties so they are
+    tried.  Health checks are passive: an upstream that
+    fails max_consecutive_failures times in a row is skipped for unhealthy_seconds.
+
+    One instance is shared by all requests so it is registered as a singleton.
+    """
+
+    def __init__(
+        self,
+        *,
+        ewma_alpha: float = 0.3,
+        max_consecutive_failures: int = 3,
+        unhealthy_seconds: float = 30.0,
+    ) -> None:
+        self.ewma_alpha: float = ewma_alpha
+        self.max_consecutive_failures: int = max_consecutive_failures
+        self.unhealthy_seconds: float = unhealthy_seconds
+        self._upstreams: Dict[str, UpstreamState] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_state(self, url: str) -> UpstreamState:
+        state: Optional[UpstreamState] = self._upstreams.get(url)
+        if state is None:
+            state = UpstreamState(url=url)
+            self._upstreams[url] = state
+        return state
+
+    def get_state(self, *, url: str) -> UpstreamState:
+        """
+        Get the current state of an upstream
+
+        Args:
+            url: upstream URL
+
+        Returns:
+            copy of the state
+        """
+        with self._lock:
+            state: UpstreamState = self._get_state(url)
+            return UpstreamState(**state.__dict__)
+
+    def is_healthy(self, *, url: str) -> bool:
+        """
+        Whether the upstream is not being skipped after repeated failures
+
+        Args:
+            url: upstream URL
+
+        Returns:
+            True if healthy
+        """
+        with self._lock:
+            return self._get_state(url).unhealthy_until <= time.monotonic()
+
+    def choose(self, *, urls: Sequence[str], exclude: Sequence[str] = ()) -> str:
+        """
+        Choose the upstream for the next request
+
+        Args:
+            urls: upstream URLs configured for the model
+            exclude: upstreams already tried for this request
+
+        Returns:
+            upstream URL.  If every upstream is unhealthy or excluded, the best of the rest is used
+            so a request is never refused.
+        """
+        assert urls, "At least one upstream url is required"
+        now: float = time.monotonic()
+        with self._lock:
+            candidates: List[UpstreamState] = [
+                self._get_state(url) for url in urls if url not in exclude
+            ] or [self._get_state(url) for url in urls]
+            healthy: List[UpstreamState] = [
+                s for s in candidates if s.unhealthy_until <= now
+            ]
+            scored: List[UpstreamState] = healthy or candidates
+
+            # upstreams without a recorded success are assumed to be as fast as the average so
+            # their outstanding requests still count.  A hung upstream never records a latency
+            # and would otherwise get every request.
+            known_latencies: List[float] = [
+                s.ewma_latency_seconds
+                for s in scored
+                if s.ewma_latency_seconds is not None
+            ]
+            prior_latency_seconds: float = (
+                sum(known_latencies) / len(known_latencies) if known_latencies else 1.0
+            )
+
+            def score(state: UpstreamState) -> float:
+                latency_seconds: float = (
+                    state.ewma_latency_seconds
+                    if state.ewma_latency_seconds is not None
+                    else prior_latency_seconds
+                )
+                return latency_seconds * (state.outstanding_requests + 1)
+
+            best_score: float = min(score(s) for s in scored)
+            best: List[UpstreamState] = [s for s in scored if score(s) == best_score]
+            # on a tie an upstream that has not been used yet is tried
+            return random.choice(
+                [s for s in best if s.ewma_latency_seconds is None] or best
+            ).url
+
+    def start(self, *, url: str) -> None:
+        """
+        Record that a request was sent to the upstream
+
+        Args:
+            url: upstream URL
+        """
+        with self._lock:
+            state: UpstreamState = self._get_state(url)
+            state.outstanding_requests += 1
+            UPSTREAM_OUTSTANDING_REQUESTS.labels(upstream=url).set(
+                state.outstanding_requests
+            )
+
+    def finish(self, *, url: str) -> None:
+        """
+        Record that a request to the upstream is done.  Call once for each start().
+
+        Args:
+            url: upstream URL
+        """
+        with self._lock:
+            state: UpstreamState = self._get_state(url)
+            state.outstanding_requests = max(state.outstanding_requests - 1, 0)
+            UPSTREAM_OUTSTANDING_REQUESTS.labels(upstream=url).set(
+                state.outstanding_requests
+            )
+
+    def record_success(self, *, url: str, latency_seconds: float) -> None:
+        """
+        Record a successful response
+
+        Args:
+            url: upstream URL
+            latency_seconds: time to the response (time to first byte for streaming requests)
+        """
+        with self._lock:
+            state: UpstreamState = self._get_state(url)
+            state.ewma_latency_seconds = (
+                latency_seconds
+                if state.ewma_latency_seconds is None
+                else self.ewma_alpha * latency_seconds
+                + (1 - self.ewma_alpha) * state.ewma_latency_seconds
+            )
+            state.consecutive_failures = 0
+            state.unhealthy_until = 0.0
+        UPSTREAM_REQUESTS.labels(upstream=url, result="success").inc()
+        UPSTREAM_LATENCY_SECONDS.labels(upstream=url).observe(latency_seconds)
+        UPSTREAM_HEALTHY.labels(upstream=url).set(1)
+
+    def record_failure(self, *, url: str) -> None:
+        """
+        Record a failed request (connection error, timeout or 5xx response)
+
+        Args:
+            url: upstream URL
+        """
+        with self._lock:
+            state: UpstreamState = self._get_state(url)
+            state.consecutive_failures += 1
+            unhealthy: bool = (
+                state.consecutive_failures >= self.max_consecutive_failures
+            )
+            if unhealthy:
+                state.unhealthy_until = time.monotonic() + self.unhealthy_seconds
+        UPSTREAM_REQUESTS.labels(upstream=url, result="failure").inc()
+        if unhealthy:
+            logger.warning(
+                f"Upstream {url} failed {state.consecutive_failures} times in a row"
+                f" so skipping it for {self.unhealthy_seconds} seconds"
+            )
+            UPSTREAM_HEALTHY.labels(upstream=url).set(0)
@@ -0,0 +1,13 @@
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass
+class UpstreamState:
+    url: str
+    # exponentially weighted moving average of the latency.  None until the first success.
+    ewma_latency_seconds: Optional[float] = None
+    outstanding_requests: int = 0
+    consecutive_failures: int = 0
+    # time.monotonic() until which the upstream is skipped after repeated failures
+    unhealthy_until: float = 0.0
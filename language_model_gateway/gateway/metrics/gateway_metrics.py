@@ -0,0 +1,217 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Prometheus metrics for the gateway.  These are exposed on /metrics together with the
+# http metrics from prometheus-fastapi-instrumentator.  Metrics are module level so
+# they are registered once per process.
+
+CONTEXT_BUDGET_INPUT_TOKENS = Histogram(
+    "language_model_gateway_context_budget_input_tokens",
+    "Input tokens (messages and tool definitions) sent to the model after the context budget was applied",
+    ["model"],
+    buckets=(500, 1_000, 2_000, 4_000, 8_000, 16_000, 32_000, 64_000, 128_000, 200_000),
+)
+
+CONTEXT_BUDGET_TOKENS_SAVED = Counter(
+    "language_model_gateway_context_budget_tokens_saved",
+    "Input tokens removed from requests by the context budget",
+    ["model", "strategy"],
+)
+
+MESSAGE_CONVERSION_CACHE_LOOKUPS = Counter(
+    "language_model_gateway_message_conversion_cache_lookups",
+    "Incoming messages looked up in the message conversion cache",
+    ["result"],
+)
+
+TOOL_SELECTION_TOKENS_SAVED = Counter(
+    "language_model_gateway_tool_selection_tokens_saved",
+    "Tool definition tokens removed from each model call by tool selection",
+    ["model"],
+)
+
+MODEL_ROUTING_DECISIONS = Counter(
+    "language_model_gateway_model_routing_decisions",
+    "Requests routed to the fast or strong model and the reason",
+    ["model", "route", "reason"],
+)
+
+MODEL_ROUTE_LATENCY_SECONDS = Histogram(
+    "language_model_gateway_model_route_latency_seconds",
+    "Time to complete a routed request (to the end of the stream for streaming requests)",
+    ["model", "route"],
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300),
+)
+
+MODEL_ROUTE_TOKENS = Counter(
+    "language_model_gateway_model_route_tokens",
+    "Tokens used by routed non-streaming requests",
+    ["model", "route", "type"],
+)
+
+MODEL_ROUTING_ESCALATIONS = Counter(
+    "language_model_gateway_model_routing_escalations",
+    "Requests retried on the strong model because the fast model's response did not match the schema",
+    ["model"],
+)
+
+STATUS_MESSAGE_TOKENS_REMOVED = Counter(
+    "language_model_gateway_status_message_tokens_removed",
+    "Tokens of gateway status messages removed from incoming assistant history.  Counted once per distinct message since converted messages are cached",
+    ["model", "mode"],
+)
+
+UPSTREAM_REQUESTS = Counter(
+    "language_model_gateway_upstream_requests",
+    "Requests sent to openai agent upstreams and whether they succeeded",
+    ["upstream", "result"],
+)
+
+UPSTREAM_LATENCY_SECONDS = Histogram(
+    "language_model_gateway_upstream_latency_seconds",
+    "Time to the response of an openai agent upstream (to the first event for streaming requests)",
+    ["upstream"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+
+UPSTREAM_OUTSTANDING_REQUESTS = Gauge(
+    "language_model_gateway_upstream_outstanding_requests",
+    "Requests in flight to each openai agent upstream",
+    ["upstream"],
+)
+
+UPSTREAM_HEALTHY = Gauge(
+    "language_model_gateway_upstream_healthy",
+    "1 if the openai agent upstream is used, 0 if it is skipped after repeated failures",
+    ["upstream"],
+)
+
+HEDGING_REQUESTS = Counter(
+    "language_model_gateway_hedging_requests",
+    "Requests for models with hedging and whether a duplicate request was sent",
+    ["model", "result"],
+)
+
+HEDGING_WINS = Counter(
+    "language_model_gateway_hedging_wins",
+    "Hedged requests by whether the original or the duplicate request responded first",
+    ["model", "winner"],
+)
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "language_model_gateway_circuit_breaker_state",
+    "State of the circuit breaker for each dependency: 0 closed, 1 half open, 2 open",
+    ["dependency"],
+)
+
+CIRCUIT_BREAKER_CALLS = Counter(
+    "language_model_gateway_circuit_breaker_calls",
+    "Calls to dependencies by result: success, slow, failure or rejected by an open circuit breaker",
+    ["dependency", "result"],
+)
+
+BEDROCK_REGION_REQUESTS = Counter(
+    "language_model_gateway_bedrock_region_requests",
+    "Bedrock requests by region and result: success, throttled or failure",
+    ["model", "region", "result"],
+)
+
+BEDROCK_REGION_LATENCY_SECONDS = Histogram(
+    "language_model_gateway_bedrock_region_latency_seconds",
+    "Time to the response of a bedrock region (to the first event for streaming requests)",
+    ["model", "region"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+)
+
+BEDROCK_REGION_FAILOVERS = Counter(
+    "language_model_gateway_bedrock_region_failovers",
+    "Bedrock requests retried in another region before any output was sent",
+    ["model", "region"],
+)
+
+BEDROCK_RATE_LIMIT = Gauge(
+    "language_model_gateway_bedrock_rate_limit",
+    "Requests per second learned by the adaptive rate limiter of a bedrock model and region",
+    ["model", "region"],
+)
+
+BEDROCK_RATE_LIMITER_WAIT_SECONDS = Histogram(
+    "language_model_gateway_bedrock_rate_limiter_wait_seconds",
+    "Time bedrock requests waited for the adaptive rate limiter",
+    ["model", "region"],
+    buckets=(0, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
+)
+
+HTTP_CACHE_REQUESTS = Counter(
+    "language_model_gateway_http_cache_requests",
+    "GET requests through the conditional request cache by host and result: not_modified (served from the cache), miss, too_large or uncacheable",
+    ["host", "result"],
+)
+
+HTTP_CACHE_EVICTIONS = Counter(
+    "language_model_gateway_http_cache_evictions",
+    "Entries evicted from the conditional request cache to stay within its size",
+)
+
+HTTP_CACHE_SIZE_BYTES = Gauge(
+    "language_model_gateway_http_cache_size_bytes",
+    "Size of the bodies in the conditional request cache",
+)
+
+GITHUB_DIFF_CACHE_LOOKUPS = Counter(
+    "language_model_gateway_github_diff_cache_lookups",
+    "Pull request diffs looked up in the diff cache",
+    ["result"],
+)
+
+CONFLUENCE_PAGE_CACHE_LOOKUPS = Counter(
+    "language_model_gateway_confluence_page_cache_lookups",
+    "Confluence pages looked up in the page cache",
+    ["result"],
+)
+
+PASSAGE_EXTRACTION_TOKENS_SAVED = Counter(
+    "language_model_gateway_passage_extraction_tokens_saved",
+    "Tool output tokens removed by returning only the passages relevant to the query",
+    ["tool"],
+)
+
+PASSAGE_EXTRACTION_COMPRESSION_RATIO = Histogram(
+    "language_model_gateway_passage_extraction_compression_ratio",
+    "Tokens of the document divided by the tokens of the passages returned",
+    ["tool"],
+    buckets=(1, 2, 5, 10, 20, 50, 100),
+)
+
+CONFLUENCE_INDEX_PAGES = Gauge(
+    "language_model_gateway_confluence_index_pages",
+    "Pages in the local Confluence search index",
+)
+
+CONFLUENCE_INDEX_SIZE_BYTES = Gauge(
+    "language_model_gateway_confluence_index_size_bytes",
+    "Size of the local Confluence search index database",
+)
+
+CONFLUENCE_INDEX_LAST_SYNC_TIMESTAMP_SECONDS = Gauge(
+    "language_model_gateway_confluence_index_last_sync_timestamp_seconds",
+    "Time of the last successful sync of each Confluence space into the local search index",
+    ["space"],
+)
+
+CONFLUENCE_INDEX_SEARCHES = Counter(
+    "language_model_gateway_confluence_index_searches",
+    "Confluence searches answered by the local index (hit) or the live search (miss)",
+    ["result"],
+)
+
+WEB_SEARCH_ENGINE_REQUESTS = Counter(
+    "language_model_gateway_web_search_engine_requests",
+    "Searches sent to each web search engine by result: success, failure or timeout",
+    ["engine", "result"],
+)
+
+WEB_SEARCH_CACHE_LOOKUPS = Counter(
+    "language_model_gateway_web_search_cache_lookups",
+    "Web search cache lookups by result (hit or miss)",
+    ["result"],
+)
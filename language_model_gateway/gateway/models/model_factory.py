@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 
 from langchain_aws import ChatBedrockConverse
 from langchain_core.language_models import BaseChatModel
@@ -11,15 +11,67 @@ from language_model_gateway.configs.config_schema import (
     ModelParameterConfig,
     ChatModelConfig,
 )
+from language_model_gateway.gateway.aws.bedrock_rate_limiter import (
+    BedrockRateLimiter,
+)
+from language_model_gateway.gateway.aws.bedrock_region_router import (
+    BedrockRegionRouter,
+)
+from language_model_gateway.gateway.aws.region_routing_bedrock_client import (
+    RegionRoutingBedrockClient,
+)
+from language_model_gateway.gateway.models.model_request_parameters import (
+    ModelRequestParameters,
+)
+from language_model_gateway.gateway.models.prompt_caching_chat_bedrock_converse import (
+    PromptCachingChatBedrockConverse,
+)
+from language_model_gateway.gateway.models.rate_limited_chat_bedrock_converse import (
+    RateLimitedChatBedrockConverse,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_callback_handler import (
+    CircuitBreakerCallbackHandler,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ModelFactory:
-    # noinspection PyMethodMayBeStatic
-    def get_model(self, chat_model_config: ChatModelConfig) -> BaseChatModel:
-        assert chat_model_config is not None
-        assert isinstance(chat_model_config, ChatModelConfig)
+    def __init__(
+        self,
+        *,
+        circuit_breaker_registry: Optional[CircuitBreakerRegistry] = None,
+        bedrock_region_router: Optional[BedrockRegionRouter] = None,
+        bedrock_rate_limiter: Optional[BedrockRateLimiter] = None,
+    ) -> None:
+        """
+        Args:
+            circuit_breaker_registry: if set, model calls go through the circuit breaker of the model
+            bedrock_region_router: if set, bedrock calls go through it and are routed across the regions of the model
+            bedrock_rate_limiter: if set (with bedrock_region_router), bedrock calls are paced per model and region
+        """
+        self.circuit_breaker_registry: Optional[CircuitBreakerRegistry] = (
+            circuit_breaker_registry
+        )
+        self.bedrock_region_router: Optional[BedrockRegionRouter] = (
+            bedrock_region_router
+        )
+        self.bedrock_rate_limiter: Optional[BedrockRateLimiter] = bedrock_rate_limiter
+
+    @staticmethod
+    def get_model_config(*, chat_model_config: ChatModelConfig) -> ModelConfig:
+        """
+        Returns the model configuration, falling back to the default model if none is configured
+
+        Args:
+            chat_model_config: chat model configuration
+
+        Returns:
+            model configuration
+        """
         model_config: ModelConfig | None = chat_model_config.model
         if model_config is None:
             # if no model configuration is provided, use the default model
@@ -32,6 +84,29 @@ class ModelFactory:
             model_config = ModelConfig(
                 provider=default_model_provider, model=default_model_name
             )
+        return model_config
+
+    # noinspection PyMethodMayBeStatic
+    def get_model(
+        self,
+        chat_model_config: ChatModelConfig,
+        request_parameters: Optional[ModelRequestParameters] = None,
+    ) -> BaseChatModel:
+        """
+        Create the chat model
+
+        Args:
+            chat_model_config: model configuration
+            request_parameters: generation parameters from the request.  These override the model parameters in the configuration.
+
+        Returns:
+            chat model
+        """
+        assert chat_model_config is not None
+        assert isinstance(chat_model_config, ChatModelConfig)
+        model_config: ModelConfig = self.get_model_config(
+            chat_model_config=chat_model_config
+        )
 
         model_vendor: str = model_config.provider
         model_name: str = model_config.model
@@ -47,18 +122,53 @@ class ModelFactory:
             for model_parameter in model_parameters:
                 model_parameters_dict[model_parameter.key] = model_parameter.value
 
+        if request_parameters is not None:
+            model_parameters_dict.update(request_parameters.to_model_parameters())
+
         logger.debug(f"Creating ChatModel with parameters: {model_parameters_dict}")
         model_parameters_dict["model"] = model_name
+        if self.circuit_breaker_registry is not None:
+            # one breaker per model so a throttled model does not block the other models of the vendor
+            model_parameters_dict["callbacks"] = [
+                CircuitBreakerCallbackHandler(
+                    circuit_breaker=self.circuit_breaker_registry.get(
+                        name=f"{model_vendor}:{model_name}"
+                    )
+                )
+            ]
         # model_parameters_dict["streaming"] = True
         llm: BaseChatModel
         if model_vendor == "openai":
             llm = ChatOpenAI(**model_parameters_dict)
         elif model_config.provider == "bedrock":
-            llm = ChatBedrockConverse(
-                client=None,
+            # use prompt caching if the model supports it and the config asks for it
+            bedrock_model_class: type[ChatBedrockConverse] = (
+                PromptCachingChatBedrockConverse
+                if PromptCachingChatBedrockConverse.is_prompt_caching_enabled(
+                    model_config=model_config,
+                    system_prompts=chat_model_config.system_prompts,
+                )
+                else RateLimitedChatBedrockConverse
+            )
+            regions: List[str] = model_config.regions or [
+                os.environ.get("AWS_REGION", "us-east-1")
+            ]
+            # route across the regions of the model and pace the calls to each region
+            region_routing_client: Optional[RegionRoutingBedrockClient] = (
+                RegionRoutingBedrockClient(
+                    bedrock_region_router=self.bedrock_region_router,
+                    model=model_name,
+                    regions=regions,
+                    bedrock_rate_limiter=self.bedrock_rate_limiter,
+                )
+                if self.bedrock_region_router is not None
+                else None
+            )
+            llm = bedrock_model_class(
+                client=region_routing_client,
                 provider="anthropic",
                 credentials_profile_name=os.environ.get("AWS_CREDENTIALS_PROFILE"),
-                region_name=os.environ.get("AWS_REGION", "us-east-1"),
+                region_name=regions[0],
                 # Setting temperature to 0 for deterministic results
                 **model_parameters_dict,
             )
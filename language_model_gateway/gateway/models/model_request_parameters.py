@@ -0,0 +1,77 @@
+import dataclasses
+import logging
+from typing import Any, Dict, List, Optional
+
+from openai import NotGiven
+
+from language_model_gateway.configs.config_schema import ChatModelConfig
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class ModelRequestParameters:
+    """Generation parameters for a single request, passed to the chat model"""
+
+    max_tokens: Optional[int] = None
+    stop: Optional[List[str]] = None
+    temperature: Optional[float] = None
+    top_p: Optional[float] = None
+
+    @staticmethod
+    def from_chat_request(
+        *, chat_request: ChatRequest, chat_model_config: ChatModelConfig
+    ) -> "ModelRequestParameters":
+        """
+        Read the generation parameters from the request, bounded by the maximums for the model
+
+        Args:
+            chat_request: incoming request
+            chat_model_config: model configuration
+
+        Returns:
+            generation parameters for the request
+        """
+
+        def get_value(key: str) -> Any:
+            value: Any = chat_request.get(key)
+            return None if isinstance(value, NotGiven) else value
+
+        max_tokens: Optional[int] = get_value("max_completion_tokens") or get_value(
+            "max_tokens"
+        )
+        max_output_tokens: Optional[int] = chat_model_config.max_output_tokens
+        if max_output_tokens is not None:
+            if max_tokens is not None and max_tokens > max_output_tokens:
+                logger.info(
+                    f"Requested max_tokens {max_tokens} is over the maximum of {max_output_tokens}"
+                    f" for {chat_model_config.name} so using the maximum"
+                )
+            # requests without a limit get the maximum for the model
+            max_tokens = (
+                min(max_tokens, max_output_tokens)
+                if max_tokens is not None
+                else max_output_tokens
+            )
+
+        stop: Optional[str | List[str]] = get_value("stop")
+        return ModelRequestParameters(
+            max_tokens=max_tokens,
+            stop=[stop] if isinstance(stop, str) else stop,
+            temperature=get_value("temperature"),
+            top_p=get_value("top_p"),
+        )
+
+    def to_model_parameters(self) -> Dict[str, Any]:
+        """
+        Returns the parameters that are set, using the names the langchain chat models accept
+
+        Returns:
+            dictionary of parameters
+        """
+        return {
+            key: value
+            for key, value in dataclasses.asdict(self).items()
+            if value is not None
+        }
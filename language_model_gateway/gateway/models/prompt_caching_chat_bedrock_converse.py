@@ -0,0 +1,124 @@
+import re
+from typing import Any, ClassVar, Dict, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, SystemMessage
+
+from language_model_gateway.configs.config_schema import ModelConfig, PromptConfig
+from language_model_gateway.gateway.models.rate_limited_chat_bedrock_converse import (
+    RateLimitedChatBedrockConverse,
+)
+
+# Bedrock Converse content block that marks the end of a cacheable prefix
+CACHE_POINT_BLOCK: Dict[str, Any] = {"cachePoint": {"type": "default"}}
+
+
+class PromptCachingChatBedrockConverse(RateLimitedChatBedrockConverse):
+    """
+    ChatBedrockConverse that adds a cache point after the tool definitions so Bedrock can reuse
+    the cached prefix (tools, then system prompt) on the next call.
+
+    The cache point after the system prompts is added to the messages by
+    add_system_prompt_cache_point() since it has to go after the last cacheable system prompt.
+
+    https://docs.aws.amazon.com/bedrock/latest/userguide/prompt-caching.html
+    """
+
+    # models that support prompt caching in Bedrock
+    supported_model_patterns: ClassVar[List[str]] = [
+        r"anthropic\.claude-3-5-haiku",
+        r"anthropic\.claude-3-7-sonnet",
+        r"anthropic\.claude-sonnet-4",
+        r"anthropic\.claude-opus-4",
+        r"amazon\.nova-",
+    ]
+
+    cache_tool_definitions: bool = True
+    """Whether to add a cache point after the tool definitions"""
+
+    @classmethod
+    def supports_prompt_caching(cls, *, model_id: str) -> bool:
+        """
+        Whether Bedrock supports prompt caching for this model
+
+        Args:
+            model_id: Bedrock model id or inference profile id
+
+        Returns:
+            True if supported
+        """
+        return any(re.search(p, model_id) for p in cls.supported_model_patterns)
+
+    @classmethod
+    def is_prompt_caching_enabled(
+        cls,
+        *,
+        model_config: ModelConfig,
+        system_prompts: Optional[Sequence[PromptConfig]],
+    ) -> bool:
+        """
+        Prompt caching is used for Bedrock models that support it when a system prompt
+        in the model configuration has cache set to true
+
+        Args:
+            model_config: model to use
+            system_prompts: system prompts from the model configuration
+
+        Returns:
+            True if prompt caching should be used
+        """
+        return (
+            model_config.provider == "bedrock"
+            and cls.supports_prompt_caching(model_id=model_config.model)
+            and any(p.cache for p in system_prompts or [])
+        )
+
+    @staticmethod
+    def add_system_prompt_cache_point(
+        *, messages: Sequence[BaseMessage], system_prompts: Sequence[PromptConfig]
+    ) -> List[BaseMessage]:
+        """
+        Add a cache point after the last system message that comes from a cacheable system prompt
+
+        Args:
+            messages: messages to send to the model
+            system_prompts: system prompts from the model configuration
+
+        Returns:
+            messages with the cache point added
+        """
+        cacheable_contents: List[str] = [
+            p.content for p in system_prompts if p.cache and p.content
+        ]
+        last_cacheable_index: int = -1
+        for i, message in enumerate(messages):
+            if isinstance(message, SystemMessage) and message.content in (
+                cacheable_contents
+            ):
+                last_cacheable_index = i
+        if last_cacheable_index < 0:
+            return list(messages)
+
+        cached_message: BaseMessage = messages[last_cacheable_index]
+        new_messages: List[BaseMessage] = list(messages)
+        new_messages[last_cacheable_index] = SystemMessage(
+            content=[
+                {"type": "text", "text": cached_message.content},
+                CACHE_POINT_BLOCK,
+            ]
+        )
+        return new_messages
+
+    def _converse_params(self, **kwargs: Any) -> Dict[str, Any]:
+        params: Dict[str, Any] = super()._converse_params(**kwargs)
+        tool_config: Dict[str, Any] | None = params.get("toolConfig")
+        if (
+            self.cache_tool_definitions
+            and tool_config is not None
+            and tool_config.get("tools")
+            and "cachePoint" not in tool_config["tools"][-1]
+        ):
+            params["toolConfig"] = {
+                **tool_config,
+                "tools": [*tool_config["tools"], CACHE_POINT_BLOCK],
+            }
+        return params
@@ -0,0 +1,49 @@
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_aws import ChatBedrockConverse
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from language_model_gateway.gateway.aws.region_routing_bedrock_client import (
+    RegionRoutingBedrockClient,
+)
+
+
+class RateLimitedChatBedrockConverse(ChatBedrockConverse):
+    """
+    ChatBedrockConverse that waits for the bedrock rate limit on the event loop before the
+    blocking call is sent to the executor.
+
+    Without this the wait happens in RegionRoutingBedrockClient on a thread of the default
+    executor, where a queue of throttled calls would starve every other asyncio.to_thread user.
+    """
+
+    async def _pace_async(self) -> None:
+        if isinstance(self.client, RegionRoutingBedrockClient):
+            await self.client.pace_async()
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await self._pace_async()
+        return await super()._agenerate(
+            messages, stop=stop, run_manager=run_manager, **kwargs
+        )
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await self._pace_async()
+        async for chunk in super()._astream(
+            messages, stop=stop, run_manager=run_manager, **kwargs
+        ):
+            yield chunk
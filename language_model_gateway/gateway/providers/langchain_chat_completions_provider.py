@@ -1,10 +1,16 @@
+import dataclasses
 import datetime
+import json
+import logging
 import random
-from typing import Dict, Any, Sequence
+import time
+from typing import AsyncGenerator, Dict, Any, Sequence, Optional, cast
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from langgraph.graph.state import CompiledStateGraph
+from openai.types.chat import ChatCompletion
+from openai.types.shared_params.response_format_json_schema import JSONSchema
 from starlette.responses import StreamingResponse, JSONResponse
 
 from language_model_gateway.configs.config_schema import ChatModelConfig
@@ -12,11 +18,31 @@ from language_model_gateway.gateway.converters.langgraph_to_openai_converter imp
     LangGraphToOpenAIConverter,
 )
 from language_model_gateway.gateway.models.model_factory import ModelFactory
+from language_model_gateway.gateway.models.model_request_parameters import (
+    ModelRequestParameters,
+)
 from language_model_gateway.gateway.providers.base_chat_completions_provider import (
     BaseChatCompletionsProvider,
 )
 from language_model_gateway.gateway.schema.openai.completions import ChatRequest
 from language_model_gateway.gateway.tools.tool_provider import ToolProvider
+from language_model_gateway.gateway.utilities.json_schema_validator import (
+    JsonSchemaValidator,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_router import (
+    ModelRouter,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_routing_decision import (
+    ModelRoutingDecision,
+)
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
+from language_model_gateway.gateway.utilities.tool_selection.tool_selector import (
+    ToolSelector,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class LangChainCompletionsProvider(BaseChatCompletionsProvider):
@@ -26,6 +52,9 @@ class LangChainCompletionsProvider(BaseChatCompletionsProvider):
         model_factory: ModelFactory,
         lang_graph_to_open_ai_converter: LangGraphToOpenAIConverter,
         tool_provider: ToolProvider,
+        tool_selector: ToolSelector,
+        model_router: ModelRouter,
+        request_hedger: RequestHedger,
     ) -> None:
         self.model_factory: ModelFactory = model_factory
         assert self.model_factory is not None
@@ -40,6 +69,15 @@ class LangChainCompletionsProvider(BaseChatCompletionsProvider):
         self.tool_provider: ToolProvider = tool_provider
         assert self.tool_provider is not None
         assert isinstance(self.tool_provider, ToolProvider)
+        self.tool_selector: ToolSelector = tool_selector
+        assert self.tool_selector is not None
+        assert isinstance(self.tool_selector, ToolSelector)
+        self.model_router: ModelRouter = model_router
+        assert self.model_router is not None
+        assert isinstance(self.model_router, ModelRouter)
+        self.request_hedger: RequestHedger = request_hedger
+        assert self.request_hedger is not None
+        assert isinstance(self.request_hedger, RequestHedger)
 
     async def chat_completions(
         self,
@@ -48,11 +86,6 @@ class LangChainCompletionsProvider(BaseChatCompletionsProvider):
         headers: Dict[str, str],
         chat_request: ChatRequest,
     ) -> StreamingResponse | JSONResponse:
-        # noinspection PyArgumentList
-        llm: BaseChatModel = self.model_factory.get_model(
-            chat_model_config=model_config
-        )
-
         # noinspection PyUnusedLocal
         def get_current_time(*args: Any, **kwargs: Any) -> str:
             """Returns the current time in H:MM AM/PM format."""
@@ -65,12 +98,217 @@ class LangChainCompletionsProvider(BaseChatCompletionsProvider):
             if model_config.get_agents() is not None
             else []
         )
+        # bind only the tools relevant to the latest user message
+        tools = self.tool_selector.select_tools(
+            model_name=model_config.name,
+            tools=tools,
+            query=ToolSelector.get_query_from_messages(chat_request["messages"]),
+            tool_selection=model_config.tool_selection,
+        ).tools
+
+        if model_config.routing is None:
+            return await self.run_agent_async(
+                model_config=model_config,
+                headers=headers,
+                chat_request=chat_request,
+                tools=tools,
+            )
+
+        decision: ModelRoutingDecision = self.model_router.route(
+            model_config=model_config, chat_request=chat_request, tools=tools
+        )
+        start_time: float = time.monotonic()
+        response: StreamingResponse | JSONResponse = await self.run_agent_async(
+            model_config=self.model_router.get_model_config(
+                model_config=model_config, route=decision.route
+            ),
+            headers=headers,
+            # copy since the messages in the request are changed for json output and
+            # the request may be retried on the strong model
+            chat_request=cast(ChatRequest, {**chat_request}),
+            tools=tools,
+        )
+        if isinstance(response, StreamingResponse):
+            response.body_iterator = self.model_router.record_stream_result_async(
+                stream=response.body_iterator,
+                model_config=model_config,
+                decision=decision,
+                start_time=start_time,
+            )
+            return response
+
+        chat_completion: ChatCompletion = ChatCompletion.model_validate_json(
+            bytes(response.body)
+        )
+        await self.model_router.record_result_async(
+            model_config=model_config,
+            decision=decision,
+            latency_seconds=time.monotonic() - start_time,
+            usage=chat_completion.usage,
+        )
+        if (
+            decision.route == "fast"
+            and model_config.routing.escalate_on_invalid_response
+            and not self.is_valid_json_response(
+                chat_request=chat_request, chat_completion=chat_completion
+            )
+        ):
+            logger.info(
+                f"Response from the fast model for {model_config.name} does not match the schema so retrying on the strong model"
+            )
+            escalated_decision: ModelRoutingDecision = dataclasses.replace(
+                decision, route="strong", reason="escalated"
+            )
+            start_time = time.monotonic()
+            response = await self.run_agent_async(
+                model_config=self.model_router.get_model_config(
+                    model_config=model_config, route=escalated_decision.route
+                ),
+                headers=headers,
+                chat_request=chat_request,
+                tools=tools,
+            )
+            assert isinstance(response, JSONResponse)
+            await self.model_router.record_result_async(
+                model_config=model_config,
+                decision=escalated_decision,
+                latency_seconds=time.monotonic() - start_time,
+                usage=ChatCompletion.model_validate_json(bytes(response.body)).usage,
+                escalated=True,
+            )
+        return response
+
+    @staticmethod
+    def is_valid_json_response(
+        *, chat_request: ChatRequest, chat_completion: ChatCompletion
+    ) -> bool:
+        """
+        Check the response against the schema of a json_schema response format
+
+        Args:
+            chat_request: incoming request
+            chat_completion: response
+
+        Returns:
+            False if the request has a json_schema response format and the response does not match it
+        """
+        json_schema: Optional[JSONSchema] = (
+            LangGraphToOpenAIConverter.get_json_schema_from_request(
+                chat_request=chat_request
+            )
+        )
+        if json_schema is None:
+            return True
+        content: Optional[str] = (
+            chat_completion.choices[0].message.content
+            if chat_completion.choices
+            else None
+        )
+        try:
+            value: Any = json.loads(content or "")
+        except json.JSONDecodeError:
+            return False
+        return not JsonSchemaValidator.validate(
+            value=value, schema=json_schema["schema"]
+        )
+
+    async def run_agent_async(
+        self,
+        *,
+        model_config: ChatModelConfig,
+        headers: Dict[str, str],
+        chat_request: ChatRequest,
+        tools: Sequence[BaseTool],
+    ) -> StreamingResponse | JSONResponse:
+        """
+        Run the agent for the model with the tools.  If the model has hedging, the agent is run
+        again when the first chunk is slow and whichever run responds first is used.  Only
+        streaming requests without tools are hedged: tools may have side effects that must not
+        run twice, and the first chunk of a non-streaming response is the whole response so it
+        would duplicate complete generations.
+
+        Args:
+            model_config: model configuration
+            headers: request headers
+            chat_request: incoming request
+            tools: tools to bind to the model
+
+        Returns:
+            The response as a StreamingResponse or JSONResponse.
+        """
+        if model_config.hedging is None or tools or not chat_request.get("stream"):
+            return await self.create_agent_response_async(
+                model_config=model_config,
+                headers=headers,
+                chat_request=chat_request,
+                tools=tools,
+            )
 
-        compiled_state_graph: CompiledStateGraph = (
-            await self.lang_graph_to_open_ai_converter.create_graph_for_llm_async(
-                llm=llm,
+        # noinspection PyUnusedLocal
+        async def run_attempt_async(
+            index: int,
+        ) -> AsyncGenerator[str | bytes | memoryview | JSONResponse, None]:
+            response: (
+                StreamingResponse | JSONResponse
+            ) = await self.create_agent_response_async(
+                model_config=model_config,
+                headers=headers,
+                # copy since the messages in the request are changed for json output
+                chat_request=cast(ChatRequest, {**chat_request}),
                 tools=tools,
             )
+            if isinstance(response, StreamingResponse):
+                async for chunk in response.body_iterator:
+                    yield chunk
+            else:
+                yield response
+
+        results: AsyncGenerator[str | bytes | memoryview | JSONResponse, None] = (
+            self.request_hedger.hedge_async(
+                key=model_config.name,
+                hedging=model_config.hedging,
+                start_attempt=run_attempt_async,
+            )
+        )
+        return StreamingResponse(
+            cast(AsyncGenerator[str | bytes | memoryview, None], results),
+            media_type="text/event-stream",
+        )
+
+    async def create_agent_response_async(
+        self,
+        *,
+        model_config: ChatModelConfig,
+        headers: Dict[str, str],
+        chat_request: ChatRequest,
+        tools: Sequence[BaseTool],
+    ) -> StreamingResponse | JSONResponse:
+        """
+        Create the graph for the model with the tools and run it
+
+        Args:
+            model_config: model configuration
+            headers: request headers
+            chat_request: incoming request
+            tools: tools to bind to the model
+
+        Returns:
+            The response as a StreamingResponse or JSONResponse.
+        """
+        # noinspection PyArgumentList
+        llm: BaseChatModel = self.model_factory.get_model(
+            chat_model_config=model_config,
+            request_parameters=ModelRequestParameters.from_chat_request(
+                chat_request=chat_request, chat_model_config=model_config
+            ),
+        )
+
+        compiled_state_graph: CompiledStateGraph = await self.lang_graph_to_open_ai_converter.create_graph_for_llm_async(
+            llm=llm,
+            tools=tools,
+            response_format=self.lang_graph_to_open_ai_converter.get_native_response_format(
+                chat_request=chat_request, model_config=model_config
+            ),
         )
         request_id = random.randint(1, 1000)
 
@@ -80,4 +318,6 @@ class LangChainCompletionsProvider(BaseChatCompletionsProvider):
             compiled_state_graph=compiled_state_graph,
             chat_request=chat_request,
             system_messages=[],
+            model_config=model_config,
+            tools=tools,
         )
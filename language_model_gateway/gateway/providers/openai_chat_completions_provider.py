@@ -4,9 +4,10 @@ import logging
 import os
 from os import environ
 from random import randint
-from typing import Any, Dict, AsyncGenerator
+import time
+from typing import Any, Dict, AsyncGenerator, List
 
-from httpx import Response
+from httpx import AsyncClient, HTTPError, Response, Timeout
 from httpx_sse import aconnect_sse, ServerSentEvent
 from openai.types.chat import (
     ChatCompletion,
@@ -15,6 +16,7 @@ from pydantic_core import ValidationError
 
 from language_model_gateway.configs.config_schema import ChatModelConfig
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
+from language_model_gateway.gateway.http.upstream_pool import UpstreamPool
 
 
 from starlette.responses import StreamingResponse, JSONResponse
@@ -23,16 +25,36 @@ from language_model_gateway.gateway.providers.base_chat_completions_provider imp
     BaseChatCompletionsProvider,
 )
 from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
 
 logger = logging.getLogger(__file__)
 
 
 class OpenAiChatCompletionsProvider(BaseChatCompletionsProvider):
-    def __init__(self, *, http_client_factory: HttpClientFactory) -> None:
+    # connecting to a dead upstream should fail fast so we can fail over to the next one
+    agent_timeout: Timeout = Timeout(60 * 60, connect=10)
+
+    def __init__(
+        self,
+        *,
+        http_client_factory: HttpClientFactory,
+        upstream_pool: UpstreamPool,
+        request_hedger: RequestHedger,
+    ) -> None:
         self.http_client_factory: HttpClientFactory = http_client_factory
         assert self.http_client_factory is not None
         assert isinstance(self.http_client_factory, HttpClientFactory)
 
+        self.upstream_pool: UpstreamPool = upstream_pool
+        assert self.upstream_pool is not None
+        assert isinstance(self.upstream_pool, UpstreamPool)
+
+        self.request_hedger: RequestHedger = request_hedger
+        assert self.request_hedger is not None
+        assert isinstance(self.request_hedger, RequestHedger)
+
     async def chat_completions(
         self,
         *,
@@ -51,13 +73,16 @@ class OpenAiChatCompletionsProvider(BaseChatCompletionsProvider):
         assert chat_request
 
         request_id: str = str(randint(1, 1000))
-        agent_url: Optional[str] = model_config.url or environ["OPENAI_AGENT_URL"]
-        assert agent_url
+        agent_urls: List[str] = model_config.urls or [
+            model_config.url or environ["OPENAI_AGENT_URL"]
+        ]
+        assert agent_urls
 
         if chat_request.get("stream"):
             return StreamingResponse(
                 await self.get_streaming_response_async(
-                    agent_url=agent_url,
+                    model_config=model_config,
+                    agent_urls=agent_urls,
                     request_id=request_id,
                     headers=headers,
                     chat_request=chat_request,
@@ -66,16 +91,21 @@ class OpenAiChatCompletionsProvider(BaseChatCompletionsProvider):
             )
 
         response_text: Optional[str] = None
+        agent_url: str = agent_urls[0]
         async with self.http_client_factory.create_http_client(
-            base_url="http://test"
+            base_url="http://test",
+            # the agent takes as long as the generation so only errors count
+            count_slow_calls=False,
         ) as client:
             try:
-                agent_response: Response = await client.post(
-                    agent_url,
-                    json=chat_request,
-                    timeout=60 * 60,
+                agent_response: Response = await self.post_async(
+                    client=client,
+                    model_config=model_config,
+                    agent_urls=agent_urls,
                     headers=headers,
+                    chat_request=chat_request,
                 )
+                agent_url = str(agent_response.request.url)
 
                 response_text = agent_response.text
                 response_dict: Dict[str, Any] = agent_response.json()
@@ -101,57 +131,225 @@ class OpenAiChatCompletionsProvider(BaseChatCompletionsProvider):
                 logger.info(f"Non-streaming response {request_id}: {response}")
             return JSONResponse(content=response.model_dump())
 
+    async def post_async(
+        self,
+        *,
+        client: AsyncClient,
+        model_config: ChatModelConfig,
+        agent_urls: List[str],
+        headers: Dict[str, str],
+        chat_request: ChatRequest,
+    ) -> Response:
+        """
+        Post the request to the agent.  If the model has hedging, a duplicate request is sent to
+        another upstream when the response is slow.
+
+        Args:
+            client: http client
+            model_config: model configuration
+            agent_urls: upstream URLs of the agent
+            headers: headers to pass
+            chat_request: request to post
+
+        Returns:
+            response of the agent
+        """
+        tried: List[str] = []
+        if model_config.hedging is None:
+            return await self.post_with_failover_async(
+                client=client,
+                agent_urls=agent_urls,
+                tried=tried,
+                headers=headers,
+                chat_request=chat_request,
+            )
+
+        # noinspection PyUnusedLocal
+        async def post_attempt_async(index: int) -> AsyncGenerator[Response, None]:
+            yield await self.post_with_failover_async(
+                client=client,
+                agent_urls=agent_urls,
+                tried=tried,
+                headers=headers,
+                chat_request=chat_request,
+            )
+
+        responses: AsyncGenerator[Response, None] = self.request_hedger.hedge_async(
+            # complete responses take much longer than the first streamed event so keep their
+            # latencies and hedging budget apart from streaming requests
+            key=f"{model_config.name}:complete",
+            hedging=model_config.hedging,
+            start_attempt=post_attempt_async,
+        )
+        try:
+            return await responses.__anext__()
+        finally:
+            await responses.aclose()
+
+    async def post_with_failover_async(
+        self,
+        *,
+        client: AsyncClient,
+        agent_urls: List[str],
+        tried: List[str],
+        headers: Dict[str, str],
+        chat_request: ChatRequest,
+    ) -> Response:
+        """
+        Post the request to the best upstream and fail over to the next one on connection
+        errors, timeouts and 5xx responses.
+
+        Args:
+            client: http client
+            agent_urls: upstream URLs of the agent
+            tried: upstreams already tried for this request.  Shared by hedged attempts so the
+                duplicate request goes to another upstream.
+            headers: headers to pass
+            chat_request: request to post
+
+        Returns:
+            response of the first upstream that succeeded or the last response if all failed
+        """
+        while True:
+            agent_url: str = self.upstream_pool.choose(urls=agent_urls, exclude=tried)
+            tried.append(agent_url)
+            is_last_attempt: bool = len(tried) >= len(agent_urls)
+            self.upstream_pool.start(url=agent_url)
+            start_time: float = time.monotonic()
+            try:
+                agent_response: Response = await client.post(
+                    agent_url,
+                    json=chat_request,
+                    timeout=self.agent_timeout,
+                    headers=headers,
+                )
+            except HTTPError as e:
+                self.upstream_pool.record_failure(url=agent_url)
+                if is_last_attempt:
+                    raise
+                logger.warning(f"Failing over from {agent_url}: {e}")
+                continue
+            finally:
+                self.upstream_pool.finish(url=agent_url)
+
+            if agent_response.status_code >= 500:
+                self.upstream_pool.record_failure(url=agent_url)
+                if not is_last_attempt:
+                    logger.warning(
+                        f"Failing over from {agent_url}: status {agent_response.status_code}"
+                    )
+                    continue
+            else:
+                self.upstream_pool.record_success(
+                    url=agent_url, latency_seconds=time.monotonic() - start_time
+                )
+            return agent_response
+
     async def get_streaming_response_async(
         self,
         *,
-        agent_url: str,
+        model_config: ChatModelConfig,
+        agent_urls: List[str],
         request_id: str,
         headers: Dict[str, str],
         chat_request: ChatRequest,
     ) -> AsyncGenerator[str, None]:
         logger.info(f"Streaming response {request_id} from agent")
-        generator: AsyncGenerator[str, None] = self._stream_resp_async_generator(
-            agent_url=agent_url,
-            request_id=request_id,
-            chat_request=chat_request,
-            headers=headers,
+        tried: List[str] = []
+
+        # noinspection PyUnusedLocal
+        def start_attempt(index: int) -> AsyncGenerator[str, None]:
+            return self._stream_resp_async_generator(
+                agent_urls=agent_urls,
+                tried=tried,
+                request_id=request_id,
+                chat_request=chat_request,
+                headers=headers,
+            )
+
+        if model_config.hedging is None:
+            return start_attempt(0)
+        return self.request_hedger.hedge_async(
+            key=model_config.name,
+            hedging=model_config.hedging,
+            start_attempt=start_attempt,
         )
-        return generator
 
     async def _stream_resp_async_generator(
         self,
         *,
         request_id: str,
-        agent_url: str,
+        agent_urls: List[str],
+        tried: List[str],
         chat_request: ChatRequest,
         headers: Dict[str, str],
     ) -> AsyncGenerator[str, None]:
+        """
+        Stream the response from the best upstream.  Fails over to the next upstream on
+        connection errors, timeouts and 5xx responses until the first event is received.  After
+        that the response has been partly sent to the client so errors are not retried.
+        tried is shared by hedged attempts so the duplicate request goes to another upstream.
+        """
         logger.info(f"Streaming response {request_id} from agent")
         async with self.http_client_factory.create_http_client(
-            base_url="http://test"
+            base_url="http://test",
+            # the agent takes as long as the generation so only errors count
+            count_slow_calls=False,
         ) as client:
-            async with aconnect_sse(
-                client,
-                "POST",
-                agent_url,
-                json=chat_request,
-                timeout=60 * 60,
-                headers=headers,
-            ) as event_source:
+            while True:
+                agent_url: str = self.upstream_pool.choose(
+                    urls=agent_urls, exclude=tried
+                )
+                tried.append(agent_url)
+                is_last_attempt: bool = len(tried) >= len(agent_urls)
+                self.upstream_pool.start(url=agent_url)
+                start_time: float = time.monotonic()
                 i = 0
-                sse: ServerSentEvent
-                async for sse in event_source.aiter_sse():
-                    event: str = sse.event
-                    data: str = sse.data
-                    i += 1
-
-                    if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
-                        if logger.isEnabledFor(logging.DEBUG):
-                            logger.debug(
-                                f"----- Received data from stream {i} {event} {type(data)} ------"
-                            )
-                            logger.debug(data)
-                            logger.debug(
-                                f"----- End data from stream {i} {event} {type(data)} ------"
-                            )
-                    yield f"data: {data}\n\n"
+                try:
+                    async with aconnect_sse(
+                        client,
+                        "POST",
+                        agent_url,
+                        json=chat_request,
+                        timeout=self.agent_timeout,
+                        headers=headers,
+                    ) as event_source:
+                        failed: bool = event_source.response.status_code >= 500
+                        if failed:
+                            self.upstream_pool.record_failure(url=agent_url)
+                            if not is_last_attempt:
+                                logger.warning(
+                                    f"Failing over from {agent_url}: status {event_source.response.status_code}"
+                                )
+                                continue
+                        sse: ServerSentEvent
+                        async for sse in event_source.aiter_sse():
+                            event: str = sse.event
+                            data: str = sse.data
+                            i += 1
+                            if i == 1 and not failed:
+                                self.upstream_pool.record_success(
+                                    url=agent_url,
+                                    latency_seconds=time.monotonic() - start_time,
+                                )
+
+                            if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug(
+                                        f"----- Received data from stream {i} {event} {type(data)} ------"
+                                    )
+                                    logger.debug(data)
+                                    logger.debug(
+                                        f"----- End data from stream {i} {event} {type(data)} ------"
+                                    )
+                            yield f"data: {data}\n\n"
+                        return
+                except HTTPError as e:
+                    if i > 0:
+                        raise
+                    self.upstream_pool.record_failure(url=agent_url)
+                    if is_last_attempt:
+                        raise
+                    logger.warning(f"Failing over from {agent_url}: {e}")
+                finally:
+                    self.upstream_pool.finish(url=agent_url)
@@ -1,30 +1,47 @@
 import logging
-from typing import Optional, Type, Tuple, Literal
+from typing import Optional, Type, Tuple, Literal, List
 from pydantic import BaseModel, Field
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.confluence.confluence_document import (
     ConfluenceDocument,
 )
 from language_model_gateway.gateway.utilities.confluence.confluence_helper import (
     ConfluenceHelper,
 )
+from language_model_gateway.gateway.utilities.html_to_markdown_converter import (
+    HtmlToMarkdownConverter,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ConfluencePageRetrieverAgentInput(BaseModel):
     """
-    Input model for retrieving a specific Confluence page by ID.
+    Input model for retrieving Confluence pages by ID.
     """
 
     page_id: str = Field(
-        default="", description="The ID of the Confluence page to retrieve."
+        default="",
+        description="The ID of the Confluence page to retrieve or a comma separated list of IDs to retrieve several pages at once.",
+    )
+    query: Optional[str] = Field(
+        default=None,
+        description="Question to answer from the page.  Long pages are cut down to the passages most relevant to it.",
     )
 
 
 class ConfluencePageRetriever(ResilientBaseTool):
     """
-    A LangChain-compatible tool for retrieving a specific Confluence page by ID.
+    A LangChain-compatible tool for retrieving Confluence pages by ID.
     """
 
     name: str = "confluence_page_retriever"
@@ -32,6 +49,7 @@ class ConfluencePageRetriever(ResilientBaseTool):
         "Tool to retrieve a specific Confluence page by ID. "
         "USAGE TIPS: "
         "- Provide the Confluence page ID to retrieve the page details."
+        "- To retrieve several pages, e.g. the top search results, provide their IDs separated by commas in one call."
     )
 
     args_schema: Type[BaseModel] = ConfluencePageRetrieverAgentInput
@@ -39,9 +57,26 @@ class ConfluencePageRetriever(ResilientBaseTool):
 
     confluence_helper: ConfluenceHelper
 
+    passage_extractor: Optional[PassageExtractor] = None
+    """If set, long pages are cut down to the passages most relevant to the query"""
+
+    passage_extraction_config: PassageExtractionConfig = PassageExtractionConfig()
+
+    def get_circuit_breaker_names(self) -> List[str]:
+        return (
+            [
+                CircuitBreakerRegistry.get_name_for_url(
+                    self.confluence_helper.confluence_base_url
+                )
+            ]
+            if self.confluence_helper.confluence_base_url
+            else []
+        )
+
     async def _arun(
         self,
         page_id: str,
+        query: Optional[str] = None,
     ) -> Tuple[str, str]:
         """
         Asynchronous version of the Confluence Page by ID tool.
@@ -52,31 +87,64 @@ class ConfluencePageRetriever(ResilientBaseTool):
         log_prefix: str = f"ConfluencePageRetriever: page_id={page_id}"
 
         try:
-            confluence_page: Optional[
-                ConfluenceDocument
-            ] = await self.confluence_helper.retrieve_page_by_id(page_id=page_id)
-
-            if not confluence_page:
+            page_ids: List[str] = [i.strip() for i in page_id.split(",") if i.strip()]
+            confluence_pages: List[
+                Optional[ConfluenceDocument]
+            ] = await self.confluence_helper.retrieve_pages_by_ids(page_ids=page_ids)
+            found_pages: List[ConfluenceDocument] = [
+                confluence_page
+                for confluence_page in confluence_pages
+                if confluence_page is not None
+            ]
+
+            if not found_pages:
                 error_msg = "Error retrieving Confluence page: Page not found"
                 error_artifact = log_prefix + " Retrieval Failed: Page not found"
                 logger.error(error_msg)
                 return error_msg, error_artifact
 
-            full_text_display = (
-                f"**Title**: {confluence_page.title}\n"
-                f"**URL**: {confluence_page.url}\n"
-                f"**Updated**: {confluence_page.updated_at}\n"
-                f"**Author**: {confluence_page.author_name}\n"
+            full_text = ""
+            artifact = (
+                log_prefix
+                + f", Retrieved pages {', '.join(p.id for p in found_pages)}.\n\n"
             )
-
-            full_text = (
-                f"Id: {confluence_page.id}\n"
-                f"{full_text_display}"
-                f"Content: {confluence_page.content}\n"
-            )
-
-            artifact = log_prefix + f", Retrieved page {confluence_page.id}.\n\n"
-            artifact += f"\n{full_text_display}"
+            for confluence_page in found_pages:
+                full_text_display = (
+                    f"**Title**: {confluence_page.title}\n"
+                    f"**URL**: {confluence_page.url}\n"
+                    f"**Updated**: {confluence_page.updated_at}\n"
+                    f"**Author**: {confluence_page.author_name}\n"
+                )
+
+                content: str = confluence_page.content
+                if self.passage_extractor is not None:
+                    # passages are ranked on the text rather than the storage format XHTML
+                    content = (
+                        await HtmlToMarkdownConverter.get_markdown_from_html_async(
+                            html_content=content
+                        )
+                    )
+                    passages = self.passage_extractor.extract(
+                        text=content,
+                        query=query,
+                        source=confluence_page.url,
+                        tool_name=self.name,
+                        config=self.passage_extraction_config,
+                    )
+                    content = passages.text
+                    if passages.handle is not None:
+                        full_text_display += f"**Passages**: {passages.get_summary()}\n"
+                full_text += (
+                    f"Id: {confluence_page.id}\n"
+                    f"{full_text_display}"
+                    f"Content: {content}\n\n"
+                )
+                artifact += f"\n{full_text_display}"
+            missing_page_ids: List[str] = [
+                i for i, p in zip(page_ids, confluence_pages) if p is None
+            ]
+            if missing_page_ids:
+                full_text += f"Pages not found: {', '.join(missing_page_ids)}\n"
 
             return full_text, artifact
 
@@ -89,6 +157,7 @@ class ConfluencePageRetriever(ResilientBaseTool):
     def _run(
         self,
         page_id: str,
+        query: Optional[str] = None,
     ) -> Tuple[str, str]:
         """
         Synchronous version of the Confluence Page by ID tool.
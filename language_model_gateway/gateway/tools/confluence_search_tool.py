@@ -1,8 +1,11 @@
 import logging
-from typing import Type, Literal, Optional, Tuple
+from typing import Type, Literal, Optional, Tuple, List
 from pydantic import BaseModel, Field
 
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.confluence.confluence_helper import (
     ConfluenceHelper,
 )
@@ -41,6 +44,17 @@ class ConfluenceSearchTool(ResilientBaseTool):
 
     confluence_helper: ConfluenceHelper
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return (
+            [
+                CircuitBreakerRegistry.get_name_for_url(
+                    self.confluence_helper.confluence_base_url
+                )
+            ]
+            if self.confluence_helper.confluence_base_url
+            else []
+        )
+
     async def _arun(self, search_string: str, limit: int = 10) -> Tuple[str, str]:
         try:
             search_results = await self.confluence_helper.search_content(
@@ -0,0 +1,76 @@
+import logging
+from typing import Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field
+
+from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_result import (
+    PassageExtractionResult,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentPassageRetrieverToolInput(BaseModel):
+    handle: str = Field(
+        description="Handle of the document given at the end of a tool output that returned only some passages"
+    )
+    start: int = Field(
+        description="Number of passages already seen, as given at the end of the tool output"
+    )
+    query: Optional[str] = Field(
+        default=None,
+        description="Question the passages should answer.  Use the same question to continue where the last passages ended.",
+    )
+
+
+class DocumentPassageRetrieverTool(ResilientBaseTool):
+    """
+    LangChain-compatible tool for fetching more passages of a long document that another tool
+    returned only the most relevant passages of.
+    """
+
+    name: str = PassageExtractor.more_passages_tool_name
+    description: str = (
+        "Fetches more passages of a long web page, PDF or Confluence page when a tool returned only "
+        "the passages most relevant to the question. "
+        "Provide the handle and start given at the end of that tool's output."
+    )
+    args_schema: Type[BaseModel] = DocumentPassageRetrieverToolInput
+    response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
+
+    passage_extractor: PassageExtractor
+    max_tokens: int = 3000
+
+    def _run(
+        self, handle: str, start: int, query: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Synchronous version of the tool (falls back to async implementation).
+        """
+        raise NotImplementedError("Use async version of this tool")
+
+    async def _arun(
+        self, handle: str, start: int, query: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        Asynchronous version of the tool.
+
+        Returns:
+            Tuple of the passages and artifact description
+        """
+        log_prefix: str = f"DocumentPassageRetriever: handle={handle}, start={start}"
+        result: Optional[PassageExtractionResult] = (
+            self.passage_extractor.get_more_passages(
+                handle=handle, query=query, start=start, max_tokens=self.max_tokens
+            )
+        )
+        if result is None:
+            return (
+                f"The document with handle {handle} has expired.  Call the original tool again.",
+                log_prefix + " Document expired",
+            )
+        return result.text, log_prefix + f", {result.get_summary()}"
@@ -8,6 +8,9 @@ from langgraph.prebuilt import InjectedState
 from pydantic import BaseModel, Field
 
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.csv_to_markdown_converter import (
     CsvToMarkdownConverter,
 )
@@ -169,6 +172,13 @@ class GitHubPullRequestAnalyzerTool(ResilientBaseTool):
     response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
     github_pull_request_helper: GithubPullRequestHelper
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return [
+            CircuitBreakerRegistry.get_name_for_url(
+                self.github_pull_request_helper.base_url
+            )
+        ]
+
     # noinspection PyPep8Naming
     def _run(
         self,
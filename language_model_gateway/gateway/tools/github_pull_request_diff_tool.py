@@ -1,9 +1,15 @@
 import logging
-from typing import Type, Optional, Tuple, Literal
+from typing import Type, Optional, Tuple, Literal, List
 
 from pydantic import BaseModel, Field
 
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff import (
+    GithubPullRequestDiff,
+)
 from language_model_gateway.gateway.utilities.github.github_pull_request_helper import (
     GithubPullRequestHelper,
 )
@@ -31,13 +37,23 @@ class GitHubPullRequestDiffTool(ResilientBaseTool):
     """
 
     name: str = "github_pull_request_diff"
-    description: str = "Provides a diff of a GitHub pull request given its URL"
+    description: str = (
+        "Provides a diff of a GitHub pull request given its URL.  Large diffs are truncated and"
+        " lock files and generated files are left out; the summary at the top lists them."
+    )
 
     args_schema: Type[BaseModel] = GitHubPullRequestDiffAgentDiffInput
     response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
 
     github_pull_request_helper: GithubPullRequestHelper
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return [
+            CircuitBreakerRegistry.get_name_for_url(
+                self.github_pull_request_helper.base_url
+            )
+        ]
+
     def _run(
         self,
         url: Optional[str] = None,
@@ -66,8 +82,13 @@ class GitHubPullRequestDiffTool(ResilientBaseTool):
         assert url, "Pull request URL is required"
 
         try:
+            diff: GithubPullRequestDiff = (
+                await self.github_pull_request_helper.get_pr_diff_async(pr_url=url)
+            )
             diff_content: str = (
-                await self.github_pull_request_helper.get_pr_diff_content(pr_url=url)
+                self.github_pull_request_helper.github_diff_reader.format_diff(
+                    diff=diff
+                )
             )
             # Create artifact description
             artifact = f"GitHubPullRequestDiffAgent: Downloaded diff for {url}"
@@ -2,8 +2,11 @@ import logging
 
 from pydantic import BaseModel, Field
 
-from typing import Type, Optional, Tuple, Literal
+from typing import Type, Optional, Tuple, Literal, List
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.github.github_pull_request import (
     GithubPullRequest,
 )
@@ -41,6 +44,13 @@ class GitHubPullRequestRetriever(ResilientBaseTool):
 
     github_pull_request_helper: GithubPullRequestHelper
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return [
+            CircuitBreakerRegistry.get_name_for_url(
+                self.github_pull_request_helper.base_url
+            )
+        ]
+
     def _run(
         self,
         url: Optional[str] = None,
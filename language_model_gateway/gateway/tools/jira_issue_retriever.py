@@ -1,7 +1,10 @@
 import logging
-from typing import Type, Tuple, Literal
+from typing import Type, Tuple, Literal, List
 from pydantic import BaseModel, Field
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.jira.jira_issue_result import (
     JiraIssueResult,
 )
@@ -14,18 +17,18 @@ logger = logging.getLogger(__name__)
 
 class JiraIssueRetrieverAgentInput(BaseModel):
     """
-    Input model for retrieving a specific Jira issue by ID.
+    Input model for retrieving Jira issues by ID.
     """
 
     issue_id: str = Field(
         default="",
-        description="The ID of the Jira issue to retrieve. It typically follows this format: 2-4 capital letters + hyphen or space + 1-5 digits. Examples: ATC-1234, Atc 6789, EFS-564",
+        description="The ID of the Jira issue to retrieve or a comma separated list of IDs to retrieve several issues at once. It typically follows this format: 2-4 capital letters + hyphen or space + 1-5 digits. Examples: ATC-1234, Atc 6789, EFS-564",
     )
 
 
 class JiraIssueRetriever(ResilientBaseTool):
     """
-    A LangChain-compatible tool for retrieving a specific Jira issue by ID.
+    A LangChain-compatible tool for retrieving Jira issues by ID.
     """
 
     name: str = "jira_issue_retriever"
@@ -33,6 +36,7 @@ class JiraIssueRetriever(ResilientBaseTool):
         "Tool to retrieve a specific Jira issue by ID. "
         "USAGE TIPS: "
         "- Provide the Jira issue ID to retrieve the issue details."
+        "- To retrieve several issues provide their IDs separated by commas in one call."
         "- ID typically follows this format: 2-4 capital letters + hyphen or space + 1-5 digits. Examples: ATC-1234, Atc 6789, EFS-564"
     )
 
@@ -41,6 +45,17 @@ class JiraIssueRetriever(ResilientBaseTool):
 
     jira_issues_helper: JiraIssueHelper
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return (
+            [
+                CircuitBreakerRegistry.get_name_for_url(
+                    self.jira_issues_helper.jira_base_url
+                )
+            ]
+            if self.jira_issues_helper.jira_base_url
+            else []
+        )
+
     async def _arun(
         self,
         issue_id: str,
@@ -54,11 +69,14 @@ class JiraIssueRetriever(ResilientBaseTool):
         log_prefix: str = f"JiraIssueRetriever: issue_id={issue_id}"
 
         try:
+            issue_ids: List[str] = [i for i in issue_id.split(",") if i.strip()]
             jira_issue_result: JiraIssueResult = (
-                await self.jira_issues_helper.retrieve_issue_by_id(issue_id=issue_id)
+                await self.jira_issues_helper.retrieve_issues_by_ids(
+                    issue_ids=issue_ids
+                )
             )
 
-            if jira_issue_result.error:
+            if not jira_issue_result.issues:
                 error_msg = f"Error retrieving Jira issue: {jira_issue_result.error}"
                 error_artifact = (
                     log_prefix + f" Retrieval Failed: {jira_issue_result.error}"
@@ -66,9 +84,7 @@ class JiraIssueRetriever(ResilientBaseTool):
                 logger.error(error_msg)
                 return error_msg, error_artifact
 
-            jira_issue = jira_issue_result.issues[0]
-
-            full_text = (
+            full_text = "\n".join(
                 f"**Id**: {jira_issue.key}\n"
                 f"**Summary**: {jira_issue.summary}\n"
                 f"**Status**: {jira_issue.status}\n"
@@ -76,9 +92,15 @@ class JiraIssueRetriever(ResilientBaseTool):
                 f"**Created**: {jira_issue.created_at}\n"
                 f"**Closed**: {jira_issue.closed_at}\n"
                 f"**Description**: {jira_issue.description}\n"
+                for jira_issue in jira_issue_result.issues
             )
+            if jira_issue_result.error:
+                full_text += f"\n{jira_issue_result.error}\n"
 
-            artifact = log_prefix + f", Retrieved issue {jira_issue.key}.\n\n"
+            artifact = (
+                log_prefix
+                + f", Retrieved issues {', '.join(i.key for i in jira_issue_result.issues)}.\n\n"
+            )
             artifact += f"\n{full_text}"
 
             return full_text, artifact
@@ -6,6 +6,9 @@ from typing import Type, Optional, List, Tuple, Literal
 from pydantic import BaseModel, Field
 
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.csv_to_markdown_converter import (
     CsvToMarkdownConverter,
 )
@@ -113,6 +116,17 @@ class JiraIssuesAnalyzerTool(ResilientBaseTool):
 
     jira_issues_helper: JiraIssueHelper
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return (
+            [
+                CircuitBreakerRegistry.get_name_for_url(
+                    self.jira_issues_helper.jira_base_url
+                )
+            ]
+            if self.jira_issues_helper.jira_base_url
+            else []
+        )
+
     # noinspection PyPep8Naming
     def _run(
         self,
@@ -209,6 +223,7 @@ class JiraIssuesAnalyzerTool(ResilientBaseTool):
                     sort_by=sort_by,
                     sort_by_direction=sort_by_direction,
                     include_full_description=include_full_description,
+                    counts_only=counts_only,
                 )
             )
 
@@ -221,6 +236,7 @@ class JiraIssuesAnalyzerTool(ResilientBaseTool):
                 return error_msg, error_artifact
 
             jira_issues: List[JiraIssue] = jira_issues_result.issues
+            issue_count: int = len(jira_issues)
 
             full_text: str
             if not counts_only:
@@ -229,19 +245,24 @@ class JiraIssuesAnalyzerTool(ResilientBaseTool):
                     clean_summary: str = issue.summary.replace('"', "'")
                     full_text += f'{issue.key},"{clean_summary}",{issue.status},{issue.assignee},{issue.created_at.date().isoformat()},{issue.closed_at.date().isoformat() if issue.closed_at else "N/A"}\n'
             else:
-                # Summarize issues by engineer
-                pr_summary = self.jira_issues_helper.summarize_issues_by_assignee(
-                    issues=jira_issues
+                # Summarize issues by engineer unless the issue index already counted them
+                pr_summary = (
+                    jira_issues_result.issue_counts
+                    if jira_issues_result.issue_counts is not None
+                    else self.jira_issues_helper.summarize_issues_by_assignee(
+                        issues=jira_issues
+                    )
                 )
+                issue_count = sum(info.issue_count for info in pr_summary.values())
                 full_text = self.jira_issues_helper.export_results_to_csv(
                     issue_counts=pr_summary
                 )
 
             # Create artifact description
-            artifact = log_prefix + f", Analyzed {len(jira_issues)} closed issues."
+            artifact = log_prefix + f", Analyzed {issue_count} closed issues."
             if jira_issues_result.error:
                 artifact += f"\nError: {jira_issues_result.error}"
-            if len(jira_issues) == 0:
+            if issue_count == 0:
                 artifact += f"\nJira Query:\n{jira_issues_result.query}"
             elif use_verbose_logging:
                 artifact += f"\nJira Query: {jira_issues_result.query}"
@@ -12,6 +12,12 @@ from pypdf import PageObject
 from language_model_gateway.gateway.ocr.ocr_extractor import OCRExtractor
 from language_model_gateway.gateway.ocr.ocr_extractor_factory import OCRExtractorFactory
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +42,10 @@ class PDFExtractionToolInput(BaseModel):
         default=False,
         description="Use OCR (Optical Character Recognition) if text extraction fails",
     )
+    query: Optional[str] = Field(
+        default=None,
+        description="Question to answer from the PDF.  Long PDFs are cut down to the passages most relevant to it.",
+    )
     use_verbose_logging: Optional[bool] = Field(
         default=False,
         description="Whether to enable verbose logging",
@@ -58,6 +68,11 @@ class PDFExtractionTool(ResilientBaseTool):
     ocr_extractor_factory: OCRExtractorFactory
     ocr_type: Literal["aws"] = "aws"
 
+    passage_extractor: Optional[PassageExtractor] = None
+    """If set, long PDFs are cut down to the passages most relevant to the query"""
+
+    passage_extraction_config: PassageExtractionConfig = PassageExtractionConfig()
+
     def _run(
         self,
         url: Optional[str] = None,
@@ -65,6 +80,7 @@ class PDFExtractionTool(ResilientBaseTool):
         start_page: Optional[int] = None,
         end_page: Optional[int] = None,
         use_ocr: bool = False,
+        query: Optional[str] = None,
         use_verbose_logging: Optional[bool] = None,
     ) -> Tuple[str, str]:
         """
@@ -84,6 +100,7 @@ class PDFExtractionTool(ResilientBaseTool):
         start_page: Optional[int] = None,
         end_page: Optional[int] = None,
         use_ocr: bool = False,
+        query: Optional[str] = None,
         use_verbose_logging: Optional[bool] = None,
     ) -> Tuple[str, str]:
         """
@@ -95,6 +112,7 @@ class PDFExtractionTool(ResilientBaseTool):
             start_page (Optional[int]): Starting page for extraction
             end_page (Optional[int]): Ending page for extraction
             use_ocr (bool): Use AWS Textract for OCR if text extraction fails
+            query (Optional[str]): Question to answer from the PDF
             use_verbose_logging (Optional[bool]): Whether to enable verbose logging
 
         Returns:
@@ -162,7 +180,19 @@ class PDFExtractionTool(ResilientBaseTool):
             if use_verbose_logging:
                 artifact += f"\n===== Extracted text =====\n```{full_text}```\n====== End of Text ======"
 
-            return full_text.strip(), artifact
+            full_text = full_text.strip()
+            if self.passage_extractor is not None:
+                passages = self.passage_extractor.extract(
+                    text=full_text,
+                    query=query,
+                    source=url or "the PDF",
+                    tool_name=self.name,
+                    config=self.passage_extraction_config,
+                )
+                full_text = passages.text
+                artifact += f"\n{passages.get_summary()}"
+
+            return full_text, artifact
 
         except Exception as e:
             error_msg = f"Failed to extract PDF contents: {str(e)}"
@@ -6,7 +6,13 @@ from typing import Optional, Dict, Any, List, cast, Type, Literal, Tuple
 import httpx
 from pydantic import BaseModel, Field
 
+from language_model_gateway.gateway.http.circuit_breaker_transport import (
+    CircuitBreakerTransport,
+)
 from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +41,13 @@ class ProviderSearchTool(ResilientBaseTool):
     response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
     api_url: Optional[str] = os.environ.get("PROVIDER_SEARCH_API_URL")
 
+    def get_circuit_breaker_names(self) -> List[str]:
+        return (
+            [CircuitBreakerRegistry.get_name_for_url(self.api_url)]
+            if self.api_url
+            else []
+        )
+
     # noinspection PyMethodMayBeStatic
     def _build_query(self) -> str:
         return """
@@ -212,7 +225,16 @@ class ProviderSearchTool(ResilientBaseTool):
             "accept": "*/*",
         }
 
-        async_client: httpx.AsyncClient = httpx.AsyncClient(headers=headers)
+        async_client: httpx.AsyncClient = httpx.AsyncClient(
+            headers=headers,
+            transport=(
+                CircuitBreakerTransport(
+                    circuit_breaker_registry=self.circuit_breaker_registry
+                )
+                if self.circuit_breaker_registry is not None
+                else None
+            ),
+        )
 
         try:
             response = await async_client.post(self.api_url, json=payload, timeout=30.0)
@@ -226,3 +248,5 @@ class ProviderSearchTool(ResilientBaseTool):
             raise Exception("Request timed out")
         except httpx.RequestError as e:
             raise Exception(f"Request failed: {str(e)}")
+        finally:
+            await async_client.aclose()
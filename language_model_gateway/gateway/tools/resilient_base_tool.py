@@ -1,16 +1,69 @@
+import logging
 from abc import ABCMeta
 from typing import Optional, Any, Dict, Union, List
 
+from langchain_core.messages import ToolCall, ToolMessage
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class ResilientBaseTool(BaseTool, metaclass=ABCMeta):
     """
     This is a base tool that provides resilience to the tool execution.
 
+    If circuit_breaker_registry is set and the circuit breaker of a dependency returned by
+    get_circuit_breaker_names() is open, the tool returns a "temporarily unavailable" message
+    immediately instead of waiting for the dependency to time out.
     """
 
+    circuit_breaker_registry: Optional[CircuitBreakerRegistry] = None
+
+    def get_circuit_breaker_names(self) -> List[str]:
+        """
+        Names of the dependencies the tool calls.  Tools that call http dependencies override this.
+
+        :return: dependency names as returned by CircuitBreakerRegistry.get_name_for_url()
+        """
+        return []
+
+    async def ainvoke(
+        self,
+        input: Union[str, Dict[str, Any], ToolCall],
+        config: Optional[RunnableConfig] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if self.circuit_breaker_registry is not None:
+            registry: CircuitBreakerRegistry = self.circuit_breaker_registry
+            unavailable: List[str] = [
+                name
+                for name in self.get_circuit_breaker_names()
+                if registry.is_open(name=name)
+            ]
+            if unavailable:
+                logger.warning(
+                    f"Not running {self.name} since {', '.join(unavailable)} is unavailable"
+                )
+                content: str = (
+                    f"{self.name} is temporarily unavailable because {', '.join(unavailable)}"
+                    " is not responding.  Try again later or answer without this tool."
+                )
+                if isinstance(input, dict) and input.get("type") == "tool_call":
+                    return ToolMessage(
+                        content=content,
+                        name=self.name,
+                        tool_call_id=input["id"],
+                        status="error",
+                    )
+                return content
+        return await super().ainvoke(input, config, **kwargs)
+
     def _parse_input(
         self, tool_input: Union[str, Dict[str, Any]], tool_call_id: Optional[str]
     ) -> Union[str, dict[str, Any]]:
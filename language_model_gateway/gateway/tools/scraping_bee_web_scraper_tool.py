@@ -9,6 +9,12 @@ from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBa
 from language_model_gateway.gateway.utilities.html_to_markdown_converter import (
     HtmlToMarkdownConverter,
 )
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +63,11 @@ class ScrapingBeeWebScraperTool(ResilientBaseTool):
     return_markdown: bool = False
     """Whether to return the content as markdown or plain text (default)"""
 
+    passage_extractor: Optional[PassageExtractor] = None
+    """If set, long pages are cut down to the passages most relevant to the query"""
+
+    passage_extraction_config: PassageExtractionConfig = PassageExtractionConfig()
+
     async def _async_scrape(self, *, url: str, query: Optional[str]) -> Optional[str]:
         """Async method to scrape URL using ScrapingBee"""
 
@@ -138,7 +149,18 @@ class ScrapingBeeWebScraperTool(ResilientBaseTool):
             artifact: str = f"ScrapingBeeWebScraperAgent: Scraped content using ScrapingBee from <{url}> "
             if use_verbose_logging:
                 logger.info(f"\n```\n{content}\n```")
-            return await self._extract_text_content_async(content), artifact
+            text: str = await self._extract_text_content_async(content)
+            if self.passage_extractor is not None:
+                passages = self.passage_extractor.extract(
+                    text=text,
+                    query=query,
+                    source=url,
+                    tool_name=self.name,
+                    config=self.passage_extraction_config,
+                )
+                text = passages.text
+                artifact += f"\n{passages.get_summary()}"
+            return text, artifact
         else:
             return (
                 "Error: Failed to scrape the webpage.",
@@ -1,5 +1,5 @@
 from os import environ
-from typing import Dict
+from typing import Dict, Optional
 
 from langchain_community.tools import (
     DuckDuckGoSearchRun,
@@ -22,6 +22,9 @@ from language_model_gateway.gateway.tools.confluence_search_tool import (
     ConfluenceSearchTool,
 )
 from language_model_gateway.gateway.tools.current_time_tool import CurrentTimeTool
+from language_model_gateway.gateway.tools.document_passage_retriever_tool import (
+    DocumentPassageRetrieverTool,
+)
 from langchain_community.tools.pubmed.tool import PubmedQueryRun
 
 from language_model_gateway.gateway.tools.er_diagram_generator_tool import (
@@ -71,6 +74,9 @@ from language_model_gateway.gateway.tools.sequence_diagram_generator_tool import
     SequenceDiagramGeneratorTool,
 )
 from language_model_gateway.gateway.tools.url_to_markdown_tool import URLToMarkdownTool
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
 from language_model_gateway.gateway.utilities.confluence.confluence_helper import (
     ConfluenceHelper,
 )
@@ -86,6 +92,16 @@ from language_model_gateway.gateway.utilities.jira.jira_issues_helper import (
 from language_model_gateway.gateway.utilities.databricks.databricks_helper import (
     DatabricksHelper,
 )
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
+from language_model_gateway.gateway.tools.web_search_tool import WebSearchTool
+from language_model_gateway.gateway.utilities.web_search.web_searcher import (
+    WebSearcher,
+)
 
 
 class ToolProvider:
@@ -100,7 +116,16 @@ class ToolProvider:
         jira_issues_helper: JiraIssueHelper,
         confluence_helper: ConfluenceHelper,
         databricks_helper: DatabricksHelper,
+        circuit_breaker_registry: CircuitBreakerRegistry,
+        passage_extractor: Optional[PassageExtractor] = None,
+        web_searcher: Optional[WebSearcher] = None,
     ) -> None:
+        # searches all the configured engines with one tool call
+        multi_engine_web_search_tool: Optional[WebSearchTool] = (
+            WebSearchTool(web_searcher=web_searcher)
+            if web_searcher is not None
+            else None
+        )
         web_search_tool: BaseTool
         default_web_search_tool: str = environ.get(
             "DEFAULT_WEB_SEARCH_TOOL", "duckduckgo"
@@ -110,6 +135,8 @@ class ToolProvider:
                 web_search_tool = DuckDuckGoSearchRun()
             case "google_search":
                 web_search_tool = GoogleSearchTool()
+            case "multi_engine_web_search" if multi_engine_web_search_tool is not None:
+                web_search_tool = multi_engine_web_search_tool
             case _:
                 raise ValueError(
                     f"Unknown default web search tool: {default_web_search_tool}"
@@ -122,7 +149,10 @@ class ToolProvider:
             "google_search": GoogleSearchTool(),
             "duckduckgo_search": DuckDuckGoSearchRun(),
             "python_repl": PythonReplTool(),
-            "get_web_page": URLToMarkdownTool(),
+            "get_web_page": URLToMarkdownTool(
+                passage_extractor=passage_extractor,
+                passage_extraction_config=PassageExtractionConfig(max_tokens=3000),
+            ),
             "arxiv_search": ArxivQueryRun(),
             "health_summary_generator": HealthSummaryGeneratorTool(
                 file_manager_factory=file_manager_factory,
@@ -153,36 +183,54 @@ class ToolProvider:
                 file_manager_factory=file_manager_factory
             ),
             "scraping_bee_web_scraper": ScrapingBeeWebScraperTool(
-                api_key=environ.get("SCRAPING_BEE_API_KEY")
+                api_key=environ.get("SCRAPING_BEE_API_KEY"),
+                passage_extractor=passage_extractor,
+                passage_extraction_config=PassageExtractionConfig(max_tokens=3000),
+            ),
+            "provider_search": ProviderSearchTool(
+                circuit_breaker_registry=circuit_breaker_registry
             ),
-            "provider_search": ProviderSearchTool(),
             "pdf_text_extractor": PDFExtractionTool(
-                ocr_extractor_factory=ocr_extractor_factory
+                ocr_extractor_factory=ocr_extractor_factory,
+                passage_extractor=passage_extractor,
+                # PDFs are often read for specific sections so keep more of them
+                passage_extraction_config=PassageExtractionConfig(
+                    max_tokens=4000, passage_tokens=300
+                ),
             ),
             "github_pull_request_analyzer": GitHubPullRequestAnalyzerTool(
-                github_pull_request_helper=github_pull_request_helper
+                github_pull_request_helper=github_pull_request_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
             ),
             "github_pull_request_diff": GitHubPullRequestDiffTool(
-                github_pull_request_helper=github_pull_request_helper
+                github_pull_request_helper=github_pull_request_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
             ),
             "jira_issues_analyzer": JiraIssuesAnalyzerTool(
-                jira_issues_helper=jira_issues_helper
+                jira_issues_helper=jira_issues_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
             ),
             "databricks_query_validator": DatabricksSQLTool(
                 databricks_helper=databricks_helper
             ),
             "fhir_graphql_schema_provider": GraphqlSchemaProviderTool(),
             "jira_issue_retriever": JiraIssueRetriever(
-                jira_issues_helper=jira_issues_helper
+                jira_issues_helper=jira_issues_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
             ),
             "github_pull_request_retriever": GitHubPullRequestRetriever(
-                github_pull_request_helper=github_pull_request_helper
+                github_pull_request_helper=github_pull_request_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
             ),
             "confluence_search_tool": ConfluenceSearchTool(
-                confluence_helper=confluence_helper
+                confluence_helper=confluence_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
             ),
             "confluence_page_retriever": ConfluencePageRetriever(
-                confluence_helper=confluence_helper
+                confluence_helper=confluence_helper,
+                circuit_breaker_registry=circuit_breaker_registry,
+                passage_extractor=passage_extractor,
+                passage_extraction_config=PassageExtractionConfig(max_tokens=3000),
             ),
             # "sql_query": QuerySQLDataBaseTool(
             #     db=SQLDatabase(
@@ -194,6 +242,13 @@ class ToolProvider:
             #     )
             # ),
         }
+        if multi_engine_web_search_tool is not None:
+            self.tools["multi_engine_web_search"] = multi_engine_web_search_tool
+        self.passage_extractor: Optional[PassageExtractor] = passage_extractor
+        if passage_extractor is not None:
+            self.tools[PassageExtractor.more_passages_tool_name] = (
+                DocumentPassageRetrieverTool(passage_extractor=passage_extractor)
+            )
 
     def get_tool_by_name(self, *, tool: AgentConfig) -> BaseTool:
         if tool.name in self.tools:
@@ -201,4 +256,14 @@ class ToolProvider:
         raise ValueError(f"Tool with name {tool.name} not found")
 
     def get_tools(self, *, tools: list[AgentConfig]) -> list[BaseTool]:
-        return [self.get_tool_by_name(tool=tool) for tool in tools]
+        result: list[BaseTool] = [self.get_tool_by_name(tool=tool) for tool in tools]
+        # tools that return only some passages of long documents need the tool to fetch more
+        if self.passage_extractor is not None and any(
+            getattr(tool, "passage_extractor", None) is not None for tool in result
+        ):
+            more_passages_tool: BaseTool = self.tools[
+                PassageExtractor.more_passages_tool_name
+            ]
+            if more_passages_tool not in result:
+                result.append(more_passages_tool)
+        return result
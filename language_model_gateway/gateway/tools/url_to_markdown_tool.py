@@ -10,6 +10,12 @@ from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBa
 from language_model_gateway.gateway.utilities.html_to_markdown_converter import (
     HtmlToMarkdownConverter,
 )
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -17,6 +23,10 @@ logger = logging.getLogger(__name__)
 
 class URLToMarkdownToolInput(BaseModel):
     url: str = Field(description="url of the webpage to scrape")
+    query: Optional[str] = Field(
+        default=None,
+        description="Question to answer from the page.  Long pages are cut down to the passages most relevant to it.",
+    )
     use_verbose_logging: Optional[bool] = Field(
         default=False,
         description="Whether to enable verbose logging",
@@ -36,8 +46,16 @@ class URLToMarkdownTool(ResilientBaseTool):
     args_schema: Type[BaseModel] = URLToMarkdownToolInput
     response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
 
+    passage_extractor: Optional[PassageExtractor] = None
+    """If set, long pages are cut down to the passages most relevant to the query"""
+
+    passage_extraction_config: PassageExtractionConfig = PassageExtractionConfig()
+
     def _run(
-        self, url: str, use_verbose_logging: Optional[bool] = None
+        self,
+        url: str,
+        query: Optional[str] = None,
+        use_verbose_logging: Optional[bool] = None,
     ) -> Tuple[str, str]:
         """
         Synchronous version of the tool (falls back to async implementation).
@@ -47,7 +65,10 @@ class URLToMarkdownTool(ResilientBaseTool):
         raise NotImplementedError("Use async version of this tool")
 
     async def _arun(
-        self, url: str, use_verbose_logging: Optional[bool] = None
+        self,
+        url: str,
+        query: Optional[str] = None,
+        use_verbose_logging: Optional[bool] = None,
     ) -> Tuple[str, str]:
         """
         Asynchronous version of the tool.
@@ -80,6 +101,16 @@ class URLToMarkdownTool(ResilientBaseTool):
             artifact: str = f"URLToMarkdownAgent: Scraped content from <{url}> "
             if use_verbose_logging:
                 logger.info(f"\n```\n{content}\n```")
+            if self.passage_extractor is not None:
+                passages = self.passage_extractor.extract(
+                    text=content,
+                    query=query,
+                    source=url,
+                    tool_name=self.name,
+                    config=self.passage_extraction_config,
+                )
+                content = passages.text
+                artifact += f"\n{passages.get_summary()}"
             return content, artifact
         except Exception as e:
             return (
@@ -0,0 +1,76 @@
+import logging
+import os
+from typing import List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel, Field
+
+from language_model_gateway.gateway.tools.resilient_base_tool import ResilientBaseTool
+from language_model_gateway.gateway.utilities.web_search.web_search_response import (
+    WebSearchResponse,
+)
+from language_model_gateway.gateway.utilities.web_search.web_searcher import (
+    WebSearcher,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WebSearchToolInput(BaseModel):
+    query: str = Field(description="The search query")
+    max_results: Optional[int] = Field(
+        default=10, description="Maximum number of results to return"
+    )
+
+
+class WebSearchTool(ResilientBaseTool):
+    """
+    Searches all the configured engines (e.g. Google, DuckDuckGo, PubMed and arXiv) with one tool
+    call instead of one call per engine
+    """
+
+    name: str = "multi_engine_web_search"
+    description: str = (
+        "Search the web, PubMed and arXiv at once and get the combined results. "
+        "Results found by several engines are listed first."
+    )
+
+    args_schema: Type[BaseModel] = WebSearchToolInput
+    response_format: Literal["content", "content_and_artifact"] = "content_and_artifact"
+
+    web_searcher: WebSearcher
+
+    def _run(self, query: str, max_results: Optional[int] = 10) -> Tuple[str, str]:
+        """Use async version of this tool."""
+        raise NotImplementedError("Use async version of this tool")
+
+    async def _arun(
+        self, query: str, max_results: Optional[int] = 10
+    ) -> Tuple[str, str]:
+        artifact: str = f'WebSearchAgent: Searched for "{query}"'
+        try:
+            response: WebSearchResponse = await self.web_searcher.search_async(
+                query=query, max_results=max_results or 10
+            )
+            artifact = (
+                f'WebSearchAgent: Searched {", ".join(response.engines)} for "{query}"'
+                + (" (cached)" if response.cached else "")
+            )
+            lines: List[str] = [
+                f"{index}. [{result.title}]({result.url}) {result.snippet}"
+                f" (found by {', '.join(result.engines)})"
+                for index, result in enumerate(response.results, start=1)
+            ]
+            if response.failed_engines:
+                lines.append(
+                    f"No results from {', '.join(response.failed_engines)} since the search failed"
+                    " or timed out."
+                )
+            if not response.results:
+                lines.insert(0, "No good search result was found.")
+            content: str = "\n".join(lines)
+            if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
+                logger.info(f"Web search results: {content}")
+            return content, artifact
+        except Exception as e:
+            logger.exception(e, stack_info=True)
+            return "Ran into an error while searching the web", artifact
@@ -0,0 +1,54 @@
+import asyncio
+from typing import AsyncGenerator, AsyncIterator, Optional, TypeVar
+
+from language_model_gateway.gateway.utilities.deadline_exceeded_error import (
+    DeadlineExceededError,
+)
+
+T = TypeVar("T")
+
+
+async def iterate_until_deadline(
+    *, items: AsyncIterator[T], timeout_seconds: Optional[float]
+) -> AsyncGenerator[T, None]:
+    """
+    Yields the items from an async iterator until the wall clock deadline is reached.
+
+    Only the wait for the next item is timed so the caller can take as long as it wants to
+    process each item.  The iterator is closed when the deadline is reached so the work it was
+    doing (e.g. a running agent) is cancelled.
+
+    Args:
+        items: async iterator to read from
+        timeout_seconds: seconds from now until the deadline.  None means no deadline.
+
+    Yields:
+        items from the iterator
+
+    Raises:
+        DeadlineExceededError: when the deadline is reached before the iterator is finished.  A
+            TimeoutError raised by the iterator itself is passed on unchanged.
+    """
+    if timeout_seconds is None:
+        async for item in items:
+            yield item
+        return
+
+    deadline: float = asyncio.get_running_loop().time() + timeout_seconds
+    try:
+        while True:
+            timeout: asyncio.Timeout = asyncio.timeout_at(deadline)
+            try:
+                async with timeout:
+                    item = await items.__anext__()
+            except StopAsyncIteration:
+                return
+            except TimeoutError as e:
+                if timeout.expired():
+                    raise DeadlineExceededError(timeout_seconds=timeout_seconds) from e
+                raise
+            yield item
+    finally:
+        close = getattr(items, "aclose", None)
+        if close is not None:
+            await close()
@@ -0,0 +1,88 @@
+import math
+import re
+from collections import Counter
+from typing import List, Sequence
+
+
+class Bm25Ranker:
+    """
+    Ranks documents against a query with BM25.  Used to select tools and to select the passages
+    of long documents.
+    """
+
+    # BM25 parameters
+    k1: float = 1.5
+    b: float = 0.75
+
+    stop_words: frozenset[str] = frozenset(
+        "a an and are as at be by can do for from get give how i in is it me my of on or "
+        "please show tell that the this to use what when where which who why with you your".split()
+    )
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """
+        Split text into lower case terms.  snake_case and CamelCase words are split and a
+        trailing s is removed so plurals match.
+
+        Args:
+            text: text to split
+
+        Returns:
+            list of terms
+        """
+        text = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
+        terms: List[str] = []
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            if word in cls.stop_words:
+                continue
+            if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+                word = word[:-1]
+            terms.append(word)
+        return terms
+
+    @classmethod
+    def rank(cls, *, documents: Sequence[Sequence[str]], query: str) -> List[float]:
+        """
+        Score each document against the query
+
+        Args:
+            documents: terms of each document as returned by tokenize()
+            query: text to rank the documents against
+
+        Returns:
+            score of each document in the same order as documents
+        """
+        term_counts: List[Counter[str]] = [Counter(document) for document in documents]
+        if not term_counts:
+            return []
+        average_length: float = sum(len(d) for d in documents) / len(documents)
+        document_frequency: Counter[str] = Counter(
+            term for document in term_counts for term in document
+        )
+        query_terms: List[str] = list(dict.fromkeys(cls.tokenize(query)))
+
+        scores: List[float] = []
+        for document in term_counts:
+            length: int = sum(document.values())
+            score: float = 0.0
+            for term in query_terms:
+                frequency: int = document.get(term, 0)
+                if frequency == 0:
+                    continue
+                idf: float = math.log(
+                    1
+                    + (len(documents) - document_frequency[term] + 0.5)
+                    / (document_frequency[term] + 0.5)
+                )
+                score += (
+                    idf
+                    * frequency
+                    * (cls.k1 + 1)
+                    / (
+                        frequency
+                        + cls.k1 * (1 - cls.b + cls.b * length / (average_length or 1))
+                    )
+                )
+            scores.append(score)
+        return scores
@@ -12,6 +12,10 @@ from langchain_core.messages import (
 )
 from openai.types.chat import ChatCompletionMessage
 
+from language_model_gateway.gateway.utilities.status_message_marker import (
+    StatusMessageMarker,
+)
+
 
 def convert_message_content_to_string(content: str | list[str | Dict[str, Any]]) -> str:
     if isinstance(content, str):
@@ -32,7 +36,11 @@ def convert_message_content_to_string(content: str | list[str | Dict[str, Any]])
 
 
 def langchain_to_chat_message(message: BaseMessage) -> Optional[ChatCompletionMessage]:
-    """Create a ChatMessage from a LangChain message."""
+    """
+    Create a ChatMessage from a LangChain message for a non-streaming response.
+
+    Status text is only marked in streamed responses so the markers are removed here.
+    """
     match message:
         case SystemMessage():
             assert False, (
@@ -45,7 +53,9 @@ def langchain_to_chat_message(message: BaseMessage) -> Optional[ChatCompletionMe
         case AIMessage():
             ai_message = ChatCompletionMessage(
                 role="assistant",
-                content=convert_message_content_to_string(message.content),
+                content=StatusMessageMarker.unmark(
+                    convert_message_content_to_string(message.content)
+                ),
             )
             # if message.tool_calls:
             #     ai_message.tool_calls = message.tool_calls
@@ -0,0 +1,190 @@
+import collections
+import logging
+import threading
+import time
+from typing import Deque, Dict, Literal, Optional, Tuple
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    CIRCUIT_BREAKER_CALLS,
+    CIRCUIT_BREAKER_STATE,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_open_error import (
+    CircuitOpenError,
+)
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_STATES = Literal["closed", "open", "half_open"]
+
+_state_values: Dict[CIRCUIT_BREAKER_STATES, int] = {
+    "closed": 0,
+    "half_open": 1,
+    "open": 2,
+}
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one dependency (an upstream host or a model provider).
+
+    The results of the calls in the last window_seconds are kept.  Once there are min_calls of
+    them, the breaker opens when the rate of failures reaches failure_rate_threshold or the rate
+    of calls slower than slow_call_seconds reaches slow_call_rate_threshold.  While open, calls
+    are rejected immediately.  After open_seconds the breaker is half open and lets one probe call
+    through: if it succeeds the breaker closes, otherwise it opens again.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        window_seconds: float = 60,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: Optional[float] = 30,
+        slow_call_rate_threshold: float = 0.8,
+        open_seconds: float = 30,
+    ) -> None:
+        self.name: str = name
+        self.window_seconds: float = window_seconds
+        self.min_calls: int = min_calls
+        self.failure_rate_threshold: float = failure_rate_threshold
+        self.slow_call_seconds: Optional[float] = slow_call_seconds
+        self.slow_call_rate_threshold: float = slow_call_rate_threshold
+        self.open_seconds: float = open_seconds
+
+        self._state: CIRCUIT_BREAKER_STATES = "closed"
+        self._opened_at: float = 0.0
+        self._probe_in_flight: bool = False
+        # (time, failed, slow) of the calls in the window
+        self._calls: Deque[Tuple[float, bool, bool]] = collections.deque()
+        self._lock: threading.Lock = threading.Lock()
+        CIRCUIT_BREAKER_STATE.labels(dependency=name).set(0)
+
+    @property
+    def state(self) -> CIRCUIT_BREAKER_STATES:
+        with self._lock:
+            if self._state == "open" and self._get_retry_after_seconds() <= 0:
+                return "half_open"
+            return self._state
+
+    def _get_retry_after_seconds(self) -> float:
+        return self._opened_at + self.open_seconds - time.monotonic()
+
+    def _set_state(self, state: CIRCUIT_BREAKER_STATES) -> None:
+        if state == self._state:
+            return
+        logger.warning(f"Circuit breaker for {self.name} is now {state}")
+        self._state = state
+        self._probe_in_flight = False
+        if state == "open":
+            self._opened_at = time.monotonic()
+        if state == "closed":
+            self._calls.clear()
+        CIRCUIT_BREAKER_STATE.labels(dependency=self.name).set(_state_values[state])
+
+    def is_open(self) -> bool:
+        """
+        Whether calls are being rejected.  Does not use up the half open probe.
+
+        Returns:
+            True if the breaker is open and the open period has not passed
+        """
+        return self.state == "open"
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call can be made.  Every allowed call must be followed by
+        record_success(), record_failure() or release().
+
+        Returns:
+            False if the call should be rejected
+        """
+        with self._lock:
+            if self._state == "open":
+                if self._get_retry_after_seconds() > 0:
+                    CIRCUIT_BREAKER_CALLS.labels(
+                        dependency=self.name, result="rejected"
+                    ).inc()
+                    return False
+                self._set_state("half_open")
+            if self._state == "half_open":
+                if self._probe_in_flight:
+                    CIRCUIT_BREAKER_CALLS.labels(
+                        dependency=self.name, result="rejected"
+                    ).inc()
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def check(self) -> None:
+        """
+        Check whether a call can be made
+
+        Raises:
+            CircuitOpenError: if the call should be rejected
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(
+                name=self.name,
+                retry_after_seconds=max(self._get_retry_after_seconds(), 0),
+            )
+
+    def record_success(self, *, latency_seconds: Optional[float] = None) -> None:
+        """
+        Record a successful call
+
+        Args:
+            latency_seconds: time the call took.  None if the latency should not be checked.
+        """
+        slow: bool = (
+            latency_seconds is not None
+            and self.slow_call_seconds is not None
+            and latency_seconds >= self.slow_call_seconds
+        )
+        CIRCUIT_BREAKER_CALLS.labels(
+            dependency=self.name, result="slow" if slow else "success"
+        ).inc()
+        with self._lock:
+            if self._state == "half_open":
+                self._set_state("open" if slow else "closed")
+                return
+            self._add_call(failed=False, slow=slow)
+
+    def record_failure(self) -> None:
+        """
+        Record a failed call (an error, a timeout or a 5xx response)
+        """
+        CIRCUIT_BREAKER_CALLS.labels(dependency=self.name, result="failure").inc()
+        with self._lock:
+            if self._state == "half_open":
+                self._set_state("open")
+                return
+            self._add_call(failed=True, slow=False)
+
+    def release(self) -> None:
+        """
+        Record that an allowed call was cancelled or failed for a reason unrelated to the
+        dependency so its result is unknown
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _add_call(self, *, failed: bool, slow: bool) -> None:
+        now: float = time.monotonic()
+        self._calls.append((now, failed, slow))
+        while self._calls and self._calls[0][0] < now - self.window_seconds:
+            self._calls.popleft()
+        if self._state != "closed" or len(self._calls) < self.min_calls:
+            return
+        failure_rate: float = sum(c[1] for c in self._calls) / len(self._calls)
+        slow_call_rate: float = sum(c[2] for c in self._calls) / len(self._calls)
+        if (
+            failure_rate >= self.failure_rate_threshold
+            or slow_call_rate >= self.slow_call_rate_threshold
+        ):
+            logger.warning(
+                f"Opening circuit breaker for {self.name}: failure rate {failure_rate:.0%},"
+                f" slow call rate {slow_call_rate:.0%} over {len(self._calls)} calls"
+            )
+            self._set_state("open")
@@ -0,0 +1,102 @@
+from typing import Any, Dict, List
+from uuid import UUID
+
+import httpx
+import openai
+from botocore.exceptions import (
+    ClientError,
+    ConnectionError as BotoConnectionError,
+    HTTPClientError,
+)
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker import (
+    CircuitBreaker,
+)
+
+
+class CircuitBreakerCallbackHandler(BaseCallbackHandler):
+    """
+    Passes the calls of a chat model through the circuit breaker of the model.  When the
+    breaker is open the call fails immediately with CircuitOpenError.
+
+    Only errors are counted since the time to generate a response depends on its length, and
+    only the errors that say the model is unavailable: throttling, 5xx and connection errors.
+    Other errors (a bad request, a tool that raised, a parsing error) are the caller's problem
+    and do not open the breaker.
+    """
+
+    # raise CircuitOpenError from on_chat_model_start in the caller
+    raise_error: bool = True
+    run_inline: bool = True
+
+    # error codes of ClientError from bedrock that mean the model is unavailable (lower cased)
+    unavailable_error_codes = {
+        "throttlingexception",
+        "toomanyrequestsexception",
+        "servicequotaexceededexception",
+        "serviceunavailableexception",
+        "internalserverexception",
+        "modelnotreadyexception",
+        "modeltimeoutexception",
+    }
+
+    def __init__(self, *, circuit_breaker: CircuitBreaker) -> None:
+        self.circuit_breaker: CircuitBreaker = circuit_breaker
+        assert self.circuit_breaker is not None
+        assert isinstance(self.circuit_breaker, CircuitBreaker)
+
+    @classmethod
+    def is_unavailable_error(cls, error: BaseException) -> bool:
+        """
+        Args:
+            error: error raised by the model call
+
+        Returns:
+            True if the error is a throttling, 5xx or connection error
+        """
+        if isinstance(error, ClientError):
+            code: str = str(error.response.get("Error", {}).get("Code", "")).lower()
+            status_code: int = int(
+                error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+            )
+            return (
+                code in cls.unavailable_error_codes
+                or status_code == 429
+                or status_code >= 500
+            )
+        if isinstance(error, openai.APIStatusError):
+            return error.status_code == 429 or error.status_code >= 500
+        return isinstance(
+            error,
+            (
+                openai.APIConnectionError,
+                BotoConnectionError,
+                HTTPClientError,
+                httpx.TransportError,
+                ConnectionError,
+                TimeoutError,
+            ),
+        )
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any,
+    ) -> Any:
+        self.circuit_breaker.check()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> Any:
+        self.circuit_breaker.record_success()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> Any:
+        if self.is_unavailable_error(error):
+            self.circuit_breaker.record_failure()
+        else:
+            # cancelled and failed calls that say nothing about the model only free the probe
+            self.circuit_breaker.release()
@@ -0,0 +1,85 @@
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker import (
+    CircuitBreaker,
+)
+
+
+class CircuitBreakerRegistry:
+    """
+    Keeps one circuit breaker per dependency.  The state has to be shared by all requests so
+    this is registered as a singleton.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_seconds: float = 60,
+        min_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 30,
+        slow_call_rate_threshold: float = 0.8,
+        open_seconds: float = 30,
+    ) -> None:
+        self.window_seconds: float = window_seconds
+        self.min_calls: int = min_calls
+        self.failure_rate_threshold: float = failure_rate_threshold
+        self.slow_call_seconds: float = slow_call_seconds
+        self.slow_call_rate_threshold: float = slow_call_rate_threshold
+        self.open_seconds: float = open_seconds
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, *, name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker for a dependency
+
+        Args:
+            name: name of the dependency.  Use get_name_for_url() for http dependencies.
+
+        Returns:
+            circuit breaker
+        """
+        with self._lock:
+            circuit_breaker: Optional[CircuitBreaker] = self._circuit_breakers.get(name)
+            if circuit_breaker is None:
+                circuit_breaker = CircuitBreaker(
+                    name=name,
+                    window_seconds=self.window_seconds,
+                    min_calls=self.min_calls,
+                    failure_rate_threshold=self.failure_rate_threshold,
+                    slow_call_seconds=self.slow_call_seconds,
+                    slow_call_rate_threshold=self.slow_call_rate_threshold,
+                    open_seconds=self.open_seconds,
+                )
+                self._circuit_breakers[name] = circuit_breaker
+            return circuit_breaker
+
+    @staticmethod
+    def get_name_for_url(url: str) -> str:
+        """
+        Get the dependency name for a URL.  Http dependencies are identified by their host.
+
+        Args:
+            url: url of the dependency
+
+        Returns:
+            dependency name
+        """
+        return urlparse(url).netloc or url
+
+    def is_open(self, *, name: str) -> bool:
+        """
+        Whether calls to the dependency are being rejected
+
+        Args:
+            name: name of the dependency
+
+        Returns:
+            True if the circuit breaker of the dependency is open
+        """
+        with self._lock:
+            circuit_breaker: Optional[CircuitBreaker] = self._circuit_breakers.get(name)
+        return circuit_breaker is not None and circuit_breaker.is_open()
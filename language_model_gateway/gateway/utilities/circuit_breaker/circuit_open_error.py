@@ -0,0 +1,9 @@
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit breaker is open"""
+
+    def __init__(self, *, name: str, retry_after_seconds: float) -> None:
+        self.name: str = name
+        self.retry_after_seconds: float = retry_after_seconds
+        super().__init__(
+            f"{name} is temporarily unavailable.  Retry in {retry_after_seconds:.0f} seconds."
+        )
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
@@ -9,3 +10,5 @@ class ConfluenceDocument:
     updated_at: str
     author_name: str
     content: str
+    # version.number of the page which changes with every edit
+    version_number: Optional[int] = None
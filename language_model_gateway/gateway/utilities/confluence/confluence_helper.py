@@ -1,18 +1,40 @@
+import asyncio
 import base64
 import csv
 import logging
 import re
-from datetime import datetime
-from typing import List, Optional
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
+import httpx
+
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    CONFLUENCE_INDEX_SEARCHES,
+)
 from language_model_gateway.gateway.utilities.confluence.confluence_document import (
     ConfluenceDocument,
 )
+from language_model_gateway.gateway.utilities.confluence.confluence_indexed_page import (
+    ConfluenceIndexedPage,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_page_cache import (
+    ConfluencePageCache,
+)
 from language_model_gateway.gateway.utilities.confluence.confluence_search_result import (
     ConfluenceSearchResult,
 )
+from language_model_gateway.gateway.utilities.confluence.confluence_search_index import (
+    ConfluenceSearchIndex,
+)
+from language_model_gateway.gateway.utilities.html_to_markdown_converter import (
+    HtmlToMarkdownConverter,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
 
 
 class ConfluenceHelper:
@@ -23,7 +45,46 @@ class ConfluenceHelper:
         confluence_base_url: Optional[str],
         access_token: Optional[str],
         username: Optional[str],
+        confluence_page_cache: Optional[ConfluencePageCache] = None,
+        max_concurrent_pages: int = 5,
+        confluence_search_index: Optional[ConfluenceSearchIndex] = None,
+        passage_extractor: Optional[PassageExtractor] = None,
+        index_sync_interval_seconds: float = 5 * 60,
+        index_sync_overlap_seconds: float = 24 * 60 * 60,
+        index_chunk_tokens: int = 250,
+        index_sync_lease_seconds: float = 10 * 60,
     ):
+        """
+        Args:
+            confluence_page_cache: if set, pages are cached by version and only downloaded again
+                after they are edited
+            max_concurrent_pages: pages that retrieve_pages_by_ids downloads concurrently
+            confluence_search_index: if set, searches are answered from this local index of the
+                configured spaces and go to Confluence only when the index finds nothing
+            passage_extractor: splits the indexed pages into chunks.  Required with the index.
+            index_sync_interval_seconds: the index is not synced again within this time
+            index_sync_overlap_seconds: syncs go back this far before the newest indexed page since
+                CQL dates are in the time zone of the Confluence user
+            index_chunk_tokens: approximate size of the indexed chunks
+            index_sync_lease_seconds: a sync that does not renew its lease within this time is
+                considered dead and another worker can sync the space
+        """
+        assert max_concurrent_pages > 0
+        assert confluence_search_index is None or passage_extractor is not None, (
+            "Passage extractor is required to index Confluence pages"
+        )
+        self.confluence_search_index: Optional[ConfluenceSearchIndex] = (
+            confluence_search_index
+        )
+        self.passage_extractor: Optional[PassageExtractor] = passage_extractor
+        self.index_sync_interval_seconds: float = index_sync_interval_seconds
+        self.index_sync_overlap_seconds: float = index_sync_overlap_seconds
+        self.index_chunk_tokens: int = index_chunk_tokens
+        self.index_sync_lease_seconds: float = index_sync_lease_seconds
+        self.confluence_page_cache: Optional[ConfluencePageCache] = (
+            confluence_page_cache
+        )
+        self.max_concurrent_pages: int = max_concurrent_pages
         self.http_client_factory = http_client_factory
         self.logger = logging.getLogger(__name__)
         self.confluence_base_url = (
@@ -47,6 +108,24 @@ class ConfluenceHelper:
             self.logger.error("Confluence base URL is not set.")
             return []
 
+        if self.confluence_search_index is not None:
+            self._schedule_index_sync()
+            indexed_results: List[ConfluenceSearchResult] = []
+            try:
+                # the index is used only when it has every page of the configured spaces
+                if await asyncio.to_thread(self.confluence_search_index.is_synced):
+                    indexed_results = await asyncio.to_thread(
+                        self.confluence_search_index.search,
+                        search_string=search_string,
+                        limit=limit,
+                    )
+            except Exception as e:
+                self.logger.error(f"Error searching Confluence index: {str(e)}")
+            if indexed_results:
+                CONFLUENCE_INDEX_SEARCHES.labels(result="hit").inc()
+                return indexed_results
+            CONFLUENCE_INDEX_SEARCHES.labels(result="miss").inc()
+
         async with self.http_client_factory.create_http_client(
             base_url=self.confluence_base_url, headers=self.headers, timeout=30.0
         ) as client:
@@ -92,6 +171,172 @@ class ConfluenceHelper:
                 self.logger.error(f"Error searching Confluence content: {str(e)}")
                 return []
 
+    def _schedule_index_sync(self) -> None:
+        """
+        Start syncing the search index in the background unless a sync is already running in
+        this process.  Searches do not wait for the sync so the first sync of a large space does
+        not hold up the conversation.
+        """
+        assert self.confluence_search_index is not None
+        sync_task: Optional[asyncio.Task[None]] = self.confluence_search_index.sync_task
+        if sync_task is not None and not sync_task.done():
+            return
+        self.confluence_search_index.sync_task = asyncio.create_task(
+            self.sync_search_index_async()
+        )
+
+    async def sync_search_index_async(self) -> None:
+        """
+        Add the pages modified since the last sync of each space to the search index.  Spaces
+        synced within index_sync_interval_seconds are skipped.
+        """
+        assert self.confluence_search_index is not None
+        assert self.confluence_base_url, "Confluence base URL is required"
+        async with self.http_client_factory.create_http_client(
+            base_url=self.confluence_base_url, headers=self.headers, timeout=30.0
+        ) as client:
+            for space_key in self.confluence_search_index.space_keys:
+                try:
+                    await self._sync_space_async(client=client, space_key=space_key)
+                except Exception as e:
+                    self.logger.error(
+                        f"Error syncing Confluence space {space_key} into the index: {str(e)}"
+                    )
+
+    def _is_sync_due(self, *, synced_at: Optional[datetime]) -> bool:
+        return (
+            synced_at is None
+            or (datetime.now(timezone.utc) - synced_at).total_seconds()
+            >= self.index_sync_interval_seconds
+        )
+
+    async def _sync_space_async(
+        self, *, client: httpx.AsyncClient, space_key: str
+    ) -> None:
+        """
+        Download the pages of a space modified since the newest indexed page and add them to the
+        search index.  Each page of results is written to the index as it arrives so a sync that
+        fails part way resumes where it stopped.  The space is skipped if another worker is
+        syncing it.
+
+        Args:
+            client: http client
+            space_key: space key
+        """
+        assert self.confluence_search_index is not None
+        confluence_search_index: ConfluenceSearchIndex = self.confluence_search_index
+        _, synced_at = await asyncio.to_thread(
+            confluence_search_index.get_sync_state, space_key=space_key
+        )
+        if not self._is_sync_due(synced_at=synced_at):
+            return
+        owner: str = uuid.uuid4().hex
+        if not await asyncio.to_thread(
+            confluence_search_index.try_acquire_sync_lease,
+            space_key=space_key,
+            owner=owner,
+            lease_seconds=self.index_sync_lease_seconds,
+        ):
+            self.logger.info(
+                f"Not syncing Confluence space {space_key} since it is being synced"
+            )
+            return
+        try:
+            now: datetime = datetime.now(timezone.utc)
+            last_modified, synced_at = await asyncio.to_thread(
+                confluence_search_index.get_sync_state, space_key=space_key
+            )
+            # another worker may have synced while we waited for the lease
+            if not self._is_sync_due(synced_at=synced_at):
+                return
+            cql: str = f'space = "{space_key}" AND type = page'
+            if last_modified is not None:
+                modified_since: datetime = last_modified - timedelta(
+                    seconds=self.index_sync_overlap_seconds
+                )
+                cql += f' AND lastModified >= "{modified_since.strftime("%Y-%m-%d %H:%M")}"'
+            cql += " ORDER BY lastModified ASC"
+
+            page_count: int = 0
+            url: Optional[str] = (
+                f"{self.confluence_base_url}/wiki/rest/api/content/search"
+            )
+            params: Optional[Dict[str, str]] = {
+                "cql": cql,
+                "expand": "body.storage,version",
+                "limit": "50",
+            }
+            while url:
+                response = await client.get(url, params=params)
+                response.raise_for_status()
+                result: Dict[str, Any] = response.json()
+                pages: List[ConfluenceIndexedPage] = [
+                    await self._get_indexed_page_async(
+                        content=content, space_key=space_key
+                    )
+                    for content in result.get("results", [])
+                ]
+                await asyncio.to_thread(confluence_search_index.upsert, pages=pages)
+                page_count += len(pages)
+                if not await asyncio.to_thread(
+                    confluence_search_index.try_acquire_sync_lease,
+                    space_key=space_key,
+                    owner=owner,
+                    lease_seconds=self.index_sync_lease_seconds,
+                ):
+                    self.logger.warning(
+                        f"Stopped syncing Confluence space {space_key} since the lease expired"
+                    )
+                    return
+                # the next link has the query and the cursor
+                next_link: Optional[str] = result.get("_links", {}).get("next")
+                url = (
+                    f"{self.confluence_base_url}/wiki{next_link}" if next_link else None
+                )
+                params = None
+            await asyncio.to_thread(
+                confluence_search_index.record_sync, space_key=space_key, synced_at=now
+            )
+            self.logger.info(
+                f"Indexed {page_count} Confluence pages of space {space_key} with CQL: {cql}"
+            )
+        finally:
+            await asyncio.to_thread(
+                confluence_search_index.release_sync_lease,
+                space_key=space_key,
+                owner=owner,
+            )
+
+    async def _get_indexed_page_async(
+        self, *, content: Dict[str, Any], space_key: str
+    ) -> ConfluenceIndexedPage:
+        """
+        Convert a page returned by the content search to markdown and split it into chunks
+
+        Args:
+            content: page with the body.storage and version expanded
+            space_key: space key
+
+        Returns:
+            the page to index
+        """
+        assert self.passage_extractor is not None
+        text: str = await HtmlToMarkdownConverter.get_markdown_from_html_async(
+            html_content=content.get("body", {}).get("storage", {}).get("value", "")
+        )
+        return ConfluenceIndexedPage(
+            id=str(content.get("id")),
+            space_key=space_key,
+            title=content.get("title") or "",
+            url=f"{self.confluence_base_url}/wiki/{content.get('_links', {}).get('webui')}",
+            last_modified=datetime.fromisoformat(
+                content.get("version", {}).get("when").replace("Z", "+00:00")
+            ),
+            chunks=self.passage_extractor.split_into_passages(
+                text=text, passage_tokens=self.index_chunk_tokens
+            ),
+        )
+
     def write_results_to_csv(
         self, search_results: List[ConfluenceSearchResult], output_file: str
     ) -> None:
@@ -161,6 +406,83 @@ class ConfluenceHelper:
             output += f"{result.title},{result.url},{result.updated_at}\n"
         return output
 
+    async def _retrieve_page_async(
+        self, *, client: httpx.AsyncClient, page_id: str
+    ) -> Optional[ConfluenceDocument]:
+        """
+        Retrieve a page.  If the page is cached, only its version is requested and the body is
+        downloaded only if the page was edited since.
+
+        Args:
+            client: http client
+            page_id: page id
+
+        Returns:
+            the page or None if it could not be retrieved
+        """
+        try:
+            url = f"{self.confluence_base_url}/wiki/rest/api/content/{page_id}"
+            if self.confluence_page_cache is not None:
+                cached_version_number: Optional[int] = (
+                    self.confluence_page_cache.get_version_number(page_id=page_id)
+                )
+                if cached_version_number is not None:
+                    version_response = await client.get(
+                        url, params={"expand": "version"}
+                    )
+                    version_response.raise_for_status()
+                    cached_page: Optional[ConfluenceDocument] = (
+                        self.confluence_page_cache.get(
+                            page_id=page_id,
+                            version_number=version_response.json()
+                            .get("version", {})
+                            .get("number"),
+                        )
+                    )
+                    if cached_page is not None:
+                        return cached_page
+
+            self.logger.info(
+                f"Retrieving Confluence page with ID: {page_id}, full URL: {url}"
+            )
+
+            response = await client.get(
+                url, params={"expand": "body.storage,version.by"}
+            )
+            response.raise_for_status()
+
+            result = response.json()
+            content = result.get("body", {}).get("storage", {}).get("value", "")
+            updated_at = (
+                datetime.fromisoformat(
+                    result.get("version", {}).get("when").replace("Z", "+00:00")
+                )
+                .date()
+                .isoformat()
+            )
+            author_name = (
+                result.get("version", {}).get("by", {}).get("displayName", "Unknown")
+            )
+
+            page = ConfluenceDocument(
+                id=result.get("id"),
+                title=result.get("title"),
+                url=f"{self.confluence_base_url}/wiki/{result.get('_links', {}).get('webui')}",
+                updated_at=updated_at,
+                author_name=author_name,
+                content=content,
+                version_number=result.get("version", {}).get("number"),
+            )
+            if (
+                self.confluence_page_cache is not None
+                and page.version_number is not None
+            ):
+                self.confluence_page_cache.set(page=page)
+            return page
+        except Exception as e:
+            self.logger.error(f"Error retrieving Confluence page: {str(e)}")
+            return None
+
     async def retrieve_page_by_id(self, page_id: str) -> Optional[ConfluenceDocument]:
         if not self.confluence_base_url:
             self.logger.error("Confluence base URL is not set.")
@@ -169,39 +491,36 @@ class ConfluenceHelper:
         async with self.http_client_factory.create_http_client(
             base_url=self.confluence_base_url, headers=self.headers, timeout=30.0
         ) as client:
-            try:
-                url = f"{self.confluence_base_url}/wiki/rest/api/content/{page_id}?expand=body.storage,version.by"
-                self.logger.info(
-                    f"Retrieving Confluence page with ID: {page_id}, full URL: {url}"
-                )
+            return await self._retrieve_page_async(client=client, page_id=page_id)
 
-                response = await client.get(url)
-                response.raise_for_status()
+    async def retrieve_pages_by_ids(
+        self, *, page_ids: List[str]
+    ) -> List[Optional[ConfluenceDocument]]:
+        """
+        Retrieve several pages on one client with up to max_concurrent_pages pages downloaded
+        concurrently
+
+        Args:
+            page_ids: page ids
+
+        Returns:
+            the pages in the order of page_ids with None for the pages that could not be retrieved
+        """
+        if not self.confluence_base_url:
+            self.logger.error("Confluence base URL is not set.")
+            return [None for _ in page_ids]
 
-                result = response.json()
-                content = result.get("body", {}).get("storage", {}).get("value", "")
-                updated_at = (
-                    datetime.fromisoformat(
-                        result.get("version", {}).get("when").replace("Z", "+00:00")
+        async with self.http_client_factory.create_http_client(
+            base_url=self.confluence_base_url, headers=self.headers, timeout=30.0
+        ) as client:
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+            async def retrieve_async(page_id: str) -> Optional[ConfluenceDocument]:
+                async with semaphore:
+                    return await self._retrieve_page_async(
+                        client=client, page_id=page_id
                     )
-                    .date()
-                    .isoformat()
-                )
-                author_name = (
-                    result.get("version", {})
-                    .get("by", {})
-                    .get("displayName", "Unknown")
-                )
 
-                page = ConfluenceDocument(
-                    id=result.get("id"),
-                    title=result.get("title"),
-                    url=f"{self.confluence_base_url}/wiki/{result.get('_links', {}).get('webui')}",
-                    updated_at=updated_at,
-                    author_name=author_name,
-                    content=content,
-                )
-                return page
-            except Exception as e:
-                self.logger.error(f"Error retrieving Confluence page: {str(e)}")
-                return None
+            return list(
+                await asyncio.gather(*[retrieve_async(page_id) for page_id in page_ids])
+            )
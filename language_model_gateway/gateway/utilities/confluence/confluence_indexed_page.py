@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+
+@dataclass
+class ConfluenceIndexedPage:
+    id: str
+    space_key: str
+    title: str
+    url: str
+    last_modified: datetime
+    # cleaned text of the page split into chunks
+    chunks: List[str]
@@ -0,0 +1,89 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    CONFLUENCE_PAGE_CACHE_LOOKUPS,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_document import (
+    ConfluenceDocument,
+)
+
+
+class ConfluencePageCache:
+    """
+    Cache of Confluence pages keyed by page id and version number.
+
+    A version of a page never changes so entries never expire.  An edit increases the version
+    number so the cached page no longer matches.  When the kept content adds up to more than
+    max_size_bytes the least recently used pages are evicted.
+
+    This is shared across requests so register it as a singleton.
+    """
+
+    def __init__(self, *, max_size_bytes: int = 50 * 1024 * 1024) -> None:
+        self.max_size_bytes: int = max_size_bytes
+        self._entries: OrderedDict[str, ConfluenceDocument] = OrderedDict()
+        self._size_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_size_bytes(page: ConfluenceDocument) -> int:
+        return len(page.content) + len(page.title or "")
+
+    def get_version_number(self, *, page_id: str) -> Optional[int]:
+        """
+        Args:
+            page_id: page id
+
+        Returns:
+            the version number of the cached page or None if the page is not cached
+        """
+        with self._lock:
+            page: Optional[ConfluenceDocument] = self._entries.get(page_id)
+        return page.version_number if page is not None else None
+
+    def get(self, *, page_id: str, version_number: int) -> Optional[ConfluenceDocument]:
+        """
+        Get a page and mark it as recently used
+
+        Args:
+            page_id: page id
+            version_number: current version number of the page
+
+        Returns:
+            the page or None if it is not cached at this version
+        """
+        with self._lock:
+            page: Optional[ConfluenceDocument] = self._entries.get(page_id)
+            if page is not None and page.version_number == version_number:
+                self._entries.move_to_end(page_id)
+            else:
+                page = None
+        CONFLUENCE_PAGE_CACHE_LOOKUPS.labels(
+            result="hit" if page is not None else "miss"
+        ).inc()
+        return page
+
+    def set(self, *, page: ConfluenceDocument) -> None:
+        """
+        Store a page, replacing its other versions, and evict the least recently used pages if
+        the cache is full
+
+        Args:
+            page: page to store
+        """
+        assert page.version_number is not None, "Version number is required"
+        with self._lock:
+            previous: Optional[ConfluenceDocument] = self._entries.pop(page.id, None)
+            if previous is not None:
+                self._size_bytes -= self._get_size_bytes(previous)
+            self._entries[page.id] = page
+            self._size_bytes += self._get_size_bytes(page)
+            # keep the newest entry even if it is larger than the cache on its own
+            while self._size_bytes > self.max_size_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= self._get_size_bytes(evicted)
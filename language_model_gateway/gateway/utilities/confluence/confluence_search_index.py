@@ -0,0 +1,310 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    CONFLUENCE_INDEX_LAST_SYNC_TIMESTAMP_SECONDS,
+    CONFLUENCE_INDEX_PAGES,
+    CONFLUENCE_INDEX_SIZE_BYTES,
+)
+from language_model_gateway.gateway.utilities.bm25_ranker import Bm25Ranker
+from language_model_gateway.gateway.utilities.confluence.confluence_indexed_page import (
+    ConfluenceIndexedPage,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_search_result import (
+    ConfluenceSearchResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ConfluenceSearchIndex:
+    """
+    Local full-text index of the pages of some Confluence spaces.
+
+    The cleaned text of the pages is split into chunks and kept in a SQLite FTS5 table so
+    searches are answered in milliseconds without calling Confluence.  The database survives
+    restarts and is shared by the workers on the host.  ConfluenceHelper keeps each space up to
+    date by searching for the pages modified since the last page it indexed.  A lease row per space
+    makes sure only one worker on the host syncs a space at a time.
+
+    The methods are blocking so call them with asyncio.to_thread.
+
+    This is shared across requests so register it as a singleton.
+    """
+
+    # a match in the title counts more than a match in the content
+    title_weight: float = 5.0
+
+    def __init__(self, *, database_path: str, space_keys: List[str]) -> None:
+        """
+        Args:
+            database_path: path of the SQLite database
+            space_keys: keys of the spaces to index
+        """
+        assert space_keys, "At least one space is required"
+        self.database_path: str = database_path
+        self.space_keys: List[str] = space_keys
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+        # sync running in this process.  The reference keeps the task from being garbage collected.
+        self.sync_task: Optional[asyncio.Task[None]] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # connections cannot be shared with forked worker processes
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection: sqlite3.Connection = sqlite3.connect(
+                self.database_path,
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS confluence_pages ("
+                " id TEXT PRIMARY KEY,"
+                " space_key TEXT NOT NULL,"
+                " title TEXT NOT NULL,"
+                " url TEXT NOT NULL,"
+                " last_modified REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS confluence_chunks USING fts5("
+                " page_id UNINDEXED, title, content, tokenize = 'porter unicode61')"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS confluence_pages_space_key_last_modified"
+                " ON confluence_pages (space_key, last_modified)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS confluence_index_sync ("
+                " space_key TEXT PRIMARY KEY,"
+                " synced_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS confluence_index_lease ("
+                " space_key TEXT PRIMARY KEY,"
+                " owner TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def get_sync_state(
+        self, *, space_key: str
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Args:
+            space_key: space key
+
+        Returns:
+            last modified time of the newest indexed page of the space and when the last complete
+            sync of the space started.  Pages are indexed in the order they were modified so a
+            sync that failed part way resumes from the newest indexed page.
+        """
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            last_modified: Optional[float] = connection.execute(
+                "SELECT MAX(last_modified) FROM confluence_pages WHERE space_key = ?",
+                (space_key,),
+            ).fetchone()[0]
+            row: Optional[Tuple[float]] = connection.execute(
+                "SELECT synced_at FROM confluence_index_sync WHERE space_key = ?",
+                (space_key,),
+            ).fetchone()
+        return (
+            datetime.fromtimestamp(last_modified, tz=timezone.utc)
+            if last_modified is not None
+            else None,
+            datetime.fromtimestamp(row[0], tz=timezone.utc) if row else None,
+        )
+
+    def is_synced(self) -> bool:
+        """
+        Returns:
+            whether every space was synced completely at least once
+        """
+        return all(
+            self.get_sync_state(space_key=space_key)[1] is not None
+            for space_key in self.space_keys
+        )
+
+    def try_acquire_sync_lease(
+        self, *, space_key: str, owner: str, lease_seconds: float
+    ) -> bool:
+        """
+        Claim the sync of a space unless another owner holds an unexpired lease.  The owner of
+        the lease calls this again to extend it.
+
+        Args:
+            space_key: space key
+            owner: unique id of the sync
+            lease_seconds: the lease expires after this time so a crashed sync does not block
+                the others
+
+        Returns:
+            True if the caller holds the lease
+        """
+        now: float = time.time()
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row: Optional[Tuple[str, float]] = connection.execute(
+                    "SELECT owner, expires_at FROM confluence_index_lease WHERE space_key = ?",
+                    (space_key,),
+                ).fetchone()
+                acquired: bool = row is None or row[0] == owner or row[1] < now
+                if acquired:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO confluence_index_lease"
+                        " (space_key, owner, expires_at) VALUES (?, ?, ?)",
+                        (space_key, owner, now + lease_seconds),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return acquired
+
+    def release_sync_lease(self, *, space_key: str, owner: str) -> None:
+        """
+        Release the lease of a space if the caller holds it
+
+        Args:
+            space_key: space key
+            owner: unique id of the sync
+        """
+        with self._lock:
+            self._get_connection().execute(
+                "DELETE FROM confluence_index_lease WHERE space_key = ? AND owner = ?",
+                (space_key, owner),
+            )
+
+    def upsert(self, *, pages: List[ConfluenceIndexedPage]) -> None:
+        """
+        Add or replace pages in one transaction
+
+        Args:
+            pages: a batch of pages returned by the sync
+        """
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for page in pages:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO confluence_pages"
+                        " (id, space_key, title, url, last_modified) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            page.id,
+                            page.space_key,
+                            page.title,
+                            page.url,
+                            page.last_modified.timestamp(),
+                        ),
+                    )
+                    connection.execute(
+                        "DELETE FROM confluence_chunks WHERE page_id = ?", (page.id,)
+                    )
+                    connection.executemany(
+                        "INSERT INTO confluence_chunks (page_id, title, content)"
+                        " VALUES (?, ?, ?)",
+                        [(page.id, page.title, chunk) for chunk in page.chunks],
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            page_count: int = connection.execute(
+                "SELECT COUNT(*) FROM confluence_pages"
+            ).fetchone()[0]
+            size_bytes: int = (
+                connection.execute("PRAGMA page_count").fetchone()[0]
+                * connection.execute("PRAGMA page_size").fetchone()[0]
+            )
+        CONFLUENCE_INDEX_PAGES.set(page_count)
+        CONFLUENCE_INDEX_SIZE_BYTES.set(size_bytes)
+        logger.info(f"Indexed {len(pages)} Confluence pages")
+
+    def record_sync(self, *, space_key: str, synced_at: datetime) -> None:
+        """
+        Record a complete sync of a space
+
+        Args:
+            space_key: space key
+            synced_at: when the sync started
+        """
+        with self._lock:
+            self._get_connection().execute(
+                "INSERT OR REPLACE INTO confluence_index_sync (space_key, synced_at)"
+                " VALUES (?, ?)",
+                (space_key, synced_at.timestamp()),
+            )
+        CONFLUENCE_INDEX_LAST_SYNC_TIMESTAMP_SECONDS.labels(space=space_key).set(
+            synced_at.timestamp()
+        )
+
+    def search(
+        self, *, search_string: str, limit: int = 10
+    ) -> List[ConfluenceSearchResult]:
+        """
+        Find the pages that best match the search string.  A page matches if all the terms of the
+        search string are in the title or the text of one of its chunks, so a search the index
+        cannot answer well finds nothing and can go to Confluence instead.
+
+        Args:
+            search_string: text to search for
+            limit: maximum number of pages to return
+
+        Returns:
+            best matching pages first with the best matching chunk as the excerpt
+        """
+        terms: List[str] = list(dict.fromkeys(Bm25Ranker.tokenize(search_string)))
+        if not terms:
+            return []
+        match: str = " AND ".join(f'"{term}"' for term in terms)
+        start: float = time.monotonic()
+        with self._lock:
+            rows: List[Tuple[str, str, str, float, str]] = (
+                self._get_connection()
+                .execute(
+                    "SELECT p.id, p.title, p.url, p.last_modified,"
+                    " snippet(confluence_chunks, 2, '', '', '...', 32)"
+                    " FROM confluence_chunks"
+                    " JOIN confluence_pages p ON p.id = confluence_chunks.page_id"
+                    " WHERE confluence_chunks MATCH ?"
+                    f" ORDER BY bm25(confluence_chunks, 0, {self.title_weight}, 1)"
+                    " LIMIT ?",
+                    # a page can match with several chunks
+                    (match, limit * 5),
+                )
+                .fetchall()
+            )
+        results: Dict[str, ConfluenceSearchResult] = {}
+        for page_id, title, url, last_modified, excerpt in rows:
+            if page_id in results:
+                continue
+            results[page_id] = ConfluenceSearchResult(
+                id=page_id,
+                title=title,
+                url=url,
+                updated_at=datetime.fromtimestamp(last_modified, tz=timezone.utc)
+                .date()
+                .isoformat(),
+                excerpt=excerpt,
+            )
+            if len(results) >= limit:
+                break
+        logger.info(
+            f"Confluence index search for {search_string!r} found {len(results)} pages"
+            f" in {(time.monotonic() - start) * 1000:.1f} ms"
+        )
+        return list(results.values())
@@ -0,0 +1,244 @@
+import logging
+import re
+from typing import List, Optional, Sequence, Set
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.tools import BaseTool
+
+from language_model_gateway.configs.config_schema import ContextBudgetConfig
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    CONTEXT_BUDGET_INPUT_TOKENS,
+    CONTEXT_BUDGET_TOKENS_SAVED,
+)
+from language_model_gateway.gateway.utilities.chat_message_helpers import (
+    convert_message_content_to_string,
+)
+from language_model_gateway.gateway.utilities.context_budget.context_budget_result import (
+    ContextBudgetResult,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+
+class ContextBudgetManager:
+    """
+    Keeps the input sent to the model (messages plus tool definitions) within the
+    context budget configured for the model.
+
+    System messages and the last N turns are always kept.  A turn is a user message
+    and everything that follows it up to the next user message.  Older turns are removed,
+    oldest first, until the input fits and are then either dropped or replaced with a
+    short extractive summary.
+    """
+
+    summary_header: str = "Summary of earlier conversation turns that were removed to fit the context window:"
+    # minimum tokens kept from each message in the summary so each line is still readable
+    min_summary_tokens_per_message: int = 16
+
+    def __init__(self, *, token_counter: TokenCounter) -> None:
+        self.token_counter: TokenCounter = token_counter
+        assert self.token_counter is not None
+        assert isinstance(self.token_counter, TokenCounter)
+
+    def apply_budget(
+        self,
+        *,
+        model_name: str,
+        messages: List[BaseMessage],
+        tools: Sequence[BaseTool],
+        context_budget: Optional[ContextBudgetConfig],
+        message_token_counts: Optional[Sequence[int]] = None,
+    ) -> ContextBudgetResult:
+        """
+        Apply the context budget to the messages
+
+        Args:
+            model_name: name of the model (used for logging and metrics)
+            messages: messages to send to the model
+            tools: tools bound to the model
+            context_budget: context budget for the model.  If None the messages are returned as is.
+            message_token_counts: token count of each message if already known (e.g. from the message conversion cache)
+
+        Returns:
+            messages to send and the token counts before and after
+        """
+        if context_budget is None:
+            return ContextBudgetResult(
+                messages=messages,
+                original_tokens=0,
+                final_tokens=0,
+                removed_message_count=0,
+            )
+
+        message_tokens: List[int] = (
+            list(message_token_counts)
+            if message_token_counts is not None
+            else [self.token_counter.count_message(message=m) for m in messages]
+        )
+        assert len(message_tokens) == len(messages)
+        tool_tokens: int = self.token_counter.count_tools(tools=tools)
+        original_tokens: int = sum(message_tokens) + tool_tokens
+
+        if original_tokens <= context_budget.max_input_tokens:
+            CONTEXT_BUDGET_INPUT_TOKENS.labels(model=model_name).observe(
+                original_tokens
+            )
+            return ContextBudgetResult(
+                messages=messages,
+                original_tokens=original_tokens,
+                final_tokens=original_tokens,
+                removed_message_count=0,
+            )
+
+        turns: List[List[int]] = self.get_turns(messages=messages)
+        removable_turns: List[List[int]] = (
+            turns[: -context_budget.keep_last_turns]
+            if context_budget.keep_last_turns > 0
+            else turns
+        )
+
+        # leave room for the summary if we are going to add one
+        target_tokens: int = context_budget.max_input_tokens - (
+            context_budget.summary_max_tokens
+            if context_budget.strategy == "summarize"
+            else 0
+        )
+        current_tokens: int = original_tokens
+        removed_indices: Set[int] = set()
+        for turn in removable_turns:
+            if current_tokens <= target_tokens:
+                break
+            removed_indices.update(turn)
+            current_tokens -= sum(message_tokens[i] for i in turn)
+
+        if not removed_indices:
+            logger.warning(
+                f"Input for {model_name} is {original_tokens} tokens which is over the context budget"
+                f" of {context_budget.max_input_tokens} but only the last {context_budget.keep_last_turns} turns are present"
+            )
+            CONTEXT_BUDGET_INPUT_TOKENS.labels(model=model_name).observe(
+                original_tokens
+            )
+            return ContextBudgetResult(
+                messages=messages,
+                original_tokens=original_tokens,
+                final_tokens=original_tokens,
+                removed_message_count=0,
+            )
+
+        removed_messages: List[BaseMessage] = [
+            m for i, m in enumerate(messages) if i in removed_indices
+        ]
+        summary_message: Optional[SystemMessage] = (
+            self.create_summary(
+                messages=removed_messages,
+                max_tokens=context_budget.summary_max_tokens,
+            )
+            if context_budget.strategy == "summarize"
+            else None
+        )
+
+        new_messages: List[BaseMessage] = []
+        first_removed_index: int = min(removed_indices)
+        for i, message in enumerate(messages):
+            if i == first_removed_index and summary_message is not None:
+                new_messages.append(summary_message)
+            if i not in removed_indices:
+                new_messages.append(message)
+
+        final_tokens: int = current_tokens + (
+            self.token_counter.count_message(message=summary_message)
+            if summary_message is not None
+            else 0
+        )
+        result: ContextBudgetResult = ContextBudgetResult(
+            messages=new_messages,
+            original_tokens=original_tokens,
+            final_tokens=final_tokens,
+            removed_message_count=len(removed_messages),
+        )
+        logger.info(
+            f"Context budget for {model_name} ({context_budget.strategy}): removed {result.removed_message_count} messages,"
+            f" {result.original_tokens} -> {result.final_tokens} tokens ({result.tokens_saved} saved)"
+        )
+        CONTEXT_BUDGET_INPUT_TOKENS.labels(model=model_name).observe(final_tokens)
+        CONTEXT_BUDGET_TOKENS_SAVED.labels(
+            model=model_name, strategy=context_budget.strategy
+        ).inc(max(result.tokens_saved, 0))
+        return result
+
+    @staticmethod
+    def get_turns(*, messages: Sequence[BaseMessage]) -> List[List[int]]:
+        """
+        Group the indices of the non-system messages into turns.  Each user message starts a new turn.
+
+        Args:
+            messages: messages to group
+
+        Returns:
+            list of turns, each a list of message indices
+        """
+        turns: List[List[int]] = []
+        for i, message in enumerate(messages):
+            if isinstance(message, SystemMessage):
+                continue
+            if isinstance(message, HumanMessage) or not turns:
+                turns.append([])
+            turns[-1].append(i)
+        return turns
+
+    def create_summary(
+        self, *, messages: Sequence[BaseMessage], max_tokens: int
+    ) -> SystemMessage:
+        """
+        Create an extractive summary of the removed messages by keeping the start of each message
+
+        Args:
+            messages: removed messages
+            max_tokens: maximum tokens in the summary
+
+        Returns:
+            system message with the summary
+        """
+        tokens_per_message: int = max(
+            max_tokens // max(len(messages), 1), self.min_summary_tokens_per_message
+        )
+        lines: List[str] = [self.summary_header]
+        used_tokens: int = self.token_counter.count_text(text=self.summary_header)
+        for message in messages:
+            text: str = re.sub(
+                r"\s+", " ", convert_message_content_to_string(message.content)
+            ).strip()
+            if not text:
+                continue
+            truncated: str = self.token_counter.truncate_text(
+                text=text, max_tokens=tokens_per_message
+            )
+            line: str = f"- {self.get_role(message)}: {truncated}" + (
+                "..." if truncated != text else ""
+            )
+            line_tokens: int = self.token_counter.count_text(text=line)
+            if used_tokens + line_tokens > max_tokens:
+                break
+            lines.append(line)
+            used_tokens += line_tokens
+        return SystemMessage(content="\n".join(lines))
+
+    @staticmethod
+    def get_role(message: BaseMessage) -> str:
+        match message:
+            case HumanMessage():
+                return "user"
+            case AIMessage():
+                return "assistant"
+            case ToolMessage():
+                return "tool"
+            case _:
+                return message.type
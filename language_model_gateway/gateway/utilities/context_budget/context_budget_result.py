@@ -0,0 +1,16 @@
+import dataclasses
+from typing import List
+
+from langchain_core.messages import BaseMessage
+
+
+@dataclasses.dataclass
+class ContextBudgetResult:
+    messages: List[BaseMessage]
+    original_tokens: int
+    final_tokens: int
+    removed_message_count: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.final_tokens
@@ -0,0 +1,6 @@
+class DeadlineExceededError(TimeoutError):
+    """Raised when the wall clock deadline of a request is reached"""
+
+    def __init__(self, *, timeout_seconds: float) -> None:
+        self.timeout_seconds: float = timeout_seconds
+        super().__init__(f"Deadline of {timeout_seconds} seconds reached")
@@ -0,0 +1,362 @@
+import asyncio
+import gzip
+import logging
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import ClassVar, Dict, List, Optional, Set, Tuple, Deque
+
+from graphql import (
+    DocumentNode,
+    EnumTypeDefinitionNode,
+    FieldDefinitionNode,
+    InputObjectTypeDefinitionNode,
+    InterfaceTypeDefinitionNode,
+    ListTypeNode,
+    NamedTypeNode,
+    NonNullTypeNode,
+    ObjectTypeDefinitionNode,
+    ScalarTypeDefinitionNode,
+    TypeNode,
+    UnionTypeDefinitionNode,
+    parse,
+    print_ast,
+)
+
+from language_model_gateway.gateway.utilities.fhir.fhir_graphql_schema_slice import (
+    FhirGraphqlSchemaSlice,
+)
+from language_model_gateway.gateway.utilities.fhir.fhir_graphql_schema_type import (
+    FhirGraphqlSchemaType,
+    FhirGraphqlSchemaTypeKind,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FhirGraphqlSchemaIndex:
+    """
+    Index over the FHIR GraphQL SDL so callers can ask for the slice of the schema
+    that is relevant to a handful of resources instead of the whole 20k line schema.
+
+    The SDL is stored gzip compressed next to this module and is only read and parsed
+    the first time the index is requested.  The parsed index is shared by the process.
+    """
+
+    schema_file_path: ClassVar[Path] = Path(__file__).parent.joinpath(
+        "fhir_graphql_schema.graphql.gz"
+    )
+
+    # resource names that are also common English words so we only match them
+    # in free text when they are written exactly like the resource name
+    ambiguous_resource_names: ClassVar[Set[str]] = {
+        "Basic",
+        "Binary",
+        "Bundle",
+        "Group",
+        "List",
+        "Parameters",
+    }
+
+    _instance: ClassVar[Optional["FhirGraphqlSchemaIndex"]] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, *, sdl: str) -> None:
+        """
+        Parse the SDL and build the index of types and query fields
+
+        Args:
+            sdl: GraphQL SDL of the FHIR server
+        """
+        document: DocumentNode = parse(sdl, no_location=True)
+
+        self.types: Dict[str, FhirGraphqlSchemaType] = {}
+        # query field name -> SDL of the field
+        self.query_fields: Dict[str, str] = {}
+        # query field name -> names of the types used by the arguments and the return type
+        self.query_field_types: Dict[str, List[str]] = {}
+        # resource name -> query fields returning a bundle of that resource
+        self.query_fields_by_resource: Dict[str, List[str]] = {}
+        # lower case resource or query field name -> resource name
+        self.resource_lookup: Dict[str, str] = {}
+
+        query_type: Optional[ObjectTypeDefinitionNode] = None
+        for definition in document.definitions:
+            if isinstance(definition, ObjectTypeDefinitionNode):
+                if definition.name.value == "Query":
+                    query_type = definition
+                    continue
+                self._add_type(
+                    name=definition.name.value,
+                    kind="type",
+                    sdl=print_ast(definition),
+                    referenced_types=self._get_referenced_types_of_fields(
+                        definition.fields
+                    )
+                    + [i.name.value for i in definition.interfaces or []],
+                    is_resource=any(
+                        i.name.value == "Resource" for i in definition.interfaces or []
+                    ),
+                )
+            elif isinstance(definition, InterfaceTypeDefinitionNode):
+                self._add_type(
+                    name=definition.name.value,
+                    kind="interface",
+                    sdl=print_ast(definition),
+                    referenced_types=self._get_referenced_types_of_fields(
+                        definition.fields
+                    ),
+                    is_resource=False,
+                )
+            elif isinstance(definition, InputObjectTypeDefinitionNode):
+                self._add_type(
+                    name=definition.name.value,
+                    kind="input",
+                    sdl=print_ast(definition),
+                    referenced_types=[
+                        self._get_named_type(f.type) for f in definition.fields or []
+                    ],
+                    is_resource=False,
+                )
+            elif isinstance(definition, UnionTypeDefinitionNode):
+                self._add_type(
+                    name=definition.name.value,
+                    kind="union",
+                    sdl=print_ast(definition),
+                    referenced_types=[t.name.value for t in definition.types or []],
+                    is_resource=False,
+                )
+            elif isinstance(definition, EnumTypeDefinitionNode):
+                self._add_type(
+                    name=definition.name.value,
+                    kind="enum",
+                    sdl=print_ast(definition),
+                    referenced_types=[],
+                    is_resource=False,
+                )
+            elif isinstance(definition, ScalarTypeDefinitionNode):
+                self._add_type(
+                    name=definition.name.value,
+                    kind="scalar",
+                    sdl=print_ast(definition),
+                    referenced_types=[],
+                    is_resource=False,
+                )
+
+        assert query_type is not None, "FHIR GraphQL schema does not define Query"
+        for field in query_type.fields or []:
+            return_type: str = self._get_named_type(field.type)
+            self.query_fields[field.name.value] = print_ast(field)
+            self.query_field_types[field.name.value] = [return_type] + [
+                self._get_named_type(a.type) for a in field.arguments or []
+            ]
+            if return_type.endswith("Bundle"):
+                resource_name: str = return_type[: -len("Bundle")]
+                resource_type = self.types.get(resource_name)
+                if resource_type is not None and resource_type.is_resource:
+                    self.query_fields_by_resource.setdefault(resource_name, []).append(
+                        field.name.value
+                    )
+                    self.resource_lookup[field.name.value.lower()] = resource_name
+
+        for name, schema_type in self.types.items():
+            if schema_type.is_resource:
+                self.resource_lookup[name.lower()] = name
+
+        logger.info(
+            f"Indexed FHIR GraphQL schema with {len(self.types)} types"
+            f" and {len(self.query_fields)} query fields"
+        )
+
+    @classmethod
+    def get_instance(cls) -> "FhirGraphqlSchemaIndex":
+        """
+        Returns the shared index, loading and parsing the schema file on first use
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    with gzip.open(
+                        cls.schema_file_path, mode="rt", encoding="utf-8"
+                    ) as f:
+                        cls._instance = FhirGraphqlSchemaIndex(sdl=f.read())
+        return cls._instance
+
+    @classmethod
+    async def get_instance_async(cls) -> "FhirGraphqlSchemaIndex":
+        """
+        Returns the shared index.  The first load parses the schema in a worker thread
+        so the event loop is not blocked.
+        """
+        if cls._instance is not None:
+            return cls._instance
+        return await asyncio.to_thread(cls.get_instance)
+
+    @property
+    def resource_names(self) -> List[str]:
+        """Names of the FHIR resources that can be queried"""
+        return sorted(self.query_fields_by_resource.keys())
+
+    def find_resources(self, *, text: str) -> List[str]:
+        """
+        Finds the FHIR resources mentioned in free text like
+        'Get conditions for patients whose name is John'
+
+        Args:
+            text: free text describing the query
+
+        Returns:
+            names of the resources in the order they are mentioned
+        """
+        words: List[str] = re.findall(r"[A-Za-z]+", text)
+        found: List[str] = []
+        i: int = 0
+        while i < len(words):
+            matched_length: int = 0
+            # try the longest run of words first so "allergy intolerance" beats "allergy"
+            for length in (3, 2, 1):
+                if i + length > len(words):
+                    continue
+                phrase: str = "".join(words[i : i + length])
+                resource_name: Optional[str] = self._lookup_resource(phrase)
+                if resource_name is not None:
+                    if resource_name not in found:
+                        found.append(resource_name)
+                    matched_length = length
+                    break
+            i += matched_length or 1
+        return found
+
+    def _lookup_resource(self, word: str) -> Optional[str]:
+        lower_word: str = word.lower()
+        candidates: List[str] = [lower_word]
+        if lower_word.endswith("ies"):
+            candidates.append(lower_word[:-3] + "y")
+        if lower_word.endswith("es"):
+            candidates.append(lower_word[:-2])
+        if lower_word.endswith("s"):
+            candidates.append(lower_word[:-1])
+        for candidate in candidates:
+            resource_name: Optional[str] = self.resource_lookup.get(candidate)
+            if resource_name is None:
+                continue
+            if resource_name in self.ambiguous_resource_names and not word.startswith(
+                resource_name
+            ):
+                continue
+            return resource_name
+        return None
+
+    def get_schema_slice(
+        self, *, resource_names: List[str], max_depth: int = 1
+    ) -> FhirGraphqlSchemaSlice:
+        """
+        Returns the part of the schema needed to query the given resources: the query fields,
+        the bundle and resource types, the types used by the resource fields up to max_depth
+        and all input types and enums used by the search arguments.
+
+        Args:
+            resource_names: FHIR resource names (case-insensitive, plurals allowed)
+            max_depth: how many levels of object types to follow from each resource
+
+        Returns:
+            schema slice
+        """
+        resources: List[str] = []
+        for resource_name in resource_names:
+            resolved: Optional[str] = self._lookup_resource(resource_name.strip())
+            if resolved is not None and resolved not in resources:
+                resources.append(resolved)
+
+        query_fields: List[str] = [
+            field for r in resources for field in self.query_fields_by_resource[r]
+        ]
+
+        included: Dict[str, None] = {}
+        # (type name, depth).  Bundles are expanded as part of the resource itself.
+        pending: Deque[Tuple[str, int]] = deque()
+        for field in query_fields:
+            for type_name in self.query_field_types[field]:
+                pending.append((type_name, 0))
+        for resource in resources:
+            pending.append((resource, 0))
+
+        while pending:
+            type_name, depth = pending.popleft()
+            if type_name in included:
+                continue
+            schema_type: Optional[FhirGraphqlSchemaType] = self.types.get(type_name)
+            if schema_type is None:
+                # built-in scalar
+                continue
+            if schema_type.is_resource and type_name not in resources:
+                continue
+            included[type_name] = None
+
+            for referenced_type_name in schema_type.referenced_types:
+                referenced_type: Optional[FhirGraphqlSchemaType] = self.types.get(
+                    referenced_type_name
+                )
+                if referenced_type is None or referenced_type_name in included:
+                    continue
+                if referenced_type.kind in ("input", "enum", "scalar"):
+                    # input types are small and needed to write valid arguments
+                    pending.append((referenced_type_name, depth))
+                elif referenced_type_name.startswith(type_name) and type_name.endswith(
+                    ("Bundle", "BundleEntry")
+                ):
+                    pending.append((referenced_type_name, depth))
+                elif depth < max_depth:
+                    pending.append((referenced_type_name, depth + 1))
+
+        sdl_parts: List[str] = []
+        if query_fields:
+            sdl_parts.append(
+                "type Query {\n"
+                + "\n".join(f"  {self.query_fields[f]}" for f in query_fields)
+                + "\n}"
+            )
+        sdl_parts.extend(self.types[t].sdl for t in included)
+
+        return FhirGraphqlSchemaSlice(
+            resources=resources,
+            query_fields=query_fields,
+            type_names=list(included),
+            sdl="\n\n".join(sdl_parts),
+        )
+
+    def _add_type(
+        self,
+        *,
+        name: str,
+        kind: FhirGraphqlSchemaTypeKind,
+        sdl: str,
+        referenced_types: List[str],
+        is_resource: bool,
+    ) -> None:
+        self.types[name] = FhirGraphqlSchemaType(
+            name=name,
+            kind=kind,
+            sdl=sdl,
+            referenced_types=list(dict.fromkeys(referenced_types)),
+            is_resource=is_resource,
+        )
+
+    def _get_referenced_types_of_fields(
+        self, fields: Optional[Tuple[FieldDefinitionNode, ...]]
+    ) -> List[str]:
+        referenced_types: List[str] = []
+        for field in fields or []:
+            referenced_types.append(self._get_named_type(field.type))
+            referenced_types.extend(
+                self._get_named_type(a.type) for a in field.arguments or []
+            )
+        return referenced_types
+
+    @staticmethod
+    def _get_named_type(type_node: TypeNode) -> str:
+        while isinstance(type_node, (ListTypeNode, NonNullTypeNode)):
+            type_node = type_node.type
+        assert isinstance(type_node, NamedTypeNode)
+        return type_node.name.value
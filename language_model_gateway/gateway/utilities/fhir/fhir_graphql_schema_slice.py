@@ -0,0 +1,10 @@
+import dataclasses
+from typing import List
+
+
+@dataclasses.dataclass
+class FhirGraphqlSchemaSlice:
+    resources: List[str]
+    query_fields: List[str]
+    type_names: List[str]
+    sdl: str
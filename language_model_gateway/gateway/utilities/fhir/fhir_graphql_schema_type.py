@@ -0,0 +1,15 @@
+import dataclasses
+from typing import List, Literal
+
+FhirGraphqlSchemaTypeKind = Literal[
+    "type", "input", "enum", "scalar", "union", "interface"
+]
+
+
+@dataclasses.dataclass
+class FhirGraphqlSchemaType:
+    name: str
+    kind: FhirGraphqlSchemaTypeKind
+    sdl: str
+    referenced_types: List[str]
+    is_resource: bool
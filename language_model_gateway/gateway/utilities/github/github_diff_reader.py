@@ -0,0 +1,190 @@
+import re
+from typing import AsyncIterator, List, Optional, Pattern
+
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff import (
+    GithubPullRequestDiff,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff_file import (
+    GithubPullRequestDiffFile,
+)
+
+
+class GithubDiffReader:
+    """
+    Reads a unified diff file by file as it is downloaded and keeps only what fits in the budgets.
+
+    Each file keeps at most max_file_bytes of its diff and all the files together keep at most
+    max_total_bytes, so one large file does not crowd out the rest and a large pull request does
+    not blow up the context of the model.  Lock files, generated files and binary files are not
+    kept at all.  The lines added and removed are counted for every file so the summary can
+    describe what was left out.  Reading stops after max_download_bytes.
+    """
+
+    lock_file_names = {
+        "package-lock.json",
+        "npm-shrinkwrap.json",
+        "yarn.lock",
+        "pnpm-lock.yaml",
+        "Pipfile.lock",
+        "poetry.lock",
+        "uv.lock",
+        "Cargo.lock",
+        "Gemfile.lock",
+        "composer.lock",
+        "go.sum",
+    }
+    generated_file_patterns: List[Pattern[str]] = [
+        re.compile(pattern)
+        for pattern in [
+            r"\.min\.(js|css)$",
+            r"\.map$",
+            r"_pb2(_grpc)?\.pyi?$",
+            r"\.pb\.go$",
+            r"\.generated\.",
+            r"\.snap$",
+            r"(^|/)(dist|vendor|node_modules)/",
+        ]
+    ]
+    diff_header_pattern: Pattern[str] = re.compile(r"^diff --git a/(.*) b/(.*)$")
+
+    def __init__(
+        self,
+        *,
+        max_file_bytes: int = 16 * 1024,
+        max_total_bytes: int = 64 * 1024,
+        max_download_bytes: int = 20 * 1024 * 1024,
+    ) -> None:
+        self.max_file_bytes: int = max_file_bytes
+        self.max_total_bytes: int = max_total_bytes
+        self.max_download_bytes: int = max_download_bytes
+
+    def get_skipped_reason(self, *, path: str) -> Optional[str]:
+        """
+        Get why the diff of a file is not worth showing
+
+        Args:
+            path: path of the file
+
+        Returns:
+            the reason or None if the diff should be shown
+        """
+        if path.rsplit("/", 1)[-1] in self.lock_file_names:
+            return "lock file"
+        if any(pattern.search(path) for pattern in self.generated_file_patterns):
+            return "generated file"
+        return None
+
+    async def read_async(
+        self,
+        *,
+        lines: AsyncIterator[str],
+        repo: str,
+        pull_request_number: int,
+        head_sha: str,
+    ) -> GithubPullRequestDiff:
+        """
+        Read a diff
+
+        Args:
+            lines: lines of the diff without line endings
+            repo: repository as owner/name
+            pull_request_number: pull request number
+            head_sha: SHA of the head commit
+
+        Returns:
+            the diff with the content that fits in the budgets
+        """
+        diff: GithubPullRequestDiff = GithubPullRequestDiff(
+            repo=repo,
+            pull_request_number=pull_request_number,
+            head_sha=head_sha,
+            files=[],
+        )
+        file: Optional[GithubPullRequestDiffFile] = None
+        parts: List[str] = []
+        kept_total_bytes: int = 0
+        in_hunk: bool = False
+
+        def finish_file() -> None:
+            if file is not None:
+                file.content = "".join(parts)
+
+        async for line in lines:
+            line_bytes: int = len(line) + 1
+            if diff.size_bytes + line_bytes > self.max_download_bytes:
+                diff.complete = False
+                if file is not None:
+                    file.truncated = True
+                break
+            diff.size_bytes += line_bytes
+
+            header = self.diff_header_pattern.match(line)
+            if header:
+                finish_file()
+                file = GithubPullRequestDiffFile(
+                    path=header.group(2),
+                    skipped_reason=self.get_skipped_reason(path=header.group(2)),
+                )
+                diff.files.append(file)
+                parts = []
+                in_hunk = False
+            elif file is None:
+                continue
+            elif line.startswith("@@"):
+                in_hunk = True
+            elif in_hunk and line.startswith("+"):
+                file.additions += 1
+            elif in_hunk and line.startswith("-"):
+                file.deletions += 1
+            elif line.startswith("Binary files"):
+                file.skipped_reason = "binary file"
+
+            file.size_bytes += line_bytes
+            if file.skipped_reason is not None or file.truncated:
+                continue
+            if (
+                file.size_bytes > self.max_file_bytes
+                or kept_total_bytes + line_bytes > self.max_total_bytes
+            ):
+                file.truncated = True
+                continue
+            parts.append(line + "\n")
+            kept_total_bytes += line_bytes
+
+        finish_file()
+        return diff
+
+    # noinspection PyMethodMayBeStatic
+    def format_diff(self, *, diff: GithubPullRequestDiff) -> str:
+        """
+        Format a diff for the model: a summary of the files followed by the kept content
+
+        Args:
+            diff: diff to format
+
+        Returns:
+            text
+        """
+        summary: List[str] = [
+            f"Pull request {diff.repo}#{diff.pull_request_number} at {diff.head_sha[:12]}:"
+            f" {len(diff.files)} files changed,"
+            f" +{sum(file.additions for file in diff.files)}"
+            f" -{sum(file.deletions for file in diff.files)}"
+        ]
+        for file in diff.files:
+            if file.skipped_reason is not None:
+                summary.append(
+                    f"- {file.path}: not shown ({file.skipped_reason}), +{file.additions} -{file.deletions}"
+                )
+            elif file.truncated:
+                summary.append(
+                    f"- {file.path}: truncated to {len(file.content)} of {file.size_bytes} bytes,"
+                    f" +{file.additions} -{file.deletions}"
+                )
+        if not diff.complete:
+            summary.append(
+                f"The diff is larger than {self.max_download_bytes} bytes so later files are missing."
+            )
+        return (
+            "\n".join(summary) + "\n\n" + "".join(file.content for file in diff.files)
+        )
@@ -0,0 +1,12 @@
+from typing import Any, Dict, List
+
+
+class GithubGraphQLError(Exception):
+    """Raised when a GitHub GraphQL response has errors"""
+
+    def __init__(self, *, errors: List[Dict[str, Any]]) -> None:
+        self.errors: List[Dict[str, Any]] = errors
+        super().__init__(
+            "GitHub GraphQL errors: "
+            + "; ".join(str(error.get("message", error)) for error in errors)
+        )
@@ -0,0 +1,25 @@
+import dataclasses
+from typing import List
+
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff_file import (
+    GithubPullRequestDiffFile,
+)
+
+
+@dataclasses.dataclass
+class GithubPullRequestDiff:
+    repo: str
+    pull_request_number: int
+    head_sha: str
+    files: List[GithubPullRequestDiffFile]
+    # size of the whole diff
+    size_bytes: int = 0
+    # False if the diff was too large to read to the end
+    complete: bool = True
+
+    def get_size_bytes(self) -> int:
+        """
+        Returns:
+            approximate memory used by the kept content
+        """
+        return sum(len(file.content) + len(file.path) for file in self.files)
@@ -0,0 +1,76 @@
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    GITHUB_DIFF_CACHE_LOOKUPS,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff import (
+    GithubPullRequestDiff,
+)
+
+
+class GithubPullRequestDiffCache:
+    """
+    Cache of pull request diffs keyed by repository, pull request number and head SHA.
+
+    The diff for a head SHA never changes so entries never expire.  A new push changes the head
+    SHA and so the key.  When the kept content adds up to more than max_size_bytes the least
+    recently used diffs are evicted.
+
+    This is shared across requests so register it as a singleton.
+    """
+
+    def __init__(self, *, max_size_bytes: int = 50 * 1024 * 1024) -> None:
+        self.max_size_bytes: int = max_size_bytes
+        self._entries: OrderedDict[Tuple[str, int, str], GithubPullRequestDiff] = (
+            OrderedDict()
+        )
+        self._size_bytes: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self, *, repo: str, pull_request_number: int, head_sha: str
+    ) -> Optional[GithubPullRequestDiff]:
+        """
+        Get a diff and mark it as recently used
+
+        Args:
+            repo: repository as owner/name
+            pull_request_number: pull request number
+            head_sha: SHA of the head commit
+
+        Returns:
+            the diff or None
+        """
+        key: Tuple[str, int, str] = (repo, pull_request_number, head_sha)
+        with self._lock:
+            diff: Optional[GithubPullRequestDiff] = self._entries.get(key)
+            if diff is not None:
+                self._entries.move_to_end(key)
+        GITHUB_DIFF_CACHE_LOOKUPS.labels(
+            result="hit" if diff is not None else "miss"
+        ).inc()
+        return diff
+
+    def set(self, *, diff: GithubPullRequestDiff) -> None:
+        """
+        Store a diff and evict the least recently used diffs if the cache is full
+
+        Args:
+            diff: diff to store
+        """
+        key: Tuple[str, int, str] = (diff.repo, diff.pull_request_number, diff.head_sha)
+        with self._lock:
+            previous: Optional[GithubPullRequestDiff] = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.get_size_bytes()
+            self._entries[key] = diff
+            self._size_bytes += diff.get_size_bytes()
+            # keep the newest entry even if it is larger than the cache on its own
+            while self._size_bytes > self.max_size_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.get_size_bytes()
@@ -0,0 +1,16 @@
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass
+class GithubPullRequestDiffFile:
+    path: str
+    additions: int = 0
+    deletions: int = 0
+    # size of the diff of the file
+    size_bytes: int = 0
+    # the part of the diff that fits in the budgets
+    content: str = ""
+    truncated: bool = False
+    # why the content was left out e.g. lock file or generated file
+    skipped_reason: Optional[str] = None
@@ -4,31 +4,72 @@ import os
 import re
 from datetime import datetime
 from logging import Logger
-from typing import Dict, Optional, List, Union, Any, Literal
+from typing import Dict, Optional, List, Union, Any, Literal, Tuple
 from urllib.parse import urlparse
 
 import httpx
 from httpx import Response, URL
 
+from language_model_gateway.gateway.http.http_cache import HttpCache
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
 from language_model_gateway.gateway.utilities.github.github_pull_request import (
     GithubPullRequest,
 )
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff import (
+    GithubPullRequestDiff,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff_cache import (
+    GithubPullRequestDiffCache,
+)
 from language_model_gateway.gateway.utilities.github.github_pull_request_per_contributor_info import (
     GithubPullRequestPerContributorInfo,
 )
 from language_model_gateway.gateway.utilities.github.github_pull_request_result import (
     GithubPullRequestResult,
 )
+from language_model_gateway.gateway.utilities.github.github_diff_reader import (
+    GithubDiffReader,
+)
+from language_model_gateway.gateway.utilities.github.github_graphql_error import (
+    GithubGraphQLError,
+)
+from language_model_gateway.gateway.utilities.github.github_rate_limiter import (
+    GithubRateLimiter,
+)
 
 
 class GithubPullRequestHelper:
+    # GraphQL order fields for the sort_by values that GraphQL supports
+    graphql_order_fields: Dict[str, str] = {
+        "created": "CREATED_AT",
+        "updated": "UPDATED_AT",
+        "popularity": "COMMENTS",
+    }
+    # only the fields used for GithubPullRequest
+    graphql_pull_request_fields: str = (
+        "fragment PullRequestFields on PullRequest {"
+        " number title body state createdAt closedAt updatedAt url author { login } }"
+    )
+    graphql_repositories_query: str = (
+        "query($owner: String!, $first: Int!, $after: String) {"
+        " organization(login: $owner) {"
+        " repositories(first: $first, after: $after,"
+        " orderBy: {field: PUSHED_AT, direction: DESC}) {"
+        " pageInfo { hasNextPage endCursor } nodes { name } } } }"
+    )
+
     def __init__(
         self,
         *,
         http_client_factory: HttpClientFactory,
         org_name: Optional[str],
         access_token: Optional[str],
+        max_concurrent_repos: int = 8,
+        http_cache: Optional[HttpCache] = None,
+        use_graphql: bool = False,
+        max_graphql_nodes: int = 1000,
+        github_pull_request_diff_cache: Optional[GithubPullRequestDiffCache] = None,
+        github_diff_reader: Optional[GithubDiffReader] = None,
     ):
         """
         Initialize GitHub PR Counter with async rate limit handling.
@@ -36,12 +77,29 @@ class GithubPullRequestHelper:
         Args:
             org_name (str): GitHub organization name
             access_token (str): GitHub Personal Access Token
+            max_concurrent_repos (int): repositories whose pull requests are fetched concurrently
+            http_cache (HttpCache): if set, repeated requests are sent as conditional requests so
+                unchanged responses do not count against the rate limit
+            use_graphql (bool): retrieve pull requests with the GraphQL API, falling back to REST
+            max_graphql_nodes (int): pull requests requested in one GraphQL query
+            github_pull_request_diff_cache (GithubPullRequestDiffCache): cache of diffs by head SHA
+            github_diff_reader (GithubDiffReader): reads diffs within byte budgets
         """
 
         self.http_client_factory: HttpClientFactory = http_client_factory
         self.logger: Logger = logging.getLogger(__name__)
         self.org_name: Optional[str] = org_name
         self.github_access_token: Optional[str] = access_token
+        self.max_concurrent_repos: int = max_concurrent_repos
+        self.http_cache: Optional[HttpCache] = http_cache
+        self.use_graphql: bool = use_graphql
+        self.max_graphql_nodes: int = max_graphql_nodes
+        self.github_pull_request_diff_cache: Optional[GithubPullRequestDiffCache] = (
+            github_pull_request_diff_cache
+        )
+        self.github_diff_reader: GithubDiffReader = (
+            github_diff_reader or GithubDiffReader()
+        )
 
         self.base_url = "https://api.github.com"
         self.headers = {
@@ -50,41 +108,400 @@ class GithubPullRequestHelper:
             "User-Agent": "AsyncGithubPullRequestHelper",
         }
 
-    async def _get_rate_limit_info(self, client: httpx.AsyncClient) -> Dict[str, int]:
+    @staticmethod
+    def _parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    def _is_last_page(
+        self,
+        *,
+        page: List[Dict[str, Any]],
+        pr_count: int,
+        max_pull_requests: Optional[int],
+        min_created_at: Optional[datetime],
+        max_created_at: Optional[datetime],
+        sort: str,
+        direction: str,
+    ) -> bool:
+        """
+        Whether to stop paging through the pull requests of a repository.  Stops once
+        max_pull_requests are fetched or, when sorting by creation date, once the pages are past
+        the date range.
+
+        Args:
+            page: pull requests of the page just fetched
+            pr_count: pull requests fetched so far including the page
+            max_pull_requests: maximum pull requests per repository
+            min_created_at: start of the date range
+            max_created_at: end of the date range
+            sort: REST sort field
+            direction: asc or desc
+        """
+        if len(page) == 0:
+            return True
+        if max_pull_requests and pr_count >= max_pull_requests:
+            return True
+        if sort == "created":
+            # the pages are in creation order so the rest are out of the range
+            last_created_at: datetime = self._parse_datetime(page[-1]["created_at"])
+            if direction == "desc":
+                return min_created_at is not None and last_created_at < min_created_at
+            return max_created_at is not None and last_created_at > max_created_at
+        return False
+
+    async def _retrieve_repo_prs_async(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        rate_limiter: GithubRateLimiter,
+        semaphore: asyncio.Semaphore,
+        repo_name: str,
+        max_pull_requests: Optional[int],
+        min_created_at: Optional[datetime],
+        max_created_at: Optional[datetime],
+        sort_by: Optional[Literal["created", "updated", "popularity", "long-running"]],
+        sort_by_direction: Optional[Literal["asc", "desc"]],
+        status: Optional[Literal["closed"]],
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Page through the pull requests of one repository with the REST API
+
+        Returns:
+            the pull requests and the urls fetched
+        """
+        prs_url = f"{self.base_url}/repos/{self.org_name}/{repo_name}/pulls"
+        prs: List[Dict[str, Any]] = []
+        urls: List[str] = []
+        page_number: int = 1
+        pages_remaining: bool = True
+        async with semaphore:
+            while pages_remaining:
+                params: Dict[str, Any] = {
+                    "state": status or "closed",
+                    "sort": sort_by or "created",
+                    "direction": sort_by_direction or "desc",
+                    "per_page": max_pull_requests or 50,
+                    "page": page_number,
+                }
+                if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
+                    self.logger.info(f"Fetching PRs: {prs_url}: {params}")
+
+                prs_response = await rate_limiter.get_async(
+                    client=client, url=prs_url, params=params
+                )
+                urls.append(str(prs_response.request.url))
+                prs_response.raise_for_status()
+                page: List[Dict[str, Any]] = prs_response.json()
+                prs.extend(page)
+                pages_remaining = not self._is_last_page(
+                    page=page,
+                    pr_count=len(prs),
+                    max_pull_requests=max_pull_requests,
+                    min_created_at=min_created_at,
+                    max_created_at=max_created_at,
+                    sort=params["sort"],
+                    direction=params["direction"],
+                )
+                page_number += 1
+        return prs, urls
+
+    async def _retrieve_prs_rest_async(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        rate_limiter: GithubRateLimiter,
+        max_repos: Optional[int],
+        max_pull_requests: Optional[int],
+        min_created_at: Optional[datetime],
+        max_created_at: Optional[datetime],
+        repo_name: Optional[str],
+        sort_by: Optional[Literal["created", "updated", "popularity", "long-running"]],
+        sort_by_direction: Optional[Literal["asc", "desc"]],
+        status: Optional[Literal["closed"]],
+    ) -> Tuple[List[str], List[List[Dict[str, Any]]], str]:
         """
-        Retrieve and log GitHub API rate limit information.
+        Retrieve the pull requests of the repositories with the REST API.  The pull requests of
+        up to max_concurrent_repos repositories are fetched concurrently.
 
         Returns:
-            Dict[str, int]: Rate limit details
+            the repository names, the pull requests of each repository and the urls fetched
         """
+        query: str = ""
+        if repo_name:
+            repos_url = f"{self.base_url}/repos/{self.org_name}/{repo_name}"
+            if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
+                self.logger.info(f"Fetching repository: {repos_url}")
+            repo_response = await rate_limiter.get_async(
+                client=client,
+                url=repos_url,
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    **self.headers,
+                },
+            )
+
+            url: URL = repo_response.request.url
+            query += f"\n{str(url)}"
+            repo_response.raise_for_status()
+            repos = [repo_response.json()]
+        else:
+            # Fetch organization repositories
+            repos_url = f"{self.base_url}/orgs/{self.org_name}/repos"
+            pages_remaining = True
+            repos = []
+
+            page_number: int = 1
+            while pages_remaining:
+                params: Dict[str, Any] = {
+                    "type": "all",
+                    "sort": "pushed",
+                    "direction": "desc",
+                    "per_page": max_repos or 50,
+                    "page": page_number,
+                }
+                if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
+                    self.logger.info(f"Fetching repositories: {repos_url}: {params}")
+                repos_response = await rate_limiter.get_async(
+                    client=client,
+                    url=repos_url,
+                    headers={
+                        "Accept": "application/vnd.github+json",
+                        **self.headers,
+                    },
+                    params=params,
+                )
+                url = repos_response.request.url
+                query += f"\n{str(url)}"
+
+                repos_response.raise_for_status()
+                repos.extend(repos_response.json())
+                if max_repos and len(repos) >= max_repos:
+                    pages_remaining = False
+                elif len(repos_response.json()) == 0:
+                    pages_remaining = False
+                page_number += 1
+
+        # Limit repositories if max_repos is specified
+        repos = repos[:max_repos] if max_repos else repos
+
+        # Fetch closed PRs for the repositories concurrently
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.max_concurrent_repos)
+        tasks: List[asyncio.Task[Tuple[List[Dict[str, Any]], List[str]]]] = [
+            asyncio.create_task(
+                self._retrieve_repo_prs_async(
+                    client=client,
+                    rate_limiter=rate_limiter,
+                    semaphore=semaphore,
+                    repo_name=repo["name"],
+                    max_pull_requests=max_pull_requests,
+                    min_created_at=min_created_at,
+                    max_created_at=max_created_at,
+                    sort_by=sort_by,
+                    sort_by_direction=sort_by_direction,
+                    status=status,
+                )
+            )
+            for repo in repos
+        ]
         try:
-            response = await client.get(
-                f"{self.base_url}/rate_limit", headers=self.headers
+            repo_results: List[
+                Tuple[List[Dict[str, Any]], List[str]]
+            ] = await asyncio.gather(*tasks)
+        finally:
+            # stop the other repositories if one failed
+            for task in tasks:
+                task.cancel()
+
+        for _, urls in repo_results:
+            for url_text in urls:
+                query += f"\n{url_text}"
+        return (
+            [repo["name"] for repo in repos],
+            [prs for prs, _ in repo_results],
+            query,
+        )
+
+    async def _post_graphql_async(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        rate_limiter: GithubRateLimiter,
+        graphql_query: str,
+        variables: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Send a GraphQL query once the rate limit allows it
+
+        Returns:
+            the data of the response
+
+        Raises:
+            GithubGraphQLError: if the response has errors
+        """
+        await rate_limiter.wait_async()
+        response: Response = await client.post(
+            f"{self.base_url}/graphql",
+            json={"query": graphql_query, "variables": variables},
+        )
+        rate_limiter.update(response=response)
+        response.raise_for_status()
+        result: Dict[str, Any] = response.json()
+        if result.get("errors"):
+            raise GithubGraphQLError(errors=result["errors"])
+        data: Dict[str, Any] = result["data"]
+        # pause before the next query if it may cost more points than are left
+        rate_limit: Optional[Dict[str, Any]] = data.get("rateLimit")
+        if rate_limit and rate_limit["remaining"] < max(rate_limit["cost"], 1):
+            rate_limiter.pause_until(
+                self._parse_datetime(rate_limit["resetAt"]).timestamp() + 1
             )
-            response.raise_for_status()
-            rate_limit_data = response.json()
-            core_rate_limit = rate_limit_data["resources"]["core"]
+        return data
 
-            return {
-                "remaining": core_rate_limit["remaining"],
-                "reset_time": core_rate_limit["reset"],
-            }
-        except Exception as e:
-            self.logger.error(f"Rate limit fetch error: {e}")
-            raise
+    def _to_rest_pull_request(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a GraphQL pull request to the fields of the REST API that are used
+        """
+        return {
+            "number": node["number"],
+            "title": node.get("title"),
+            "body": node.get("body"),
+            # the REST API reports merged pull requests as closed
+            "state": "open" if node["state"] == "OPEN" else "closed",
+            "created_at": node["createdAt"],
+            "closed_at": node.get("closedAt"),
+            "updated_at": node.get("updatedAt"),
+            "html_url": node["url"],
+            "diff_url": f"{node['url']}.diff",
+            "user": {"login": (node.get("author") or {}).get("login")},
+        }
 
-    async def _wait_for_rate_limit_reset(self, reset_time: int) -> None:
+    async def _retrieve_prs_graphql_async(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        rate_limiter: GithubRateLimiter,
+        max_repos: Optional[int],
+        max_pull_requests: Optional[int],
+        min_created_at: Optional[datetime],
+        max_created_at: Optional[datetime],
+        repo_name: Optional[str],
+        sort_by: Optional[Literal["created", "updated", "popularity", "long-running"]],
+        sort_by_direction: Optional[Literal["asc", "desc"]],
+    ) -> Tuple[List[str], List[List[Dict[str, Any]]], str]:
         """
-        Async wait until rate limit resets.
+        Retrieve the pull requests of the repositories with the GraphQL API.
 
-        Args:
-            reset_time (int): Timestamp when rate limit will reset
+        Each query fetches the next page of several repositories at once using aliases and only
+        the fields of GithubPullRequest.  The number of repositories per query is limited so the
+        query costs at most max_graphql_nodes / 100 points and is reduced further when fewer
+        points are left in the rate limit.
+
+        Returns:
+            the repository names, the pull requests of each repository and the queries sent
         """
-        current_time = int(asyncio.get_event_loop().time())
-        wait_time = max(reset_time - current_time + 5, 0)
-        if wait_time > 0:
-            self.logger.warning(f"Rate limit exceeded. Waiting {wait_time} seconds.")
-            await asyncio.sleep(wait_time)
+        query: str = ""
+        repo_names: List[str]
+        if repo_name:
+            repo_names = [repo_name]
+        else:
+            repo_names = []
+            cursor: Optional[str] = None
+            while True:
+                variables: Dict[str, Any] = {
+                    "owner": self.org_name,
+                    "first": min(max_repos or 100, 100),
+                    "after": cursor,
+                }
+                query += f"\n{self.base_url}/graphql: repositories {variables}"
+                data: Dict[str, Any] = await self._post_graphql_async(
+                    client=client,
+                    rate_limiter=rate_limiter,
+                    graphql_query=self.graphql_repositories_query,
+                    variables=variables,
+                )
+                repositories: Dict[str, Any] = data["organization"]["repositories"]
+                repo_names.extend(node["name"] for node in repositories["nodes"])
+                if (max_repos and len(repo_names) >= max_repos) or not repositories[
+                    "pageInfo"
+                ]["hasNextPage"]:
+                    break
+                cursor = repositories["pageInfo"]["endCursor"]
+            repo_names = repo_names[:max_repos] if max_repos else repo_names
+
+        sort: str = sort_by or "created"
+        direction: str = sort_by_direction or "desc"
+        page_size: int = min(max_pull_requests or 50, 100)
+        prs: Dict[str, List[Dict[str, Any]]] = {name: [] for name in repo_names}
+        # repositories with more pages and the cursor of their next page
+        cursors: Dict[str, Optional[str]] = {name: None for name in repo_names}
+        remaining_points: Optional[int] = None
+        while cursors:
+            batch_size: int = max(self.max_graphql_nodes // page_size, 1)
+            if remaining_points is not None:
+                # each repository in the query costs page_size / 100 points
+                batch_size = min(
+                    batch_size, max(remaining_points * 100 // page_size, 1)
+                )
+            batch: List[str] = list(cursors)[:batch_size]
+            variables = {
+                "owner": self.org_name,
+                "first": page_size,
+                "states": ["CLOSED", "MERGED"],
+                "orderBy": {
+                    "field": self.graphql_order_fields[sort],
+                    "direction": direction.upper(),
+                },
+            }
+            repository_queries: List[str] = []
+            for index, name in enumerate(batch):
+                variables[f"name{index}"] = name
+                variables[f"after{index}"] = cursors[name]
+                repository_queries.append(
+                    f"r{index}: repository(owner: $owner, name: $name{index}) {{"
+                    f" pullRequests(first: $first, after: $after{index}, states: $states,"
+                    f" orderBy: $orderBy) {{"
+                    f" pageInfo {{ hasNextPage endCursor }}"
+                    f" nodes {{ ...PullRequestFields }} }} }}"
+                )
+            variable_definitions: str = "".join(
+                f", $name{index}: String!, $after{index}: String"
+                for index in range(len(batch))
+            )
+            graphql_query: str = (
+                f"query($owner: String!, $first: Int!, $states: [PullRequestState!],"
+                f" $orderBy: IssueOrder{variable_definitions}) {{"
+                f" rateLimit {{ cost remaining resetAt }}"
+                f" {' '.join(repository_queries)} }}"
+                f" {self.graphql_pull_request_fields}"
+            )
+            query += f"\n{self.base_url}/graphql: pull requests of {', '.join(batch)}"
+            data = await self._post_graphql_async(
+                client=client,
+                rate_limiter=rate_limiter,
+                graphql_query=graphql_query,
+                variables=variables,
+            )
+            remaining_points = data["rateLimit"]["remaining"]
+            for index, name in enumerate(batch):
+                pull_requests: Dict[str, Any] = data[f"r{index}"]["pullRequests"]
+                page: List[Dict[str, Any]] = [
+                    self._to_rest_pull_request(node) for node in pull_requests["nodes"]
+                ]
+                prs[name].extend(page)
+                if not pull_requests["pageInfo"]["hasNextPage"] or self._is_last_page(
+                    page=page,
+                    pr_count=len(prs[name]),
+                    max_pull_requests=max_pull_requests,
+                    min_created_at=min_created_at,
+                    max_created_at=max_created_at,
+                    sort=sort,
+                    direction=direction,
+                ):
+                    del cursors[name]
+                else:
+                    cursors[name] = pull_requests["pageInfo"]["endCursor"]
+
+        return repo_names, [prs[name] for name in repo_names], query
 
     async def retrieve_closed_prs(
         self,
@@ -103,6 +520,10 @@ class GithubPullRequestHelper:
     ) -> GithubPullRequestResult:
         """
         Async method to retrieve closed pull requests across organization repositories.
+
+        With use_graphql the GraphQL API is used and the REST API is the fallback if that fails or
+        the sort order is not supported by GraphQL.  All requests pause together when the GitHub
+        rate limit runs out.
         """
 
         assert self.org_name, "Organization name is required"
@@ -118,126 +539,64 @@ class GithubPullRequestHelper:
                 f" status={status}"
             )
 
+        rate_limiter: GithubRateLimiter = GithubRateLimiter()
         async with self.http_client_factory.create_http_client(
-            base_url=self.base_url, headers=self.headers, timeout=30.0
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=30.0,
+            http_cache=self.http_cache,
         ) as client:
             query: str = ""
             try:
-                if repo_name:
-                    repos_url = f"{self.base_url}/repos/{self.org_name}/{repo_name}"
-                    if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
-                        self.logger.info(f"Fetching repository: {repos_url}")
-                    repo_response = await client.get(
-                        repos_url,
-                        headers={
-                            "Accept": "application/vnd.github+json",
-                            **self.headers,
-                        },
-                    )
-
-                    if not query:
-                        url: URL = repo_response.request.url
-                        query += f"\n{str(url)}"
-                    repo_response.raise_for_status()
-                    repos = [repo_response.json()]
-                else:
-                    # Fetch organization repositories
-                    repos_url = f"{self.base_url}/orgs/{self.org_name}/repos"
-                    pages_remaining = True
-                    repos = []
-
-                    page_number: int = 1
-                    while pages_remaining:
-                        params: Dict[str, Any] = {
-                            "type": "all",
-                            "sort": "pushed",
-                            "direction": "desc",
-                            "per_page": max_repos or 50,
-                            "page": page_number,
-                        }
-                        if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
-                            self.logger.info(
-                                f"Fetching repositories: {repos_url}: {params}"
-                            )
-                        repos_response = await client.get(
-                            repos_url,
-                            headers={
-                                "Accept": "application/vnd.github+json",
-                                **self.headers,
-                            },
-                            params=params,
+                retrieved: Optional[
+                    Tuple[List[str], List[List[Dict[str, Any]]], str]
+                ] = None
+                if (
+                    self.use_graphql
+                    and (sort_by or "created") in self.graphql_order_fields
+                ):
+                    try:
+                        retrieved = await self._retrieve_prs_graphql_async(
+                            client=client,
+                            rate_limiter=rate_limiter,
+                            max_repos=max_repos,
+                            max_pull_requests=max_pull_requests,
+                            min_created_at=min_created_at,
+                            max_created_at=max_created_at,
+                            repo_name=repo_name,
+                            sort_by=sort_by,
+                            sort_by_direction=sort_by_direction,
                         )
-                        url = repos_response.request.url
-                        query += f"\n{str(url)}"
-
-                        repos_response.raise_for_status()
-                        repos.extend(repos_response.json())
-                        if max_repos and len(repos) >= max_repos:
-                            pages_remaining = False
-                        elif len(repos_response.json()) == 0:
-                            pages_remaining = False
-                        page_number += 1
-
-                # Limit repositories if max_repos is specified
-                repos = repos[:max_repos] if max_repos else repos
+                    except Exception as e:
+                        self.logger.warning(
+                            f"Retrieving PRs with GraphQL failed so using REST: {e}"
+                        )
+                if retrieved is None:
+                    retrieved = await self._retrieve_prs_rest_async(
+                        client=client,
+                        rate_limiter=rate_limiter,
+                        max_repos=max_repos,
+                        max_pull_requests=max_pull_requests,
+                        min_created_at=min_created_at,
+                        max_created_at=max_created_at,
+                        repo_name=repo_name,
+                        sort_by=sort_by,
+                        sort_by_direction=sort_by_direction,
+                        status=status,
+                    )
+                repo_names: List[str]
+                repo_prs: List[List[Dict[str, Any]]]
+                repo_names, repo_prs, query = retrieved
 
                 closed_prs_list: List[GithubPullRequest] = []
 
-                for repo in repos:
-                    # Fetch closed PRs for the repository
-                    prs_url = (
-                        f"{self.base_url}/repos/{self.org_name}/{repo['name']}/pulls"
-                    )
-                    pages_remaining = True
-                    prs: List[Dict[str, Any]] = []
-                    page_number = 1
-
-                    while pages_remaining:
-                        params = {
-                            "state": status or "closed",
-                            "sort": sort_by or "created",
-                            "direction": sort_by_direction or "desc",
-                            "per_page": max_pull_requests or 50,
-                            "page": page_number,
-                        }
-                        if os.environ.get("LOG_INPUT_AND_OUTPUT", "0") == "1":
-                            self.logger.info(f"Fetching PRs: {prs_url}: {params}")
-
-                        prs_response = await client.get(
-                            prs_url,
-                            params=params,
-                        )
-                        query += f"\n{str(prs_response.request.url)}"
-                        prs_response.raise_for_status()
-                        prs.extend(prs_response.json())
-                        if len(prs_response.json()) == 0:
-                            pages_remaining = False
-                        else:
-                            if max_pull_requests and len(prs) >= max_pull_requests:
-                                pages_remaining = False
-
-                            if max_created_at:
-                                pr_created_at = datetime.fromisoformat(
-                                    prs[-1]["created_at"].replace("Z", "+00:00")
-                                )
-                                if pr_created_at <= max_created_at:
-                                    pages_remaining = False
-                            if min_created_at:
-                                pr_created_at = datetime.fromisoformat(
-                                    prs[-1]["created_at"].replace("Z", "+00:00")
-                                )
-                                if pr_created_at < min_created_at:
-                                    pages_remaining = False
-                        page_number += 1
-
+                for name, prs in zip(repo_names, repo_prs):
                     for pr_index, pr in enumerate(prs):
                         self.logger.info(f"PR DETAILS:\n{pr}")
                         if max_pull_requests and pr_index >= max_pull_requests:
                             break
 
-                        pr_created_at = datetime.fromisoformat(
-                            pr["created_at"].replace("Z", "+00:00")
-                        )
+                        pr_created_at = self._parse_datetime(pr["created_at"])
 
                         if min_created_at and pr_created_at < min_created_at:
                             break
@@ -249,26 +608,20 @@ class GithubPullRequestHelper:
                                 closed_prs_list.append(
                                     GithubPullRequest(
                                         pull_request_number=pr["number"],
-                                        repo=repo["name"],
+                                        repo=name,
                                         title=pr.get("title") or "No Title",
                                         created_at=(
-                                            datetime.fromisoformat(
-                                                pr["created_at"].replace("Z", "+00:00")
-                                            )
+                                            self._parse_datetime(pr["created_at"])
                                             if pr.get("created_at")
                                             else None
                                         ),
                                         closed_at=(
-                                            datetime.fromisoformat(
-                                                pr["closed_at"].replace("Z", "+00:00")
-                                            )
+                                            self._parse_datetime(pr["closed_at"])
                                             if pr.get("closed_at")
                                             else None
                                         ),
                                         updated_at=(
-                                            datetime.fromisoformat(
-                                                pr["updated_at"].replace("Z", "+00:00")
-                                            )
+                                            self._parse_datetime(pr["updated_at"])
                                             if pr.get("updated_at")
                                             else None
                                         ),
@@ -393,6 +746,79 @@ class GithubPullRequestHelper:
             "pr_number": int(match.group(3)),
         }
 
+    async def get_pr_diff_async(self, *, pr_url: str) -> GithubPullRequestDiff:
+        """
+        Fetch the diff of a GitHub PR, keeping only what fits in the budgets of the diff reader.
+
+        The base and head SHAs of the PR are looked up first and the diff is downloaded with the
+        compare API pinned to them, so a push while the diff is downloaded cannot put the diff of
+        another commit in the cache under the head SHA.  The diff is streamed and parsed file by
+        file.
+
+        Args:
+            pr_url (str): Full GitHub PR URL
+
+        Returns:
+            GithubPullRequestDiff: the diff
+        """
+        assert self.org_name, "Organization name is required"
+        assert self.github_access_token, "GitHub access token is required"
+
+        pr_details: Dict[str, Any] = self.parse_pr_url(pr_url=pr_url)
+        repo: str = f"{pr_details['owner']}/{pr_details['repo']}"
+        pr_number: int = pr_details["pr_number"]
+        api_url: str = f"{self.base_url}/repos/{repo}/pulls/{pr_number}"
+        headers: Dict[str, str] = {
+            "Authorization": f"Bearer {self.github_access_token}",
+            "X-GitHub-Api-Version": "2022-11-28",
+            "User-Agent": "AsyncGithubPullRequestHelper",
+        }
+
+        async with self.http_client_factory.create_http_client(
+            base_url=self.base_url, http_cache=self.http_cache
+        ) as client:
+            pr_response: Response = await client.get(
+                url=api_url,
+                headers={**headers, "Accept": "application/vnd.github.v3+json"},
+                follow_redirects=True,
+            )
+            pr_response.raise_for_status()
+        pull_request: Dict[str, Any] = pr_response.json()
+        head_sha: str = pull_request["head"]["sha"]
+        base_sha: str = pull_request["base"]["sha"]
+
+        if self.github_pull_request_diff_cache is not None:
+            cached_diff: Optional[GithubPullRequestDiff] = (
+                self.github_pull_request_diff_cache.get(
+                    repo=repo, pull_request_number=pr_number, head_sha=head_sha
+                )
+            )
+            if cached_diff is not None:
+                return cached_diff
+
+        # the diff is streamed so it does not go through the http cache
+        async with self.http_client_factory.create_http_client(
+            base_url=self.base_url, timeout=30.0
+        ) as client:
+            # three dots compares from the merge base like the diff of the PR
+            async with client.stream(
+                "GET",
+                f"{self.base_url}/repos/{repo}/compare/{base_sha}...{head_sha}",
+                headers={**headers, "Accept": "application/vnd.github.v3.diff"},
+                follow_redirects=True,
+            ) as diff_response:
+                diff_response.raise_for_status()
+                diff: GithubPullRequestDiff = await self.github_diff_reader.read_async(
+                    lines=diff_response.aiter_lines(),
+                    repo=repo,
+                    pull_request_number=pr_number,
+                    head_sha=head_sha,
+                )
+
+        if self.github_pull_request_diff_cache is not None:
+            self.github_pull_request_diff_cache.set(diff=diff)
+        return diff
+
     async def get_pr_diff_content(self, *, pr_url: str) -> str:
         """
         Async method to fetch the actual diff content for a given GitHub PR URL.
@@ -408,7 +834,7 @@ class GithubPullRequestHelper:
         assert self.github_access_token, "GitHub access token is required"
 
         async with self.http_client_factory.create_http_client(
-            base_url=self.base_url
+            base_url=self.base_url, http_cache=self.http_cache
         ) as client:
             try:
                 # Parse the PR URL
@@ -492,7 +918,7 @@ class GithubPullRequestHelper:
         assert self.github_access_token, "GitHub access token is required"
 
         async with self.http_client_factory.create_http_client(
-            base_url=self.base_url
+            base_url=self.base_url, http_cache=self.http_cache
         ) as client:
             try:
                 # Parse the PR URL
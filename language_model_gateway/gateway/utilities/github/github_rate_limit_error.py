@@ -0,0 +1,8 @@
+class GithubRateLimitError(Exception):
+    """Raised when the GitHub rate limit resets later than we are willing to wait"""
+
+    def __init__(self, *, retry_after_seconds: float) -> None:
+        self.retry_after_seconds: float = retry_after_seconds
+        super().__init__(
+            f"GitHub rate limit exceeded.  It resets in {retry_after_seconds:.0f} seconds."
+        )
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+import httpx
+
+from language_model_gateway.gateway.utilities.github.github_rate_limit_error import (
+    GithubRateLimitError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GithubRateLimiter:
+    """
+    Pauses all the concurrent requests of a GitHub query together when the rate limit runs out.
+
+    Every response updates the limiter from its X-RateLimit-Remaining and X-RateLimit-Reset
+    headers (Reset is epoch seconds) or its Retry-After header.  Once the remaining requests drop
+    to min_remaining, or a request is rejected by the secondary rate limit, every request waits for
+    the reset before it is sent.  A request that was rejected for the rate limit is retried after
+    the wait.  If the reset is more than max_wait_seconds away GithubRateLimitError is raised
+    rather than holding the caller for up to an hour.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_remaining: int = 0,
+        max_wait_seconds: float = 60,
+        max_retries: int = 2,
+    ) -> None:
+        self.min_remaining: int = min_remaining
+        self.max_wait_seconds: float = max_wait_seconds
+        self.max_retries: int = max_retries
+        # epoch seconds until which no request is sent
+        self.resume_at: float = 0.0
+
+    def get_wait_seconds(self) -> float:
+        """
+        Returns:
+            seconds until requests can be sent again
+        """
+        return max(self.resume_at - time.time(), 0)
+
+    async def wait_async(self) -> None:
+        """
+        Wait until requests can be sent again
+
+        Raises:
+            GithubRateLimitError: if that is more than max_wait_seconds away
+        """
+        wait_seconds: float = self.get_wait_seconds()
+        if wait_seconds > self.max_wait_seconds:
+            raise GithubRateLimitError(retry_after_seconds=wait_seconds)
+        if wait_seconds > 0:
+            logger.warning(
+                f"GitHub rate limit reached.  Waiting {wait_seconds:.0f} seconds."
+            )
+            await asyncio.sleep(wait_seconds)
+
+    def pause_until(self, resume_at: float) -> None:
+        """
+        Hold all requests until a time
+
+        Args:
+            resume_at: epoch seconds
+        """
+        self.resume_at = max(self.resume_at, resume_at)
+
+    def update(self, *, response: httpx.Response) -> bool:
+        """
+        Update the limiter from the rate limit headers of a response
+
+        Args:
+            response: GitHub response
+
+        Returns:
+            True if the request was rejected for the rate limit and should be retried
+        """
+        remaining: Optional[str] = response.headers.get("X-RateLimit-Remaining")
+        reset: Optional[str] = response.headers.get("X-RateLimit-Reset")
+        retry_after: Optional[str] = response.headers.get("Retry-After")
+        if response.status_code in (403, 429):
+            if retry_after is not None:
+                self.pause_until(time.time() + float(retry_after))
+                return True
+            if remaining == "0" and reset is not None:
+                # one second of slack for clock skew
+                self.pause_until(float(reset) + 1)
+                return True
+            return False
+        if (
+            remaining is not None
+            and reset is not None
+            and int(remaining) <= self.min_remaining
+        ):
+            self.pause_until(float(reset) + 1)
+        return False
+
+    async def get_async(
+        self, *, client: httpx.AsyncClient, url: str, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a GET request once the rate limit allows it and retry it if it is rejected for the
+        rate limit
+
+        Args:
+            client: http client
+            url: url to get
+            kwargs: other arguments of httpx.AsyncClient.get()
+
+        Returns:
+            the response
+        """
+        attempt: int = 0
+        while True:
+            await self.wait_async()
+            response: httpx.Response = await client.get(url, **kwargs)
+            if not self.update(response=response) or attempt >= self.max_retries:
+                return response
+            attempt += 1
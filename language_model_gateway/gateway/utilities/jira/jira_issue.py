@@ -22,3 +22,4 @@ class JiraIssue:
     project: Optional[str] = None
     description: Optional[str] = None
     priority: Optional[str] = None
+    updated_at: Optional[datetime] = None
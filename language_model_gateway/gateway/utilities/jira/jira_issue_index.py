@@ -0,0 +1,397 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from language_model_gateway.gateway.utilities.jira.JiraIssuesPerAssigneeInfo import (
+    JiraIssuesPerAssigneeInfo,
+)
+from language_model_gateway.gateway.utilities.jira.jira_issue import JiraIssue
+
+logger = logging.getLogger(__name__)
+
+
+class JiraIssueIndex:
+    """
+    Local index of Jira issues for analytics queries.
+
+    The issues are kept in a SQLite database so they survive restarts and are shared by the
+    workers on the host.  JiraIssueHelper keeps the index up to date by searching for the issues
+    updated since the last sync, so filters and per-assignee counts are answered with SQL instead
+    of downloading the issues from Jira every time.  Descriptions are not indexed.
+
+    Only the issues updated since indexed_since are in the index so queries reaching further back
+    have to go to Jira.  A lease row makes sure only one worker on the host syncs at a time.
+
+    The methods are blocking so call them with asyncio.to_thread.
+    """
+
+    # sort fields of JiraIssueHelper.retrieve_closed_issues and their columns
+    sort_columns: Dict[str, str] = {
+        "created": "created_at",
+        "updated": "updated_at",
+        "resolved": "closed_at",
+    }
+
+    def __init__(self, *, database_path: str) -> None:
+        self.database_path: str = database_path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+        # sync running in this process.  The reference keeps the task from being garbage collected.
+        self.sync_task: Optional[asyncio.Task[None]] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # connections cannot be shared with forked worker processes
+        if self._connection is None or self._connection_pid != os.getpid():
+            connection: sqlite3.Connection = sqlite3.connect(
+                self.database_path,
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jira_issues ("
+                " key TEXT PRIMARY KEY,"
+                " url TEXT NOT NULL,"
+                " summary TEXT NOT NULL,"
+                " status TEXT,"
+                " project TEXT,"
+                " project_name TEXT,"
+                " assignee TEXT,"
+                " assignee_email TEXT,"
+                " reporter TEXT,"
+                " reporter_email TEXT,"
+                " creator TEXT,"
+                " creator_email TEXT,"
+                " issue_type TEXT,"
+                " priority TEXT,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL,"
+                " closed_at REAL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jira_issues_status_created_at"
+                " ON jira_issues (status COLLATE NOCASE, created_at)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jira_issue_index_sync ("
+                " id INTEGER PRIMARY KEY CHECK (id = 1),"
+                " last_sync_at REAL NOT NULL,"
+                " indexed_since REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jira_issue_index_lease ("
+                " id INTEGER PRIMARY KEY CHECK (id = 1),"
+                " owner TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _to_timestamp(value: Optional[datetime]) -> Optional[float]:
+        if value is None:
+            return None
+        # naive datetimes are in UTC
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    @staticmethod
+    def _from_timestamp(value: Optional[float]) -> Optional[datetime]:
+        return (
+            datetime.fromtimestamp(value, tz=timezone.utc)
+            if value is not None
+            else None
+        )
+
+    def get_sync_state(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        Returns:
+            when the index was last synced with Jira and the updated time from which issues are
+            indexed.  Both are None if the index was never fully synced.
+        """
+        with self._lock:
+            row: Optional[Tuple[float, float]] = (
+                self._get_connection()
+                .execute(
+                    "SELECT last_sync_at, indexed_since FROM jira_issue_index_sync"
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None, None
+        return self._from_timestamp(row[0]), self._from_timestamp(row[1])
+
+    def try_acquire_sync_lease(self, *, owner: str, lease_seconds: float) -> bool:
+        """
+        Claim the sync unless another owner holds an unexpired lease.  The owner of the lease
+        calls this again to extend it.
+
+        Args:
+            owner: unique id of the sync
+            lease_seconds: the lease expires after this time so a crashed sync does not block
+                the others
+
+        Returns:
+            True if the caller holds the lease
+        """
+        now: float = datetime.now(timezone.utc).timestamp()
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row: Optional[Tuple[str, float]] = connection.execute(
+                    "SELECT owner, expires_at FROM jira_issue_index_lease"
+                ).fetchone()
+                acquired: bool = row is None or row[0] == owner or row[1] < now
+                if acquired:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO jira_issue_index_lease (id, owner, expires_at)"
+                        " VALUES (1, ?, ?)",
+                        (owner, now + lease_seconds),
+                    )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return acquired
+
+    def release_sync_lease(self, *, owner: str) -> None:
+        """
+        Release the lease if the caller holds it
+
+        Args:
+            owner: unique id of the sync
+        """
+        with self._lock:
+            self._get_connection().execute(
+                "DELETE FROM jira_issue_index_lease WHERE owner = ?", (owner,)
+            )
+
+    def record_sync(self, *, synced_at: datetime, indexed_since: datetime) -> None:
+        """
+        Record a completed sync
+
+        Args:
+            synced_at: when the sync started
+            indexed_since: the updated time from which issues are indexed
+        """
+        with self._lock:
+            self._get_connection().execute(
+                "INSERT OR REPLACE INTO jira_issue_index_sync"
+                " (id, last_sync_at, indexed_since) VALUES (1, ?, ?)",
+                (self._to_timestamp(synced_at), self._to_timestamp(indexed_since)),
+            )
+
+    def upsert(self, *, issues: List[JiraIssue]) -> None:
+        """
+        Add or replace issues in one transaction
+
+        Args:
+            issues: issues returned by a page of the sync
+        """
+        with self._lock:
+            connection: sqlite3.Connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO jira_issues"
+                    " (key, url, summary, status, project, project_name, assignee, assignee_email,"
+                    " reporter, reporter_email, creator, creator_email, issue_type, priority,"
+                    " created_at, updated_at, closed_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            issue.key,
+                            issue.url,
+                            issue.summary,
+                            issue.status,
+                            issue.project,
+                            issue.project_name,
+                            issue.assignee,
+                            issue.assignee_email,
+                            issue.reporter,
+                            issue.reporter_email,
+                            issue.creator,
+                            issue.creator_email,
+                            issue.issue_type,
+                            issue.priority,
+                            self._to_timestamp(issue.created_at),
+                            self._to_timestamp(issue.updated_at),
+                            self._to_timestamp(issue.closed_at),
+                        )
+                        for issue in issues
+                    ],
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        logger.info(f"Indexed {len(issues)} Jira issues")
+
+    def _get_where_clause(
+        self,
+        *,
+        status: Optional[str],
+        project_key: Optional[str],
+        assignee: Optional[str],
+        min_created_at: Optional[datetime],
+        max_created_at: Optional[datetime],
+        min_updated_at: Optional[datetime],
+        max_updated_at: Optional[datetime],
+    ) -> Tuple[str, List[Any]]:
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        if status:
+            conditions.append("status = ? COLLATE NOCASE")
+            parameters.append(status)
+        if project_key:
+            conditions.append("project = ? COLLATE NOCASE")
+            parameters.append(project_key)
+        if assignee:
+            # like JQL, match the display name or the email of the assignee
+            conditions.append(
+                "(assignee = ? COLLATE NOCASE OR assignee_email = ? COLLATE NOCASE)"
+            )
+            parameters.extend([assignee, assignee])
+        for column, operator, value in [
+            ("created_at", ">=", min_created_at),
+            ("created_at", "<=", max_created_at),
+            ("updated_at", ">=", min_updated_at),
+            ("updated_at", "<=", max_updated_at),
+        ]:
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                parameters.append(self._to_timestamp(value))
+        return (
+            " WHERE " + " AND ".join(conditions) if conditions else "",
+            parameters,
+        )
+
+    def search(
+        self,
+        *,
+        status: Optional[str] = None,
+        project_key: Optional[str] = None,
+        assignee: Optional[str] = None,
+        min_created_at: Optional[datetime] = None,
+        max_created_at: Optional[datetime] = None,
+        min_updated_at: Optional[datetime] = None,
+        max_updated_at: Optional[datetime] = None,
+        sort_by: Optional[Literal["updated", "created", "resolved"]] = None,
+        sort_by_direction: Optional[Literal["asc", "desc"]] = None,
+        max_issues: Optional[int] = None,
+    ) -> List[JiraIssue]:
+        """
+        Find the indexed issues matching the filters.  The filters behave like the JQL built by
+        JiraIssueHelper.retrieve_closed_issues.
+
+        Returns:
+            matching issues sorted by sort_by (updated by default) and sort_by_direction (desc by default)
+        """
+        where_clause, parameters = self._get_where_clause(
+            status=status,
+            project_key=project_key,
+            assignee=assignee,
+            min_created_at=min_created_at,
+            max_created_at=max_created_at,
+            min_updated_at=min_updated_at,
+            max_updated_at=max_updated_at,
+        )
+        order_by: str = (
+            f" ORDER BY {self.sort_columns[sort_by or 'updated']}"
+            f" {'ASC' if sort_by_direction == 'asc' else 'DESC'}, key"
+        )
+        limit: str = " LIMIT ?" if max_issues else ""
+        if max_issues:
+            parameters.append(max_issues)
+        with self._lock:
+            rows: List[Tuple[Any, ...]] = (
+                self._get_connection()
+                .execute(
+                    "SELECT key, url, summary, status, project, project_name, assignee,"
+                    " assignee_email, reporter, reporter_email, creator, creator_email,"
+                    " issue_type, priority, created_at, updated_at, closed_at"
+                    " FROM jira_issues" + where_clause + order_by + limit,
+                    parameters,
+                )
+                .fetchall()
+            )
+        return [
+            JiraIssue(
+                key=row[0],
+                url=row[1],
+                summary=row[2],
+                status=row[3],
+                project=row[4],
+                project_name=row[5],
+                assignee=row[6],
+                assignee_email=row[7],
+                reporter=row[8],
+                reporter_email=row[9],
+                creator=row[10],
+                creator_email=row[11],
+                issue_type=row[12],
+                priority=row[13],
+                created_at=datetime.fromtimestamp(row[14], tz=timezone.utc),
+                updated_at=self._from_timestamp(row[15]),
+                closed_at=self._from_timestamp(row[16]),
+                description="",
+            )
+            for row in rows
+        ]
+
+    def count_by_assignee(
+        self,
+        *,
+        status: Optional[str] = None,
+        project_key: Optional[str] = None,
+        assignee: Optional[str] = None,
+        min_created_at: Optional[datetime] = None,
+        max_created_at: Optional[datetime] = None,
+        min_updated_at: Optional[datetime] = None,
+        max_updated_at: Optional[datetime] = None,
+    ) -> Dict[str, JiraIssuesPerAssigneeInfo]:
+        """
+        Count the indexed issues matching the filters per assignee
+
+        Returns:
+            issue counts and projects per assignee with the highest counts first
+        """
+        where_clause, parameters = self._get_where_clause(
+            status=status,
+            project_key=project_key,
+            assignee=assignee,
+            min_created_at=min_created_at,
+            max_created_at=max_created_at,
+            min_updated_at=min_updated_at,
+            max_updated_at=max_updated_at,
+        )
+        with self._lock:
+            rows: List[Tuple[Optional[str], int, Optional[str]]] = (
+                self._get_connection()
+                .execute(
+                    "SELECT COALESCE(assignee, 'Unassigned') AS name, COUNT(*),"
+                    " GROUP_CONCAT(DISTINCT project)"
+                    " FROM jira_issues"
+                    + where_clause
+                    + " GROUP BY name ORDER BY COUNT(*) DESC, name",
+                    parameters,
+                )
+                .fetchall()
+            )
+        return {
+            str(name): JiraIssuesPerAssigneeInfo(
+                assignee=name,
+                issue_count=issue_count,
+                projects=sorted(projects.split(",")) if projects else [],
+            )
+            for name, issue_count, projects in rows
+        }
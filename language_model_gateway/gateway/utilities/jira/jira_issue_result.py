@@ -1,6 +1,9 @@
 import dataclasses
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from language_model_gateway.gateway.utilities.jira.JiraIssuesPerAssigneeInfo import (
+    JiraIssuesPerAssigneeInfo,
+)
 from language_model_gateway.gateway.utilities.jira.jira_issue import JiraIssue
 
 
@@ -9,3 +12,5 @@ class JiraIssueResult:
     issues: List[JiraIssue]
     query: str
     error: Optional[str]
+    # counts per assignee when they are computed by the issue index instead of from issues
+    issue_counts: Optional[Dict[str, JiraIssuesPerAssigneeInfo]] = None
@@ -1,9 +1,13 @@
+import asyncio
 import base64
 import logging
-from datetime import datetime
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
 from logging import Logger
-from typing import Dict, Optional, List, Any, Literal
+from typing import AsyncGenerator, Dict, Optional, List, Any, Literal, Tuple
 
+import httpx
 from httpx import URL
 
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
@@ -11,12 +15,35 @@ from language_model_gateway.gateway.utilities.jira.JiraIssuesPerAssigneeInfo imp
     JiraIssuesPerAssigneeInfo,
 )
 from language_model_gateway.gateway.utilities.jira.jira_issue import JiraIssue
+from language_model_gateway.gateway.utilities.jira.jira_issue_index import (
+    JiraIssueIndex,
+)
 from language_model_gateway.gateway.utilities.jira.jira_issue_result import (
     JiraIssueResult,
 )
 
 
 class JiraIssueHelper:
+    # fields needed to count the issues per assignee
+    counts_fields: List[str] = ["assignee", "project", "status", "created"]
+    # fields of JiraIssue except the description which can be large
+    summary_fields: List[str] = [
+        "summary",
+        "status",
+        "created",
+        "resolutiondate",
+        "assignee",
+        "reporter",
+        "creator",
+        "project",
+        "issuetype",
+        "priority",
+    ]
+    # fields kept in the issue index
+    index_fields: List[str] = summary_fields + ["updated"]
+    # keys that are safe to put in JQL, e.g. ATC-6789
+    issue_key_pattern: re.Pattern[str] = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+
     def __init__(
         self,
         *,
@@ -24,6 +51,15 @@ class JiraIssueHelper:
         jira_base_url: Optional[str],
         access_token: Optional[str],
         username: Optional[str],
+        max_concurrent_batches: int = 4,
+        max_keys_per_batch: int = 50,
+        jira_issue_index: Optional[JiraIssueIndex] = None,
+        index_sync_interval_seconds: float = 60,
+        index_backfill_days: int = 365,
+        index_sync_overlap_seconds: float = 24 * 60 * 60,
+        index_max_staleness_seconds: float = 15 * 60,
+        index_sync_lease_seconds: float = 10 * 60,
+        index_project_keys: Optional[List[str]] = None,
     ):
         """
         Initialize Jira Issue Helper with async rate limit handling.
@@ -31,7 +67,35 @@ class JiraIssueHelper:
         Args:
             jira_base_url (str): Base URL of the Jira instance
             access_token (str): Jira API token or personal access token
+            max_concurrent_batches (int): batches of issue ids that are searched concurrently
+            max_keys_per_batch (int): issue ids looked up by one search
+            jira_issue_index (JiraIssueIndex, optional): if set, issues without descriptions are
+                read from this index which is synced with the issues updated since the last sync
+            index_sync_interval_seconds (float): the index is not synced again within this time
+            index_backfill_days (int): the first sync indexes the issues updated in these days
+            index_sync_overlap_seconds (float): syncs go back this far before the last sync since
+                JQL dates are in the time zone of the Jira user
+            index_max_staleness_seconds (float): Jira is searched instead of the index if the
+                index was not synced within this time
+            index_sync_lease_seconds (float): a sync that does not renew its lease within this
+                time is considered dead and another worker can sync
+            index_project_keys (List[str], optional): if set, only these projects are indexed
         """
+        assert max_concurrent_batches > 0
+        assert max_keys_per_batch > 0
+        self.max_concurrent_batches: int = max_concurrent_batches
+        self.max_keys_per_batch: int = max_keys_per_batch
+        self.jira_issue_index: Optional[JiraIssueIndex] = jira_issue_index
+        self.index_sync_interval_seconds: float = index_sync_interval_seconds
+        self.index_backfill_days: int = index_backfill_days
+        self.index_sync_overlap_seconds: float = index_sync_overlap_seconds
+        self.index_max_staleness_seconds: float = index_max_staleness_seconds
+        self.index_sync_lease_seconds: float = index_sync_lease_seconds
+        self.index_project_keys: Optional[List[str]] = (
+            [project_key.upper() for project_key in index_project_keys]
+            if index_project_keys
+            else None
+        )
         self.http_client_factory: HttpClientFactory = http_client_factory
         self.logger: Logger = logging.getLogger(__name__)
         self.jira_base_url: Optional[str] = (
@@ -49,6 +113,335 @@ class JiraIssueHelper:
             "User-Agent": "AsyncJiraIssueHelper",
         }
 
+    @staticmethod
+    def normalize_issue_key(issue_id: str) -> str:
+        """
+        Normalize an issue id as typed by a user, e.g. "atc 6789" to "ATC-6789"
+        """
+        return re.sub(r"[\s-]+", "-", issue_id.strip()).upper()
+
+    def get_fields(self, *, include_description: bool, counts_only: bool) -> List[str]:
+        """
+        Fields requested from the search so Jira does not send fields that are not used
+
+        Args:
+            include_description: whether the description is requested
+            counts_only: whether only the fields needed to count issues are requested
+        """
+        if counts_only:
+            return self.counts_fields
+        if include_description:
+            return self.summary_fields + ["description"]
+        return self.summary_fields
+
+    def _read_description(self, description: Dict[str, Any] | None) -> str:
+        if not description:
+            return ""
+        try:
+            description1 = ""
+            content: List[Dict[str, Any]] = description.get("content", [])
+            for item in content:
+                if item.get("type") == "paragraph":
+                    for element in item.get("content", []):
+                        if element.get("type") == "text":
+                            description1 += element.get("text", "")
+            return description1
+        except Exception as e:
+            self.logger.error(f"Error reading description: {e}: {description}")
+            return ""
+
+    def _parse_issue(
+        self, *, issue: Dict[str, Any], include_description: bool
+    ) -> JiraIssue:
+        """
+        Convert an issue returned by the Jira API to JiraIssue
+
+        Args:
+            issue: issue returned by the Jira API
+            include_description: whether to read the description
+        """
+        fields_ = issue["fields"]
+
+        def read_person(field: str) -> Tuple[str, str]:
+            person: Optional[Dict[str, Any]] = fields_.get(field, {})
+            if not person:
+                return "Unassigned", "Unassigned"
+            return (
+                person.get("displayName", "Unassigned"),
+                person.get("emailAddress", "Unassigned"),
+            )
+
+        assignee_name, assignee_email = read_person("assignee")
+        reporter_name, reporter_email = read_person("reporter")
+        creator_name, creator_email = read_person("creator")
+        return JiraIssue(
+            key=issue.get("key", ""),
+            url=issue.get("self", ""),
+            summary=fields_.get("summary", "No Summary"),
+            status=fields_.get("status", {}).get("name"),
+            created_at=datetime.fromisoformat(
+                fields_["created"].replace("Z", "+00:00")
+            ),
+            closed_at=(
+                datetime.fromisoformat(
+                    fields_.get("resolutiondate", "").replace("Z", "+00:00")
+                )
+                if fields_.get("resolutiondate")
+                else None
+            ),
+            assignee=assignee_name,
+            assignee_email=assignee_email,
+            reporter=reporter_name,
+            reporter_email=reporter_email,
+            creator=creator_name,
+            creator_email=creator_email,
+            issue_type=fields_.get("issuetype", {}).get("name"),
+            project_name=fields_.get("project", {}).get("name"),
+            description=(
+                self._read_description(fields_.get("description", {}))
+                if include_description
+                else ""
+            ),
+            priority=fields_.get("priority", {}).get("name"),
+            project=fields_.get("project", {}).get("key"),
+            updated_at=(
+                datetime.fromisoformat(fields_["updated"].replace("Z", "+00:00"))
+                if fields_.get("updated")
+                else None
+            ),
+        )
+
+    async def _search_pages_async(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        jql: str,
+        fields: List[str],
+        max_issues: Optional[int],
+    ) -> AsyncGenerator[Tuple[List[Dict[str, Any]], str], None]:
+        """
+        Page through the issues matching the JQL
+
+        Args:
+            client: http client
+            jql: Jira query
+            fields: fields to return
+            max_issues: maximum number of issues to return
+
+        Yields:
+            each page of issues returned by the Jira API and the request sent for it
+        """
+        # Pagination parameters
+        max_results = max_issues or 100
+
+        issue_count: int = 0
+        pages_remaining = True
+        next_page_token: Optional[str] = None
+
+        while pages_remaining:
+            # https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-search/#api-rest-api-3-search-jql-post
+            params = {
+                "jql": jql,
+                "nextPageToken": next_page_token,
+                "maxResults": max_results,
+                "fields": fields,
+            }
+            response = await client.post(
+                f"{self.jira_base_url}/rest/api/3/search/jql",
+                json=params,
+            )
+            response.raise_for_status()
+
+            url: URL = response.request.url
+            query: str = f"{url}: {response.request.content.decode()}\n"
+
+            issues_data = response.json()
+            page: List[Dict[str, Any]] = issues_data.get("issues", [])
+            if max_issues:
+                page = page[: max_issues - issue_count]
+            issue_count += len(page)
+            yield page, query
+
+            # Break if no more issues or max issues reached
+            if (not page) or (max_issues and issue_count >= max_issues):
+                pages_remaining = False
+
+            next_page_token = issues_data.get("nextPageToken")
+            if next_page_token is None:
+                pages_remaining = False
+
+    async def _search_async(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        jql: str,
+        fields: List[str],
+        max_issues: Optional[int],
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        Get all the issues matching the JQL
+
+        Args:
+            client: http client
+            jql: Jira query
+            fields: fields to return
+            max_issues: maximum number of issues to return
+
+        Returns:
+            the issues returned by the Jira API and the requests sent
+        """
+        issues: List[Dict[str, Any]] = []
+        query: str = ""
+        async for page, page_query in self._search_pages_async(
+            client=client, jql=jql, fields=fields, max_issues=max_issues
+        ):
+            issues.extend(page)
+            query += page_query
+        return issues, query
+
+    async def sync_issue_index_async(self) -> None:
+        """
+        Add the issues updated since the last sync to the issue index.  Does nothing if the index
+        was synced within index_sync_interval_seconds or another worker is syncing it.
+
+        The first sync backfills the issues updated in the last index_backfill_days.  Each page
+        of issues is written to the index as it arrives.  The sync is recorded only when all the
+        pages are written so the index is not used before it is complete.
+        """
+        assert self.jira_issue_index is not None, "Jira issue index is required"
+        assert self.jira_base_url, "Jira base URL is required"
+        jira_issue_index: JiraIssueIndex = self.jira_issue_index
+        owner: str = uuid.uuid4().hex
+        if not await asyncio.to_thread(
+            jira_issue_index.try_acquire_sync_lease,
+            owner=owner,
+            lease_seconds=self.index_sync_lease_seconds,
+        ):
+            self.logger.info(
+                "Not syncing the Jira issue index since it is being synced"
+            )
+            return
+        try:
+            now: datetime = datetime.now(timezone.utc)
+            last_sync_at, indexed_since = await asyncio.to_thread(
+                jira_issue_index.get_sync_state
+            )
+            # another worker may have synced while we waited for the lease
+            if (
+                last_sync_at is not None
+                and (now - last_sync_at).total_seconds()
+                < self.index_sync_interval_seconds
+            ):
+                return
+            updated_since: datetime = (
+                last_sync_at - timedelta(seconds=self.index_sync_overlap_seconds)
+                if last_sync_at is not None
+                else now - timedelta(days=self.index_backfill_days)
+            )
+            jql: str = f"updated >= '{updated_since.strftime('%Y-%m-%d %H:%M')}'"
+            if self.index_project_keys:
+                jql += f" AND project in ({', '.join(self.index_project_keys)})"
+            jql += " ORDER BY updated asc"
+            issue_count: int = 0
+            async with self.http_client_factory.create_http_client(
+                base_url=self.jira_base_url, headers=self.headers, timeout=30.0
+            ) as client:
+                async for page, _ in self._search_pages_async(
+                    client=client, jql=jql, fields=self.index_fields, max_issues=None
+                ):
+                    await asyncio.to_thread(
+                        jira_issue_index.upsert,
+                        issues=[
+                            self._parse_issue(issue=issue, include_description=False)
+                            for issue in page
+                        ],
+                    )
+                    issue_count += len(page)
+                    if not await asyncio.to_thread(
+                        jira_issue_index.try_acquire_sync_lease,
+                        owner=owner,
+                        lease_seconds=self.index_sync_lease_seconds,
+                    ):
+                        self.logger.warning(
+                            "Stopped syncing the Jira issue index since the lease expired"
+                        )
+                        return
+            await asyncio.to_thread(
+                jira_issue_index.record_sync,
+                synced_at=now,
+                indexed_since=indexed_since or updated_since,
+            )
+            self.logger.info(f"Synced {issue_count} issues with JQL: {jql}")
+        finally:
+            await asyncio.to_thread(jira_issue_index.release_sync_lease, owner=owner)
+
+    async def _sync_issue_index_in_background_async(self) -> None:
+        try:
+            await self.sync_issue_index_async()
+        except Exception as e:
+            self.logger.error(f"Error syncing the Jira issue index: {str(e)}")
+
+    def _schedule_issue_index_sync(self, *, last_sync_at: Optional[datetime]) -> None:
+        """
+        Start syncing the issue index in the background if it is due and no sync is running in
+        this process.  Requests do not wait for the sync so the backfill does not hold them up.
+
+        Args:
+            last_sync_at: when the index was last synced
+        """
+        assert self.jira_issue_index is not None
+        if (
+            last_sync_at is not None
+            and (datetime.now(timezone.utc) - last_sync_at).total_seconds()
+            < self.index_sync_interval_seconds
+        ):
+            return
+        sync_task: Optional[asyncio.Task[None]] = self.jira_issue_index.sync_task
+        if sync_task is not None and not sync_task.done():
+            return
+        self.jira_issue_index.sync_task = asyncio.create_task(
+            self._sync_issue_index_in_background_async()
+        )
+
+    def _is_covered_by_index(
+        self,
+        *,
+        last_sync_at: Optional[datetime],
+        indexed_since: Optional[datetime],
+        project_key: Optional[str],
+        min_created_at: Optional[datetime],
+        min_updated_at: Optional[datetime],
+    ) -> bool:
+        """
+        Whether every issue matching a query is in the index.  Issues are indexed if they were
+        updated since indexed_since so the query has to be limited to issues created or updated
+        since then.  An issue created since then was also updated since then.
+
+        Returns:
+            True if the query can be answered from the index
+        """
+        if last_sync_at is None or indexed_since is None:
+            return False
+        if (
+            datetime.now(timezone.utc) - last_sync_at
+        ).total_seconds() > self.index_max_staleness_seconds:
+            return False
+        if self.index_project_keys and (
+            not project_key or project_key.upper() not in self.index_project_keys
+        ):
+            return False
+        return any(
+            value is not None
+            # naive datetimes are in UTC
+            and (
+                value
+                if value.tzinfo is not None
+                else value.replace(tzinfo=timezone.utc)
+            )
+            >= indexed_since
+            for value in [min_created_at, min_updated_at]
+        )
+
     async def retrieve_closed_issues(
         self,
         *,
@@ -64,6 +457,7 @@ class JiraIssueHelper:
         sort_by_direction: Optional[Literal["asc", "desc"]] = None,
         include_full_description: Optional[bool] = False,
         status: Optional[str] = "Closed",
+        counts_only: Optional[bool] = False,
     ) -> JiraIssueResult:
         """
         Async method to retrieve closed issues across Jira projects.
@@ -81,6 +475,9 @@ class JiraIssueHelper:
             sort_by_direction (str, optional): Sort direction
             include_full_description (bool, optional): Include full description
             status: (str, Optional): match status
+            counts_only (bool, optional): only the fields needed to count issues per assignee are
+                fetched and descriptions are not read.  With an issue index, issue_counts of the
+                result has the counts of all the matching issues and issues is empty.
 
         Returns:
             List[JiraIssue]: List of closed Jira issues
@@ -92,6 +489,60 @@ class JiraIssueHelper:
             base_url=self.jira_base_url, headers=self.headers, timeout=30.0
         ) as client:
             query: str = ""
+            if self.jira_issue_index is not None and (
+                counts_only or not include_full_description
+            ):
+                jira_issue_index: JiraIssueIndex = self.jira_issue_index
+                try:
+                    last_sync_at, indexed_since = await asyncio.to_thread(
+                        jira_issue_index.get_sync_state
+                    )
+                    self._schedule_issue_index_sync(last_sync_at=last_sync_at)
+                    if self._is_covered_by_index(
+                        last_sync_at=last_sync_at,
+                        indexed_since=indexed_since,
+                        project_key=project_key,
+                        min_created_at=min_created_at,
+                        min_updated_at=min_updated_at,
+                    ):
+                        query = f"Jira issue index: {jira_issue_index.database_path}\n"
+                        if counts_only:
+                            return JiraIssueResult(
+                                issues=[],
+                                query=query,
+                                error=None,
+                                issue_counts=await asyncio.to_thread(
+                                    jira_issue_index.count_by_assignee,
+                                    status=status,
+                                    project_key=project_key,
+                                    assignee=assignee,
+                                    min_created_at=min_created_at,
+                                    max_created_at=max_created_at,
+                                    min_updated_at=min_updated_at,
+                                    max_updated_at=max_updated_at,
+                                ),
+                            )
+                        return JiraIssueResult(
+                            issues=await asyncio.to_thread(
+                                jira_issue_index.search,
+                                status=status,
+                                project_key=project_key,
+                                assignee=assignee,
+                                min_created_at=min_created_at,
+                                max_created_at=max_created_at,
+                                min_updated_at=min_updated_at,
+                                max_updated_at=max_updated_at,
+                                sort_by=sort_by,
+                                sort_by_direction=sort_by_direction,
+                                max_issues=max_issues,
+                            ),
+                            query=query,
+                            error=None,
+                        )
+                except Exception as e:
+                    self.logger.warning(
+                        f"Searching Jira since the issue index failed: {e}"
+                    )
             try:
                 # Construct JQL (Jira Query Language) based on parameters
                 jql_conditions = [f"status = '{status}'"]
@@ -132,173 +583,138 @@ class JiraIssueHelper:
                 else:
                     jql += " ORDER BY updated desc"
 
-                # Pagination parameters
-                max_results = max_issues or 100  # * (max_projects or 10)
-
-                closed_issues_list: List[JiraIssue] = []
-                pages_remaining = True
-                next_page_token: Optional[str] = None
-
-                while pages_remaining:
-                    # https://developer.atlassian.com/cloud/jira/platform/rest/v3/api-group-issue-search/#api-rest-api-3-search-jql-post
-                    params = {
-                        "jql": jql,
-                        # "startAt": start_at,
-                        "nextPageToken": next_page_token,
-                        "maxResults": max_results,
-                        "fields": [
-                            # "*all",
-                            "id",
-                            "summary",
-                            "status",
-                            "created",
-                            "resolutiondate",
-                            "assignee",
-                            "assignee",
-                            "reporter",
-                            "creator",
-                            "project",
-                            "issuetype",
-                            "priority",
-                            "description",
-                        ],
-                    }
-                    response = await client.post(
-                        f"{self.jira_base_url}/rest/api/3/search/jql",
-                        json=params,
-                    )
-                    response.raise_for_status()
+                include_description: bool = bool(
+                    include_full_description and not counts_only
+                )
+                issues, query = await self._search_async(
+                    client=client,
+                    jql=jql,
+                    fields=self.get_fields(
+                        include_description=include_description,
+                        counts_only=bool(counts_only),
+                    ),
+                    max_issues=max_issues,
+                )
 
-                    url: URL = response.request.url
-                    query += f"{url}: {response.request.content.decode()}\n"
+                return JiraIssueResult(
+                    issues=[
+                        self._parse_issue(
+                            issue=issue, include_description=include_description
+                        )
+                        for issue in issues
+                    ],
+                    query=query,
+                    error=None,
+                )
 
-                    issues_data = response.json()
+            except Exception as e:
+                return JiraIssueResult(
+                    issues=[],
+                    query=query,
+                    error=str(e),
+                )
 
-                    for issue in issues_data.get("issues", []):
-                        fields_ = issue["fields"]
-                        assignee_object: Optional[Dict[str, Any]] = fields_.get(
-                            "assignee", {}
-                        )
-                        assignee_name: str = (
-                            assignee_object.get("displayName", "Unassigned")
-                            if assignee_object
-                            else "Unassigned"
-                        )
-                        assignee_email: str = (
-                            assignee_object.get("emailAddress", "Unassigned")
-                            if assignee_object
-                            else "Unassigned"
-                        )
-                        reporter_object: Optional[Dict[str, Any]] = fields_.get(
-                            "reporter", {}
-                        )
-                        reporter_name: str = (
-                            reporter_object.get("displayName", "Unassigned")
-                            if reporter_object
-                            else "Unassigned"
-                        )
-                        reporter_email: str = (
-                            reporter_object.get("emailAddress", "Unassigned")
-                            if reporter_object
-                            else "Unassigned"
-                        )
-                        creator_object: Optional[Dict[str, Any]] = fields_.get(
-                            "creator", {}
-                        )
-                        creator_name: str = (
-                            creator_object.get("displayName", "Unassigned")
-                            if creator_object
-                            else "Unassigned"
-                        )
-                        creator_email: str = (
-                            creator_object.get("emailAddress", "Unassigned")
-                            if creator_object
-                            else "Unassigned"
-                        )
-                        issue_type: str = fields_.get("issuetype", {}).get("name")
-                        project_name: str = fields_.get("project", {}).get("name")
-
-                        def read_description(description: Dict[str, Any] | None) -> str:
-                            if not include_full_description:
-                                return ""
-                            if not description:
-                                return ""
-                            try:
-                                description1 = ""
-                                content: List[Dict[str, Any]] = description.get(
-                                    "content", []
-                                )
-                                for item in content:
-                                    if item.get("type") == "paragraph":
-                                        for element in item.get("content", []):
-                                            if element.get("type") == "text":
-                                                description1 += element.get("text", "")
-                                return description1
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Error reading description: {e}: {description}"
-                                )
-                                return ""
-
-                        item_description: str = read_description(
-                            fields_.get("description", {})
-                        )
-                        issue_priority: str = fields_.get("priority", {}).get("name")
-                        closed_issues_list.append(
-                            JiraIssue(
-                                key=issue.get("key"),
-                                url=issue.get("self"),
-                                summary=fields_.get("summary", "No Summary"),
-                                status=fields_.get("status", {}).get("name"),
-                                created_at=datetime.fromisoformat(
-                                    fields_["created"].replace("Z", "+00:00")
-                                ),
-                                closed_at=(
-                                    datetime.fromisoformat(
-                                        fields_.get("resolutiondate", "").replace(
-                                            "Z", "+00:00"
-                                        )
-                                    )
-                                    if fields_.get("resolutiondate")
-                                    else None
-                                ),
-                                assignee=assignee_name,
-                                assignee_email=assignee_email,
-                                reporter=reporter_name,
-                                reporter_email=reporter_email,
-                                creator=creator_name,
-                                creator_email=creator_email,
-                                issue_type=issue_type,
-                                project_name=project_name,
-                                description=item_description,
-                                priority=issue_priority,
-                                project=fields_.get("project", {}).get("key"),
-                            )
-                        )
+    async def retrieve_issues_by_ids(
+        self,
+        *,
+        issue_ids: List[str],
+        include_full_description: bool = True,
+    ) -> JiraIssueResult:
+        """
+        Async method to retrieve Jira issues by ID.  The ids are looked up with `key in (...)`
+        searches of up to max_keys_per_batch keys.  Up to max_concurrent_batches searches run
+        concurrently on the same client.  Jira rejects the whole search if any key does not
+        exist or cannot be seen so the keys of a rejected batch are looked up one by one.
+        Ids that are not valid issue keys are not searched and are reported as not found.
 
-                        if max_issues and len(closed_issues_list) >= max_issues:
-                            break
+        Args:
+            issue_ids (List[str]): The IDs of the Jira issues to retrieve
+            include_full_description (bool): Include full description
 
-                    # Break if no more issues or max issues reached
-                    if (not issues_data.get("issues")) or (
-                        max_issues and len(closed_issues_list) >= max_issues
-                    ):
-                        pages_remaining = False
+        Returns:
+            JiraIssueResult: The issues in the order of issue_ids
+        """
+        assert self.jira_base_url, "Jira base URL is required"
+        assert self.jira_access_token, "Jira access token is required"
 
-                    next_page_token = issues_data.get("nextPageToken")
-                    if next_page_token is None:
-                        pages_remaining = False
+        keys: List[str] = list(
+            dict.fromkeys(self.normalize_issue_key(issue_id) for issue_id in issue_ids)
+        )
+        if not keys:
+            return JiraIssueResult(issues=[], query="", error="No issue ids given")
+        valid_keys: List[str] = [
+            key for key in keys if self.issue_key_pattern.match(key)
+        ]
+        batches: List[List[str]] = [
+            valid_keys[i : i + self.max_keys_per_batch]
+            for i in range(0, len(valid_keys), self.max_keys_per_batch)
+        ]
+        fields: List[str] = self.get_fields(
+            include_description=include_full_description, counts_only=False
+        )
 
-                return JiraIssueResult(
-                    issues=closed_issues_list, query=query, error=None
+        async with self.http_client_factory.create_http_client(
+            base_url=self.jira_base_url, headers=self.headers, timeout=30.0
+        ) as client:
+            semaphore: asyncio.Semaphore = asyncio.Semaphore(
+                self.max_concurrent_batches
+            )
+
+            async def search_batch_async(
+                batch: List[str],
+            ) -> Tuple[List[Dict[str, Any]], str]:
+                try:
+                    async with semaphore:
+                        return await self._search_async(
+                            client=client,
+                            jql=f"key in ({', '.join(batch)})",
+                            fields=fields,
+                            max_issues=None,
+                        )
+                except httpx.HTTPStatusError as e:
+                    # Jira returns 400 if any key does not exist or cannot be seen
+                    if e.response.status_code != 400:
+                        raise
+                if len(batch) == 1:
+                    return [], ""
+                # look up the keys one by one so only the bad keys are missing
+                key_results: List[
+                    Tuple[List[Dict[str, Any]], str]
+                ] = await asyncio.gather(*(search_batch_async([key]) for key in batch))
+                return (
+                    [issue for issues, _ in key_results for issue in issues],
+                    "".join(query for _, query in key_results),
                 )
 
+            tasks: List[asyncio.Task[Tuple[List[Dict[str, Any]], str]]] = [
+                asyncio.create_task(search_batch_async(batch)) for batch in batches
+            ]
+            try:
+                batch_results: List[
+                    Tuple[List[Dict[str, Any]], str]
+                ] = await asyncio.gather(*tasks)
             except Exception as e:
-                return JiraIssueResult(
-                    issues=[],
-                    query=query,
-                    error=str(e),
+                return JiraIssueResult(issues=[], query="", error=str(e))
+            finally:
+                # stop the other batches if one failed
+                for task in tasks:
+                    task.cancel()
+
+        issues_by_key: Dict[str, JiraIssue] = {}
+        for issues, _ in batch_results:
+            for issue in issues:
+                jira_issue: JiraIssue = self._parse_issue(
+                    issue=issue, include_description=include_full_description
                 )
+                issues_by_key[jira_issue.key] = jira_issue
+        missing_keys: List[str] = [key for key in keys if key not in issues_by_key]
+        return JiraIssueResult(
+            issues=[issues_by_key[key] for key in keys if key in issues_by_key],
+            query="".join(query for _, query in batch_results),
+            error=(
+                f"Issues not found: {', '.join(missing_keys)}" if missing_keys else None
+            ),
+        )
 
     # noinspection PyMethodMayBeStatic
     def summarize_issues_by_assignee(
@@ -395,111 +811,4 @@ class JiraIssueHelper:
         Returns:
             JiraIssueResult: The result containing the Jira issue
         """
-        assert self.jira_base_url, "Jira base URL is required"
-        assert self.jira_access_token, "Jira access token is required"
-
-        async with self.http_client_factory.create_http_client(
-            base_url=self.jira_base_url, headers=self.headers, timeout=30.0
-        ) as client:
-            query: str = ""
-            try:
-                response = await client.get(
-                    f"{self.jira_base_url}/rest/api/3/issue/{issue_id}"
-                )
-                response.raise_for_status()
-
-                url: URL = response.request.url
-                query += f"{url}: {response.request.content.decode()}\n"
-
-                issue_data = response.json()
-                fields_ = issue_data["fields"]
-
-                assignee_object: Optional[Dict[str, Any]] = fields_.get("assignee", {})
-                assignee_name: str = (
-                    assignee_object.get("displayName", "Unassigned")
-                    if assignee_object
-                    else "Unassigned"
-                )
-                assignee_email: str = (
-                    assignee_object.get("emailAddress", "Unassigned")
-                    if assignee_object
-                    else "Unassigned"
-                )
-                reporter_object: Optional[Dict[str, Any]] = fields_.get("reporter", {})
-                reporter_name: str = (
-                    reporter_object.get("displayName", "Unassigned")
-                    if reporter_object
-                    else "Unassigned"
-                )
-                reporter_email: str = (
-                    reporter_object.get("emailAddress", "Unassigned")
-                    if reporter_object
-                    else "Unassigned"
-                )
-                creator_object: Optional[Dict[str, Any]] = fields_.get("creator", {})
-                creator_name: str = (
-                    creator_object.get("displayName", "Unassigned")
-                    if creator_object
-                    else "Unassigned"
-                )
-                creator_email: str = (
-                    creator_object.get("emailAddress", "Unassigned")
-                    if creator_object
-                    else "Unassigned"
-                )
-                issue_type: str = fields_.get("issuetype", {}).get("name")
-                project_name: str = fields_.get("project", {}).get("name")
-
-                def read_description(description: Dict[str, Any] | None) -> str:
-                    if not description:
-                        return ""
-                    try:
-                        description1 = ""
-                        content: List[Dict[str, Any]] = description.get("content", [])
-                        for item in content:
-                            if item.get("type") == "paragraph":
-                                for element in item.get("content", []):
-                                    if element.get("type") == "text":
-                                        description1 += element.get("text", "")
-                        return description1
-                    except Exception as e:
-                        self.logger.error(
-                            f"Error reading description: {e}: {description}"
-                        )
-                        return ""
-
-                item_description: str = read_description(fields_.get("description", {}))
-                issue_priority: str = fields_.get("priority", {}).get("name")
-
-                jira_issue = JiraIssue(
-                    key=issue_data.get("key"),
-                    url=issue_data.get("self"),
-                    summary=fields_.get("summary", "No Summary"),
-                    status=fields_.get("status", {}).get("name"),
-                    created_at=datetime.fromisoformat(
-                        fields_["created"].replace("Z", "+00:00")
-                    ),
-                    closed_at=(
-                        datetime.fromisoformat(
-                            fields_.get("resolutiondate", "").replace("Z", "+00:00")
-                        )
-                        if fields_.get("resolutiondate")
-                        else None
-                    ),
-                    assignee=assignee_name,
-                    assignee_email=assignee_email,
-                    reporter=reporter_name,
-                    reporter_email=reporter_email,
-                    creator=creator_name,
-                    creator_email=creator_email,
-                    issue_type=issue_type,
-                    project_name=project_name,
-                    description=item_description,
-                    priority=issue_priority,
-                    project=fields_.get("project", {}).get("key"),
-                )
-
-                return JiraIssueResult(issues=[jira_issue], query=query, error=None)
-
-            except Exception as e:
-                return JiraIssueResult(issues=[], query=query, error=str(e))
+        return await self.retrieve_issues_by_ids(issue_ids=[issue_id])
@@ -0,0 +1,84 @@
+from typing import Any, Dict, List, Optional
+
+
+class JsonSchemaValidator:
+    """
+    Minimal JSON schema validation for checking model output against the schema in a
+    json_schema response format
+    """
+
+    @classmethod
+    def validate(
+        cls, *, value: Any, schema: Dict[str, Any], path: str = "$"
+    ) -> List[str]:
+        """
+        Checks a value against the type, required, properties, items and anyOf keywords of a
+        JSON schema.  References must already be resolved.
+
+        Args:
+            value: parsed JSON value
+            schema: JSON schema
+            path: path of the value used in the errors
+
+        Returns:
+            list of errors.  Empty if the value is valid.
+        """
+        any_of: Optional[List[Dict[str, Any]]] = schema.get("anyOf")
+        if any_of and all(
+            cls.validate(value=value, schema=s, path=path) for s in any_of
+        ):
+            return [f"{path} does not match any of the allowed schemas"]
+
+        schema_type: str | List[str] | None = schema.get("type")
+        if schema_type is not None:
+            types: List[str] = (
+                [schema_type] if isinstance(schema_type, str) else schema_type
+            )
+            if not any(cls._is_type(value=value, schema_type=t) for t in types):
+                return [f"{path} should be of type {schema_type}"]
+
+        errors: List[str] = []
+        if isinstance(value, dict):
+            errors.extend(
+                f"{path}.{key} is required"
+                for key in schema.get("required", [])
+                if key not in value
+            )
+            properties: Dict[str, Dict[str, Any]] = schema.get("properties", {})
+            for key, property_schema in properties.items():
+                if key in value:
+                    errors.extend(
+                        cls.validate(
+                            value=value[key],
+                            schema=property_schema,
+                            path=f"{path}.{key}",
+                        )
+                    )
+        elif isinstance(value, list) and isinstance(schema.get("items"), dict):
+            for i, item in enumerate(value):
+                errors.extend(
+                    cls.validate(
+                        value=item, schema=schema["items"], path=f"{path}[{i}]"
+                    )
+                )
+        return errors
+
+    @staticmethod
+    def _is_type(*, value: Any, schema_type: str) -> bool:
+        match schema_type:
+            case "object":
+                return isinstance(value, dict)
+            case "array":
+                return isinstance(value, list)
+            case "string":
+                return isinstance(value, str)
+            case "integer":
+                return isinstance(value, int) and not isinstance(value, bool)
+            case "number":
+                return isinstance(value, (int, float)) and not isinstance(value, bool)
+            case "boolean":
+                return isinstance(value, bool)
+            case "null":
+                return value is None
+            case _:
+                return True
@@ -0,0 +1,254 @@
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, Optional, Sequence, Tuple
+
+from langchain_core.tools import BaseTool
+from openai.types import CompletionUsage
+
+from language_model_gateway.configs.config_schema import (
+    ChatModelConfig,
+    ModelRoutingConfig,
+)
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    MODEL_ROUTE_LATENCY_SECONDS,
+    MODEL_ROUTE_TOKENS,
+    MODEL_ROUTING_DECISIONS,
+    MODEL_ROUTING_ESCALATIONS,
+)
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.model_routing.model_routing_decision import (
+    MODEL_ROUTES,
+    ModelRoutingDecision,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_routing_features import (
+    ModelRoutingFeatures,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+from language_model_gateway.gateway.utilities.tool_selection.tool_selector import (
+    ToolSelector,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ModelRouter:
+    """
+    Routes each request for a model with a routing configuration to the fast model (the model
+    in the configuration) or to the strong model.
+
+    The decision only uses the features of the request so captured traffic can be replayed
+    against a different policy with ModelRoutingReplay.  When MODEL_ROUTING_CAPTURE_FILE is set,
+    the features, decision and result of each routed request are appended to it as JSON lines.
+    """
+
+    _capture_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, *, token_counter: TokenCounter) -> None:
+        self.token_counter: TokenCounter = token_counter
+        assert self.token_counter is not None
+        assert isinstance(self.token_counter, TokenCounter)
+
+    def get_features(
+        self, *, chat_request: ChatRequest, tools: Sequence[BaseTool]
+    ) -> ModelRoutingFeatures:
+        """
+        Get the request features used for routing
+
+        Args:
+            chat_request: incoming request
+            tools: tools that will be bound to the model
+
+        Returns:
+            features of the request
+        """
+        prompt_tokens: int = sum(
+            self.token_counter.count_text(
+                text=content
+                if isinstance(content, str)
+                else json.dumps(content, default=str)
+            )
+            for content in (m.get("content") or "" for m in chat_request["messages"])
+        ) + self.token_counter.count_tools(tools=tools)
+        tool_scores = ToolSelector.rank_tools(
+            tools=tools,
+            query=ToolSelector.get_query_from_messages(chat_request["messages"]),
+        )
+        response_format: Any = chat_request.get("response_format")
+        return ModelRoutingFeatures(
+            prompt_tokens=prompt_tokens,
+            max_tool_score=round(max(tool_scores, default=0.0), 3),
+            response_format_type=(
+                response_format.get("type")
+                if isinstance(response_format, dict)
+                else None
+            ),
+            stream=bool(chat_request.get("stream")),
+        )
+
+    @staticmethod
+    def decide(
+        *, features: ModelRoutingFeatures, routing: ModelRoutingConfig
+    ) -> Tuple[MODEL_ROUTES, str]:
+        """
+        Apply the routing policy to the request features
+
+        Args:
+            features: features of the request
+            routing: routing configuration
+
+        Returns:
+            route and the reason for it
+        """
+        if features.prompt_tokens > routing.max_fast_prompt_tokens:
+            return "strong", "prompt_tokens"
+        if (
+            routing.max_fast_tool_score is not None
+            and features.max_tool_score > routing.max_fast_tool_score
+        ):
+            return "strong", "tools"
+        if routing.strong_for_json_schema and (
+            features.response_format_type == "json_schema"
+        ):
+            return "strong", "json_schema"
+        return "fast", "default"
+
+    def route(
+        self,
+        *,
+        model_config: ChatModelConfig,
+        chat_request: ChatRequest,
+        tools: Sequence[BaseTool],
+    ) -> ModelRoutingDecision:
+        """
+        Decide which model handles the request
+
+        Args:
+            model_config: model configuration with routing set
+            chat_request: incoming request
+            tools: tools that will be bound to the model
+
+        Returns:
+            routing decision
+        """
+        assert model_config.routing is not None
+        features: ModelRoutingFeatures = self.get_features(
+            chat_request=chat_request, tools=tools
+        )
+        route: MODEL_ROUTES
+        reason: str
+        route, reason = self.decide(features=features, routing=model_config.routing)
+        MODEL_ROUTING_DECISIONS.labels(
+            model=model_config.name, route=route, reason=reason
+        ).inc()
+        logger.info(f"Routing request for {model_config.name} to {route}: {reason}")
+        return ModelRoutingDecision(route=route, reason=reason, features=features)
+
+    @staticmethod
+    def get_model_config(
+        *, model_config: ChatModelConfig, route: MODEL_ROUTES
+    ) -> ChatModelConfig:
+        """
+        Get the model configuration for a route
+
+        Args:
+            model_config: model configuration with routing set
+            route: route to use
+
+        Returns:
+            model configuration with the model for the route
+        """
+        assert model_config.routing is not None
+        if route == "fast":
+            return model_config
+        return model_config.model_copy(
+            update={"model": model_config.routing.strong_model}
+        )
+
+    async def record_result_async(
+        self,
+        *,
+        model_config: ChatModelConfig,
+        decision: ModelRoutingDecision,
+        latency_seconds: float,
+        usage: Optional[CompletionUsage],
+        escalated: bool = False,
+    ) -> None:
+        """
+        Report the latency and tokens of a routed request and capture it if
+        MODEL_ROUTING_CAPTURE_FILE is set.  The capture file is written in a thread so the event
+        loop is not blocked.
+
+        Args:
+            model_config: model configuration
+            decision: routing decision used for the request
+            latency_seconds: time to complete the request
+            usage: token usage.  None for streaming requests.
+            escalated: True if the request was retried on the strong model
+        """
+        MODEL_ROUTE_LATENCY_SECONDS.labels(
+            model=model_config.name, route=decision.route
+        ).observe(latency_seconds)
+        if usage is not None:
+            MODEL_ROUTE_TOKENS.labels(
+                model=model_config.name, route=decision.route, type="prompt"
+            ).inc(usage.prompt_tokens)
+            MODEL_ROUTE_TOKENS.labels(
+                model=model_config.name, route=decision.route, type="completion"
+            ).inc(usage.completion_tokens)
+        if escalated:
+            MODEL_ROUTING_ESCALATIONS.labels(model=model_config.name).inc()
+
+        capture_file: Optional[str] = os.environ.get("MODEL_ROUTING_CAPTURE_FILE")
+        if capture_file:
+            record: Dict[str, Any] = {
+                "time": time.time(),
+                "model": model_config.name,
+                "route": decision.route,
+                "reason": decision.reason,
+                "features": dataclasses.asdict(decision.features),
+                "latency_seconds": round(latency_seconds, 3),
+                "total_tokens": usage.total_tokens if usage is not None else None,
+                "escalated": escalated,
+            }
+            await asyncio.to_thread(
+                self._write_capture, capture_file=capture_file, record=record
+            )
+
+    def _write_capture(self, *, capture_file: str, record: Dict[str, Any]) -> None:
+        with self._capture_lock:
+            with open(capture_file, "a") as file:
+                file.write(json.dumps(record) + "\n")
+
+    async def record_stream_result_async(
+        self,
+        *,
+        stream: AsyncIterable[Any],
+        model_config: ChatModelConfig,
+        decision: ModelRoutingDecision,
+        start_time: float,
+    ) -> AsyncGenerator[Any, None]:
+        """
+        Pass through a streaming response and record the result when the stream ends
+
+        Args:
+            stream: body of the streaming response
+            model_config: model configuration
+            decision: routing decision used for the request
+            start_time: time.monotonic() when the request started
+
+        Yields:
+            the chunks of the stream
+        """
+        async for chunk in stream:
+            yield chunk
+        await self.record_result_async(
+            model_config=model_config,
+            decision=decision,
+            latency_seconds=time.monotonic() - start_time,
+            usage=None,
+        )
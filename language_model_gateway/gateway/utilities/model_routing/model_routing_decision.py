@@ -0,0 +1,15 @@
+import dataclasses
+from typing import Literal
+
+from language_model_gateway.gateway.utilities.model_routing.model_routing_features import (
+    ModelRoutingFeatures,
+)
+
+MODEL_ROUTES = Literal["fast", "strong"]
+
+
+@dataclasses.dataclass
+class ModelRoutingDecision:
+    route: MODEL_ROUTES
+    reason: str
+    features: ModelRoutingFeatures
@@ -0,0 +1,10 @@
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass
+class ModelRoutingFeatures:
+    prompt_tokens: int
+    max_tool_score: float
+    response_format_type: Optional[str]
+    stream: bool
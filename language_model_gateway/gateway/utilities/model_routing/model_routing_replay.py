@@ -0,0 +1,99 @@
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List
+
+from language_model_gateway.configs.config_schema import ModelRoutingConfig
+from language_model_gateway.gateway.utilities.model_routing.model_router import (
+    ModelRouter,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_routing_features import (
+    ModelRoutingFeatures,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_routing_replay_result import (
+    ModelRoutingReplayResult,
+)
+
+
+class ModelRoutingReplay:
+    """
+    Evaluates a routing policy offline against traffic captured with MODEL_ROUTING_CAPTURE_FILE.
+
+    Each captured request is routed again with the new policy.  When the route is the same the
+    captured latency and tokens are used, otherwise the average latency and tokens of the captured
+    requests on the new route are used as the estimate.
+    """
+
+    @staticmethod
+    def read_records(*, path: str) -> List[Dict[str, Any]]:
+        """
+        Read the captured requests
+
+        Args:
+            path: capture file written by ModelRouter
+
+        Returns:
+            list of captured requests
+        """
+        with open(path) as file:
+            return [json.loads(line) for line in file if line.strip()]
+
+    @staticmethod
+    def replay(
+        *, records: Iterable[Dict[str, Any]], routing: ModelRoutingConfig
+    ) -> ModelRoutingReplayResult:
+        """
+        Route the captured requests with the routing policy
+
+        Args:
+            records: captured requests.  Escalation retries are skipped since they are replayed
+                as part of the original request.
+            routing: routing policy to evaluate
+
+        Returns:
+            route counts and the captured and estimated latency and tokens
+        """
+        requests: List[Dict[str, Any]] = [r for r in records if not r.get("escalated")]
+
+        latencies: Dict[str, List[float]] = defaultdict(list)
+        tokens: Dict[str, List[int]] = defaultdict(list)
+        for record in requests:
+            latencies[record["route"]].append(record["latency_seconds"])
+            if record.get("total_tokens") is not None:
+                tokens[record["route"]].append(record["total_tokens"])
+
+        route_counts: Dict[str, int] = defaultdict(int)
+        changed_count: int = 0
+        estimated_latency_seconds: float = 0.0
+        estimated_total_tokens: float = 0.0
+        for record in requests:
+            route: str
+            route, _ = ModelRouter.decide(
+                features=ModelRoutingFeatures(**record["features"]), routing=routing
+            )
+            route_counts[route] += 1
+            captured_tokens: int = record.get("total_tokens") or 0
+            if route == record["route"] or not latencies[route]:
+                estimated_latency_seconds += record["latency_seconds"]
+                estimated_total_tokens += captured_tokens
+            else:
+                changed_count += 1
+                estimated_latency_seconds += sum(latencies[route]) / len(
+                    latencies[route]
+                )
+                estimated_total_tokens += (
+                    sum(tokens[route]) / len(tokens[route])
+                    if tokens[route]
+                    else captured_tokens
+                )
+
+        return ModelRoutingReplayResult(
+            request_count=len(requests),
+            route_counts=dict(route_counts),
+            changed_count=changed_count,
+            captured_latency_seconds=round(
+                sum(r["latency_seconds"] for r in requests), 3
+            ),
+            estimated_latency_seconds=round(estimated_latency_seconds, 3),
+            captured_total_tokens=sum(r.get("total_tokens") or 0 for r in requests),
+            estimated_total_tokens=round(estimated_total_tokens),
+        )
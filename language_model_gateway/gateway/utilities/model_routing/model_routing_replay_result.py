@@ -0,0 +1,13 @@
+import dataclasses
+from typing import Dict
+
+
+@dataclasses.dataclass
+class ModelRoutingReplayResult:
+    request_count: int
+    route_counts: Dict[str, int]
+    changed_count: int
+    captured_latency_seconds: float
+    estimated_latency_seconds: float
+    captured_total_tokens: int
+    estimated_total_tokens: int
@@ -0,0 +1,9 @@
+import dataclasses
+
+
+@dataclasses.dataclass
+class PassageExtractionConfig:
+    # documents up to this many tokens are returned whole
+    max_tokens: int = 3000
+    # approximate size of the passages the document is split into
+    passage_tokens: int = 250
@@ -0,0 +1,36 @@
+import dataclasses
+from typing import Optional
+
+
+@dataclasses.dataclass
+class PassageExtractionResult:
+    text: str
+    original_tokens: int
+    final_tokens: int
+    passage_count: int = 0
+    returned_passage_count: int = 0
+    # rank of the next passage to return.  None if all passages were returned.
+    next_start: Optional[int] = None
+    # handle of the stored document to fetch more passages from
+    handle: Optional[str] = None
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.final_tokens
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.original_tokens / self.final_tokens if self.final_tokens else 1.0
+
+    def get_summary(self) -> str:
+        """
+        Returns:
+            description of the extraction for tool artifacts
+        """
+        if self.handle is None:
+            return f"Returned whole document ({self.original_tokens} tokens)"
+        return (
+            f"Returned {self.returned_passage_count} of {self.passage_count} passages"
+            f" ({self.final_tokens} of {self.original_tokens} tokens,"
+            f" compression {self.compression_ratio:.1f}x)"
+        )
@@ -0,0 +1,286 @@
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    PASSAGE_EXTRACTION_COMPRESSION_RATIO,
+    PASSAGE_EXTRACTION_TOKENS_SAVED,
+)
+from language_model_gateway.gateway.utilities.bm25_ranker import Bm25Ranker
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_result import (
+    PassageExtractionResult,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_store import (
+    PassageStore,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+
+class PassageExtractor:
+    """
+    Returns only the passages of a long tool output that are most relevant to a query.
+
+    The document is split into passages of about passage_tokens tokens at paragraph and sentence
+    boundaries.  The passages are ranked against the query with BM25 and the best ones that fit
+    in max_tokens are returned in document order.  The passages are kept in the PassageStore so
+    the model can fetch the next best passages with the document_passage_retriever tool.
+    """
+
+    more_passages_tool_name: str = "document_passage_retriever"
+
+    def __init__(
+        self, *, token_counter: TokenCounter, passage_store: PassageStore
+    ) -> None:
+        self.token_counter: TokenCounter = token_counter
+        assert self.token_counter is not None
+        assert isinstance(self.token_counter, TokenCounter)
+        self.passage_store: PassageStore = passage_store
+        assert self.passage_store is not None
+        assert isinstance(self.passage_store, PassageStore)
+
+    def _split_long_text(self, *, text: str, passage_tokens: int) -> List[str]:
+        """
+        Split text longer than passage_tokens at sentence boundaries and sentences that are
+        still too long at passage_tokens
+        """
+        parts: List[str] = []
+        for sentence in re.split(r"(?<=[.!?])\s+|\n", text):
+            sentence = sentence.strip()
+            while (
+                sentence
+                and self.token_counter.count_text(text=sentence) > passage_tokens
+            ):
+                head: str = self.token_counter.truncate_text(
+                    text=sentence, max_tokens=passage_tokens
+                )
+                if not head:
+                    break
+                parts.append(head)
+                sentence = sentence[len(head) :].strip()
+            if sentence:
+                parts.append(sentence)
+        return parts
+
+    def split_into_passages(self, *, text: str, passage_tokens: int) -> List[str]:
+        """
+        Split a document into passages of about passage_tokens tokens.  Consecutive paragraphs
+        are joined until a passage is full.
+
+        Args:
+            text: document
+            passage_tokens: approximate size of a passage
+
+        Returns:
+            passages in document order
+        """
+        passages: List[str] = []
+        current: str = ""
+        for paragraph in re.split(r"\n\s*\n", text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            parts: List[str] = (
+                [paragraph]
+                if self.token_counter.count_text(text=paragraph) <= passage_tokens
+                else self._split_long_text(
+                    text=paragraph, passage_tokens=passage_tokens
+                )
+            )
+            for part in parts:
+                candidate: str = f"{current}\n\n{part}" if current else part
+                if (
+                    current
+                    and self.token_counter.count_text(text=candidate) > passage_tokens
+                ):
+                    passages.append(current)
+                    candidate = part
+                current = candidate
+        if current:
+            passages.append(current)
+        return passages
+
+    def _select_passages(
+        self,
+        *,
+        passages: List[str],
+        query: Optional[str],
+        start: int,
+        max_tokens: int,
+    ) -> Tuple[List[int], Optional[int]]:
+        """
+        Select the best passages from rank start on that fit in max_tokens
+
+        Returns:
+            indexes of the selected passages in document order and the rank of the next passage
+        """
+        scores: List[float] = Bm25Ranker.rank(
+            documents=[Bm25Ranker.tokenize(passage) for passage in passages],
+            query=query or "",
+        )
+        # without a query every score is 0 so the passages are in document order
+        ranked_indexes: List[int] = sorted(
+            range(len(passages)), key=lambda i: (-scores[i], i)
+        )
+        selected_indexes: List[int] = []
+        total_tokens: int = 0
+        for index in ranked_indexes[start:]:
+            tokens: int = self.token_counter.count_text(text=passages[index])
+            # always return at least one passage
+            # passages that do not match the query are not mixed into matching ones
+            if selected_indexes and (
+                total_tokens + tokens > max_tokens
+                or (scores[selected_indexes[0]] > 0 and scores[index] == 0)
+            ):
+                break
+            selected_indexes.append(index)
+            total_tokens += tokens
+        next_start: int = start + len(selected_indexes)
+        return (
+            sorted(selected_indexes),
+            next_start if next_start < len(passages) else None,
+        )
+
+    def _format_passages(
+        self,
+        *,
+        passages: List[str],
+        selected_indexes: List[int],
+        source: str,
+        query: Optional[str],
+        handle: str,
+        next_start: Optional[int],
+    ) -> str:
+        text: str = (
+            f"[Passages of {source} most relevant to: {query}]\n\n"
+            if query
+            else f"[Passages of {source}]\n\n"
+        )
+        for index in selected_indexes:
+            text += f"[Passage {index + 1} of {len(passages)}]\n{passages[index]}\n\n"
+        if next_start is not None:
+            text += (
+                f"[Showing {len(selected_indexes)} of {len(passages)} passages."
+                f' To get more call {self.more_passages_tool_name} with handle="{handle}"'
+                f" and start={next_start}]"
+            )
+        return text.strip()
+
+    def extract(
+        self,
+        *,
+        text: str,
+        query: Optional[str],
+        source: str,
+        tool_name: str,
+        config: PassageExtractionConfig,
+    ) -> PassageExtractionResult:
+        """
+        Return the passages of a document most relevant to the query.  Documents that fit in
+        config.max_tokens are returned whole.
+
+        Args:
+            text: document returned by the tool
+            query: question the passages should answer.  If empty the first passages are returned.
+            source: where the document came from (e.g. its url)
+            tool_name: name of the tool (used for logging and metrics)
+            config: passage extraction configuration of the tool
+
+        Returns:
+            the text to return from the tool and the token counts
+        """
+        original_tokens: int = self.token_counter.count_text(text=text)
+        if original_tokens <= config.max_tokens:
+            return PassageExtractionResult(
+                text=text, original_tokens=original_tokens, final_tokens=original_tokens
+            )
+        passages: List[str] = self.split_into_passages(
+            text=text, passage_tokens=config.passage_tokens
+        )
+        handle: str = self.passage_store.add(source=source, passages=passages)
+        result: PassageExtractionResult = self._get_passages(
+            passages=passages,
+            query=query,
+            source=source,
+            handle=handle,
+            start=0,
+            max_tokens=config.max_tokens,
+            original_tokens=original_tokens,
+        )
+        PASSAGE_EXTRACTION_TOKENS_SAVED.labels(tool=tool_name).inc(
+            max(result.tokens_saved, 0)
+        )
+        PASSAGE_EXTRACTION_COMPRESSION_RATIO.labels(tool=tool_name).observe(
+            result.compression_ratio
+        )
+        logger.info(
+            f"Passage extraction for {tool_name} from {source}: {result.get_summary()}"
+        )
+        return result
+
+    def get_more_passages(
+        self, *, handle: str, query: Optional[str], start: int, max_tokens: int
+    ) -> Optional[PassageExtractionResult]:
+        """
+        Return the next passages of a document returned in part by extract()
+
+        Args:
+            handle: handle of the document
+            query: question the passages should answer
+            start: rank of the first passage to return
+            max_tokens: maximum tokens to return
+
+        Returns:
+            the passages or None if the document expired
+        """
+        entry: Optional[Tuple[str, List[str]]] = self.passage_store.get(handle=handle)
+        if entry is None:
+            return None
+        source, passages = entry
+        return self._get_passages(
+            passages=passages,
+            query=query,
+            source=source,
+            handle=handle,
+            start=max(start, 0),
+            max_tokens=max_tokens,
+            original_tokens=sum(
+                self.token_counter.count_text(text=passage) for passage in passages
+            ),
+        )
+
+    def _get_passages(
+        self,
+        *,
+        passages: List[str],
+        query: Optional[str],
+        source: str,
+        handle: str,
+        start: int,
+        max_tokens: int,
+        original_tokens: int,
+    ) -> PassageExtractionResult:
+        selected_indexes, next_start = self._select_passages(
+            passages=passages, query=query, start=start, max_tokens=max_tokens
+        )
+        text: str = self._format_passages(
+            passages=passages,
+            selected_indexes=selected_indexes,
+            source=source,
+            query=query,
+            handle=handle,
+            next_start=next_start,
+        )
+        return PassageExtractionResult(
+            text=text,
+            original_tokens=original_tokens,
+            final_tokens=self.token_counter.count_text(text=text),
+            passage_count=len(passages),
+            returned_passage_count=len(selected_indexes),
+            next_start=next_start,
+            handle=handle,
+        )
@@ -0,0 +1,67 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class PassageStore:
+    """
+    Keeps the passages of documents returned in part by PassageExtractor so more passages can be
+    fetched with the handle of the document.
+
+    Documents expire after ttl_seconds and the least recently used documents are evicted when
+    more than max_documents are kept.
+
+    This is shared across requests so register it as a singleton.
+    """
+
+    def __init__(
+        self, *, max_documents: int = 200, ttl_seconds: float = 60 * 60
+    ) -> None:
+        self.max_documents: int = max_documents
+        self.ttl_seconds: float = ttl_seconds
+        # handle -> (stored at, source, passages)
+        self._entries: OrderedDict[str, Tuple[float, str, List[str]]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, *, source: str, passages: List[str]) -> str:
+        """
+        Store the passages of a document
+
+        Args:
+            source: where the document came from (e.g. its url)
+            passages: passages of the document in document order
+
+        Returns:
+            handle of the document
+        """
+        handle: str = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._entries[handle] = (time.monotonic(), source, passages)
+            while len(self._entries) > self.max_documents:
+                self._entries.popitem(last=False)
+        return handle
+
+    def get(self, *, handle: str) -> Optional[Tuple[str, List[str]]]:
+        """
+        Get the passages of a document and mark it as recently used
+
+        Args:
+            handle: handle returned by add()
+
+        Returns:
+            source and passages of the document or None if it expired
+        """
+        with self._lock:
+            entry: Optional[Tuple[float, str, List[str]]] = self._entries.get(handle)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[handle]
+                return None
+            self._entries.move_to_end(handle)
+        return entry[1], entry[2]
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+from typing import AsyncGenerator, Callable, Dict, List, Optional, Set, TypeVar
+
+from language_model_gateway.configs.config_schema import HedgingConfig
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    HEDGING_REQUESTS,
+    HEDGING_WINS,
+)
+from language_model_gateway.gateway.utilities.request_hedging.request_hedging_state import (
+    RequestHedgingState,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RequestHedger:
+    """
+    Cuts tail latency by sending a duplicate request when the first item of a response has not
+    arrived within a percentile of the recent times to first item.  Whichever attempt produces
+    its first item first is used and the other one is cancelled.
+
+    The number of duplicated requests is limited to max_extra_load_percent of the recent requests
+    so a slow upstream does not get double the load.  The recent times and the budget are kept per
+    key (the model name) so one instance is shared by all requests and registered as a singleton.
+
+    The time of every attempt is recorded, not just the winner's: an attempt that was cancelled
+    before its first item records the time it had waited, which is a lower bound of its time to
+    first item.  Recording only the winners would make the percentile, and so the delay, too low.
+    """
+
+    # times to first byte needed before the percentile is used instead of initial_delay_seconds
+    min_samples: int = 20
+
+    def __init__(self) -> None:
+        self._states: Dict[str, RequestHedgingState] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def _get_state(self, key: str) -> RequestHedgingState:
+        state: Optional[RequestHedgingState] = self._states.get(key)
+        if state is None:
+            state = RequestHedgingState()
+            self._states[key] = state
+        return state
+
+    def get_delay_seconds(self, *, key: str, hedging: HedgingConfig) -> float:
+        """
+        Get how long to wait for the first item before sending a duplicate request
+
+        Args:
+            key: model name
+            hedging: hedging configuration
+
+        Returns:
+            delay in seconds
+        """
+        with self._lock:
+            samples: List[float] = sorted(self._get_state(key).first_byte_seconds)
+        if len(samples) < self.min_samples:
+            return max(hedging.initial_delay_seconds, hedging.min_delay_seconds)
+        index: int = min(
+            math.ceil(hedging.percentile / 100 * len(samples)) - 1, len(samples) - 1
+        )
+        return max(samples[max(index, 0)], hedging.min_delay_seconds)
+
+    def record_first_byte(self, *, key: str, seconds: float) -> None:
+        """
+        Record the time to the first item of a response
+
+        Args:
+            key: model name
+            seconds: time to first item
+        """
+        with self._lock:
+            self._get_state(key).first_byte_seconds.append(seconds)
+
+    def try_hedge(self, *, key: str, hedging: HedgingConfig) -> bool:
+        """
+        Check the hedge budget for a request whose first item is late
+
+        Args:
+            key: model name
+            hedging: hedging configuration
+
+        Returns:
+            True if a duplicate request can be sent
+        """
+        with self._lock:
+            hedged = self._get_state(key).hedged
+            # the current request is recorded when it finishes so count it here
+            return sum(hedged) + 1 <= hedging.max_extra_load_percent / 100 * (
+                len(hedged) + 1
+            )
+
+    def record_request(self, *, key: str, hedged: bool) -> None:
+        """
+        Record whether a request was duplicated for the hedge budget
+
+        Args:
+            key: model name
+            hedged: True if a duplicate request was sent
+        """
+        with self._lock:
+            self._get_state(key).hedged.append(hedged)
+
+    async def hedge_async(
+        self,
+        *,
+        key: str,
+        hedging: HedgingConfig,
+        start_attempt: Callable[[int], AsyncGenerator[T, None]],
+    ) -> AsyncGenerator[T, None]:
+        """
+        Run the request and send a duplicate request if its first item is late
+
+        Args:
+            key: model name used for the recent times to first item and the budget
+            hedging: hedging configuration
+            start_attempt: starts an attempt of the request.  Called with 0 for the original
+                request and 1 for the duplicate so the duplicate can go to another upstream.
+
+        Yields:
+            the items of the attempt that produced its first item first
+        """
+        delay_seconds: float = self.get_delay_seconds(key=key, hedging=hedging)
+        iterators: List[AsyncGenerator[T, None]] = []
+        tasks: List[asyncio.Future[T]] = []
+        start_times: List[float] = []
+
+        def start(index: int) -> None:
+            iterator: AsyncGenerator[T, None] = start_attempt(index)
+            iterators.append(iterator)
+            tasks.append(asyncio.ensure_future(iterator.__anext__()))
+            start_times.append(time.monotonic())
+
+        winner: Optional[int] = None
+        try:
+            start(0)
+            done: Set[asyncio.Future[T]]
+            done, _ = await asyncio.wait(tasks, timeout=delay_seconds)
+            if not done:
+                if self.try_hedge(key=key, hedging=hedging):
+                    logger.info(
+                        f"No response for {key} after {delay_seconds:.2f}s so sending a duplicate request"
+                    )
+                    start(1)
+                    HEDGING_REQUESTS.labels(model=key, result="hedged").inc()
+                else:
+                    HEDGING_REQUESTS.labels(model=key, result="over_budget").inc()
+            else:
+                HEDGING_REQUESTS.labels(model=key, result="not_hedged").inc()
+            self.record_request(key=key, hedged=len(tasks) > 1)
+
+            pending: Set[asyncio.Future[T]] = set(tasks)
+            while winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for index, task in enumerate(tasks):
+                    # a failed attempt loses unless every attempt failed
+                    if task in done and (
+                        not pending
+                        or task.exception() is None
+                        or isinstance(task.exception(), StopAsyncIteration)
+                    ):
+                        winner = index
+                        break
+        finally:
+            for index, task in enumerate(tasks):
+                if index != winner:
+                    if not task.done() or (
+                        not task.cancelled() and task.exception() is None
+                    ):
+                        self.record_first_byte(
+                            key=key, seconds=time.monotonic() - start_times[index]
+                        )
+                    task.cancel()
+                    await asyncio.gather(task, return_exceptions=True)
+                    await iterators[index].aclose()
+
+        assert winner is not None
+        if len(tasks) > 1:
+            HEDGING_WINS.labels(
+                model=key, winner="original" if winner == 0 else "duplicate"
+            ).inc()
+        iterator = iterators[winner]
+        try:
+            try:
+                first_item: T = tasks[winner].result()
+            except StopAsyncIteration:
+                return
+            self.record_first_byte(
+                key=key, seconds=time.monotonic() - start_times[winner]
+            )
+            yield first_item
+            async for item in iterator:
+                yield item
+        finally:
+            await iterator.aclose()
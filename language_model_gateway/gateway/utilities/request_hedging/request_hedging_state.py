@@ -0,0 +1,15 @@
+import collections
+import dataclasses
+from typing import Deque
+
+
+@dataclasses.dataclass
+class RequestHedgingState:
+    # recent times to first byte in seconds
+    first_byte_seconds: Deque[float] = dataclasses.field(
+        default_factory=lambda: collections.deque(maxlen=200)
+    )
+    # whether each recent request was duplicated.  Used for the hedge budget.
+    hedged: Deque[bool] = dataclasses.field(
+        default_factory=lambda: collections.deque(maxlen=1000)
+    )
@@ -0,0 +1,87 @@
+import re
+from typing import List, Literal, Tuple
+
+STATUS_MESSAGE_MODES = Literal["keep", "collapse", "strip"]
+
+
+class StatusMessageMarker:
+    """
+    Marks the status text the gateway adds to assistant responses (e.g. "> Running Agent ..."
+    and tool artifacts) so it can be found again when the chat client sends the response back
+    as history on the next turn.
+
+    The status text is wrapped in invisible unicode characters that render as nothing in chat
+    clients but are easy to detect.  The start marker is put after any markdown prefix like "> "
+    so the markdown still renders the same.
+    """
+
+    start: str = "\u2063"  # INVISIBLE SEPARATOR
+    end: str = "\u2064"  # INVISIBLE PLUS
+    # maximum characters of a status message kept when collapsing
+    collapsed_length: int = 80
+
+    # the marked text plus the markdown prefix/suffix and blank lines around it
+    _pattern: re.Pattern[str] = re.compile(
+        r"\n*(?:> |\[)?\u2063(?P<text>.*?)\u2064\]?\n?", re.DOTALL
+    )
+
+    @classmethod
+    def mark(cls, text: str) -> str:
+        """
+        Wrap status text in the markers
+
+        Args:
+            text: status text
+
+        Returns:
+            marked text
+        """
+        return f"{cls.start}{text}{cls.end}"
+
+    @classmethod
+    def unmark(cls, text: str) -> str:
+        """
+        Remove the markers but keep the status text, e.g. for non-streaming responses where the
+        invisible characters would end up in the content the caller parses
+
+        Args:
+            text: text with marked status messages
+
+        Returns:
+            text without the markers
+        """
+        return text.replace(cls.start, "").replace(cls.end, "")
+
+    @classmethod
+    def remove(cls, *, text: str, mode: STATUS_MESSAGE_MODES) -> Tuple[str, List[str]]:
+        """
+        Remove or collapse the marked status messages in text
+
+        Args:
+            text: assistant message content
+            mode: keep leaves the text as is, strip removes status messages, collapse keeps
+                only the start of the first line of each status message
+
+        Returns:
+            the new text and the status messages that were found
+        """
+        if mode == "keep" or cls.start not in text:
+            return text, []
+
+        status_messages: List[str] = []
+
+        def replace(match: re.Match[str]) -> str:
+            status_message: str = match.group("text")
+            status_messages.append(status_message)
+            if mode == "strip":
+                return "\n" if match.group(0).endswith("\n") else ""
+            first_line: str = status_message.strip().split("\n", 1)[0]
+            if len(first_line) > cls.collapsed_length:
+                first_line = first_line[: cls.collapsed_length] + "..."
+            return f"\n> {first_line}\n"
+
+        new_text: str = cls._pattern.sub(replace, text)
+        if not status_messages:
+            return text, status_messages
+        # removing consecutive status messages can leave runs of blank lines
+        return re.sub(r"\n{3,}", "\n\n", new_text).strip("\n"), status_messages
@@ -0,0 +1,142 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from language_model_gateway.gateway.utilities.json_schema_validator import (
+    JsonSchemaValidator,
+)
+
+
+class StreamingJsonExtractor:
+    """
+    Finds the JSON payload in a response as it is streamed so only the JSON is sent to the client.
+
+    The prompt from add_system_messages_for_json() asks the model to wrap the JSON in <json> tags
+    but models sometimes add prose before or after it.  The payload starts at the first { or [
+    after the <json> tag, or at the start of the response if it starts with JSON (optionally in a
+    code fence).  After that the brackets are counted, ignoring the ones in strings, so the end of
+    the payload is found without waiting for the closing tag.  If the start is not found while
+    streaming, finish() looks for JSON anywhere in the response.
+    """
+
+    start_tag: str = "<json>"
+    # response that starts with JSON, optionally in a markdown code fence
+    _json_start_pattern: re.Pattern[str] = re.compile(r"\s*(?:```(?:json)?\s*)?[\[{]")
+
+    def __init__(self) -> None:
+        # text seen before the start of the JSON
+        self._prefix: str = ""
+        self._json_parts: List[str] = []
+        self._started: bool = False
+        self._finished: bool = False
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._escaped: bool = False
+
+    @property
+    def json_text(self) -> str:
+        """The JSON text found so far"""
+        return "".join(self._json_parts)
+
+    @property
+    def finished(self) -> bool:
+        """True once the closing bracket of the payload has been seen"""
+        return self._finished
+
+    def add(self, text: str) -> str:
+        """
+        Add the next chunk of the response
+
+        Args:
+            text: chunk of text from the model
+
+        Returns:
+            the part of the chunk that belongs to the JSON payload.  Empty if there is none.
+        """
+        if self._finished or not text:
+            return ""
+        if not self._started:
+            self._prefix += text
+            start: int = self._find_start()
+            if start < 0:
+                return ""
+            text = self._prefix[start:]
+            self._prefix = ""
+            self._started = True
+        return self._consume(text)
+
+    def finish(self) -> str:
+        """
+        Call at the end of the stream.  If the start of the payload was not found while streaming,
+        the first JSON in the whole response is used.
+
+        Returns:
+            the rest of the JSON payload.  Empty if it was already sent or there is none.
+        """
+        if self._started:
+            return ""
+        start: int = self._find_bracket(search_from=0)
+        if start < 0:
+            return ""
+        self._started = True
+        return self._consume(self._prefix[start:])
+
+    def _find_start(self) -> int:
+        tag_index: int = self._prefix.lower().find(self.start_tag)
+        if tag_index >= 0:
+            return self._find_bracket(search_from=tag_index + len(self.start_tag))
+        match: re.Match[str] | None = self._json_start_pattern.match(self._prefix)
+        return match.end() - 1 if match else -1
+
+    def _find_bracket(self, *, search_from: int) -> int:
+        starts: List[int] = [
+            i for i in (self._prefix.find(c, search_from) for c in "{[") if i >= 0
+        ]
+        return min(starts) if starts else -1
+
+    def _consume(self, text: str) -> str:
+        end: int = len(text)
+        for i, char in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finished = True
+                    end = i + 1
+                    break
+        delta: str = text[:end]
+        self._json_parts.append(delta)
+        return delta
+
+    def validate(self, *, schema: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Check the JSON payload once the stream is done
+
+        Args:
+            schema: JSON schema from the response_format of the request.  None only checks that
+                the payload is complete, valid JSON.
+
+        Returns:
+            list of errors.  Empty if the payload is valid.
+        """
+        if not self._started:
+            return ["No JSON found in the response"]
+        if not self._finished:
+            return ["The JSON in the response is incomplete"]
+        try:
+            value: Any = json.loads(self.json_text)
+        except json.JSONDecodeError as e:
+            return [f"The JSON in the response is not valid: {e}"]
+        return (
+            JsonSchemaValidator.validate(value=value, schema=schema) if schema else []
+        )
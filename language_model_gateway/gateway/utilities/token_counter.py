@@ -0,0 +1,130 @@
+import json
+import logging
+import threading
+from typing import ClassVar, List, Optional, Sequence
+
+import tiktoken
+from langchain_core.messages import BaseMessage
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from language_model_gateway.gateway.utilities.chat_message_helpers import (
+    convert_message_content_to_string,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCounter:
+    """
+    Counts tokens for messages and tool definitions.
+
+    Uses the cl100k_base tiktoken encoding which is close enough for budgeting with both
+    OpenAI and Anthropic models.  If the encoding cannot be loaded (e.g. no network access
+    to download it) we fall back to an estimate of 4 characters per token.
+    """
+
+    encoding_name: ClassVar[str] = "cl100k_base"
+    # tokens added per message for the role and message separators
+    tokens_per_message: ClassVar[int] = 4
+    characters_per_token: ClassVar[int] = 4
+
+    _encoding: ClassVar[Optional[tiktoken.Encoding]] = None
+    _encoding_load_failed: ClassVar[bool] = False
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get_encoding(cls) -> Optional[tiktoken.Encoding]:
+        """
+        Returns the tiktoken encoding, loading it on first use.  Returns None if it cannot be loaded.
+        """
+        if cls._encoding is None and not cls._encoding_load_failed:
+            with cls._lock:
+                if cls._encoding is None and not cls._encoding_load_failed:
+                    try:
+                        cls._encoding = tiktoken.get_encoding(cls.encoding_name)
+                    except Exception as e:
+                        logger.warning(
+                            f"Unable to load tiktoken encoding {cls.encoding_name} so estimating token counts: {e}"
+                        )
+                        cls._encoding_load_failed = True
+        return cls._encoding
+
+    def count_text(self, *, text: str) -> int:
+        """
+        Count the tokens in text
+
+        Args:
+            text: text to count
+
+        Returns:
+            number of tokens
+        """
+        if not text:
+            return 0
+        encoding: Optional[tiktoken.Encoding] = self.get_encoding()
+        if encoding is None:
+            return (
+                len(text) + self.characters_per_token - 1
+            ) // self.characters_per_token
+        return len(encoding.encode(text, disallowed_special=()))
+
+    def truncate_text(self, *, text: str, max_tokens: int) -> str:
+        """
+        Truncate text to at most max_tokens tokens
+
+        Args:
+            text: text to truncate
+            max_tokens: maximum number of tokens to keep
+
+        Returns:
+            truncated text
+        """
+        encoding: Optional[tiktoken.Encoding] = self.get_encoding()
+        if encoding is None:
+            return text[: max_tokens * self.characters_per_token]
+        tokens: List[int] = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return encoding.decode(tokens[:max_tokens])
+
+    def count_message(self, *, message: BaseMessage) -> int:
+        """
+        Count the tokens in a message including the per message overhead
+
+        Args:
+            message: message to count
+
+        Returns:
+            number of tokens
+        """
+        return self.tokens_per_message + self.count_text(
+            text=convert_message_content_to_string(message.content)
+        )
+
+    def count_messages(self, *, messages: Sequence[BaseMessage]) -> int:
+        """
+        Count the tokens in a list of messages
+
+        Args:
+            messages: messages to count
+
+        Returns:
+            number of tokens
+        """
+        return sum(self.count_message(message=m) for m in messages)
+
+    def count_tools(self, *, tools: Sequence[BaseTool]) -> int:
+        """
+        Count the tokens used by the tool definitions sent to the model
+
+        Args:
+            tools: tools bound to the model
+
+        Returns:
+            number of tokens
+        """
+        return sum(
+            self.count_text(text=json.dumps(convert_to_openai_tool(tool)))
+            for tool in tools
+        )
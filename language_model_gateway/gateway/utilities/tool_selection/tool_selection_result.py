@@ -0,0 +1,15 @@
+import dataclasses
+from typing import List
+
+from langchain_core.tools import BaseTool
+
+
+@dataclasses.dataclass
+class ToolSelectionResult:
+    tools: List[BaseTool]
+    original_tokens: int
+    final_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.original_tokens - self.final_tokens
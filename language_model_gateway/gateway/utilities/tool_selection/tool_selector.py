@@ -0,0 +1,231 @@
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.tools import BaseTool
+from openai.types.chat import ChatCompletionMessageParam
+
+from language_model_gateway.configs.config_schema import ToolSelectionConfig
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    TOOL_SELECTION_TOKENS_SAVED,
+)
+from language_model_gateway.gateway.utilities.bm25_ranker import Bm25Ranker
+from language_model_gateway.gateway.utilities.tool_selection.tool_selection_result import (
+    ToolSelectionResult,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+
+class ToolSelector:
+    """
+    Selects the tools most relevant to the latest user message so only those are bound to the model.
+
+    The tools are ranked with BM25 over their name, description and argument names and
+    descriptions.  The name is repeated so a match on it counts more than a match in a long
+    description.  When nothing in the message matches any tool, every tool is bound since there
+    is nothing to rank them by.
+
+    The terms and the definition tokens of each tool are cached by its definition.  The caches
+    are shared by all instances since the tools are created again for each request.
+    """
+
+    name_weight: int = 3
+    max_cached_tools: int = 1000
+
+    _cache_lock: threading.Lock = threading.Lock()
+    _tool_terms_cache: OrderedDict[Tuple[str, str, str], List[str]] = OrderedDict()
+    _tool_tokens_cache: OrderedDict[Tuple[str, str, str], int] = OrderedDict()
+
+    def __init__(self, *, token_counter: TokenCounter) -> None:
+        self.token_counter: TokenCounter = token_counter
+        assert self.token_counter is not None
+        assert isinstance(self.token_counter, TokenCounter)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """
+        Split text into lower case terms as Bm25Ranker does
+
+        Args:
+            text: text to split
+
+        Returns:
+            list of terms
+        """
+        return Bm25Ranker.tokenize(text)
+
+    @staticmethod
+    def get_tool_key(*, tool: BaseTool) -> Tuple[str, str, str]:
+        """
+        Key of the definition of a tool for the caches
+
+        Args:
+            tool: tool
+
+        Returns:
+            name, description and arguments of the tool
+        """
+        return (
+            tool.name,
+            tool.description,
+            json.dumps(tool.args, sort_keys=True, default=str),
+        )
+
+    @classmethod
+    def get_tool_terms(cls, *, tool: BaseTool) -> List[str]:
+        """
+        Terms indexed for a tool
+
+        Args:
+            tool: tool to index
+
+        Returns:
+            list of terms
+        """
+        key: Tuple[str, str, str] = cls.get_tool_key(tool=tool)
+        with cls._cache_lock:
+            cached_terms: Optional[List[str]] = cls._tool_terms_cache.get(key)
+            if cached_terms is not None:
+                cls._tool_terms_cache.move_to_end(key)
+                return cached_terms
+        argument_text: str = " ".join(
+            f"{name} {schema.get('description') or ''}"
+            for name, schema in tool.args.items()
+        )
+        terms: List[str] = (
+            cls.tokenize(tool.name) * cls.name_weight
+            + cls.tokenize(tool.description)
+            + cls.tokenize(argument_text)
+        )
+        with cls._cache_lock:
+            cls._tool_terms_cache[key] = terms
+            if len(cls._tool_terms_cache) > cls.max_cached_tools:
+                cls._tool_terms_cache.popitem(last=False)
+        return terms
+
+    def count_tool_tokens(self, *, tools: Sequence[BaseTool]) -> int:
+        """
+        Count the tokens of the tool definitions sent to the model
+
+        Args:
+            tools: tools bound to the model
+
+        Returns:
+            number of tokens
+        """
+        total: int = 0
+        for tool in tools:
+            key: Tuple[str, str, str] = self.get_tool_key(tool=tool)
+            with self._cache_lock:
+                tokens: Optional[int] = self._tool_tokens_cache.get(key)
+                if tokens is not None:
+                    self._tool_tokens_cache.move_to_end(key)
+            if tokens is None:
+                tokens = self.token_counter.count_tools(tools=[tool])
+                with self._cache_lock:
+                    self._tool_tokens_cache[key] = tokens
+                    if len(self._tool_tokens_cache) > self.max_cached_tools:
+                        self._tool_tokens_cache.popitem(last=False)
+            total += tokens
+        return total
+
+    @classmethod
+    def rank_tools(cls, *, tools: Sequence[BaseTool], query: str) -> List[float]:
+        """
+        Score each tool against the query with BM25
+
+        Args:
+            tools: tools to rank
+            query: text to rank the tools against
+
+        Returns:
+            score of each tool in the same order as tools
+        """
+        return Bm25Ranker.rank(
+            documents=[cls.get_tool_terms(tool=tool) for tool in tools], query=query
+        )
+
+    def select_tools(
+        self,
+        *,
+        model_name: str,
+        tools: Sequence[BaseTool],
+        query: str,
+        tool_selection: Optional[ToolSelectionConfig],
+    ) -> ToolSelectionResult:
+        """
+        Select the tools to bind to the model
+
+        Args:
+            model_name: name of the model (used for logging and metrics)
+            tools: tools configured for the model
+            query: latest user message
+            tool_selection: tool selection configuration for the model.  If None all tools are returned.
+
+        Returns:
+            selected tools in their configured order and the tool definition tokens before and after
+        """
+        if tool_selection is None or len(tools) <= tool_selection.max_tools:
+            return ToolSelectionResult(
+                tools=list(tools), original_tokens=0, final_tokens=0
+            )
+
+        always_include: List[str] = tool_selection.always_include or []
+        scores: List[float] = self.rank_tools(tools=tools, query=query)
+        if not any(score > 0 for score in scores):
+            # the configured order says nothing about relevance so do not cut the tools by it
+            logger.info(
+                f"Tool selection for {model_name}: no tool matches the message so binding all {len(tools)} tools"
+            )
+            return ToolSelectionResult(
+                tools=list(tools), original_tokens=0, final_tokens=0
+            )
+        # always included tools first, then by score.  Ties keep the configured order.
+        ranked_indexes: List[int] = sorted(
+            range(len(tools)),
+            key=lambda i: (tools[i].name not in always_include, -scores[i], i),
+        )
+        selected_indexes: List[int] = sorted(ranked_indexes[: tool_selection.max_tools])
+        selected_tools: List[BaseTool] = [tools[i] for i in selected_indexes]
+
+        result = ToolSelectionResult(
+            tools=selected_tools,
+            original_tokens=self.count_tool_tokens(tools=tools),
+            final_tokens=self.count_tool_tokens(tools=selected_tools),
+        )
+        TOOL_SELECTION_TOKENS_SAVED.labels(model=model_name).inc(result.tokens_saved)
+        logger.info(
+            f"Tool selection for {model_name}: bound {len(selected_tools)} of {len(tools)} tools"
+            f" ({[t.name for t in selected_tools]}), saving {result.tokens_saved} tokens per model call"
+        )
+        return result
+
+    @staticmethod
+    def get_query_from_messages(messages: Iterable[ChatCompletionMessageParam]) -> str:
+        """
+        Get the text of the latest user message
+
+        Args:
+            messages: incoming messages
+
+        Returns:
+            text of the latest user message.  Empty if there is none.
+        """
+        user_messages: List[ChatCompletionMessageParam] = [
+            m for m in messages if m["role"] == "user"
+        ]
+        if not user_messages:
+            return ""
+        content: object = user_messages[-1].get("content")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            parts: List[Dict[str, object]] = [p for p in content if isinstance(p, dict)]
+            return " ".join(
+                str(p.get("text") or "") for p in parts if p.get("type") == "text"
+            )
+        return ""
@@ -0,0 +1,70 @@
+import re
+from typing import Dict, List, Optional
+from xml.etree import ElementTree
+
+import httpx
+
+from language_model_gateway.gateway.utilities.web_search.web_search_engine import (
+    WebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+
+class ArxivWebSearchEngine(WebSearchEngine):
+    """
+    Searches arXiv papers with the arXiv API
+    """
+
+    name: str = "arxiv"
+    url: str = "https://export.arxiv.org/api/query"
+    namespaces: Dict[str, str] = {"atom": "http://www.w3.org/2005/Atom"}
+
+    def __init__(self, *, max_snippet_characters: int = 300) -> None:
+        """
+        Args:
+            max_snippet_characters: abstracts are cut to this length
+        """
+        self.max_snippet_characters: int = max_snippet_characters
+
+    def _get_text(self, entry: ElementTree.Element, tag: str) -> str:
+        element: Optional[ElementTree.Element] = entry.find(
+            f"atom:{tag}", self.namespaces
+        )
+        # titles and abstracts are wrapped over several lines
+        return (
+            re.sub(r"\s+", " ", element.text or "").strip()
+            if element is not None
+            else ""
+        )
+
+    async def search_async(
+        self, *, client: httpx.AsyncClient, query: str, max_results: int
+    ) -> List[WebSearchResult]:
+        response = await client.get(
+            self.url,
+            params={
+                "search_query": f"all:{query}",
+                "start": "0",
+                "max_results": str(max_results),
+            },
+        )
+        response.raise_for_status()
+        feed: ElementTree.Element = ElementTree.fromstring(response.text)
+        results: List[WebSearchResult] = []
+        for entry in feed.findall("atom:entry", self.namespaces):
+            url: str = self._get_text(entry, "id")
+            if not url:
+                continue
+            summary: str = self._get_text(entry, "summary")
+            if len(summary) > self.max_snippet_characters:
+                summary = (
+                    summary[: self.max_snippet_characters].rsplit(" ", 1)[0] + "..."
+                )
+            results.append(
+                WebSearchResult(
+                    title=self._get_text(entry, "title"), url=url, snippet=summary
+                )
+            )
+        return results
@@ -0,0 +1,62 @@
+from typing import List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+from bs4 import BeautifulSoup, Tag
+
+from language_model_gateway.gateway.utilities.web_search.web_search_engine import (
+    WebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+
+class DuckDuckGoWebSearchEngine(WebSearchEngine):
+    """
+    Searches the web with the DuckDuckGo HTML page.  Unlike DuckDuckGoSearchRun this does not
+    need a thread since the page is requested with the async http client.
+    """
+
+    name: str = "duckduckgo"
+    url: str = "https://html.duckduckgo.com/html/"
+
+    @staticmethod
+    def _get_target_url(href: str) -> str:
+        # links go through a redirect with the target in the uddg parameter
+        split = urlsplit(href)
+        if split.path == "/l/":
+            targets: List[str] = parse_qs(split.query).get("uddg", [])
+            if targets:
+                return targets[0]
+        return href
+
+    async def search_async(
+        self, *, client: httpx.AsyncClient, query: str, max_results: int
+    ) -> List[WebSearchResult]:
+        response = await client.get(
+            self.url,
+            params={"q": query},
+            # the page is not returned to clients without a browser user agent
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+        response.raise_for_status()
+        soup = BeautifulSoup(response.text, "html.parser")
+        results: List[WebSearchResult] = []
+        for result in soup.select("div.result"):
+            if "result--ad" in (result.get("class") or []):
+                continue
+            link: Optional[Tag] = result.select_one("a.result__a")
+            if link is None or not link.get("href"):
+                continue
+            snippet: Optional[Tag] = result.select_one(".result__snippet")
+            results.append(
+                WebSearchResult(
+                    title=link.get_text(strip=True),
+                    url=self._get_target_url(str(link["href"])),
+                    snippet=snippet.get_text(" ", strip=True) if snippet else "",
+                )
+            )
+            if len(results) >= max_results:
+                break
+        return results
@@ -0,0 +1,58 @@
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.web_search.web_search_engine import (
+    WebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+
+class GoogleWebSearchEngine(WebSearchEngine):
+    """
+    Searches the web with the Google Custom Search API.  See GoogleSearchTool for how to get an
+    API key and a search engine id.
+    """
+
+    name: str = "google"
+    url: str = "https://customsearch.googleapis.com/customsearch/v1"
+
+    def __init__(self, *, api_key: str, cse_id: str) -> None:
+        """
+        Args:
+            api_key: Google API key
+            cse_id: id of a custom search engine that searches the entire web
+        """
+        assert api_key, "Google API key is required"
+        assert cse_id, "Google custom search engine id is required"
+        self.api_key: str = api_key
+        self.cse_id: str = cse_id
+
+    async def search_async(
+        self, *, client: httpx.AsyncClient, query: str, max_results: int
+    ) -> List[WebSearchResult]:
+        response = await client.get(
+            self.url,
+            params={
+                "key": self.api_key,
+                "cx": self.cse_id,
+                "q": query,
+                "c2coff": "1",
+                # the API returns at most 10 results per request
+                "num": str(min(max_results, 10)),
+            },
+        )
+        response.raise_for_status()
+        # Result follows https://developers.google.com/custom-search/v1/reference/rest/v1/Search
+        items: List[Dict[str, Any]] = response.json().get("items", [])
+        return [
+            WebSearchResult(
+                title=item.get("title", ""),
+                url=item["link"],
+                snippet=item.get("snippet", ""),
+            )
+            for item in items
+            if item.get("link")
+        ]
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.web_search.web_search_engine import (
+    WebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+
+class PubmedWebSearchEngine(WebSearchEngine):
+    """
+    Searches PubMed articles with the NCBI E-utilities API
+    """
+
+    name: str = "pubmed"
+    base_url: str = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+
+    async def search_async(
+        self, *, client: httpx.AsyncClient, query: str, max_results: int
+    ) -> List[WebSearchResult]:
+        search_response = await client.get(
+            f"{self.base_url}/esearch.fcgi",
+            params={
+                "db": "pubmed",
+                "term": query,
+                "retmode": "json",
+                "retmax": str(max_results),
+                "sort": "relevance",
+            },
+        )
+        search_response.raise_for_status()
+        ids: List[str] = (
+            search_response.json().get("esearchresult", {}).get("idlist", [])
+        )
+        if not ids:
+            return []
+        summary_response = await client.get(
+            f"{self.base_url}/esummary.fcgi",
+            params={"db": "pubmed", "id": ",".join(ids), "retmode": "json"},
+        )
+        summary_response.raise_for_status()
+        summaries: Dict[str, Any] = summary_response.json().get("result", {})
+        results: List[WebSearchResult] = []
+        for article_id in ids:
+            summary: Dict[str, Any] = summaries.get(article_id, {})
+            if not summary.get("title"):
+                continue
+            authors: List[str] = [
+                author.get("name", "") for author in summary.get("authors", [])[:3]
+            ]
+            results.append(
+                WebSearchResult(
+                    title=summary["title"],
+                    url=f"https://pubmed.ncbi.nlm.nih.gov/{article_id}/",
+                    snippet=", ".join(
+                        part
+                        for part in [
+                            ", ".join(authors),
+                            summary.get("fulljournalname"),
+                            summary.get("pubdate"),
+                        ]
+                        if part
+                    ),
+                )
+            )
+        return results
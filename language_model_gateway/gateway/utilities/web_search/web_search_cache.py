@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    WEB_SEARCH_CACHE_LOOKUPS,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_response import (
+    WebSearchResponse,
+)
+
+
+class WebSearchCache:
+    """
+    Keeps the fused results of web searches by normalized query so the same search in the same
+    or another conversation does not go to the engines again.
+
+    Results expire after ttl_seconds and the least recently used searches are evicted when more
+    than max_queries are kept.
+
+    This is shared across requests so register it as a singleton.
+    """
+
+    def __init__(self, *, max_queries: int = 500, ttl_seconds: float = 10 * 60) -> None:
+        self.max_queries: int = max_queries
+        self.ttl_seconds: float = ttl_seconds
+        # key -> (stored at, response)
+        self._entries: OrderedDict[str, Tuple[float, WebSearchResponse]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Normalize a query so queries that differ only in case or spacing share the cached
+        results.  Punctuation is kept since it changes the meaning of queries like C++ and C#.
+
+        Args:
+            query: search query
+
+        Returns:
+            normalized query
+        """
+        return " ".join(query.lower().split())
+
+    def get(self, *, key: str) -> Optional[WebSearchResponse]:
+        """
+        Get the cached results of a search and mark them as recently used
+
+        Args:
+            key: key built by WebSearcher from the normalized query
+
+        Returns:
+            the cached response or None if there is none or it expired
+        """
+        with self._lock:
+            entry: Optional[Tuple[float, WebSearchResponse]] = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        WEB_SEARCH_CACHE_LOOKUPS.labels(
+            result="hit" if entry is not None else "miss"
+        ).inc()
+        return entry[1] if entry is not None else None
+
+    def set(self, *, key: str, response: WebSearchResponse) -> None:
+        """
+        Cache the results of a search
+
+        Args:
+            key: key built by WebSearcher from the normalized query
+            response: fused results
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_queries:
+                self._entries.popitem(last=False)
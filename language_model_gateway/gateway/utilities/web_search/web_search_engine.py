@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+
+class WebSearchEngine(ABC):
+    """
+    Adapter for a search engine used by WebSearcher
+    """
+
+    # name of the engine in WEB_SEARCH_ENGINES, the results and the metrics
+    name: str
+
+    @abstractmethod
+    async def search_async(
+        self, *, client: httpx.AsyncClient, query: str, max_results: int
+    ) -> List[WebSearchResult]:
+        """
+        Search the engine
+
+        Args:
+            client: http client shared by the engines of a search
+            query: search query
+            max_results: maximum number of results to return
+
+        Returns:
+            results with the best first
+        """
+        ...
@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+
+@dataclass
+class WebSearchResponse:
+    query: str
+    # fused results with the best first
+    results: List[WebSearchResult]
+    # engines that were searched
+    engines: List[str]
+    # engines that failed or did not answer before the deadline
+    failed_engines: List[str] = field(default_factory=list)
+    cached: bool = False
@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class WebSearchResult:
+    title: str
+    url: str
+    snippet: str
+    # engines that returned the result
+    engines: List[str] = field(default_factory=list)
+    # reciprocal rank fusion score
+    score: float = 0.0
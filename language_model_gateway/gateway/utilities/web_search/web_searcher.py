@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack
+from dataclasses import replace
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
+from language_model_gateway.gateway.metrics.gateway_metrics import (
+    WEB_SEARCH_ENGINE_REQUESTS,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_cache import (
+    WebSearchCache,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_engine import (
+    WebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_response import (
+    WebSearchResponse,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_result import (
+    WebSearchResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WebSearcher:
+    """
+    Searches several engines concurrently and fuses their results.
+
+    The engines share one http client, kept open across searches so connections to the engines
+    are reused, and are given timeout_seconds in total.  Engines that fail
+    or do not answer in time are left out so a slow engine does not hold up the search.  The
+    result lists are fused with reciprocal rank fusion: a result scores 1 / (rrf_k + rank) for each
+    engine that returned it, so results found by several engines rank first.  Results with the same
+    normalized url are merged.
+
+    Fused results are kept in the WebSearchCache by normalized query.
+
+    This holds the http client so register it as a singleton.
+    """
+
+    def __init__(
+        self,
+        *,
+        http_client_factory: HttpClientFactory,
+        web_search_cache: WebSearchCache,
+        engines: List[WebSearchEngine],
+        timeout_seconds: float = 10.0,
+        rrf_k: int = 60,
+    ) -> None:
+        """
+        Args:
+            http_client_factory: creates the http client shared by the engines
+            web_search_cache: cache of fused results
+            engines: engines to search
+            timeout_seconds: deadline for all the engines
+            rrf_k: reciprocal rank fusion constant.  Higher values weigh the ranks less.
+        """
+        self.http_client_factory: HttpClientFactory = http_client_factory
+        assert self.http_client_factory is not None
+        self.web_search_cache: WebSearchCache = web_search_cache
+        assert self.web_search_cache is not None
+        assert engines, "At least one search engine is required"
+        self.engines: List[WebSearchEngine] = engines
+        assert timeout_seconds > 0
+        self.timeout_seconds: float = timeout_seconds
+        self.rrf_k: int = rrf_k
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_exit_stack: Optional[AsyncExitStack] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_client_async(self) -> httpx.AsyncClient:
+        # clients cannot be shared across event loops
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
+        exit_stack: AsyncExitStack = AsyncExitStack()
+        client: httpx.AsyncClient = await exit_stack.enter_async_context(
+            self.http_client_factory.create_http_client(
+                base_url="", timeout=self.timeout_seconds
+            )
+        )
+        if self._client is not None and self._client_loop is loop:
+            # another search created the client while this one was waiting
+            await exit_stack.aclose()
+            return self._client
+        self._client = client
+        self._client_exit_stack = exit_stack
+        self._client_loop = loop
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the http client
+        """
+        exit_stack: Optional[AsyncExitStack] = self._client_exit_stack
+        self._client = None
+        self._client_exit_stack = None
+        self._client_loop = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """
+        Normalize a url so the same page returned by several engines is merged
+
+        Args:
+            url: url of a result
+
+        Returns:
+            url without the scheme, www., trailing slash, fragment and tracking parameters
+        """
+        split = urlsplit(url.strip())
+        host: str = split.netloc.lower().removeprefix("www.")
+        query: str = urlencode(
+            [
+                (name, value)
+                for name, value in parse_qsl(split.query, keep_blank_values=True)
+                if not name.startswith("utm_")
+            ]
+        )
+        return f"{host}{split.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+    @staticmethod
+    def fuse_results(
+        *,
+        results_per_engine: Dict[str, List[WebSearchResult]],
+        rrf_k: int,
+        max_results: int,
+    ) -> List[WebSearchResult]:
+        """
+        Fuse the result lists of several engines with reciprocal rank fusion
+
+        Args:
+            results_per_engine: results of each engine with the best first
+            rrf_k: reciprocal rank fusion constant
+            max_results: maximum number of results to return
+
+        Returns:
+            merged results with the highest score first.  Ties keep the order of the engines.
+        """
+        fused: Dict[str, WebSearchResult] = {}
+        for engine, results in results_per_engine.items():
+            seen: Set[str] = set()
+            for rank, result in enumerate(results, start=1):
+                key: str = WebSearcher.normalize_url(result.url)
+                # an engine counts once per page
+                if key in seen:
+                    continue
+                seen.add(key)
+                existing: Optional[WebSearchResult] = fused.get(key)
+                if existing is None:
+                    existing = replace(result, engines=[], score=0.0)
+                    fused[key] = existing
+                elif not existing.snippet:
+                    existing.snippet = result.snippet
+                existing.engines.append(engine)
+                existing.score += 1 / (rrf_k + rank)
+        # sorted() is stable so ties keep their first seen order
+        return sorted(fused.values(), key=lambda result: result.score, reverse=True)[
+            :max_results
+        ]
+
+    async def _search_engine_async(
+        self,
+        *,
+        engine: WebSearchEngine,
+        query: str,
+        max_results: int,
+        client: httpx.AsyncClient,
+    ) -> List[WebSearchResult]:
+        start: float = time.monotonic()
+        try:
+            results: List[WebSearchResult] = await engine.search_async(
+                client=client, query=query, max_results=max_results
+            )
+        except asyncio.CancelledError:
+            WEB_SEARCH_ENGINE_REQUESTS.labels(
+                engine=engine.name, result="timeout"
+            ).inc()
+            logger.warning(
+                f"Web search engine {engine.name} did not answer within {self.timeout_seconds}s"
+            )
+            raise
+        except Exception as e:
+            WEB_SEARCH_ENGINE_REQUESTS.labels(
+                engine=engine.name, result="failure"
+            ).inc()
+            logger.error(f"Error searching {engine.name} for {query!r}: {str(e)}")
+            raise
+        WEB_SEARCH_ENGINE_REQUESTS.labels(engine=engine.name, result="success").inc()
+        logger.info(
+            f"Web search engine {engine.name} returned {len(results)} results"
+            f" in {time.monotonic() - start:.2f}s"
+        )
+        return results
+
+    async def search_async(
+        self, *, query: str, max_results: int = 10
+    ) -> WebSearchResponse:
+        """
+        Search all the engines concurrently and fuse their results
+
+        Args:
+            query: search query
+            max_results: maximum number of results to return and to request from each engine
+
+        Returns:
+            fused results and the engines that failed
+        """
+        engine_names: List[str] = [engine.name for engine in self.engines]
+        cache_key: str = (
+            f"{','.join(engine_names)}|{max_results}|"
+            f"{WebSearchCache.normalize_query(query)}"
+        )
+        cached_response: Optional[WebSearchResponse] = self.web_search_cache.get(
+            key=cache_key
+        )
+        if cached_response is not None:
+            return replace(cached_response, query=query, cached=True)
+
+        results_per_engine: Dict[str, List[WebSearchResult]] = {}
+        failed_engines: List[str] = []
+        client: httpx.AsyncClient = await self._get_client_async()
+        tasks: Dict[asyncio.Task[List[WebSearchResult]], WebSearchEngine] = {
+            asyncio.create_task(
+                self._search_engine_async(
+                    engine=engine,
+                    query=query,
+                    max_results=max_results,
+                    client=client,
+                )
+            ): engine
+            for engine in self.engines
+        }
+        _, pending = await asyncio.wait(tasks, timeout=self.timeout_seconds)
+        for task in pending:
+            task.cancel()
+        # wait for the cancelled engines so their connections go back to the pool
+        await asyncio.gather(*pending, return_exceptions=True)
+        # keep the configured order of the engines for ties in the fusion
+        for task, engine in tasks.items():
+            if task.cancelled() or task.exception() is not None:
+                failed_engines.append(engine.name)
+            else:
+                results_per_engine[engine.name] = task.result()
+
+        response: WebSearchResponse = WebSearchResponse(
+            query=query,
+            results=self.fuse_results(
+                results_per_engine=results_per_engine,
+                rrf_k=self.rrf_k,
+                max_results=max_results,
+            ),
+            engines=engine_names,
+            failed_engines=failed_engines,
+        )
+        # partial results are not cached so the next search tries the failed engines again
+        if not failed_engines:
+            self.web_search_cache.set(key=cache_key, response=response)
+        return response
@@ -14,6 +14,10 @@ from starlette.responses import StreamingResponse, JSONResponse
 
 from language_model_gateway.configs.config_schema import ChatModelConfig, ModelConfig
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
+from language_model_gateway.gateway.http.upstream_pool import UpstreamPool
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
 from language_model_gateway.gateway.providers.openai_chat_completions_provider import (
     OpenAiChatCompletionsProvider,
 )
@@ -48,7 +52,9 @@ async def test_call_agent_with_input(async_client: httpx.AsyncClient) -> None:
         provider = OpenAiChatCompletionsProvider(
             http_client_factory=MockHttpClientFactory(
                 fn_http_client=lambda: async_client
-            )
+            ),
+            upstream_pool=UpstreamPool(),
+            request_hedger=RequestHedger(),
         )
     else:
 
@@ -77,6 +83,8 @@ async def test_call_agent_with_input(async_client: httpx.AsyncClient) -> None:
 
         provider = MockOpenAiChatCompletionsProvider(
             http_client_factory=HttpClientFactory(),
+            upstream_pool=UpstreamPool(),
+            request_hedger=RequestHedger(),
             fn_get_response=mock_fn_get_response,
         )
 
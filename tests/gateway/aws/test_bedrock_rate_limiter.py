@@ -0,0 +1,147 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Dict, override
+
+import pytest
+
+from language_model_gateway.gateway.aws.bedrock_rate_limiter import (
+    BedrockRateLimiter,
+)
+from language_model_gateway.gateway.aws.bedrock_region_router import (
+    BedrockRegionRouter,
+)
+from language_model_gateway.gateway.aws.region_routing_bedrock_client import (
+    RegionRoutingBedrockClient,
+)
+from tests.gateway.aws.test_region_routing_bedrock_client import (
+    FakeAwsClientFactory,
+    FakeRegionalBedrockClient,
+    model,
+)
+
+
+class ThrottleOnceBedrockClient(FakeRegionalBedrockClient):
+    @override
+    def converse(self, **kwargs: Any) -> Dict[str, Any]:
+        try:
+            return super().converse(**kwargs)
+        finally:
+            self.throttle = False
+
+
+def test_rate_is_learned_from_throttles(tmp_path: Path) -> None:
+    database_path: str = str(tmp_path / "rates.db")
+    # two limiters on the same file stand in for two workers on the host
+    worker1 = BedrockRateLimiter(
+        database_path=database_path,
+        initial_rate=8,
+        additive_increase=1,
+        decrease_interval_seconds=60,
+    )
+    worker2 = BedrockRateLimiter(
+        database_path=database_path,
+        initial_rate=8,
+        additive_increase=1,
+        decrease_interval_seconds=60,
+    )
+
+    # a throttle halves the rate for every worker
+    worker1.record_throttle(model=model, region="us-east-1")
+    assert worker2.get_rate(model=model, region="us-east-1") == 4
+    # further throttles from the same burst only count once
+    worker2.record_throttle(model=model, region="us-east-1")
+    assert worker1.get_rate(model=model, region="us-east-1") == 4
+    # successes increase the rate additively
+    worker2.record_success(model=model, region="us-east-1")
+    worker1.record_success(model=model, region="us-east-1")
+    assert worker1.get_rate(model=model, region="us-east-1") == 6
+    # the other region is not affected
+    assert worker1.get_rate(model=model, region="us-west-2") == 8
+
+
+def test_requests_queue_for_the_rate(tmp_path: Path) -> None:
+    database_path: str = str(tmp_path / "rates.db")
+    worker1 = BedrockRateLimiter(database_path=database_path, initial_rate=2)
+    worker2 = BedrockRateLimiter(database_path=database_path, initial_rate=2)
+
+    # the bucket starts with one second of requests
+    start_time: float = time.monotonic()
+    assert worker1.acquire(model=model, region="us-east-1") == 0
+    assert worker2.acquire(model=model, region="us-east-1") == 0
+    # then requests from both workers wait in turn
+    assert worker1.acquire(model=model, region="us-east-1") > 0
+    assert worker2.acquire(model=model, region="us-east-1") > 0
+    assert time.monotonic() - start_time >= 0.9
+
+
+def test_throttled_request_is_retried_at_the_learned_rate(tmp_path: Path) -> None:
+    clients: Dict[str, FakeRegionalBedrockClient] = {
+        "us-east-1": ThrottleOnceBedrockClient(region="us-east-1", throttle=True),
+    }
+    bedrock_rate_limiter = BedrockRateLimiter(
+        database_path=str(tmp_path / "rates.db"), initial_rate=2
+    )
+    client = RegionRoutingBedrockClient(
+        bedrock_region_router=BedrockRegionRouter(
+            aws_client_factory=FakeAwsClientFactory(clients=clients)
+        ),
+        model=model,
+        regions=["us-east-1"],
+        bedrock_rate_limiter=bedrock_rate_limiter,
+    )
+
+    # the first call is throttled and the retry waits for the halved rate
+    start_time: float = time.monotonic()
+    response = client.converse(modelId=model, messages=[])
+    assert response["output"]["message"]["content"][0]["text"] == "us-east-1"
+    assert clients["us-east-1"].calls == 2
+    assert time.monotonic() - start_time >= 0.5
+    assert bedrock_rate_limiter.get_rate(
+        model=model, region="us-east-1"
+    ) == pytest.approx(1.1)
+
+
+async def test_async_callers_wait_on_the_event_loop(tmp_path: Path) -> None:
+    bedrock_rate_limiter = BedrockRateLimiter(
+        database_path=str(tmp_path / "rates.db"),
+        initial_rate=10,
+        max_wait_seconds=0.1,
+    )
+
+    # the callers wait concurrently instead of each holding a thread
+    start_time: float = time.monotonic()
+    await asyncio.gather(
+        *[
+            bedrock_rate_limiter.acquire_async(model=model, region="us-east-1")
+            for _ in range(20)
+        ]
+    )
+    assert time.monotonic() - start_time < 0.5
+
+    # the callers that gave up waiting are not owed so the debt stays at one wait
+    await asyncio.sleep(0.15)
+    assert bedrock_rate_limiter.acquire(model=model, region="us-east-1") == 0
+
+
+async def test_paced_call_does_not_wait_again(tmp_path: Path) -> None:
+    clients: Dict[str, FakeRegionalBedrockClient] = {
+        "us-east-1": FakeRegionalBedrockClient(region="us-east-1", throttle=False),
+    }
+    client = RegionRoutingBedrockClient(
+        bedrock_region_router=BedrockRegionRouter(
+            aws_client_factory=FakeAwsClientFactory(clients=clients)
+        ),
+        model=model,
+        regions=["us-east-1"],
+        bedrock_rate_limiter=BedrockRateLimiter(
+            database_path=str(tmp_path / "rates.db"), initial_rate=1
+        ),
+    )
+
+    # the one token in the bucket is taken on the event loop and used by the call
+    start_time: float = time.monotonic()
+    await client.pace_async()
+    await asyncio.to_thread(client.converse, modelId=model, messages=[])
+    assert clients["us-east-1"].calls == 1
+    assert time.monotonic() - start_time < 0.5
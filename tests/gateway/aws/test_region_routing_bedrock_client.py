@@ -0,0 +1,212 @@
+import time
+from typing import Any, Dict, Iterator, List, Optional, override
+
+import boto3
+import pytest
+from botocore.config import Config
+from botocore.exceptions import ClientError, EventStreamError
+from langchain_core.messages import AIMessageChunk
+
+from language_model_gateway.configs.config_schema import ChatModelConfig, ModelConfig
+from language_model_gateway.gateway.aws.aws_client_factory import AwsClientFactory
+from language_model_gateway.gateway.aws.bedrock_region_router import (
+    BedrockRegionRouter,
+)
+from language_model_gateway.gateway.models.model_factory import ModelFactory
+
+model = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
+
+
+def get_throttling_error(operation_name: str) -> ClientError:
+    return ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Too many requests"}},
+        operation_name,
+    )
+
+
+class FakeRegionalBedrockClient:
+    def __init__(self, *, region: str, throttle: bool) -> None:
+        self.region: str = region
+        self.throttle: bool = throttle
+        self.calls: int = 0
+
+    def converse(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls += 1
+        if self.throttle:
+            raise get_throttling_error("Converse")
+        return {
+            "output": {
+                "message": {"role": "assistant", "content": [{"text": self.region}]}
+            },
+            "stopReason": "end_turn",
+            "usage": {"inputTokens": 5, "outputTokens": 1, "totalTokens": 6},
+            "metrics": {"latencyMs": 10},
+        }
+
+    def converse_stream(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls += 1
+
+        def events() -> Iterator[Dict[str, Any]]:
+            if self.throttle:
+                # throttling during a stream is an error event
+                raise EventStreamError(
+                    {
+                        "Error": {
+                            "Code": "throttlingException",
+                            "Message": "Too many requests",
+                        }
+                    },
+                    "ConverseStream",
+                )
+            yield {"messageStart": {"role": "assistant"}}
+            yield {
+                "contentBlockDelta": {
+                    "delta": {"text": self.region},
+                    "contentBlockIndex": 0,
+                }
+            }
+            yield {"messageStop": {"stopReason": "end_turn"}}
+
+        return {"stream": events()}
+
+
+class FakeAwsClientFactory(AwsClientFactory):
+    def __init__(self, *, clients: Dict[str, FakeRegionalBedrockClient]) -> None:
+        self.clients: Dict[str, FakeRegionalBedrockClient] = clients
+
+    @override
+    def create_client(
+        self,
+        *,
+        service_name: str,
+        region_name: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> boto3.client:
+        assert region_name is not None
+        return self.clients[region_name]
+
+
+def get_chat_model_config(regions: List[str]) -> ChatModelConfig:
+    return ChatModelConfig(
+        id="test",
+        name="test",
+        description="test",
+        model=ModelConfig(provider="bedrock", model=model, regions=regions),
+    )
+
+
+async def test_region_failover() -> None:
+    clients: Dict[str, FakeRegionalBedrockClient] = {
+        "us-east-1": FakeRegionalBedrockClient(region="us-east-1", throttle=True),
+        "us-west-2": FakeRegionalBedrockClient(region="us-west-2", throttle=False),
+    }
+    bedrock_region_router = BedrockRegionRouter(
+        aws_client_factory=FakeAwsClientFactory(clients=clients)
+    )
+    model_factory = ModelFactory(bedrock_region_router=bedrock_region_router)
+    llm = model_factory.get_model(
+        chat_model_config=get_chat_model_config(["us-east-1", "us-west-2"])
+    )
+
+    # the throttled region fails over to the next one
+    assert (await llm.ainvoke("hi")).content == "us-west-2"
+    assert clients["us-east-1"].calls == 1
+    state = bedrock_region_router.get_state(model=model, region="us-east-1")
+    assert state.throttle_rate > 0
+    assert state.consecutive_throttles == 1
+
+    # the throttled region is tried last while it cools down
+    assert bedrock_region_router.order_regions(
+        model=model, regions=["us-east-1", "us-west-2"]
+    ) == ["us-west-2", "us-east-1"]
+    chunks: List[str] = [
+        chunk.text() async for chunk in llm.astream("hi") if chunk.text()
+    ]
+    assert chunks == ["us-west-2"]
+    assert clients["us-east-1"].calls == 1
+
+    # streaming errors before the first event fail over too
+    clients["us-west-2"].throttle = True
+    clients["us-east-1"].throttle = False
+    chunks = [chunk.text() async for chunk in llm.astream("hi") if chunk.text()]
+    assert chunks == ["us-east-1"]
+
+    # the error is raised when every region throttles
+    clients["us-east-1"].throttle = True
+    with pytest.raises(ClientError):
+        await llm.ainvoke("hi")
+
+
+async def test_region_failover_not_after_output() -> None:
+    class MidStreamFailingClient(FakeRegionalBedrockClient):
+        def converse_stream(self, **kwargs: Any) -> Dict[str, Any]:
+            self.calls += 1
+
+            def events() -> Iterator[Dict[str, Any]]:
+                yield {"messageStart": {"role": "assistant"}}
+                yield {
+                    "contentBlockDelta": {
+                        "delta": {"text": "partial"},
+                        "contentBlockIndex": 0,
+                    }
+                }
+                raise get_throttling_error("ConverseStream")
+
+            return {"stream": events()}
+
+    clients: Dict[str, FakeRegionalBedrockClient] = {
+        "us-east-1": MidStreamFailingClient(region="us-east-1", throttle=False),
+        "us-west-2": FakeRegionalBedrockClient(region="us-west-2", throttle=False),
+    }
+    llm = ModelFactory(
+        bedrock_region_router=BedrockRegionRouter(
+            aws_client_factory=FakeAwsClientFactory(clients=clients)
+        )
+    ).get_model(chat_model_config=get_chat_model_config(["us-east-1", "us-west-2"]))
+
+    chunks: List[AIMessageChunk] = []
+    with pytest.raises(ClientError):
+        async for chunk in llm.astream("hi"):
+            assert isinstance(chunk, AIMessageChunk)
+            chunks.append(chunk)
+    assert "partial" in [c.text() for c in chunks]
+    assert clients["us-west-2"].calls == 0
+
+
+def test_failed_region_is_tried_last() -> None:
+    bedrock_region_router = BedrockRegionRouter(
+        aws_client_factory=FakeAwsClientFactory(clients={}),
+        throttle_cool_down_seconds=0.05,
+    )
+    regions: List[str] = ["us-east-1", "us-west-2"]
+    bedrock_region_router.record_success(
+        model=model, region="us-east-1", latency_seconds=1.0
+    )
+    bedrock_region_router.record_success(
+        model=model, region="us-west-2", latency_seconds=1.2
+    )
+
+    bedrock_region_router.record_failure(model=model, region="us-east-1")
+    state = bedrock_region_router.get_state(model=model, region="us-east-1")
+    assert state.failure_rate > 0
+    assert state.consecutive_failures == 1
+    assert bedrock_region_router.order_regions(model=model, regions=regions) == [
+        "us-west-2",
+        "us-east-1",
+    ]
+
+    # after the cool down the failure rate still makes the region look slower
+    time.sleep(0.06)
+    assert bedrock_region_router.order_regions(model=model, regions=regions) == [
+        "us-west-2",
+        "us-east-1",
+    ]
+
+    # a success ends the cool down
+    bedrock_region_router.record_success(
+        model=model, region="us-east-1", latency_seconds=1.0
+    )
+    assert (
+        bedrock_region_router.get_state(model=model, region="us-east-1").failed_until
+        == 0.0
+    )
@@ -0,0 +1,130 @@
+from typing import List
+
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from openai.types.chat import ChatCompletionMessageParam
+
+from language_model_gateway.gateway.converters.converted_messages import (
+    ConvertedMessages,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+
+
+def convert(message: ChatCompletionMessageParam) -> BaseMessage:
+    if message["role"] == "user":
+        return HumanMessage(content=str(message.get("content")))
+    return AIMessage(content=str(message.get("content")))
+
+
+def test_message_conversion_cache_reuses_prefix() -> None:
+    cache = MessageConversionCache(max_entries=100)
+    messages: List[ChatCompletionMessageParam] = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi, how can I help?"},
+        {"role": "user", "content": "What is FHIR?"},
+    ]
+
+    first: ConvertedMessages = cache.convert_messages(
+        messages=messages, convert=convert
+    )
+    assert first.cached_message_count == 0
+    assert [m.content for m in first.messages] == [
+        "Hello",
+        "Hi, how can I help?",
+        "What is FHIR?",
+    ]
+
+    # next turn: the client resends the history with two new messages
+    messages = messages + [
+        {"role": "assistant", "content": "A standard for health data"},
+        {"role": "user", "content": "Tell me more"},
+    ]
+    second: ConvertedMessages = cache.convert_messages(
+        messages=messages, convert=convert
+    )
+    assert second.cached_message_count == 3
+    assert second.prefix_keys[:3] == first.prefix_keys
+    assert [m.content for m in second.messages][-1] == "Tell me more"
+    # the cached messages are copies so the graph can modify them
+    assert second.messages[0] is not first.messages[0]
+
+    # same message after a different history is not reused
+    third: ConvertedMessages = cache.convert_messages(
+        messages=[
+            {"role": "user", "content": "Goodbye"},
+            {"role": "assistant", "content": "Hi, how can I help?"},
+        ],
+        convert=convert,
+    )
+    assert third.cached_message_count == 0
+
+
+def test_message_conversion_cache_token_counts() -> None:
+    cache = MessageConversionCache(max_entries=100)
+    counted: List[str] = []
+
+    def count(message: BaseMessage) -> int:
+        counted.append(str(message.content))
+        return len(str(message.content))
+
+    messages: List[ChatCompletionMessageParam] = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi"},
+    ]
+    result = cache.count_tokens(
+        converted_messages=cache.convert_messages(messages=messages, convert=convert),
+        count=count,
+    )
+    assert result.token_counts == [5, 2]
+    assert result.cumulative_token_counts == [5, 7]
+
+    messages = messages + [{"role": "user", "content": "Bye"}]
+    result = cache.count_tokens(
+        converted_messages=cache.convert_messages(messages=messages, convert=convert),
+        count=count,
+    )
+    assert result.token_counts == [5, 2, 3]
+    assert result.cumulative_token_counts == [5, 7, 10]
+    # only the new message was counted
+    assert counted == ["Hello", "Hi", "Bye"]
+
+
+def test_message_conversion_cache_evicts_least_recently_used() -> None:
+    cache = MessageConversionCache(max_entries=3)
+    cache.convert_messages(
+        messages=[
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "b"},
+        ],
+        convert=convert,
+    )
+    cache.convert_messages(
+        messages=[
+            {"role": "user", "content": "c"},
+            {"role": "assistant", "content": "d"},
+        ],
+        convert=convert,
+    )
+    assert len(cache) == 3
+
+    # the most recent conversation is still cached
+    result = cache.convert_messages(
+        messages=[
+            {"role": "user", "content": "c"},
+            {"role": "assistant", "content": "d"},
+        ],
+        convert=convert,
+    )
+    assert result.cached_message_count == 2
+
+    # "a" was evicted so the whole conversation is converted again
+    result = cache.convert_messages(
+        messages=[
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "b"},
+        ],
+        convert=convert,
+    )
+    assert result.cached_message_count == 0
+    assert len(cache) == 3
@@ -0,0 +1,149 @@
+import json
+from typing import Any, Dict, List
+
+from langchain_aws import ChatBedrockConverse
+from openai.types.chat import ChatCompletion
+from openai.types.shared_params import ResponseFormatJSONSchema
+from openai.types.shared_params.response_format_json_schema import JSONSchema
+from pydantic import BaseModel, Field
+from starlette.responses import JSONResponse
+
+from language_model_gateway.configs.config_schema import ChatModelConfig, ModelConfig
+from language_model_gateway.gateway.converters.langgraph_to_openai_converter import (
+    LangGraphToOpenAIConverter,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+
+class Address(BaseModel):
+    city: str = Field(description="City of the doctor's practice")
+    state: str = Field(description="State of the doctor's practice")
+
+
+class DoctorInformation(BaseModel):
+    doctor_name: str = Field(description="The full name of the doctor")
+    doctor_address: Address = Field(description="The address of the practice")
+
+
+structured_response: Dict[str, Any] = {
+    "doctor_name": "Dr. James Ward",
+    "doctor_address": {"city": "Baltimore", "state": "MD"},
+}
+
+
+class FakeBedrockRuntimeClient:
+    """Answers with text, then with a tool call when a tool is forced"""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def converse(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls.append(kwargs)
+        content: List[Dict[str, Any]] = (
+            [
+                {
+                    "toolUse": {
+                        "toolUseId": "1",
+                        "name": "DoctorInformation",
+                        "input": structured_response,
+                    }
+                }
+            ]
+            if "toolConfig" in kwargs
+            else [{"text": "Dr. James Ward practices in Baltimore, MD."}]
+        )
+        return {
+            "output": {"message": {"role": "assistant", "content": content}},
+            "stopReason": "tool_use" if "toolConfig" in kwargs else "end_turn",
+            "usage": {"inputTokens": 50, "outputTokens": 20, "totalTokens": 70},
+            "metrics": {"latencyMs": 10},
+        }
+
+
+async def test_native_structured_output() -> None:
+    client = FakeBedrockRuntimeClient()
+    llm = ChatBedrockConverse(
+        client=client,
+        provider="anthropic",
+        region_name="us-east-1",
+        model="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    )
+    model_config = ChatModelConfig(
+        id="test",
+        name="test",
+        description="test",
+        model=ModelConfig(provider="bedrock", model=llm.model_id),
+        structured_output_mode="native",
+    )
+    chat_request: ChatRequest = {
+        "model": "test",
+        "messages": [{"role": "user", "content": "Where does Dr. James Ward work?"}],
+        "response_format": ResponseFormatJSONSchema(
+            type="json_schema",
+            json_schema=JSONSchema(
+                name="DoctorInformation",
+                schema=DoctorInformation.model_json_schema(),
+            ),
+        ),
+    }
+    converter = LangGraphToOpenAIConverter(
+        context_budget_manager=ContextBudgetManager(token_counter=TokenCounter()),
+        message_conversion_cache=MessageConversionCache(max_entries=10),
+    )
+    response_format = converter.get_native_response_format(
+        chat_request=chat_request, model_config=model_config
+    )
+    assert response_format is not None
+    assert response_format["title"] == "DoctorInformation"
+
+    response = await converter.call_agent_with_input(
+        headers={},
+        chat_request=chat_request,
+        request_id="1",
+        compiled_state_graph=await converter.create_graph_for_llm_async(
+            llm=llm, tools=[], response_format=response_format
+        ),
+        system_messages=[],
+        model_config=model_config,
+        tools=[],
+    )
+    assert isinstance(response, JSONResponse)
+    chat_completion = ChatCompletion.model_validate(json.loads(bytes(response.body)))
+    assert len(chat_completion.choices) == 1
+    content = chat_completion.choices[0].message.content
+    assert content is not None
+    assert DoctorInformation.model_validate_json(content) == DoctorInformation(
+        **structured_response
+    )
+
+    # no prompt asking for <json> tags
+    assert "<json>" not in json.dumps(client.calls)
+    # the structured response is requested with a forced tool call for the schema
+    tool_config: Dict[str, Any] = client.calls[-1]["toolConfig"]
+    tool_spec: Dict[str, Any] = tool_config["tools"][0]["toolSpec"]
+    assert tool_spec["name"] == "DoctorInformation"
+    assert "$defs" not in json.dumps(tool_spec["inputSchema"])
+
+    # prompt mode and streaming use the prompt
+    assert (
+        converter.get_native_response_format(
+            chat_request=chat_request,
+            model_config=model_config.model_copy(
+                update={"structured_output_mode": "prompt"}
+            ),
+        )
+        is None
+    )
+    assert (
+        converter.get_native_response_format(
+            chat_request={**chat_request, "stream": True}, model_config=model_config
+        )
+        is None
+    )
@@ -0,0 +1,107 @@
+from typing import List
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from openai.types.chat import ChatCompletionMessageParam
+
+from language_model_gateway.gateway.converters.langgraph_to_openai_converter import (
+    LangGraphToOpenAIConverter,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+from language_model_gateway.gateway.utilities.chat_message_helpers import (
+    langchain_to_chat_message,
+)
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
+from language_model_gateway.gateway.utilities.status_message_marker import (
+    StatusMessageMarker,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+assistant_content: str = (
+    "Let me search for that."
+    f"\n\n> {StatusMessageMarker.mark('Running Agent google_search: ' + str({'query': 'FHIR ' * 40}))}\n"
+    f"\n> {StatusMessageMarker.mark('Search results:' + chr(10) + 'result ' * 200)}\n"
+    "FHIR is a standard for exchanging health data."
+)
+
+
+def test_status_message_marker_remove() -> None:
+    text, status_messages = StatusMessageMarker.remove(
+        text=assistant_content, mode="strip"
+    )
+    assert (
+        text
+        == "Let me search for that.\n\nFHIR is a standard for exchanging health data."
+    )
+    assert len(status_messages) == 2
+
+    text, status_messages = StatusMessageMarker.remove(
+        text=assistant_content, mode="collapse"
+    )
+    print(text)
+    assert text.startswith(
+        "Let me search for that.\n> Running Agent google_search: {'query': 'FHIR FHIR"
+    )
+    assert "\n> Search results:\n" in text
+    assert "result result" not in text
+    assert text.endswith("FHIR is a standard for exchanging health data.")
+
+    text, status_messages = StatusMessageMarker.remove(
+        text=assistant_content, mode="keep"
+    )
+    assert text == assistant_content
+    assert status_messages == []
+
+    # text without markers (e.g. from before they were added) is left alone
+    text, status_messages = StatusMessageMarker.remove(
+        text="\n> Running Agent google_search: {}\nHello", mode="strip"
+    )
+    assert text == "\n> Running Agent google_search: {}\nHello"
+
+
+def test_converter_removes_status_messages_from_history() -> None:
+    token_counter = TokenCounter()
+    converter = LangGraphToOpenAIConverter(
+        context_budget_manager=ContextBudgetManager(token_counter=token_counter),
+        message_conversion_cache=MessageConversionCache(max_entries=100),
+    )
+    messages: List[ChatCompletionMessageParam] = [
+        {"role": "user", "content": "What is FHIR?"},
+        {"role": "assistant", "content": assistant_content},
+        {"role": "user", "content": "Tell me more"},
+    ]
+
+    kept: List[BaseMessage] = converter.convert_messages_for_graph(
+        messages=messages, model_name="test", status_messages_in_history="keep"
+    ).messages
+    stripped: List[BaseMessage] = converter.convert_messages_for_graph(
+        messages=messages, model_name="test", status_messages_in_history="strip"
+    ).messages
+
+    assert kept[1].content == assistant_content
+    assert StatusMessageMarker.start not in str(stripped[1].content)
+    assert token_counter.count_messages(
+        messages=stripped
+    ) < token_counter.count_messages(messages=kept)
+
+
+def test_non_streaming_messages_have_no_markers() -> None:
+    tool_message = langchain_to_chat_message(
+        ToolMessage(content="results", tool_call_id="1", artifact="Search results")
+    )
+    assert tool_message is not None
+    assert tool_message.content == "\n[Search results]\n"
+
+    ai_message = langchain_to_chat_message(
+        AIMessage(
+            content="Partial answer"
+            + LangGraphToOpenAIConverter.get_timeout_message(timeout_seconds=10)
+        )
+    )
+    assert ai_message is not None and ai_message.content is not None
+    assert "longer than 10 seconds" in ai_message.content
+    assert StatusMessageMarker.start not in ai_message.content
+    assert StatusMessageMarker.end not in ai_message.content
@@ -0,0 +1,85 @@
+from pathlib import Path
+from typing import List
+
+import httpx
+
+from language_model_gateway.gateway.http.http_cache import HttpCache
+from language_model_gateway.gateway.http.http_cache_transport import (
+    HttpCacheTransport,
+)
+
+
+async def test_not_modified_response_is_served_from_cache(tmp_path: Path) -> None:
+    requests: List[httpx.Request] = []
+    repos: List[str] = ["repo1"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        etag: str = f'"{len(repos)}"'
+        headers = {"ETag": etag, "X-RateLimit-Remaining": str(100 - len(requests))}
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, json=[{"name": r} for r in repos], headers=headers)
+
+    http_cache = HttpCache(database_path=str(tmp_path / "http_cache.db"))
+    url: str = "https://api.github.com/orgs/icanbwell/repos"
+    async with httpx.AsyncClient(
+        transport=HttpCacheTransport(
+            http_cache=http_cache, transport=httpx.MockTransport(handler)
+        ),
+        headers={"Authorization": "token fake_token"},
+    ) as client:
+        response = await client.get(url)
+        assert response.json() == [{"name": "repo1"}]
+        assert "If-None-Match" not in requests[0].headers
+
+        # the second request is conditional and the 304 is answered from the cache
+        response = await client.get(url)
+        assert response.status_code == 200
+        assert response.json() == [{"name": "repo1"}]
+        assert requests[1].headers["If-None-Match"] == '"1"'
+        # with the headers of the 304 response
+        assert response.headers["X-RateLimit-Remaining"] == "98"
+
+        # a changed resource is returned and replaces the cached one
+        repos.append("repo2")
+        response = await client.get(url)
+        assert response.json() == [{"name": "repo1"}, {"name": "repo2"}]
+        response = await client.get(url)
+        assert response.json() == [{"name": "repo1"}, {"name": "repo2"}]
+        assert requests[3].headers["If-None-Match"] == '"2"'
+
+    # another token does not see the cached response
+    async with httpx.AsyncClient(
+        transport=HttpCacheTransport(
+            http_cache=http_cache, transport=httpx.MockTransport(handler)
+        ),
+        headers={"Authorization": "token other_token"},
+    ) as client:
+        await client.get(url)
+        assert "If-None-Match" not in requests[4].headers
+
+
+async def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"x" * 40, headers={"ETag": '"1"'})
+
+    http_cache = HttpCache(
+        database_path=str(tmp_path / "http_cache.db"), max_size_bytes=100
+    )
+    async with httpx.AsyncClient(
+        transport=HttpCacheTransport(
+            http_cache=http_cache, transport=httpx.MockTransport(handler)
+        )
+    ) as client:
+        for name in ["a", "b", "c"]:
+            await client.get(f"https://api.github.com/{name}")
+
+    def get_key(name: str) -> str:
+        return HttpCache.get_key(
+            url=f"https://api.github.com/{name}", accept="*/*", authorization=None
+        )
+
+    assert http_cache.get(key=get_key("a")) is None
+    assert http_cache.get(key=get_key("b")) is not None
+    assert http_cache.get(key=get_key("c")) is not None
@@ -0,0 +1,245 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+from starlette.responses import JSONResponse, StreamingResponse
+
+from language_model_gateway.configs.config_schema import ChatModelConfig, HedgingConfig
+from language_model_gateway.gateway.http.upstream_pool import UpstreamPool
+from language_model_gateway.gateway.providers.openai_chat_completions_provider import (
+    OpenAiChatCompletionsProvider,
+)
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+chat_completion: Dict[str, Any] = ChatCompletion(
+    id="chat_1",
+    object="chat.completion",
+    created=1633660000,
+    model="test",
+    choices=[
+        Choice(
+            finish_reason="stop",
+            index=0,
+            message=ChatCompletionMessage(content="hello", role="assistant"),
+        )
+    ],
+).model_dump()
+
+model_config = ChatModelConfig(
+    id="test",
+    name="test",
+    description="test",
+    type="openai",
+    urls=["http://agent1/chat", "http://agent2/chat"],
+)
+
+
+def test_upstream_pool() -> None:
+    upstream_pool = UpstreamPool(max_consecutive_failures=2)
+    urls: List[str] = ["http://a", "http://b"]
+
+    upstream_pool.record_success(url="http://a", latency_seconds=1.0)
+    # b has not been used yet so it is tried
+    assert upstream_pool.choose(urls=urls) == "http://b"
+    upstream_pool.record_success(url="http://b", latency_seconds=2.0)
+    assert upstream_pool.choose(urls=urls) == "http://a"
+
+    # outstanding requests count against an upstream
+    upstream_pool.start(url="http://a")
+    upstream_pool.start(url="http://a")
+    assert upstream_pool.choose(urls=urls) == "http://b"
+    upstream_pool.finish(url="http://a")
+    upstream_pool.finish(url="http://a")
+    assert upstream_pool.get_state(url="http://a").outstanding_requests == 0
+
+    # latency is smoothed
+    upstream_pool.record_success(url="http://a", latency_seconds=11.0)
+    assert upstream_pool.get_state(url="http://a").ewma_latency_seconds == 4.0
+    assert upstream_pool.choose(urls=urls) == "http://b"
+    assert upstream_pool.choose(urls=urls, exclude=["http://b"]) == "http://a"
+
+    # unhealthy upstreams are skipped unless there is nothing else
+    upstream_pool.record_failure(url="http://b")
+    assert upstream_pool.is_healthy(url="http://b")
+    upstream_pool.record_failure(url="http://b")
+    assert not upstream_pool.is_healthy(url="http://b")
+    assert upstream_pool.choose(urls=urls) == "http://a"
+    assert upstream_pool.choose(urls=["http://b"]) == "http://b"
+    upstream_pool.record_success(url="http://b", latency_seconds=1.0)
+    assert upstream_pool.is_healthy(url="http://b")
+
+
+def test_unused_upstream_with_outstanding_requests_is_not_preferred() -> None:
+    upstream_pool = UpstreamPool()
+    urls: List[str] = ["http://a", "http://b"]
+    upstream_pool.record_success(url="http://a", latency_seconds=1.0)
+
+    # b has not answered its request yet so it scores the average latency of the others
+    upstream_pool.start(url="http://b")
+    assert upstream_pool.choose(urls=urls) == "http://a"
+    # a scores 1 * 3 and b scores 1 * 2
+    upstream_pool.start(url="http://a")
+    upstream_pool.start(url="http://a")
+    assert upstream_pool.choose(urls=urls) == "http://b"
+
+    # without any recorded latency the outstanding requests decide
+    upstream_pool = UpstreamPool()
+    upstream_pool.start(url="http://a")
+    assert upstream_pool.choose(urls=urls) == "http://b"
+
+
+async def test_upstream_failover() -> None:
+    requested_urls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        if request.url.host == "agent1":
+            return httpx.Response(503, text="unavailable")
+        if json.loads(request.content).get("stream"):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                text='data: {"a": 1}\n\ndata: [DONE]\n\n',
+            )
+        return httpx.Response(200, json=chat_completion)
+
+    upstream_pool = UpstreamPool()
+    # make agent1 the preferred upstream
+    upstream_pool.record_success(url="http://agent1/chat", latency_seconds=0.1)
+    upstream_pool.record_success(url="http://agent2/chat", latency_seconds=1.0)
+    provider = OpenAiChatCompletionsProvider(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+        ),
+        upstream_pool=upstream_pool,
+        request_hedger=RequestHedger(),
+    )
+
+    response = await provider.chat_completions(
+        model_config=model_config,
+        headers={},
+        chat_request={
+            "model": "test",
+            "messages": [{"role": "user", "content": "hi"}],
+        },
+    )
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == 200
+    assert requested_urls == ["http://agent1/chat", "http://agent2/chat"]
+    assert upstream_pool.get_state(url="http://agent1/chat").consecutive_failures == 1
+
+    requested_urls.clear()
+    response = await provider.chat_completions(
+        model_config=model_config,
+        headers={},
+        chat_request={
+            "model": "test",
+            "messages": [{"role": "user", "content": "hi"}],
+            "stream": True,
+        },
+    )
+    assert isinstance(response, StreamingResponse)
+    chunks: List[str] = [
+        chunk  # type: ignore[misc]
+        async for chunk in response.body_iterator
+    ]
+    assert requested_urls == ["http://agent1/chat", "http://agent2/chat"]
+    assert chunks == ['data: {"a": 1}\n\n', "data: [DONE]\n\n"]
+    assert upstream_pool.get_state(url="http://agent1/chat").consecutive_failures == 2
+    assert upstream_pool.get_state(url="http://agent2/chat").outstanding_requests == 0
+
+
+async def test_upstream_hedging() -> None:
+    requested_urls: List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        if request.url.host == "agent1":
+            await asyncio.sleep(10)
+        return httpx.Response(200, json=chat_completion)
+
+    upstream_pool = UpstreamPool()
+    upstream_pool.record_success(url="http://agent1/chat", latency_seconds=0.1)
+    upstream_pool.record_success(url="http://agent2/chat", latency_seconds=1.0)
+    provider = OpenAiChatCompletionsProvider(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+        ),
+        upstream_pool=upstream_pool,
+        request_hedger=RequestHedger(),
+    )
+
+    response = await asyncio.wait_for(
+        provider.chat_completions(
+            model_config=model_config.model_copy(
+                update={
+                    "hedging": HedgingConfig(
+                        max_extra_load_percent=100, initial_delay_seconds=0.05
+                    )
+                }
+            ),
+            headers={},
+            chat_request={
+                "model": "test",
+                "messages": [{"role": "user", "content": "hi"}],
+            },
+        ),
+        timeout=5,
+    )
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == 200
+    # the slow upstream was cancelled
+    assert requested_urls == ["http://agent1/chat", "http://agent2/chat"]
+    assert upstream_pool.get_state(url="http://agent1/chat").outstanding_requests == 0
+
+
+async def test_non_streaming_hedging_does_not_change_streaming_delay() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=chat_completion)
+
+    request_hedger = RequestHedger()
+    provider = OpenAiChatCompletionsProvider(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+        ),
+        upstream_pool=UpstreamPool(),
+        request_hedger=request_hedger,
+    )
+    hedging = HedgingConfig(max_extra_load_percent=100, initial_delay_seconds=1)
+    # streaming requests for the model get their first event quickly
+    for _ in range(request_hedger.min_samples):
+        request_hedger.record_first_byte(key="test", seconds=0.01)
+    streaming_delay: float = request_hedger.get_delay_seconds(
+        key="test", hedging=hedging
+    )
+
+    response = await provider.chat_completions(
+        model_config=model_config.model_copy(update={"hedging": hedging}),
+        headers={},
+        chat_request={
+            "model": "test",
+            "messages": [{"role": "user", "content": "hi"}],
+        },
+    )
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == 200
+    assert len(request_hedger._get_state("test:complete").first_byte_seconds) == 1
+    assert len(request_hedger._get_state("test").first_byte_seconds) == (
+        request_hedger.min_samples
+    )
+    assert (
+        request_hedger.get_delay_seconds(key="test", hedging=hedging) == streaming_delay
+    )
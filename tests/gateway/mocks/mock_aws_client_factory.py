@@ -1,6 +1,7 @@
-from typing import override
+from typing import Optional, override
 
 import boto3
+from botocore.config import Config
 
 from language_model_gateway.gateway.aws.aws_client_factory import AwsClientFactory
 
@@ -11,5 +12,11 @@ class MockAwsClientFactory(AwsClientFactory):
         assert self.aws_client is not None
 
     @override
-    def create_client(self, *, service_name: str) -> boto3.client:
+    def create_client(
+        self,
+        *,
+        service_name: str,
+        region_name: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> boto3.client:
         return self.aws_client
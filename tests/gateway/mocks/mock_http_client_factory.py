@@ -3,6 +3,7 @@ from typing import Callable, AsyncGenerator, override, Optional, Dict
 
 import httpx
 
+from language_model_gateway.gateway.http.http_cache import HttpCache
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
 
 
@@ -19,5 +20,7 @@ class MockHttpClientFactory(HttpClientFactory):
         base_url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = 5.0,
+        http_cache: Optional[HttpCache] = None,
+        count_slow_calls: bool = True,
     ) -> AsyncGenerator[httpx.AsyncClient, None]:
         yield self.fn_http_client()
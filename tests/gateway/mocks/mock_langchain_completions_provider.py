@@ -12,6 +12,15 @@ from language_model_gateway.gateway.providers.langchain_chat_completions_provide
 )
 from language_model_gateway.gateway.schema.openai.completions import ChatRequest
 from language_model_gateway.gateway.tools.tool_provider import ToolProvider
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_router import (
+    ModelRouter,
+)
+from language_model_gateway.gateway.utilities.tool_selection.tool_selector import (
+    ToolSelector,
+)
 from tests.gateway.mocks.mock_chat_response import MockChatResponseProtocol
 
 
@@ -22,12 +31,18 @@ class MockLangChainChatCompletionsProvider(LangChainCompletionsProvider):
         model_factory: ModelFactory,
         lang_graph_to_open_ai_converter: LangGraphToOpenAIConverter,
         tool_provider: ToolProvider,
+        tool_selector: ToolSelector,
+        model_router: ModelRouter,
+        request_hedger: RequestHedger,
         fn_get_response: MockChatResponseProtocol,
     ) -> None:
         super().__init__(
             model_factory=model_factory,
             lang_graph_to_open_ai_converter=lang_graph_to_open_ai_converter,
             tool_provider=tool_provider,
+            tool_selector=tool_selector,
+            model_router=model_router,
+            request_hedger=request_hedger,
         )
         self.fn_get_response: MockChatResponseProtocol = fn_get_response
 
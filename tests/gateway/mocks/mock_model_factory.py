@@ -1,7 +1,12 @@
+from typing import Optional
+
 from langchain_core.language_models import BaseChatModel
 
 from language_model_gateway.configs.config_schema import ChatModelConfig
 from language_model_gateway.gateway.models.model_factory import ModelFactory
+from language_model_gateway.gateway.models.model_request_parameters import (
+    ModelRequestParameters,
+)
 from tests.gateway.mocks.mock_get_model_protocol import MockGetModelProtocol
 
 
@@ -12,5 +17,9 @@ class MockModelFactory(ModelFactory):
         assert self.fn_get_model is not None
         assert isinstance(self.fn_get_model, MockGetModelProtocol)
 
-    def get_model(self, chat_model_config: ChatModelConfig) -> BaseChatModel:
+    def get_model(
+        self,
+        chat_model_config: ChatModelConfig,
+        request_parameters: Optional[ModelRequestParameters] = None,
+    ) -> BaseChatModel:
         return self.fn_get_model(chat_model_config=chat_model_config)
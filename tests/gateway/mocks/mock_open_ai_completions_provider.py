@@ -4,10 +4,14 @@ from starlette.responses import StreamingResponse, JSONResponse
 
 from language_model_gateway.configs.config_schema import ChatModelConfig
 from language_model_gateway.gateway.http.http_client_factory import HttpClientFactory
+from language_model_gateway.gateway.http.upstream_pool import UpstreamPool
 from language_model_gateway.gateway.providers.openai_chat_completions_provider import (
     OpenAiChatCompletionsProvider,
 )
 from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
 from tests.gateway.mocks.mock_chat_response import MockChatResponseProtocol
 
 
@@ -16,9 +20,15 @@ class MockOpenAiChatCompletionsProvider(OpenAiChatCompletionsProvider):
         self,
         *,
         http_client_factory: HttpClientFactory,
+        upstream_pool: UpstreamPool,
+        request_hedger: RequestHedger,
         fn_get_response: MockChatResponseProtocol,
     ) -> None:
-        super().__init__(http_client_factory=http_client_factory)
+        super().__init__(
+            http_client_factory=http_client_factory,
+            upstream_pool=upstream_pool,
+            request_hedger=request_hedger,
+        )
         self.fn_get_response: MockChatResponseProtocol = fn_get_response
 
     async def chat_completions(
@@ -0,0 +1,76 @@
+from langchain_aws import ChatBedrockConverse
+
+from language_model_gateway.configs.config_schema import (
+    ChatModelConfig,
+    ModelConfig,
+    ModelParameterConfig,
+)
+from language_model_gateway.gateway.models.model_factory import ModelFactory
+from language_model_gateway.gateway.models.model_request_parameters import (
+    ModelRequestParameters,
+)
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+
+chat_model_config = ChatModelConfig(
+    id="test",
+    name="test",
+    description="test",
+    model=ModelConfig(
+        provider="bedrock", model="us.anthropic.claude-3-5-haiku-20241022-v1:0"
+    ),
+    model_parameters=[ModelParameterConfig(key="temperature", value=0)],
+    max_output_tokens=1000,
+)
+
+
+def test_model_request_parameters_bounded_by_model() -> None:
+    chat_request: ChatRequest = {
+        "model": "test",
+        "messages": [{"role": "user", "content": "Hi"}],
+        "max_tokens": 5000,
+        "stop": "END",
+        "temperature": 0.5,
+    }
+    parameters = ModelRequestParameters.from_chat_request(
+        chat_request=chat_request, chat_model_config=chat_model_config
+    )
+    assert parameters == ModelRequestParameters(
+        max_tokens=1000, stop=["END"], temperature=0.5
+    )
+
+    # max_completion_tokens is used over max_tokens
+    parameters = ModelRequestParameters.from_chat_request(
+        chat_request={**chat_request, "max_completion_tokens": 200},
+        chat_model_config=chat_model_config,
+    )
+    assert parameters.max_tokens == 200
+
+    # requests without a limit get the maximum for the model
+    parameters = ModelRequestParameters.from_chat_request(
+        chat_request={"model": "test", "messages": []},
+        chat_model_config=chat_model_config,
+    )
+    assert parameters.to_model_parameters() == {"max_tokens": 1000}
+
+    # no maximum for the model
+    parameters = ModelRequestParameters.from_chat_request(
+        chat_request={"model": "test", "messages": []},
+        chat_model_config=chat_model_config.model_copy(
+            update={"max_output_tokens": None}
+        ),
+    )
+    assert parameters.to_model_parameters() == {}
+
+
+def test_model_factory_uses_request_parameters() -> None:
+    llm = ModelFactory().get_model(
+        chat_model_config=chat_model_config,
+        request_parameters=ModelRequestParameters(
+            max_tokens=100, stop=["END"], temperature=0.5
+        ),
+    )
+    assert isinstance(llm, ChatBedrockConverse)
+    assert llm.max_tokens == 100
+    assert llm.stop_sequences == ["END"]
+    # request parameters override the configuration
+    assert llm.temperature == 0.5
@@ -0,0 +1,134 @@
+from typing import Any, Dict, List
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from openai.types import CompletionUsage
+
+from language_model_gateway.configs.config_schema import (
+    ChatModelConfig,
+    ModelConfig,
+    PromptConfig,
+)
+from language_model_gateway.gateway.converters.langgraph_to_openai_converter import (
+    LangGraphToOpenAIConverter,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+from language_model_gateway.gateway.models.model_factory import ModelFactory
+from language_model_gateway.gateway.models.prompt_caching_chat_bedrock_converse import (
+    PromptCachingChatBedrockConverse,
+    CACHE_POINT_BLOCK,
+)
+from language_model_gateway.gateway.tools.current_time_tool import CurrentTimeTool
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+
+class FakeBedrockRuntimeClient:
+    """Records the calls to converse() and returns a response with cache usage"""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    def converse(self, **kwargs: Any) -> Dict[str, Any]:
+        self.calls.append(kwargs)
+        return {
+            "output": {
+                "message": {"role": "assistant", "content": [{"text": "Hello"}]}
+            },
+            "stopReason": "end_turn",
+            "usage": {
+                "inputTokens": 100,
+                "outputTokens": 5,
+                "totalTokens": 1605,
+                "cacheReadInputTokens": 1500,
+                "cacheWriteInputTokens": 0,
+            },
+            "metrics": {"latencyMs": 10},
+        }
+
+
+system_prompt: str = "You are a helpful assistant. " * 300
+
+
+def test_prompt_caching_model_selection() -> None:
+    chat_model_config = ChatModelConfig(
+        id="test",
+        name="test",
+        description="test",
+        model=ModelConfig(
+            provider="bedrock", model="us.anthropic.claude-3-5-haiku-20241022-v1:0"
+        ),
+        system_prompts=[PromptConfig(role="system", content=system_prompt, cache=True)],
+    )
+    assert isinstance(
+        ModelFactory().get_model(chat_model_config=chat_model_config),
+        PromptCachingChatBedrockConverse,
+    )
+    # no cacheable prompt
+    assert not isinstance(
+        ModelFactory().get_model(
+            chat_model_config=chat_model_config.model_copy(
+                update={"system_prompts": [PromptConfig(role="system", content="Hi")]}
+            )
+        ),
+        PromptCachingChatBedrockConverse,
+    )
+    # model does not support caching
+    assert not PromptCachingChatBedrockConverse.supports_prompt_caching(
+        model_id="anthropic.claude-3-haiku-20240307-v1:0"
+    )
+
+
+def test_prompt_caching_cache_points() -> None:
+    client = FakeBedrockRuntimeClient()
+    llm = PromptCachingChatBedrockConverse(
+        client=client,
+        provider="anthropic",
+        region_name="us-east-1",
+        model="us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    )
+    messages: List[BaseMessage] = (
+        PromptCachingChatBedrockConverse.add_system_prompt_cache_point(
+            messages=[
+                SystemMessage(content=system_prompt),
+                SystemMessage(content="Not cached"),
+                HumanMessage(content="Hi"),
+            ],
+            system_prompts=[
+                PromptConfig(role="system", content=system_prompt, cache=True),
+                PromptConfig(role="system", content="Not cached"),
+            ],
+        )
+    )
+    assert messages[0].content == [
+        {"type": "text", "text": system_prompt},
+        CACHE_POINT_BLOCK,
+    ]
+    assert messages[1].content == "Not cached"
+
+    response = llm.bind_tools([CurrentTimeTool()]).invoke(messages)
+
+    call: Dict[str, Any] = client.calls[0]
+    assert call["system"] == [
+        {"text": system_prompt},
+        CACHE_POINT_BLOCK,
+        {"text": "Not cached"},
+    ]
+    assert call["toolConfig"]["tools"][0]["toolSpec"]["name"] == CurrentTimeTool().name
+    assert call["toolConfig"]["tools"][-1] == CACHE_POINT_BLOCK
+
+    # cached tokens are reported in the OpenAI usage
+    assert isinstance(response, AIMessage)
+    assert response.usage_metadata is not None
+    converter = LangGraphToOpenAIConverter(
+        context_budget_manager=ContextBudgetManager(token_counter=TokenCounter()),
+        message_conversion_cache=MessageConversionCache(max_entries=10),
+    )
+    usage: CompletionUsage = converter.convert_usage_meta_data_to_openai(
+        usages=[response.usage_metadata]
+    )
+    assert usage.prompt_tokens_details is not None
+    assert usage.prompt_tokens_details.cached_tokens == 1500
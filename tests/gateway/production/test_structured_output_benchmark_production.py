@@ -0,0 +1,129 @@
+import json
+import os
+import time
+from typing import Any, Dict, List, Literal
+
+import pytest
+from langchain_core.callbacks import get_usage_metadata_callback
+from openai.types.chat import ChatCompletion
+from openai.types.shared_params import ResponseFormatJSONSchema
+from openai.types.shared_params.response_format_json_schema import JSONSchema
+from pydantic import BaseModel, Field, ValidationError
+from starlette.responses import JSONResponse
+
+from language_model_gateway.configs.config_schema import ChatModelConfig
+from language_model_gateway.gateway.converters.langgraph_to_openai_converter import (
+    LangGraphToOpenAIConverter,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+from language_model_gateway.gateway.models.model_factory import ModelFactory
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+
+class Address(BaseModel):
+    city: str = Field(description="City of the doctor's practice")
+    state: str = Field(description="State of the doctor's practice")
+
+
+class DoctorInformation(BaseModel):
+    doctor_name: str = Field(description="The full name of the doctor")
+    specialty: str = Field(description="The medical specialty of the doctor")
+    doctor_address: List[Address] = Field(
+        description="The addresses of the doctor's practice"
+    )
+
+
+@pytest.mark.skipif(
+    os.getenv("RUN_TESTS_WITH_REAL_LLM") != "1",
+    reason="hits production API",
+)
+async def test_structured_output_benchmark_production() -> None:
+    """
+    Compares the tokens and latency of the native and prompt structured output modes
+    using the default model
+    """
+    print("")
+    runs: int = int(os.getenv("STRUCTURED_OUTPUT_BENCHMARK_RUNS", "3"))
+    converter = LangGraphToOpenAIConverter(
+        context_budget_manager=ContextBudgetManager(token_counter=TokenCounter()),
+        message_conversion_cache=MessageConversionCache(max_entries=100),
+    )
+    results: Dict[str, Dict[str, Any]] = {}
+    modes: List[Literal["native", "prompt"]] = ["native", "prompt"]
+    for mode in modes:
+        model_config = ChatModelConfig(
+            id="benchmark",
+            name="benchmark",
+            description="benchmark",
+            structured_output_mode=mode,
+        )
+        latencies: List[float] = []
+        total_tokens: List[int] = []
+        valid_responses: int = 0
+        for _ in range(runs):
+            chat_request: ChatRequest = {
+                "model": "benchmark",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": "Make up a cardiologist with two practice locations.",
+                    }
+                ],
+                "response_format": ResponseFormatJSONSchema(
+                    type="json_schema",
+                    json_schema=JSONSchema(
+                        name="DoctorInformation",
+                        schema=DoctorInformation.model_json_schema(),
+                    ),
+                ),
+            }
+            start: float = time.perf_counter()
+            with get_usage_metadata_callback() as usage_callback:
+                response = await converter.call_agent_with_input(
+                    headers={},
+                    chat_request=chat_request,
+                    request_id="benchmark",
+                    compiled_state_graph=await converter.create_graph_for_llm_async(
+                        llm=ModelFactory().get_model(chat_model_config=model_config),
+                        tools=[],
+                        response_format=converter.get_native_response_format(
+                            chat_request=chat_request, model_config=model_config
+                        ),
+                    ),
+                    system_messages=[],
+                    model_config=model_config,
+                    tools=[],
+                )
+            latencies.append(time.perf_counter() - start)
+            total_tokens.append(
+                sum(u["total_tokens"] for u in usage_callback.usage_metadata.values())
+            )
+
+            assert isinstance(response, JSONResponse)
+            chat_completion = ChatCompletion.model_validate(
+                json.loads(bytes(response.body))
+            )
+            try:
+                DoctorInformation.model_validate_json(
+                    chat_completion.choices[0].message.content or ""
+                )
+                valid_responses += 1
+            except ValidationError as e:
+                print(f"{mode}: invalid response: {e}")
+
+        results[mode] = {
+            "average_latency_seconds": round(sum(latencies) / runs, 2),
+            "average_total_tokens": sum(total_tokens) / runs,
+            "valid_responses": f"{valid_responses}/{runs}",
+        }
+
+    print("======= Structured Output Benchmark =======")
+    for mode_name, result in results.items():
+        print(f"{mode_name}: {result}")
+    print("======= End of Structured Output Benchmark =======")
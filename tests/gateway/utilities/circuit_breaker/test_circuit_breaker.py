@@ -0,0 +1,194 @@
+import asyncio
+import time
+import uuid
+from typing import List
+
+import httpx
+import pytest
+from botocore.exceptions import ClientError
+from langchain_core.messages import ToolMessage
+
+from language_model_gateway.gateway.http.circuit_breaker_transport import (
+    CircuitBreakerTransport,
+)
+from language_model_gateway.gateway.tools.github_pull_request_retriever_tool import (
+    GitHubPullRequestRetriever,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker import (
+    CircuitBreaker,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_callback_handler import (
+    CircuitBreakerCallbackHandler,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_breaker_registry import (
+    CircuitBreakerRegistry,
+)
+from language_model_gateway.gateway.utilities.circuit_breaker.circuit_open_error import (
+    CircuitOpenError,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_helper import (
+    GithubPullRequestHelper,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+
+def test_circuit_breaker() -> None:
+    circuit_breaker = CircuitBreaker(
+        name="test", min_calls=4, failure_rate_threshold=0.5, open_seconds=0.05
+    )
+    for _ in range(2):
+        assert circuit_breaker.allow_request()
+        circuit_breaker.record_success(latency_seconds=0.1)
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+    assert not circuit_breaker.is_open()
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+
+    # 2 of 4 calls failed
+    assert circuit_breaker.is_open()
+    assert not circuit_breaker.allow_request()
+    with pytest.raises(CircuitOpenError):
+        circuit_breaker.check()
+
+    # one probe is let through when half open
+    time.sleep(0.06)
+    assert circuit_breaker.state == "half_open"
+    assert circuit_breaker.allow_request()
+    assert not circuit_breaker.allow_request()
+    circuit_breaker.record_failure()
+    assert circuit_breaker.is_open()
+
+    time.sleep(0.06)
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_success(latency_seconds=0.1)
+    assert circuit_breaker.allow_request()
+    assert circuit_breaker.allow_request()
+
+
+def test_circuit_breaker_slow_calls() -> None:
+    circuit_breaker = CircuitBreaker(
+        name="test", min_calls=2, slow_call_seconds=1, slow_call_rate_threshold=1
+    )
+    circuit_breaker.record_success(latency_seconds=5)
+    circuit_breaker.record_success()
+    assert not circuit_breaker.is_open()
+    circuit_breaker.record_success(latency_seconds=5)
+    circuit_breaker.record_success(latency_seconds=5)
+    # 3 of the 4 calls in the window are slow
+    assert not circuit_breaker.is_open()
+
+    circuit_breaker = CircuitBreaker(
+        name="test", min_calls=2, slow_call_seconds=1, slow_call_rate_threshold=1
+    )
+    circuit_breaker.record_success(latency_seconds=5)
+    circuit_breaker.record_success(latency_seconds=5)
+    assert circuit_breaker.is_open()
+
+
+async def test_circuit_breaker_transport() -> None:
+    requested_urls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(503, text="unavailable")
+
+    circuit_breaker_registry = CircuitBreakerRegistry(min_calls=2)
+    async with httpx.AsyncClient(
+        transport=CircuitBreakerTransport(
+            circuit_breaker_registry=circuit_breaker_registry,
+            transport=httpx.MockTransport(handler),
+        )
+    ) as client:
+        for _ in range(2):
+            response = await client.get("https://api.github.com/repos")
+            assert response.status_code == 503
+        assert circuit_breaker_registry.is_open(name="api.github.com")
+
+        # fails fast without calling the host
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://api.github.com/repos")
+        assert len(requested_urls) == 2
+        # other hosts are not affected
+        response = await client.get("https://jira.example.com/issues")
+        assert response.status_code == 503
+
+    # tools return a message instead of calling the dependency
+    tool = GitHubPullRequestRetriever(
+        github_pull_request_helper=GithubPullRequestHelper(
+            http_client_factory=MockHttpClientFactory(
+                fn_http_client=lambda: httpx.AsyncClient()
+            ),
+            org_name="icanbwell",
+            access_token="token",
+        ),
+        circuit_breaker_registry=circuit_breaker_registry,
+    )
+    result = await tool.ainvoke(
+        {
+            "type": "tool_call",
+            "id": "1",
+            "name": tool.name,
+            "args": {"url": "https://github.com/icanbwell/fhir-server/pull/1"},
+        }
+    )
+    assert isinstance(result, ToolMessage)
+    assert result.status == "error"
+    assert "temporarily unavailable" in str(result.content)
+
+
+async def test_circuit_breaker_transport_without_slow_calls() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={})
+
+    circuit_breaker_registry = CircuitBreakerRegistry(
+        min_calls=2, slow_call_seconds=0.01, slow_call_rate_threshold=1
+    )
+    async with httpx.AsyncClient(
+        transport=CircuitBreakerTransport(
+            circuit_breaker_registry=circuit_breaker_registry,
+            transport=httpx.MockTransport(handler),
+            count_slow_calls=False,
+        )
+    ) as client:
+        for _ in range(3):
+            response = await client.post("http://agent/chat")
+            assert response.status_code == 200
+    assert not circuit_breaker_registry.is_open(name="agent")
+
+
+def test_circuit_breaker_callback_handler_counts_only_unavailable_errors() -> None:
+    circuit_breaker = CircuitBreaker(name="bedrock:model", min_calls=2)
+    handler = CircuitBreakerCallbackHandler(circuit_breaker=circuit_breaker)
+    run_id = uuid.uuid4()
+
+    # errors that say nothing about the model do not open the breaker
+    for error in [
+        ValueError("bad tool arguments"),
+        asyncio.CancelledError(),
+        ClientError(
+            {
+                "Error": {"Code": "ValidationException"},
+                "ResponseMetadata": {"HTTPStatusCode": 400},
+            },
+            "Converse",
+        ),
+    ]:
+        handler.on_chat_model_start({}, [], run_id=run_id)
+        handler.on_llm_error(error, run_id=run_id)
+    assert not circuit_breaker.is_open()
+
+    for _ in range(2):
+        handler.on_chat_model_start({}, [], run_id=run_id)
+        handler.on_llm_error(
+            ClientError(
+                {
+                    "Error": {"Code": "ThrottlingException"},
+                    "ResponseMetadata": {"HTTPStatusCode": 429},
+                },
+                "Converse",
+            ),
+            run_id=run_id,
+        )
+    assert circuit_breaker.is_open()
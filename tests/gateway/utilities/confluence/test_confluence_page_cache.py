@@ -0,0 +1,120 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from language_model_gateway.gateway.utilities.confluence.confluence_document import (
+    ConfluenceDocument,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_helper import (
+    ConfluenceHelper,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_page_cache import (
+    ConfluencePageCache,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+
+class FakeConfluenceServer:
+    """
+    Serves the Confluence content API for pages 1 to 9
+    """
+
+    def __init__(self) -> None:
+        self.versions: Dict[str, int] = {str(i): 1 for i in range(1, 10)}
+        self.requests: List[str] = []
+        self.active: int = 0
+        self.max_active: int = 0
+        self.clients: int = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        page_id: str = request.url.path.split("/")[-1]
+        expand: str = request.url.params["expand"]
+        self.requests.append(f"{page_id}:{expand}")
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if page_id not in self.versions:
+            return httpx.Response(404)
+        version: Dict[str, Any] = {
+            "number": self.versions[page_id],
+            "when": "2024-09-01T00:00:00.000Z",
+        }
+        page: Dict[str, Any] = {
+            "id": page_id,
+            "title": f"Page {page_id}",
+            "version": version,
+            "_links": {"webui": f"spaces/ENG/pages/{page_id}"},
+        }
+        if "body.storage" in expand:
+            version["by"] = {"displayName": "user1"}
+            page["body"] = {
+                "storage": {"value": f"<p>Page {page_id} v{version['number']}</p>"}
+            }
+        return httpx.Response(200, json=page)
+
+    def create_client(self) -> httpx.AsyncClient:
+        self.clients += 1
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+
+async def test_pages_are_cached_by_version_and_retrieved_concurrently() -> None:
+    server = FakeConfluenceServer()
+    helper = ConfluenceHelper(
+        http_client_factory=MockHttpClientFactory(fn_http_client=server.create_client),
+        confluence_base_url="https://icanbwell.atlassian.net",
+        access_token="fake_token",
+        username="dummy_username",
+        confluence_page_cache=ConfluencePageCache(),
+        max_concurrent_pages=2,
+    )
+
+    pages: List[Optional[ConfluenceDocument]] = await helper.retrieve_pages_by_ids(
+        page_ids=["3", "1", "42", "2"]
+    )
+
+    assert [page.id if page else None for page in pages] == ["3", "1", None, "2"]
+    assert pages[0] is not None and pages[0].content == "<p>Page 3 v1</p>"
+    assert server.max_active == 2
+    assert server.clients == 1
+
+    # unchanged pages are revalidated with their version only
+    server.requests.clear()
+    page: Optional[ConfluenceDocument] = await helper.retrieve_page_by_id(page_id="3")
+    assert page is pages[0]
+    assert server.requests == ["3:version"]
+
+    # an edited page is downloaded again
+    server.requests.clear()
+    server.versions["3"] = 2
+    page = await helper.retrieve_page_by_id(page_id="3")
+    assert page is not None and page.content == "<p>Page 3 v2</p>"
+    assert server.requests == ["3:version", "3:body.storage,version.by"]
+
+
+def test_least_recently_used_pages_are_evicted() -> None:
+    def get_page(page_id: str) -> ConfluenceDocument:
+        return ConfluenceDocument(
+            id=page_id,
+            title="Page",
+            url="",
+            updated_at="2024-09-01",
+            author_name="user1",
+            content="x" * 6,
+            version_number=1,
+        )
+
+    # each page takes 10 bytes
+    cache = ConfluencePageCache(max_size_bytes=25)
+    cache.set(page=get_page("a"))
+    cache.set(page=get_page("b"))
+    # using a makes b the least recently used
+    assert cache.get(page_id="a", version_number=1)
+    cache.set(page=get_page("c"))
+
+    assert len(cache) == 2
+    assert cache.get_version_number(page_id="b") is None
+    # another version of a page is not returned
+    assert cache.get(page_id="a", version_number=2) is None
+    assert cache.get(page_id="a", version_number=1)
@@ -0,0 +1,202 @@
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.confluence.confluence_helper import (
+    ConfluenceHelper,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_search_index import (
+    ConfluenceSearchIndex,
+)
+from language_model_gateway.gateway.utilities.confluence.confluence_search_result import (
+    ConfluenceSearchResult,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_store import (
+    PassageStore,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+
+class FakeConfluenceContentSearchServer:
+    """
+    Serves the Confluence content search API for the pages of the ENG space, two pages at a time,
+    and the live search API
+    """
+
+    def __init__(self) -> None:
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.changed: List[str] = []
+        self.content_searches: List[str] = []
+        self.live_searches: List[str] = []
+
+    def set_page(self, *, page_id: str, title: str, body: str, when: str) -> None:
+        self.pages[page_id] = {
+            "id": page_id,
+            "title": title,
+            "body": {"storage": {"value": body}},
+            "version": {"when": when},
+            "_links": {"webui": f"spaces/ENG/pages/{page_id}"},
+        }
+        self.changed.append(page_id)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/wiki/rest/api/search":
+            self.live_searches.append(request.url.params["cql"])
+            return httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {
+                            "content": {"id": "99", "_links": {"webui": "live"}},
+                            "lastModified": "2024-09-01T00:00:00Z",
+                        }
+                    ]
+                },
+            )
+        assert request.url.path == "/wiki/rest/api/content/search"
+        assert request.url.params["expand"] == "body.storage,version"
+        start: int = int(request.url.params.get("start", "0"))
+        if start == 0:
+            self.content_searches.append(request.url.params["cql"])
+        results: List[Dict[str, Any]] = [
+            self.pages[page_id] for page_id in self.changed[start : start + 2]
+        ]
+        links: Dict[str, str] = {}
+        if start + 2 < len(self.changed):
+            links["next"] = (
+                f"/rest/api/content/search?start={start + 2}&expand=body.storage,version&cql=x"
+            )
+        else:
+            self.changed = []
+        return httpx.Response(200, json={"results": results, "_links": links})
+
+
+async def test_searches_are_answered_from_the_index(tmp_path: Path) -> None:
+    server = FakeConfluenceContentSearchServer()
+    server.set_page(
+        page_id="1",
+        title="Deployment runbook",
+        body="<h1>Deploy</h1><p>Run the pipeline and watch the canary.</p>",
+        when="2024-08-01T10:00:00.000Z",
+    )
+    server.set_page(
+        page_id="2",
+        title="Onboarding",
+        body="<p>Request a laptop and read the deployment guide.</p>",
+        when="2024-08-02T10:00:00.000Z",
+    )
+    server.set_page(
+        page_id="3",
+        title="Holidays",
+        body="<p>The office is closed on public holidays.</p>",
+        when="2024-08-03T10:00:00.000Z",
+    )
+    confluence_search_index = ConfluenceSearchIndex(
+        database_path=str(tmp_path / "confluence.db"), space_keys=["ENG"]
+    )
+    helper = ConfluenceHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(server.handle)
+            )
+        ),
+        confluence_base_url="https://icanbwell.atlassian.net",
+        access_token="fake_token",
+        username="dummy_username",
+        confluence_search_index=confluence_search_index,
+        passage_extractor=PassageExtractor(
+            token_counter=TokenCounter(), passage_store=PassageStore()
+        ),
+    )
+
+    # the first search goes to Confluence while the index is synced in the background
+    results: List[ConfluenceSearchResult] = await helper.search_content("deployment")
+    assert [result.id for result in results] == ["99"]
+    assert confluence_search_index.sync_task is not None
+    await confluence_search_index.sync_task
+    assert server.content_searches == [
+        'space = "ENG" AND type = page ORDER BY lastModified ASC'
+    ]
+    assert confluence_search_index.is_synced()
+
+    # a match in the title ranks first
+    results = await helper.search_content("deployment")
+    assert [result.id for result in results] == ["1", "2"]
+    assert results[0].url == "https://icanbwell.atlassian.net/wiki/spaces/ENG/pages/1"
+    assert results[0].updated_at == "2024-08-01"
+    assert results[1].excerpt is not None and "deployment guide" in results[1].excerpt
+    assert len(server.live_searches) == 1
+
+    # every term has to match
+    results = await helper.search_content("deployment laptop")
+    assert [result.id for result in results] == ["2"]
+    assert len(server.live_searches) == 1
+
+    # a search the index cannot answer falls back to Confluence
+    results = await helper.search_content("deployment kubernetes")
+    assert [result.id for result in results] == ["99"]
+    assert len(server.live_searches) == 2
+
+    # after the sync interval only the pages modified since the newest indexed page are downloaded
+    helper.index_sync_interval_seconds = 0
+    server.set_page(
+        page_id="3",
+        title="Holidays",
+        body="<p>Kubernetes upgrades are frozen on public holidays.</p>",
+        when="2024-08-04T10:00:00.000Z",
+    )
+    await helper.sync_search_index_async()
+    # the sync goes back a day in case the Confluence user is in another time zone
+    assert server.content_searches[1] == (
+        'space = "ENG" AND type = page AND lastModified >= "2024-08-02 10:00"'
+        " ORDER BY lastModified ASC"
+    )
+    helper.index_sync_interval_seconds = 300
+    results = await helper.search_content("kubernetes")
+    assert [result.id for result in results] == ["3"]
+    assert len(server.live_searches) == 2
+
+
+async def test_only_one_worker_syncs_a_space(tmp_path: Path) -> None:
+    server = FakeConfluenceContentSearchServer()
+    server.set_page(
+        page_id="1",
+        title="Deployment runbook",
+        body="<p>Run the pipeline.</p>",
+        when="2024-08-01T10:00:00.000Z",
+    )
+    confluence_search_index = ConfluenceSearchIndex(
+        database_path=str(tmp_path / "confluence.db"), space_keys=["ENG"]
+    )
+    helper = ConfluenceHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(server.handle)
+            )
+        ),
+        confluence_base_url="https://icanbwell.atlassian.net",
+        access_token="fake_token",
+        username="dummy_username",
+        confluence_search_index=confluence_search_index,
+        passage_extractor=PassageExtractor(
+            token_counter=TokenCounter(), passage_store=PassageStore()
+        ),
+    )
+
+    # another worker holds the lease
+    assert confluence_search_index.try_acquire_sync_lease(
+        space_key="ENG", owner="other", lease_seconds=60
+    )
+    await helper.sync_search_index_async()
+    assert server.content_searches == []
+    assert not confluence_search_index.is_synced()
+
+    confluence_search_index.release_sync_lease(space_key="ENG", owner="other")
+    await helper.sync_search_index_async()
+    assert len(server.content_searches) == 1
+    assert confluence_search_index.is_synced()
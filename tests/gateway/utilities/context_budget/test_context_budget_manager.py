@@ -0,0 +1,111 @@
+from typing import List
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
+
+from language_model_gateway.configs.config_schema import ContextBudgetConfig
+from language_model_gateway.gateway.tools.current_time_tool import CurrentTimeTool
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
+from language_model_gateway.gateway.utilities.context_budget.context_budget_result import (
+    ContextBudgetResult,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+
+def create_conversation(*, turns: int) -> List[BaseMessage]:
+    messages: List[BaseMessage] = [
+        SystemMessage(content="You are a helpful assistant.")
+    ]
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"Question {i}: " + "tell me more " * 50))
+        messages.append(AIMessage(content=f"Answer {i}: " + "here is more " * 50))
+    return messages
+
+
+def test_context_budget_not_configured() -> None:
+    messages = create_conversation(turns=10)
+    result: ContextBudgetResult = ContextBudgetManager(
+        token_counter=TokenCounter()
+    ).apply_budget(model_name="test", messages=messages, tools=[], context_budget=None)
+    assert result.messages == messages
+    assert result.tokens_saved == 0
+
+
+def test_context_budget_drop() -> None:
+    token_counter = TokenCounter()
+    messages = create_conversation(turns=10)
+    tools = [CurrentTimeTool()]
+    original_tokens = token_counter.count_messages(
+        messages=messages
+    ) + token_counter.count_tools(tools=tools)
+
+    result: ContextBudgetResult = ContextBudgetManager(
+        token_counter=token_counter
+    ).apply_budget(
+        model_name="test",
+        messages=messages,
+        tools=tools,
+        context_budget=ContextBudgetConfig(
+            max_input_tokens=original_tokens // 2, keep_last_turns=2, strategy="drop"
+        ),
+    )
+    assert result.original_tokens == original_tokens
+    assert result.final_tokens <= original_tokens // 2
+    assert result.tokens_saved > 0
+    # system prompt is kept and the oldest turns are dropped
+    assert result.messages[0] == messages[0]
+    assert result.messages[-4:] == messages[-4:]
+    assert messages[1] not in result.messages
+    assert result.final_tokens == token_counter.count_messages(
+        messages=result.messages
+    ) + token_counter.count_tools(tools=tools)
+
+
+def test_context_budget_keeps_last_turns_even_if_over_budget() -> None:
+    messages = create_conversation(turns=3)
+    result: ContextBudgetResult = ContextBudgetManager(
+        token_counter=TokenCounter()
+    ).apply_budget(
+        model_name="test",
+        messages=messages,
+        tools=[],
+        context_budget=ContextBudgetConfig(max_input_tokens=10, keep_last_turns=3),
+    )
+    assert result.messages == messages
+    assert result.tokens_saved == 0
+
+
+def test_context_budget_summarize() -> None:
+    token_counter = TokenCounter()
+    messages = create_conversation(turns=10)
+    original_tokens = token_counter.count_messages(messages=messages)
+
+    result: ContextBudgetResult = ContextBudgetManager(
+        token_counter=token_counter
+    ).apply_budget(
+        model_name="test",
+        messages=messages,
+        tools=[],
+        context_budget=ContextBudgetConfig(
+            max_input_tokens=original_tokens // 2,
+            keep_last_turns=2,
+            strategy="summarize",
+            summary_max_tokens=200,
+        ),
+    )
+    print(result.messages[1].content)
+    assert result.final_tokens <= original_tokens // 2
+    assert result.messages[0] == messages[0]
+    assert isinstance(result.messages[1], SystemMessage)
+    assert str(result.messages[1].content).startswith(
+        ContextBudgetManager.summary_header
+    )
+    assert "- user: Question 0:" in str(result.messages[1].content)
+    assert result.messages[-4:] == messages[-4:]
+    assert result.final_tokens == token_counter.count_messages(messages=result.messages)
@@ -0,0 +1,59 @@
+from language_model_gateway.gateway.tools.fhir_graphql_schema_provider import (
+    GraphqlSchemaProviderTool,
+)
+from language_model_gateway.gateway.utilities.fhir.fhir_graphql_schema_index import (
+    FhirGraphqlSchemaIndex,
+)
+from language_model_gateway.gateway.utilities.fhir.fhir_graphql_schema_slice import (
+    FhirGraphqlSchemaSlice,
+)
+
+
+async def test_fhir_graphql_schema_index_find_resources() -> None:
+    schema_index: FhirGraphqlSchemaIndex = (
+        await FhirGraphqlSchemaIndex.get_instance_async()
+    )
+    assert "Patient" in schema_index.resource_names
+
+    assert schema_index.find_resources(
+        text="Get conditions and allergy intolerances for patients whose name is John"
+    ) == ["Condition", "AllergyIntolerance", "Patient"]
+    # common words are not mistaken for resources
+    assert schema_index.find_resources(text="list all patients in the group") == [
+        "Patient"
+    ]
+    assert schema_index.find_resources(text="What is the weather today?") == []
+
+
+async def test_fhir_graphql_schema_index_get_schema_slice() -> None:
+    schema_index: FhirGraphqlSchemaIndex = (
+        await FhirGraphqlSchemaIndex.get_instance_async()
+    )
+
+    schema_slice: FhirGraphqlSchemaSlice = schema_index.get_schema_slice(
+        resource_names=["patients", "Condition"]
+    )
+    print(schema_slice.sdl)
+    assert schema_slice.resources == ["Patient", "Condition"]
+    assert schema_slice.query_fields == ["patients", "conditions"]
+    assert "PatientBundle" in schema_slice.type_names
+    assert "PatientBundleEntry" in schema_slice.type_names
+    assert "SearchString" in schema_slice.type_names
+    assert "SearchStringValue" in schema_slice.type_names
+    # other resources linked from Patient are left out
+    assert "Observation" not in schema_slice.type_names
+    assert "type Query {\n  patients(" in schema_slice.sdl
+    assert len(schema_slice.sdl) < 50_000
+
+
+async def test_fhir_graphql_schema_provider_tool() -> None:
+    tool = GraphqlSchemaProviderTool()
+
+    content, artifact = await tool._arun(query_intent="Get encounters for a patient")
+    assert "encounters(" in content
+    assert "patients(" in content
+    assert artifact.startswith("FHIR server graphql schema for Encounter, Patient")
+
+    content, artifact = await tool._arun(resource_names=["NotAResource"])
+    assert "No FHIR resource matched" in content
+    assert "Patient" in content
@@ -0,0 +1,157 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.github.github_pull_request_helper import (
+    GithubPullRequestHelper,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_result import (
+    GithubPullRequestResult,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+from tests.gateway.utilities.github.test_github_pull_request_helper_concurrency import (
+    FakeGithubServer,
+)
+
+
+class FakeGithubGraphQLServer:
+    """
+    Serves the GraphQL API for an organization whose repositories have five pull requests each,
+    newest first, in pages of at most two.
+    """
+
+    def __init__(self, *, repo_names: List[str]) -> None:
+        self.repo_names: List[str] = repo_names
+        self.queries: List[Dict[str, Any]] = []
+
+    @staticmethod
+    def get_pull_request(repo: str, number: int) -> Dict[str, Any]:
+        return {
+            "number": number,
+            "title": f"{repo} {number}",
+            "body": None,
+            "state": "MERGED" if number % 2 else "CLOSED",
+            "createdAt": (
+                datetime(2024, 9, 10, tzinfo=timezone.utc) - timedelta(days=number)
+            ).isoformat(),
+            "closedAt": None,
+            "updatedAt": None,
+            "url": f"https://github.com/icanbwell/{repo}/pull/{number}",
+            "author": {"login": repo},
+        }
+
+    @staticmethod
+    def get_page(nodes: List[Any], after: str | None, first: int) -> Dict[str, Any]:
+        start: int = int(after or 0)
+        end: int = start + min(first, 2)
+        return {
+            "pageInfo": {"hasNextPage": end < len(nodes), "endCursor": str(end)},
+            "nodes": nodes[start:end],
+        }
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/graphql"
+        body: Dict[str, Any] = json.loads(request.content)
+        self.queries.append(body)
+        variables: Dict[str, Any] = body["variables"]
+        data: Dict[str, Any] = {
+            "rateLimit": {
+                "cost": 1,
+                "remaining": 4000,
+                "resetAt": "2024-09-10T00:00:00Z",
+            }
+        }
+        if "organization(" in body["query"]:
+            data["organization"] = {
+                "repositories": self.get_page(
+                    [{"name": name} for name in self.repo_names],
+                    variables["after"],
+                    variables["first"],
+                )
+            }
+        else:
+            index: int = 0
+            while f"name{index}" in variables:
+                name: str = variables[f"name{index}"]
+                data[f"r{index}"] = {
+                    "pullRequests": self.get_page(
+                        [self.get_pull_request(name, number) for number in range(5)],
+                        variables[f"after{index}"],
+                        variables["first"],
+                    )
+                }
+                index += 1
+        return httpx.Response(200, json={"data": data})
+
+
+async def test_pull_requests_are_retrieved_with_graphql() -> None:
+    server = FakeGithubGraphQLServer(repo_names=["repo0", "repo1", "repo2"])
+    helper = GithubPullRequestHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(server.handle)
+            )
+        ),
+        org_name="icanbwell",
+        access_token="fake_token",
+        use_graphql=True,
+        # two repositories per query with the default page size of 50
+        max_graphql_nodes=100,
+    )
+
+    result: GithubPullRequestResult = await helper.retrieve_closed_prs(
+        min_created_at=datetime(2024, 9, 8, tzinfo=timezone.utc)
+    )
+
+    assert result.error is None
+    # pull requests 0, 1 and 2 of each repo are in the date range
+    assert sorted(
+        (pr.repo, str(pr.pull_request_number)) for pr in result.pull_requests
+    ) == [(f"repo{r}", str(n)) for r in range(3) for n in range(3)]
+    pr = next(pr for pr in result.pull_requests if str(pr.pull_request_number) == "1")
+    assert pr.state == "closed"
+    assert pr.user == pr.repo
+    assert pr.diff_url == f"https://github.com/icanbwell/{pr.repo}/pull/1.diff"
+
+    # 2 pages of repositories, then 2 pages for each repository batched two at a time
+    pull_request_queries = [
+        q for q in server.queries if "organization(" not in q["query"]
+    ]
+    assert len(server.queries) - len(pull_request_queries) == 2
+    assert [
+        [v for k, v in q["variables"].items() if k.startswith("name")]
+        for q in pull_request_queries
+    ] == [["repo0", "repo1"], ["repo0", "repo1"], ["repo2"], ["repo2"]]
+    # only the fields of GithubPullRequest are requested
+    assert "PullRequestFields on PullRequest" in pull_request_queries[0]["query"]
+    assert "additions" not in pull_request_queries[0]["query"]
+
+
+async def test_rest_is_used_when_graphql_fails() -> None:
+    rest_server = FakeGithubServer(repo_count=2, pages_per_repo=1, rate_limit=100)
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/graphql":
+            return httpx.Response(
+                200, json={"errors": [{"message": "Something went wrong"}]}
+            )
+        return await rest_server.handle(request)
+
+    helper = GithubPullRequestHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(handle)
+            )
+        ),
+        org_name="icanbwell",
+        access_token="fake_token",
+        use_graphql=True,
+    )
+
+    result: GithubPullRequestResult = await helper.retrieve_closed_prs(max_repos=2)
+
+    assert result.error is None
+    assert len(result.pull_requests) == 4
+    assert "/orgs/icanbwell/repos?page=1" in rest_server.paths
@@ -0,0 +1,142 @@
+from typing import Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.github.github_diff_reader import (
+    GithubDiffReader,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff import (
+    GithubPullRequestDiff,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff_file import (
+    GithubPullRequestDiffFile,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_diff_cache import (
+    GithubPullRequestDiffCache,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_helper import (
+    GithubPullRequestHelper,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+
+def get_file_diff(path: str, added_lines: int) -> str:
+    return (
+        f"diff --git a/{path} b/{path}\n"
+        f"index 1111111..2222222 100644\n"
+        f"--- a/{path}\n"
+        f"+++ b/{path}\n"
+        f"@@ -1,1 +1,{added_lines} @@\n"
+        + "".join(f"+--line {i} of {path}\n" for i in range(added_lines))
+        + "-old line\n"
+    )
+
+
+pr_diff: str = (
+    get_file_diff("src/app.py", 3)
+    + get_file_diff("package-lock.json", 500)
+    + get_file_diff("src/big.py", 200)
+    + get_file_diff("static/app.min.js", 10)
+    + "diff --git a/logo.png b/logo.png\n"
+    + "Binary files a/logo.png and b/logo.png differ\n"
+)
+
+
+async def test_diff_is_cached_by_head_sha() -> None:
+    head: Dict[str, str] = {"sha": "a" * 40}
+    base: Dict[str, str] = {"sha": "0" * 40}
+    requests: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        accept: str = request.headers["Accept"]
+        requests.append(accept)
+        if accept == "application/vnd.github.v3.diff":
+            # the diff is pinned to the SHAs returned with the PR
+            assert request.url.path == (
+                f"/repos/icanbwell/helix.pipelines/compare/{base['sha']}...{head['sha']}"
+            )
+            return httpx.Response(200, text=pr_diff)
+        assert request.url.path == "/repos/icanbwell/helix.pipelines/pulls/7"
+        return httpx.Response(200, json={"number": 7, "head": head, "base": base})
+
+    helper = GithubPullRequestHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+        ),
+        org_name="icanbwell",
+        access_token="fake_token",
+        github_pull_request_diff_cache=GithubPullRequestDiffCache(),
+        github_diff_reader=GithubDiffReader(max_file_bytes=1000, max_total_bytes=2000),
+    )
+    url: str = "https://github.com/icanbwell/helix.pipelines/pull/7"
+
+    diff: GithubPullRequestDiff = await helper.get_pr_diff_async(pr_url=url)
+    assert [file.path for file in diff.files] == [
+        "src/app.py",
+        "package-lock.json",
+        "src/big.py",
+        "static/app.min.js",
+        "logo.png",
+    ]
+    app, lock, big, minified, logo = diff.files
+    assert (app.additions, app.deletions, app.truncated) == (3, 1, False)
+    # lines starting with -- inside a hunk are content and not file headers
+    assert "+--line 2 of src/app.py" in app.content
+    assert lock.skipped_reason == "lock file" and lock.content == ""
+    assert lock.additions == 500
+    assert big.truncated and 0 < len(big.content) <= 1000
+    assert big.additions == 200
+    assert minified.skipped_reason == "generated file"
+    assert logo.skipped_reason == "binary file"
+    assert sum(len(file.content) for file in diff.files) <= 2000
+
+    text: str = helper.github_diff_reader.format_diff(diff=diff)
+    assert text.startswith(
+        "Pull request icanbwell/helix.pipelines#7 at aaaaaaaaaaaa: 5 files changed, +713 -4"
+    )
+    assert "- package-lock.json: not shown (lock file), +500 -1" in text
+    assert (
+        f"- src/big.py: truncated to {len(big.content)} of {big.size_bytes} bytes"
+        in text
+    )
+
+    # the same head SHA is served from the cache
+    assert await helper.get_pr_diff_async(pr_url=url) is diff
+    assert requests.count("application/vnd.github.v3.diff") == 1
+
+    # a new push changes the head SHA so the diff is downloaded again
+    head["sha"] = "b" * 40
+    new_diff: GithubPullRequestDiff = await helper.get_pr_diff_async(pr_url=url)
+    assert new_diff.head_sha == "b" * 40
+    assert requests.count("application/vnd.github.v3.diff") == 2
+
+
+def test_least_recently_used_diffs_are_evicted() -> None:
+    def get_diff(head_sha: str) -> GithubPullRequestDiff:
+        return GithubPullRequestDiff(
+            repo="icanbwell/helix.pipelines",
+            pull_request_number=7,
+            head_sha=head_sha,
+            files=[GithubPullRequestDiffFile(path="a.py", content="x" * 7)],
+        )
+
+    # each diff takes 10 bytes
+    cache = GithubPullRequestDiffCache(max_size_bytes=25)
+    cache.set(diff=get_diff("a"))
+    cache.set(diff=get_diff("b"))
+    # using a makes b the least recently used
+    assert cache.get(
+        repo="icanbwell/helix.pipelines", pull_request_number=7, head_sha="a"
+    )
+    cache.set(diff=get_diff("c"))
+
+    assert len(cache) == 2
+    assert (
+        cache.get(repo="icanbwell/helix.pipelines", pull_request_number=7, head_sha="b")
+        is None
+    )
+    assert cache.get(
+        repo="icanbwell/helix.pipelines", pull_request_number=7, head_sha="a"
+    )
@@ -0,0 +1,119 @@
+import asyncio
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.github.github_pull_request_helper import (
+    GithubPullRequestHelper,
+)
+from language_model_gateway.gateway.utilities.github.github_pull_request_result import (
+    GithubPullRequestResult,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+
+class FakeGithubServer:
+    """
+    Serves an organization whose repositories each have pages of two pull requests, newest first,
+    and enforces a rate limit that resets a second after it runs out.
+    """
+
+    def __init__(
+        self, *, repo_count: int, pages_per_repo: int, rate_limit: int
+    ) -> None:
+        self.repo_count: int = repo_count
+        self.pages_per_repo: int = pages_per_repo
+        self.rate_limit: int = rate_limit
+        self.remaining: int = rate_limit
+        self.reset: int = 0
+        self.in_flight: int = 0
+        self.max_in_flight: int = 0
+        self.rejected: int = 0
+        self.paths: List[str] = []
+
+    def _rate_limit_headers(self) -> Dict[str, str]:
+        return {
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self.reset),
+        }
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.remaining == 0 and time.time() >= self.reset:
+            self.remaining = self.rate_limit
+        if self.remaining == 0:
+            self.rejected += 1
+            return httpx.Response(
+                403,
+                json={"message": "API rate limit exceeded"},
+                headers=self._rate_limit_headers(),
+            )
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.reset = math.ceil(time.time()) + 1
+        self.paths.append(f"{request.url.path}?page={request.url.params['page']}")
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            page: int = int(request.url.params["page"])
+            if request.url.path == "/orgs/icanbwell/repos":
+                body: List[Dict[str, Any]] = (
+                    [{"name": f"repo{i}"} for i in range(self.repo_count)]
+                    if page == 1
+                    else []
+                )
+            else:
+                repo: str = request.url.path.split("/")[3]
+                body = [
+                    {
+                        "number": number,
+                        "state": "closed",
+                        "title": f"{repo} {number}",
+                        "user": {"login": repo},
+                        "created_at": (
+                            datetime(2024, 9, 10, tzinfo=timezone.utc)
+                            - timedelta(days=number)
+                        ).isoformat(),
+                    }
+                    for number in [(page - 1) * 2, (page - 1) * 2 + 1]
+                    if page <= self.pages_per_repo
+                ]
+            return httpx.Response(200, json=body, headers=self._rate_limit_headers())
+        finally:
+            self.in_flight -= 1
+
+
+async def test_repos_are_fetched_concurrently_within_the_rate_limit() -> None:
+    server = FakeGithubServer(repo_count=6, pages_per_repo=5, rate_limit=8)
+    helper = GithubPullRequestHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(server.handle)
+            )
+        ),
+        org_name="icanbwell",
+        access_token="fake_token",
+        max_concurrent_repos=3,
+    )
+
+    start_time: float = time.monotonic()
+    result: GithubPullRequestResult = await helper.retrieve_closed_prs(
+        max_repos=6, min_created_at=datetime(2024, 9, 8, tzinfo=timezone.utc)
+    )
+
+    assert result.error is None
+    # pull requests 0, 1 and 2 of each repo are in the date range
+    assert len(result.pull_requests) == 18
+    assert {pr.repo for pr in result.pull_requests} == {f"repo{i}" for i in range(6)}
+    # each repo stops after the page that goes past min_created_at
+    assert "/repos/icanbwell/repo0/pulls?page=2" in server.paths
+    assert "/repos/icanbwell/repo0/pulls?page=3" not in server.paths
+    # 1 + 6 * 2 requests with a rate limit of 8 so all the requests paused for the reset
+    assert len(server.paths) == 13
+    assert time.monotonic() - start_time >= 1
+    assert 1 < server.max_in_flight <= 3
+    assert server.rejected <= 3
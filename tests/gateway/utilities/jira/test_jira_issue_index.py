@@ -0,0 +1,182 @@
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.jira.jira_issue_index import (
+    JiraIssueIndex,
+)
+from language_model_gateway.gateway.utilities.jira.jira_issue_result import (
+    JiraIssueResult,
+)
+from language_model_gateway.gateway.utilities.jira.jira_issues_helper import (
+    JiraIssueHelper,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+now: datetime = datetime.now(timezone.utc)
+
+
+def days_ago(days: int) -> str:
+    return (now - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+
+
+class FakeJiraSearchServer:
+    """
+    Serves the Jira search API for a set of issues.  Index syncs get every issue the first time
+    and only the issues changed since the previous sync afterward.  Other searches get every issue.
+    """
+
+    def __init__(self) -> None:
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.changed: List[str] = []
+        self.searches: List[Dict[str, Any]] = []
+
+    def set_issue(
+        self, *, key: str, status: str, assignee: str | None, created: str
+    ) -> None:
+        self.issues[key] = {
+            "key": key,
+            "self": f"https://icanbwell.atlassian.net/rest/api/3/issue/{key}",
+            "fields": {
+                "summary": f"Summary of {key}",
+                "status": {"name": status},
+                "created": created,
+                "updated": days_ago(1),
+                "assignee": {"displayName": assignee} if assignee else None,
+                "project": {"key": key.split("-")[0]},
+            },
+        }
+        self.changed.append(key)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/rest/api/3/search/jql"
+        body: Dict[str, Any] = json.loads(request.content)
+        self.searches.append(body)
+        if not body["jql"].startswith("updated >= "):
+            return httpx.Response(200, json={"issues": list(self.issues.values())})
+        issues: List[Dict[str, Any]] = [self.issues[key] for key in self.changed]
+        self.changed = []
+        return httpx.Response(200, json={"issues": issues})
+
+
+async def test_analytics_queries_are_answered_from_the_index(tmp_path: Path) -> None:
+    server = FakeJiraSearchServer()
+    server.set_issue(
+        key="EFS-1", status="Closed", assignee="user1", created=days_ago(60)
+    )
+    server.set_issue(
+        key="EFS-2", status="Closed", assignee="user1", created=days_ago(20)
+    )
+    server.set_issue(
+        key="ATC-1", status="Closed", assignee="user1", created=days_ago(19)
+    )
+    server.set_issue(key="ATC-2", status="Closed", assignee=None, created=days_ago(18))
+    server.set_issue(key="ATC-3", status="Open", assignee="user2", created=days_ago(17))
+    jira_issue_index = JiraIssueIndex(database_path=str(tmp_path / "jira.db"))
+    helper = JiraIssueHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(server.handle)
+            )
+        ),
+        jira_base_url="https://icanbwell.atlassian.net",
+        access_token="fake_token",
+        username="dummy_username",
+        jira_issue_index=jira_issue_index,
+    )
+
+    # Jira is searched while the index is backfilled in the background
+    result: JiraIssueResult = await helper.retrieve_closed_issues(
+        min_created_at=now - timedelta(days=30), counts_only=True
+    )
+    assert result.issue_counts is None
+    assert len(result.issues) == 5
+    assert jira_issue_index.sync_task is not None
+    await jira_issue_index.sync_task
+    # the first sync backfills the issues updated in the last year
+    assert len(server.searches) == 2
+    assert server.searches[1]["jql"].startswith(
+        f"updated >= '{now - timedelta(days=365):%Y-%m-%d} "
+    )
+    assert server.searches[1]["jql"].endswith("' ORDER BY updated asc")
+    assert server.searches[1]["fields"] == JiraIssueHelper.index_fields
+
+    result = await helper.retrieve_closed_issues(
+        min_created_at=now - timedelta(days=30), counts_only=True
+    )
+    assert result.error is None
+    assert result.issue_counts is not None
+    assert {
+        name: (info.issue_count, info.projects)
+        for name, info in result.issue_counts.items()
+    } == {"user1": (2, ["ATC", "EFS"]), "Unassigned": (1, ["ATC"])}
+    assert len(server.searches) == 2
+
+    # list queries return all the matching issues like Jira does
+    result = await helper.retrieve_closed_issues(
+        project_key="efs",
+        min_updated_at=now - timedelta(days=90),
+        sort_by="created",
+        sort_by_direction="asc",
+    )
+    assert [issue.key for issue in result.issues] == ["EFS-1", "EFS-2"]
+    assert len(server.searches) == 2
+
+    # queries reaching before the indexed issues go to Jira
+    await helper.retrieve_closed_issues(project_key="efs")
+    await helper.retrieve_closed_issues(min_created_at=now - timedelta(days=400))
+    assert len(server.searches) == 4
+
+    # after the sync interval only the changes are downloaded
+    helper.index_sync_interval_seconds = 0
+    server.set_issue(
+        key="ATC-3", status="Closed", assignee="user2", created=days_ago(17)
+    )
+    last_sync_at, _ = jira_issue_index.get_sync_state()
+    assert last_sync_at is not None
+    await helper.sync_issue_index_async()
+    # the sync goes back a day in case the Jira user is in another time zone
+    assert (
+        server.searches[4]["jql"]
+        == f"updated >= '{last_sync_at - timedelta(days=1):%Y-%m-%d %H:%M}' ORDER BY updated asc"
+    )
+    helper.index_sync_interval_seconds = 60
+    result = await helper.retrieve_closed_issues(
+        assignee="USER2", min_created_at=now - timedelta(days=30)
+    )
+    assert [issue.key for issue in result.issues] == ["ATC-3"]
+    assert len(server.searches) == 5
+
+
+async def test_only_one_worker_syncs_the_index(tmp_path: Path) -> None:
+    server = FakeJiraSearchServer()
+    jira_issue_index = JiraIssueIndex(database_path=str(tmp_path / "jira.db"))
+    helper = JiraIssueHelper(
+        http_client_factory=MockHttpClientFactory(
+            fn_http_client=lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(server.handle)
+            )
+        ),
+        jira_base_url="https://icanbwell.atlassian.net",
+        access_token="fake_token",
+        username="dummy_username",
+        jira_issue_index=jira_issue_index,
+        index_project_keys=["efs"],
+    )
+
+    # another worker holds the lease
+    assert jira_issue_index.try_acquire_sync_lease(owner="other", lease_seconds=60)
+    await helper.sync_issue_index_async()
+    assert server.searches == []
+
+    jira_issue_index.release_sync_lease(owner="other")
+    await helper.sync_issue_index_async()
+    assert len(server.searches) == 1
+    assert server.searches[0]["jql"].endswith(
+        " AND project in (EFS) ORDER BY updated asc"
+    )
+    # the lease is released after the sync
+    assert jira_issue_index.try_acquire_sync_lease(owner="other", lease_seconds=60)
@@ -0,0 +1,184 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.jira.jira_issue_result import (
+    JiraIssueResult,
+)
+from language_model_gateway.gateway.utilities.jira.jira_issues_helper import (
+    JiraIssueHelper,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+
+class FakeJiraServer:
+    """
+    Serves the Jira search API for issues PROJECT-0 to PROJECT-9 in pages of at most two.
+    Like Jira, a search for keys that do not exist fails with 400.
+    """
+
+    def __init__(self) -> None:
+        self.searches: List[Dict[str, Any]] = []
+        self.active: int = 0
+        self.max_active: int = 0
+        self.clients: int = 0
+
+    @staticmethod
+    def get_issue(number: int) -> Dict[str, Any]:
+        return {
+            "key": f"PROJECT-{number}",
+            "self": f"https://icanbwell.atlassian.net/rest/api/3/issue/{number}",
+            "fields": {
+                "summary": f"Issue {number}",
+                "status": {"name": "Closed"},
+                "created": "2024-09-01T00:00:00.000Z",
+                "assignee": {"displayName": f"user{number % 2}"},
+                "project": {"key": "PROJECT"},
+                "description": {
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [{"type": "text", "text": f"Fix {number}"}],
+                        }
+                    ]
+                },
+            },
+        }
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/rest/api/3/search/jql"
+        body: Dict[str, Any] = json.loads(request.content)
+        self.searches.append(body)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+        jql: str = body["jql"]
+        if jql.startswith("key in ("):
+            keys: List[str] = jql[len("key in (") : -1].split(", ")
+            numbers: List[int] = [int(key.split("-")[1]) for key in keys]
+            unknown_keys: List[str] = [
+                key for key, number in zip(keys, numbers) if number >= 10
+            ]
+            if unknown_keys:
+                return httpx.Response(
+                    400,
+                    json={
+                        "errorMessages": [
+                            f"An issue with key '{key}' does not exist for field 'key'."
+                            for key in unknown_keys
+                        ],
+                        "errors": {},
+                    },
+                )
+        else:
+            numbers = list(range(10))
+        start: int = int(body["nextPageToken"] or 0)
+        end: int = start + min(body["maxResults"], 2)
+        issues: List[Dict[str, Any]] = []
+        for number in numbers[start:end]:
+            issue: Dict[str, Any] = self.get_issue(number)
+            # Jira only returns the requested fields
+            issue["fields"] = {
+                k: v for k, v in issue["fields"].items() if k in body["fields"]
+            }
+            issues.append(issue)
+        content: Dict[str, Any] = {"issues": issues}
+        if end < len(numbers):
+            content["nextPageToken"] = str(end)
+        return httpx.Response(200, json=content)
+
+    def create_client(self) -> httpx.AsyncClient:
+        self.clients += 1
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+
+def get_helper(server: FakeJiraServer) -> JiraIssueHelper:
+    return JiraIssueHelper(
+        http_client_factory=MockHttpClientFactory(fn_http_client=server.create_client),
+        jira_base_url="https://icanbwell.atlassian.net",
+        access_token="fake_token",
+        username="dummy_username",
+        max_concurrent_batches=2,
+        max_keys_per_batch=3,
+    )
+
+
+async def test_issues_are_retrieved_in_concurrent_batches() -> None:
+    server = FakeJiraServer()
+    helper = get_helper(server)
+
+    result: JiraIssueResult = await helper.retrieve_issues_by_ids(
+        issue_ids=["PROJECT-7", "project 1", "PROJECT-3", "PROJECT-1"]
+        + [f"PROJECT-{n}" for n in [4, 5, 6, 42]]
+    )
+
+    # in the requested order without duplicates and with the missing issue reported
+    assert [issue.key for issue in result.issues] == [
+        "PROJECT-7",
+        "PROJECT-1",
+        "PROJECT-3",
+        "PROJECT-4",
+        "PROJECT-5",
+        "PROJECT-6",
+    ]
+    assert result.error == "Issues not found: PROJECT-42"
+    assert result.issues[0].description == "Fix 7"
+    # 7 keys in batches of 3 with two batches at a time on one client
+    assert sorted(
+        search["jql"] for search in server.searches if not search["nextPageToken"]
+    ) == [
+        "key in (PROJECT-4, PROJECT-5, PROJECT-6)",
+        "key in (PROJECT-42)",
+        "key in (PROJECT-7, PROJECT-1, PROJECT-3)",
+    ]
+    assert server.max_active == 2
+    assert server.clients == 1
+    assert "description" in server.searches[0]["fields"]
+
+
+async def test_batch_with_unknown_key_is_looked_up_per_key() -> None:
+    server = FakeJiraServer()
+    helper = get_helper(server)
+
+    result: JiraIssueResult = await helper.retrieve_issues_by_ids(
+        issue_ids=["PROJECT-2", "PROJECT-42", "PROJECT-3", "PROJECT", "key) OR (x"]
+    )
+
+    assert [issue.key for issue in result.issues] == ["PROJECT-2", "PROJECT-3"]
+    assert result.error == "Issues not found: PROJECT-42, PROJECT, KEY)-OR-(X"
+    # the invalid keys are never put in JQL
+    assert sorted(search["jql"] for search in server.searches) == [
+        "key in (PROJECT-2)",
+        "key in (PROJECT-2, PROJECT-42, PROJECT-3)",
+        "key in (PROJECT-3)",
+        "key in (PROJECT-42)",
+    ]
+
+
+async def test_counts_only_requests_only_the_fields_to_count() -> None:
+    server = FakeJiraServer()
+    helper = get_helper(server)
+
+    result: JiraIssueResult = await helper.retrieve_closed_issues(
+        max_issues=5, include_full_description=True, counts_only=True
+    )
+
+    assert result.error is None
+    assert len(result.issues) == 5
+    # pages of two until five issues are fetched
+    assert [search["nextPageToken"] for search in server.searches] == [None, "2", "4"]
+    assert server.searches[0]["fields"] == JiraIssueHelper.counts_fields
+    assert all(issue.description == "" for issue in result.issues)
+    counts = helper.summarize_issues_by_assignee(issues=result.issues)
+    assert {k: v.issue_count for k, v in counts.items()} == {"user0": 3, "user1": 2}
+
+    # the description is only requested when asked for
+    server.searches.clear()
+    result = await helper.retrieve_closed_issues(max_issues=1)
+    assert "description" not in server.searches[0]["fields"]
+    assert "summary" in server.searches[0]["fields"]
+    assert result.issues[0].description == ""
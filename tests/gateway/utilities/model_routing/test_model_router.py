@@ -0,0 +1,148 @@
+import dataclasses
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from langchain_core.tools import BaseTool, StructuredTool
+from openai.types import CompletionUsage
+
+from language_model_gateway.configs.config_schema import (
+    ChatModelConfig,
+    ModelConfig,
+    ModelRoutingConfig,
+)
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.model_routing.model_router import (
+    ModelRouter,
+)
+from language_model_gateway.gateway.utilities.model_routing.model_routing_replay import (
+    ModelRoutingReplay,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+
+def get_jira_issues(project: str) -> str:
+    """Retrieves the issues in a Jira project with their status and assignee"""
+    return project
+
+
+def search_google(query: str) -> str:
+    """Searches the web with Google for current information"""
+    return query
+
+
+tools: List[BaseTool] = [
+    StructuredTool.from_function(get_jira_issues, name="jira_issues"),
+    StructuredTool.from_function(search_google, name="google_search"),
+]
+
+routing_config = ModelRoutingConfig(
+    strong_model=ModelConfig(
+        provider="bedrock", model="us.anthropic.claude-3-7-sonnet-20250219-v1:0"
+    ),
+    max_fast_prompt_tokens=1000,
+    max_fast_tool_score=0.5,
+)
+
+model_config = ChatModelConfig(
+    id="test",
+    name="test",
+    description="test",
+    model=ModelConfig(
+        provider="bedrock", model="us.anthropic.claude-3-5-haiku-20241022-v1:0"
+    ),
+    routing=routing_config,
+)
+
+
+async def test_model_router(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    capture_file: Path = tmp_path.joinpath("routing.jsonl")
+    monkeypatch.setenv("MODEL_ROUTING_CAPTURE_FILE", str(capture_file))
+    model_router = ModelRouter(token_counter=TokenCounter())
+
+    chat_request: ChatRequest = {
+        "model": "test",
+        "messages": [{"role": "user", "content": "Hello, how are you?"}],
+    }
+    decision = model_router.route(
+        model_config=model_config, chat_request=chat_request, tools=tools
+    )
+    assert (decision.route, decision.reason) == ("fast", "default")
+    assert (
+        ModelRouter.get_model_config(model_config=model_config, route=decision.route)
+        == model_config
+    )
+    await model_router.record_result_async(
+        model_config=model_config,
+        decision=decision,
+        latency_seconds=1.0,
+        usage=CompletionUsage(prompt_tokens=90, completion_tokens=10, total_tokens=100),
+    )
+
+    # likely to need a tool
+    decision = model_router.route(
+        model_config=model_config,
+        chat_request={
+            "model": "test",
+            "messages": [
+                {"role": "user", "content": "List the open Jira issues assigned to me"}
+            ],
+        },
+        tools=tools,
+    )
+    assert (decision.route, decision.reason) == ("strong", "tools")
+    assert (
+        ModelRouter.get_model_config(
+            model_config=model_config, route=decision.route
+        ).model
+        == routing_config.strong_model
+    )
+    await model_router.record_result_async(
+        model_config=model_config,
+        decision=decision,
+        latency_seconds=5.0,
+        usage=CompletionUsage(
+            prompt_tokens=900, completion_tokens=100, total_tokens=1000
+        ),
+    )
+
+    # long prompt
+    decision = model_router.route(
+        model_config=model_config,
+        chat_request={
+            "model": "test",
+            "messages": [{"role": "user", "content": "Summarize this. " * 1000}],
+        },
+        tools=tools,
+    )
+    assert (decision.route, decision.reason) == ("strong", "prompt_tokens")
+
+    records: List[Dict[str, Any]] = ModelRoutingReplay.read_records(
+        path=str(capture_file)
+    )
+    assert [r["route"] for r in records] == ["fast", "strong"]
+    assert records[1]["features"]["max_tool_score"] > 0.5
+    assert json.loads(capture_file.read_text().splitlines()[0])["total_tokens"] == 100
+
+    # a policy that ignores tools sends the second request to the fast model
+    result = ModelRoutingReplay.replay(
+        records=records,
+        routing=routing_config.model_copy(update={"max_fast_tool_score": None}),
+    )
+    assert result.route_counts == {"fast": 2}
+    assert result.changed_count == 1
+    assert result.captured_latency_seconds == 6.0
+    assert result.estimated_latency_seconds == 2.0
+    assert result.captured_total_tokens == 1100
+    assert result.estimated_total_tokens == 200
+
+    # escalation retries are not replayed
+    escalated_records: List[Dict[str, Any]] = records + [
+        {**records[0], "route": "strong", "reason": "escalated", "escalated": True}
+    ]
+    assert ModelRoutingReplay.replay(
+        records=escalated_records,
+        routing=routing_config,
+    ) == ModelRoutingReplay.replay(records=records, routing=routing_config)
+    assert dataclasses.asdict(decision.features)["stream"] is False
@@ -0,0 +1,112 @@
+from typing import List, Optional
+
+from language_model_gateway.gateway.tools.document_passage_retriever_tool import (
+    DocumentPassageRetrieverTool,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_config import (
+    PassageExtractionConfig,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extraction_result import (
+    PassageExtractionResult,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_extractor import (
+    PassageExtractor,
+)
+from language_model_gateway.gateway.utilities.passage_extraction.passage_store import (
+    PassageStore,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+
+paragraphs: List[str] = [
+    f"Section {i}. The quarterly report covers revenue, staffing and office moves for region {i}."
+    for i in range(60)
+]
+paragraphs[42] = (
+    "Section 42. Refunds are issued within 30 days of a cancelled order."
+    " The refund policy does not cover gift cards."
+)
+document: str = "\n\n".join(paragraphs)
+
+
+async def test_only_relevant_passages_are_returned() -> None:
+    passage_extractor = PassageExtractor(
+        token_counter=TokenCounter(), passage_store=PassageStore()
+    )
+    config = PassageExtractionConfig(max_tokens=100, passage_tokens=50)
+
+    result: PassageExtractionResult = passage_extractor.extract(
+        text=document,
+        query="What is the refund policy?",
+        source="https://example.com/report",
+        tool_name="get_web_page",
+        config=config,
+    )
+
+    assert "Refunds are issued within 30 days" in result.text
+    assert "region 0." not in result.text
+    assert result.handle is not None
+    # only the passage that matches the query
+    assert result.returned_passage_count == 1
+    assert result.compression_ratio > 5
+    assert (
+        f'call document_passage_retriever with handle="{result.handle}"'
+        f" and start={result.next_start}" in result.text
+    )
+
+    # the next passages can be fetched with the handle
+    tool = DocumentPassageRetrieverTool(
+        passage_extractor=passage_extractor, max_tokens=100
+    )
+    more_text, _ = await tool._arun(
+        handle=result.handle,
+        start=result.returned_passage_count,
+        query="What is the refund policy?",
+    )
+    # the passages that do not match fill the budget
+    assert "Refunds are issued" not in more_text
+    assert more_text.count("[Passage ") > 1
+
+    # without a query the passages are in document order
+    more_text, _ = await tool._arun(handle=result.handle, start=0)
+    assert more_text.index("region 0.") < more_text.index("region 1.")
+
+    expired_text, _ = await tool._arun(handle="unknown", start=0)
+    assert "expired" in expired_text
+
+
+def test_short_documents_are_returned_whole() -> None:
+    passage_store = PassageStore()
+    passage_extractor = PassageExtractor(
+        token_counter=TokenCounter(), passage_store=passage_store
+    )
+
+    result: PassageExtractionResult = passage_extractor.extract(
+        text=paragraphs[0],
+        query="refund",
+        source="https://example.com/short",
+        tool_name="get_web_page",
+        config=PassageExtractionConfig(),
+    )
+
+    assert result.text == paragraphs[0]
+    assert result.handle is None
+    assert len(passage_store) == 0
+
+
+def test_passages_respect_the_passage_size() -> None:
+    token_counter = TokenCounter()
+    passage_extractor = PassageExtractor(
+        token_counter=token_counter, passage_store=PassageStore()
+    )
+    long_paragraph: str = " ".join(f"Sentence number {i}." for i in range(200))
+
+    passages: List[str] = passage_extractor.split_into_passages(
+        text=document + "\n\n" + long_paragraph, passage_tokens=50
+    )
+
+    assert all(token_counter.count_text(text=p) <= 50 for p in passages)
+    # nothing is lost
+    assert "".join(passages).count("Section ") == 60
+    assert "".join(passages).count("Sentence number") == 200
+    first: Optional[str] = passages[0] if passages else None
+    assert first is not None and first.startswith("Section 0.")
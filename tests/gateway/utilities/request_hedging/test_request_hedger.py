@@ -0,0 +1,122 @@
+import asyncio
+from typing import AsyncGenerator, Callable, List
+
+import pytest
+
+from language_model_gateway.configs.config_schema import HedgingConfig
+from language_model_gateway.gateway.utilities.request_hedging.request_hedger import (
+    RequestHedger,
+)
+
+hedging = HedgingConfig(
+    percentile=90,
+    max_extra_load_percent=50,
+    initial_delay_seconds=0.05,
+    min_delay_seconds=0.01,
+)
+
+
+def get_start_attempt(
+    *, first_item_delays: List[float], closed: List[int]
+) -> Callable[[int], AsyncGenerator[str, None]]:
+    async def start_attempt(index: int) -> AsyncGenerator[str, None]:
+        try:
+            await asyncio.sleep(first_item_delays[index])
+            yield f"{index}-1"
+            yield f"{index}-2"
+        finally:
+            closed.append(index)
+
+    return start_attempt
+
+
+async def test_request_hedger() -> None:
+    request_hedger = RequestHedger()
+    closed: List[int] = []
+
+    # the first item is fast so no duplicate is sent
+    items: List[str] = [
+        item
+        async for item in request_hedger.hedge_async(
+            key="test",
+            hedging=hedging,
+            start_attempt=get_start_attempt(first_item_delays=[0], closed=closed),
+        )
+    ]
+    assert items == ["0-1", "0-2"]
+    assert closed == [0]
+
+    # the original is slow so the duplicate wins and the original is cancelled
+    closed.clear()
+    items = [
+        item
+        async for item in request_hedger.hedge_async(
+            key="test",
+            hedging=hedging,
+            start_attempt=get_start_attempt(first_item_delays=[10, 0], closed=closed),
+        )
+    ]
+    assert items == ["1-1", "1-2"]
+    assert sorted(closed) == [0, 1]
+    # the cancelled original records the time it waited so the percentile is not biased low
+    first_byte_seconds: List[float] = list(
+        request_hedger._get_state("test").first_byte_seconds
+    )
+    assert len(first_byte_seconds) == 3
+    assert max(first_byte_seconds) >= 0.05
+
+    # the hedge budget of 50% is used up
+    closed.clear()
+    items = [
+        item
+        async for item in request_hedger.hedge_async(
+            key="test",
+            hedging=hedging,
+            start_attempt=get_start_attempt(first_item_delays=[0.1, 0], closed=closed),
+        )
+    ]
+    assert items == ["0-1", "0-2"]
+    assert closed == [0]
+
+
+async def test_request_hedger_failure() -> None:
+    request_hedger = RequestHedger()
+
+    async def start_attempt(index: int) -> AsyncGenerator[str, None]:
+        await asyncio.sleep(0.1)
+        if index == 0:
+            raise ValueError("upstream failed")
+        yield "duplicate"
+
+    # a failed attempt loses to the other one
+    assert [
+        item
+        async for item in request_hedger.hedge_async(
+            key="test",
+            hedging=hedging.model_copy(update={"max_extra_load_percent": 100}),
+            start_attempt=start_attempt,
+        )
+    ] == ["duplicate"]
+
+    # the error is raised if every attempt failed
+    with pytest.raises(ValueError):
+        async for _ in request_hedger.hedge_async(
+            key="test",
+            hedging=hedging.model_copy(update={"max_extra_load_percent": 0}),
+            start_attempt=start_attempt,
+        ):
+            pass
+
+
+def test_request_hedger_delay() -> None:
+    request_hedger = RequestHedger()
+    assert request_hedger.get_delay_seconds(key="test", hedging=hedging) == 0.05
+    for i in range(1, 101):
+        request_hedger.record_first_byte(key="test", seconds=i / 100)
+    assert request_hedger.get_delay_seconds(key="test", hedging=hedging) == 0.9
+    assert (
+        request_hedger.get_delay_seconds(
+            key="test", hedging=hedging.model_copy(update={"min_delay_seconds": 2})
+        )
+        == 2
+    )
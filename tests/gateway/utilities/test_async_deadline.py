@@ -0,0 +1,57 @@
+import asyncio
+from typing import AsyncGenerator, List
+
+import pytest
+
+from language_model_gateway.gateway.utilities.async_deadline import (
+    iterate_until_deadline,
+)
+from language_model_gateway.gateway.utilities.deadline_exceeded_error import (
+    DeadlineExceededError,
+)
+
+
+async def test_iterate_until_deadline() -> None:
+    closed: List[bool] = []
+
+    async def slow_items() -> AsyncGenerator[int, None]:
+        try:
+            for i in range(10):
+                await asyncio.sleep(0.05)
+                yield i
+        finally:
+            closed.append(True)
+
+    received: List[int] = []
+    with pytest.raises(DeadlineExceededError):
+        async for item in iterate_until_deadline(
+            items=slow_items(), timeout_seconds=0.12
+        ):
+            received.append(item)
+    assert received == [0, 1]
+    # the iterator is closed so the work it was doing stops
+    assert closed == [True]
+
+    # no deadline
+    received = [
+        item
+        async for item in iterate_until_deadline(
+            items=slow_items(), timeout_seconds=None
+        )
+    ]
+    assert received == list(range(10))
+
+
+async def test_timeout_from_the_iterator_is_not_the_deadline() -> None:
+    async def failing_items() -> AsyncGenerator[int, None]:
+        yield 0
+        raise TimeoutError("tool timed out")
+
+    received: List[int] = []
+    with pytest.raises(TimeoutError) as exc_info:
+        async for item in iterate_until_deadline(
+            items=failing_items(), timeout_seconds=10
+        ):
+            received.append(item)
+    assert received == [0]
+    assert not isinstance(exc_info.value, DeadlineExceededError)
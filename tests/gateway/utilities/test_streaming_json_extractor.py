@@ -0,0 +1,188 @@
+import json
+from typing import Any, Dict, List
+
+from langchain_core.messages import BaseMessage
+from openai.types.chat import ChatCompletionChunk
+from openai.types.shared_params import ResponseFormatJSONSchema
+from openai.types.shared_params.response_format_json_schema import JSONSchema
+from starlette.responses import StreamingResponse
+
+from language_model_gateway.configs.config_schema import ChatModelConfig
+from language_model_gateway.gateway.converters.langgraph_to_openai_converter import (
+    LangGraphToOpenAIConverter,
+)
+from language_model_gateway.gateway.converters.message_conversion_cache import (
+    MessageConversionCache,
+)
+from language_model_gateway.gateway.schema.openai.completions import ChatRequest
+from language_model_gateway.gateway.utilities.context_budget.context_budget_manager import (
+    ContextBudgetManager,
+)
+from language_model_gateway.gateway.utilities.json_schema_validator import (
+    JsonSchemaValidator,
+)
+from language_model_gateway.gateway.utilities.streaming_json_extractor import (
+    StreamingJsonExtractor,
+)
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+from tests.gateway.mocks.mock_chat_model import MockChatModel
+
+schema: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}},
+            "required": ["city"],
+        },
+    },
+    "required": ["name", "tags"],
+}
+
+response_text: str = (
+    'Sure, here is the {JSON}: <json>\n{"name": "Dr. {Ward}", "tags": ["a]", "b\\""],'
+    ' "address": {"city": "Baltimore"}}\n</json> Let me know if you need more.'
+)
+
+
+def test_streaming_json_extractor() -> None:
+    extractor = StreamingJsonExtractor()
+    # stream a few characters at a time so the tag and strings are split across chunks
+    deltas: List[str] = [
+        extractor.add(response_text[i : i + 3]) for i in range(0, len(response_text), 3)
+    ]
+    assert extractor.finished
+    assert "".join(deltas) == extractor.json_text
+    assert json.loads(extractor.json_text) == {
+        "name": "Dr. {Ward}",
+        "tags": ["a]", 'b"'],
+        "address": {"city": "Baltimore"},
+    }
+    assert extractor.validate(schema=schema) == []
+
+    # no <json> tag
+    extractor = StreamingJsonExtractor()
+    assert extractor.add("```json\n[1, ") == "[1, "
+    assert extractor.add("2]\n```") == "2]"
+
+    # JSON after prose is only found at the end of the stream
+    extractor = StreamingJsonExtractor()
+    assert extractor.add("The answer is [1, 2] and that is all") == ""
+    assert extractor.finish() == "[1, 2]"
+    assert extractor.validate(schema=None) == []
+
+    # incomplete and missing JSON
+    extractor = StreamingJsonExtractor()
+    extractor.add('<json>{"name": "Dr. Ward"')
+    assert extractor.validate(schema=schema) == [
+        "The JSON in the response is incomplete"
+    ]
+    assert StreamingJsonExtractor().validate(schema=None) == [
+        "No JSON found in the response"
+    ]
+
+    # schema errors
+    assert JsonSchemaValidator.validate(
+        value={"name": 1, "address": {}}, schema=schema
+    ) == [
+        "$.tags is required",
+        "$.name should be of type string",
+        "$.address.city is required",
+    ]
+
+
+async def test_streaming_json_response_format() -> None:
+    def get_response(messages: List[BaseMessage]) -> str:
+        # the prompt asking for JSON is added to streaming requests
+        assert "<json>" in str(messages[-1].content)
+        return response_text
+
+    converter = LangGraphToOpenAIConverter(
+        context_budget_manager=ContextBudgetManager(token_counter=TokenCounter()),
+        message_conversion_cache=MessageConversionCache(max_entries=10),
+    )
+    chat_request: ChatRequest = {
+        "model": "test",
+        "messages": [{"role": "user", "content": "Who is Dr. Ward?"}],
+        "stream": True,
+        "response_format": ResponseFormatJSONSchema(
+            type="json_schema",
+            json_schema=JSONSchema(name="Doctor", schema=schema),
+        ),
+    }
+    response = await converter.call_agent_with_input(
+        headers={},
+        chat_request=chat_request,
+        request_id="1",
+        compiled_state_graph=await converter.create_graph_for_llm_async(
+            llm=MockChatModel(fn_get_response=get_response), tools=[]
+        ),
+        system_messages=[],
+        model_config=ChatModelConfig(id="test", name="test", description="test"),
+        tools=[],
+    )
+    assert isinstance(response, StreamingResponse)
+
+    content: str = ""
+    async for line in response.body_iterator:
+        assert isinstance(line, str)
+        data: str = line.removeprefix("data: ").strip()
+        if data == "[DONE]":
+            break
+        chunk = ChatCompletionChunk.model_validate_json(data)
+        if chunk.choices:
+            content += chunk.choices[0].delta.content or ""
+
+    assert json.loads(content)["name"] == "Dr. {Ward}"
+
+
+async def test_streaming_json_validation_errors_are_not_in_content() -> None:
+    converter = LangGraphToOpenAIConverter(
+        context_budget_manager=ContextBudgetManager(token_counter=TokenCounter()),
+        message_conversion_cache=MessageConversionCache(max_entries=10),
+    )
+    chat_request: ChatRequest = {
+        "model": "test",
+        "messages": [{"role": "user", "content": "Who is Dr. Ward?"}],
+        "stream": True,
+        "response_format": ResponseFormatJSONSchema(
+            type="json_schema",
+            json_schema=JSONSchema(name="Doctor", schema=schema),
+        ),
+    }
+    response = await converter.call_agent_with_input(
+        headers={},
+        chat_request=chat_request,
+        request_id="1",
+        compiled_state_graph=await converter.create_graph_for_llm_async(
+            # the tags are required by the schema
+            llm=MockChatModel(
+                fn_get_response=lambda messages: '<json>{"name": "Dr. Ward"}</json>'
+            ),
+            tools=[],
+        ),
+        system_messages=[],
+        model_config=ChatModelConfig(id="test", name="test", description="test"),
+        tools=[],
+    )
+    assert isinstance(response, StreamingResponse)
+
+    content: str = ""
+    errors: List[str] = []
+    async for line in response.body_iterator:
+        assert isinstance(line, str)
+        data: str = line.removeprefix("data: ").strip()
+        if data == "[DONE]":
+            break
+        event: Dict[str, Any] = json.loads(data)
+        if "error" in event:
+            errors.append(event["error"]["message"])
+            continue
+        chunk = ChatCompletionChunk.model_validate(event)
+        if chunk.choices:
+            content += chunk.choices[0].delta.content or ""
+
+    assert json.loads(content) == {"name": "Dr. Ward"}
+    assert errors == ["$.tags is required"]
@@ -0,0 +1,120 @@
+from typing import List
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+from language_model_gateway.configs.config_schema import ToolSelectionConfig
+from language_model_gateway.gateway.tools.current_time_tool import CurrentTimeTool
+from language_model_gateway.gateway.utilities.token_counter import TokenCounter
+from language_model_gateway.gateway.utilities.tool_selection.tool_selector import (
+    ToolSelector,
+)
+
+
+def get_pull_requests(repository: str) -> str:
+    """Retrieves the pull requests in a GitHub repository with their authors and reviewers"""
+    return repository
+
+
+def get_jira_issues(project: str) -> str:
+    """Retrieves the issues in a Jira project with their status and assignee"""
+    return project
+
+
+def search_confluence(query: str) -> str:
+    """Searches Confluence pages for documentation"""
+    return query
+
+
+def search_google(query: str) -> str:
+    """Searches the web with Google for current information"""
+    return query
+
+
+tools: List[BaseTool] = [
+    CurrentTimeTool(),
+    StructuredTool.from_function(get_pull_requests, name="github_pull_requests"),
+    StructuredTool.from_function(get_jira_issues, name="jira_issues"),
+    StructuredTool.from_function(search_confluence, name="confluence_search"),
+    StructuredTool.from_function(search_google, name="google_search"),
+]
+
+
+def test_tool_selector() -> None:
+    tool_selector = ToolSelector(token_counter=TokenCounter())
+
+    result = tool_selector.select_tools(
+        model_name="test",
+        tools=tools,
+        query="Which pull requests did Sam review in the icanbwell/fhir-server repo?",
+        tool_selection=ToolSelectionConfig(max_tools=2, always_include=["CurrentTime"]),
+    )
+    # the configured order is kept
+    assert [t.name for t in result.tools] == ["CurrentTime", "github_pull_requests"]
+    assert result.tokens_saved > 0
+    assert result.final_tokens < result.original_tokens
+
+    result = tool_selector.select_tools(
+        model_name="test",
+        tools=tools,
+        query="What are the open Jira issues assigned to me?",
+        tool_selection=ToolSelectionConfig(max_tools=1),
+    )
+    assert [t.name for t in result.tools] == ["jira_issues"]
+
+    # a message that matches no tool binds all of them instead of the first in the configuration
+    result = tool_selector.select_tools(
+        model_name="test",
+        tools=tools,
+        query="Thanks!",
+        tool_selection=ToolSelectionConfig(max_tools=2),
+    )
+    assert result.tools == tools
+
+    # the token counts come from the cache and match a fresh count
+    assert tool_selector.count_tool_tokens(tools=tools) == TokenCounter().count_tools(
+        tools=tools
+    )
+
+    # no selection configured or fewer tools than the maximum
+    assert (
+        tool_selector.select_tools(
+            model_name="test", tools=tools, query="Hi", tool_selection=None
+        ).tools
+        == tools
+    )
+    assert (
+        tool_selector.select_tools(
+            model_name="test",
+            tools=tools,
+            query="Hi",
+            tool_selection=ToolSelectionConfig(max_tools=10),
+        ).tools
+        == tools
+    )
+
+
+def test_tool_selector_query() -> None:
+    assert ToolSelector.tokenize("GitHubPullRequests get_jira_issues") == [
+        "git",
+        "hub",
+        "pull",
+        "request",
+        "jira",
+        "issue",
+    ]
+    assert (
+        ToolSelector.get_query_from_messages(
+            [
+                {"role": "user", "content": "first"},
+                {"role": "assistant", "content": "answer"},
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "second"},
+                        {"type": "image_url", "image_url": {"url": "http://x"}},
+                    ],
+                },
+            ]
+        )
+        == "second"
+    )
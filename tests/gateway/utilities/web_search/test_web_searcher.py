@@ -0,0 +1,183 @@
+import asyncio
+from typing import List
+
+import httpx
+
+from language_model_gateway.gateway.utilities.web_search.arxiv_web_search_engine import (
+    ArxivWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.duckduckgo_web_search_engine import (
+    DuckDuckGoWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.google_web_search_engine import (
+    GoogleWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.pubmed_web_search_engine import (
+    PubmedWebSearchEngine,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_cache import (
+    WebSearchCache,
+)
+from language_model_gateway.gateway.utilities.web_search.web_search_response import (
+    WebSearchResponse,
+)
+from language_model_gateway.gateway.utilities.web_search.web_searcher import (
+    WebSearcher,
+)
+from tests.gateway.mocks.mock_http_client_factory import MockHttpClientFactory
+
+duckduckgo_html: str = """
+<div class="result results_links result--ad">
+  <a class="result__a" href="https://ads.example.com">Ad</a>
+</div>
+<div class="result results_links">
+  <a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fwww.example.com%2Fcrispr%2F%3Futm_source%3Dddg&amp;rut=abc">CRISPR explained</a>
+  <a class="result__snippet">Gene editing with <b>CRISPR</b>.</a>
+</div>
+<div class="result results_links">
+  <a class="result__a" href="https://en.wikipedia.org/wiki/CRISPR">CRISPR - Wikipedia</a>
+  <a class="result__snippet">CRISPR is a family of DNA sequences.</a>
+</div>
+"""
+
+arxiv_xml: str = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>http://arxiv.org/abs/2401.00001v1</id>
+    <title>Deep learning
+      for CRISPR guide design</title>
+    <summary>We predict guide efficiency.</summary>
+  </entry>
+</feed>
+"""
+
+
+async def test_engines_are_searched_concurrently_and_fused() -> None:
+    requests: List[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.url.host}{request.url.path}")
+        match request.url.host:
+            case "customsearch.googleapis.com":
+                assert request.url.params["q"] == "CRISPR gene editing"
+                return httpx.Response(
+                    200,
+                    json={
+                        "items": [
+                            {
+                                "title": "Wikipedia",
+                                "link": "https://en.wikipedia.org/wiki/CRISPR/",
+                                "snippet": "CRISPR on Wikipedia",
+                            },
+                            {
+                                "title": "CRISPR explained",
+                                "link": "http://example.com/crispr#intro",
+                                "snippet": "Explained",
+                            },
+                        ]
+                    },
+                )
+            case "html.duckduckgo.com":
+                return httpx.Response(200, text=duckduckgo_html)
+            case "eutils.ncbi.nlm.nih.gov":
+                if request.url.path.endswith("esearch.fcgi"):
+                    return httpx.Response(
+                        200, json={"esearchresult": {"idlist": ["123"]}}
+                    )
+                assert request.url.params["id"] == "123"
+                return httpx.Response(
+                    200,
+                    json={
+                        "result": {
+                            "123": {
+                                "title": "CRISPR in the clinic",
+                                "authors": [{"name": "Doe J"}],
+                                "fulljournalname": "Nature",
+                                "pubdate": "2024 Jan",
+                            }
+                        }
+                    },
+                )
+            case "export.arxiv.org":
+                # arXiv is slower than the deadline
+                await asyncio.sleep(5)
+                return httpx.Response(200, text=arxiv_xml)
+        return httpx.Response(404)
+
+    clients: List[httpx.AsyncClient] = []
+
+    def create_http_client() -> httpx.AsyncClient:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    web_searcher = WebSearcher(
+        http_client_factory=MockHttpClientFactory(fn_http_client=create_http_client),
+        web_search_cache=WebSearchCache(),
+        engines=[
+            GoogleWebSearchEngine(api_key="fake_key", cse_id="fake_cse_id"),
+            DuckDuckGoWebSearchEngine(),
+            PubmedWebSearchEngine(),
+            ArxivWebSearchEngine(),
+        ],
+        timeout_seconds=0.5,
+    )
+
+    response: WebSearchResponse = await web_searcher.search_async(
+        query="CRISPR gene editing", max_results=5
+    )
+
+    # the pages found by both Google and DuckDuckGo are merged and rank first
+    assert [(result.url, result.engines) for result in response.results] == [
+        ("https://en.wikipedia.org/wiki/CRISPR/", ["google", "duckduckgo"]),
+        ("http://example.com/crispr#intro", ["google", "duckduckgo"]),
+        ("https://pubmed.ncbi.nlm.nih.gov/123/", ["pubmed"]),
+    ]
+    assert response.results[2].snippet == "Doe J, Nature, 2024 Jan"
+    assert response.failed_engines == ["arxiv"]
+    assert not response.cached
+
+    # partial results are not cached
+    requests.clear()
+    await web_searcher.search_async(query="CRISPR gene editing", max_results=5)
+    assert "export.arxiv.org/api/query" in requests
+
+    # with every engine answering the results are cached by normalized query
+    web_searcher.engines = web_searcher.engines[:3]
+    await web_searcher.search_async(query="CRISPR gene editing", max_results=5)
+    requests.clear()
+    response = await web_searcher.search_async(
+        query="  crispr GENE   editing ", max_results=5
+    )
+    assert response.cached
+    assert response.query == "  crispr GENE   editing "
+    assert len(response.results) == 3
+    assert requests == []
+
+    # the searches share one http client
+    assert len(clients) == 1
+    await web_searcher.aclose()
+
+
+def test_punctuation_is_part_of_the_cached_query() -> None:
+    assert WebSearchCache.normalize_query("  C++  Templates ") == "c++ templates"
+    assert (
+        len({WebSearchCache.normalize_query(query) for query in ["C++", "C#", "C"]})
+        == 3
+    )
+
+
+async def test_arxiv_results_are_parsed() -> None:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, text=arxiv_xml))
+    ) as client:
+        results = await ArxivWebSearchEngine().search_async(
+            client=client, query="crispr", max_results=3
+        )
+    assert [(result.title, result.url, result.snippet) for result in results] == [
+        (
+            "Deep learning for CRISPR guide design",
+            "http://arxiv.org/abs/2401.00001v1",
+            "We predict guide efficiency.",
+        )
+    ]